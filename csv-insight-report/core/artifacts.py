@@ -0,0 +1,526 @@
+"""
+Artifact Serialization Module
+Compact binary storage for schema, profile and insights artifacts, with lazily loaded record tables.
+
+An artifact file is a small JSON skeleton followed by Arrow IPC blobs. Large
+collections of flat records (pairwise correlations, chi-square tests,
+per-column statistics, appendix insights) are stored as compressed Arrow
+tables and only decoded when first accessed. JSON remains available as an
+explicit export.
+"""
+
+import io
+import json
+import struct
+from collections.abc import Mapping, Sequence
+from numbers import Integral, Real
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+import polars as pl
+
+
+ARTIFACT_MAGIC = b'CIRA\x00\x01'
+ARTIFACT_SUFFIX = '.cira'
+
+# Collections smaller than this stay in the JSON skeleton
+MIN_TABLE_ROWS = 32
+
+KEY_COLUMN = '__key__'
+ABSENT_COLUMN = '__absent__'
+
+# Column dtypes for record fields holding only these Python types (and None)
+_FAST_DTYPES = {
+    frozenset(): pl.Utf8,
+    frozenset({bool}): pl.Boolean,
+    frozenset({int}): pl.Int64,
+    frozenset({float}): pl.Float64,
+    frozenset({int, float}): pl.Float64,
+    frozenset({str}): pl.Utf8,
+}
+
+
+def _scalar_kind(value: Any) -> Optional[str]:
+    """
+    Classify a record value for column typing.
+
+    Args:
+        value: Record value
+
+    Returns:
+        'null', 'bool', 'int', 'float', 'str', or None for nested values
+    """
+    if value is None:
+        return 'null'
+    if isinstance(value, (bool, np.bool_)):
+        return 'bool'
+    if isinstance(value, Integral):
+        return 'int' if -2**63 <= int(value) < 2**63 else None
+    if isinstance(value, Real):
+        return 'float'
+    if isinstance(value, str):
+        return 'str'
+    return None
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Convert NumPy scalars and lazy record views for json.dumps.
+
+    Args:
+        value: Value json could not encode
+
+    Returns:
+        Equivalent Python value
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    if _is_lazy(value):
+        return value.materialize()
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _is_lazy(obj: Any) -> bool:
+    """
+    Check whether an object is a lazy or columnar record collection.
+
+    Args:
+        obj: Artifact value
+
+    Returns:
+        True for LazyRecords, LazyRecordList and other objects with materialize()
+    """
+    return callable(getattr(obj, 'materialize', None))
+
+
+def _is_record_collection(values: List[Any]) -> bool:
+    """
+    Check whether values are dicts that can be stored as table rows.
+
+    Args:
+        values: Candidate rows
+
+    Returns:
+        True if every value is a dict with string keys
+    """
+    return len(values) >= MIN_TABLE_ROWS and all(
+        isinstance(v, Mapping) and all(isinstance(k, str) for k in v) for v in values
+    )
+
+
+def _records_to_frame(records: List[Mapping], keys: Optional[List[str]] = None) -> Tuple[pl.DataFrame, List[str]]:
+    """
+    Build a typed DataFrame from flat records.
+
+    Scalar fields become native columns; nested fields are stored as JSON
+    strings. Fields missing from some records are listed per row in an
+    absent-keys column so that rows round-trip exactly.
+
+    Args:
+        records: Record dicts
+        keys: Optional row keys (for dict-of-records collections)
+
+    Returns:
+        Tuple of (DataFrame, list of JSON-encoded column names)
+    """
+    columns: List[str] = []
+    seen = set()
+    for record in records:
+        for name in record:
+            if name not in seen:
+                seen.add(name)
+                columns.append(name)
+
+    data: Dict[str, pl.Series] = {}
+    json_columns = []
+
+    if keys is not None:
+        data[KEY_COLUMN] = pl.Series(KEY_COLUMN, keys, dtype=pl.Utf8)
+
+    for name in columns:
+        values = [record.get(name) for record in records]
+
+        # Fast path: plain Python scalars of one type
+        python_types = set(map(type, values)) - {type(None)}
+        fast_dtype = _FAST_DTYPES.get(frozenset(python_types))
+        if fast_dtype is not None:
+            try:
+                data[name] = pl.Series(name, values, dtype=fast_dtype, strict=fast_dtype != pl.Float64)
+                continue
+            except (OverflowError, TypeError, pl.exceptions.PolarsError):
+                pass  # e.g. ints beyond 64 bits
+
+        kinds = {_scalar_kind(v) for v in values} - {'null'}
+
+        if kinds == {'bool'}:
+            data[name] = pl.Series(name, [None if v is None else bool(v) for v in values], dtype=pl.Boolean)
+        elif kinds == {'int'}:
+            data[name] = pl.Series(name, [None if v is None else int(v) for v in values], dtype=pl.Int64)
+        elif kinds in ({'float'}, {'int', 'float'}):
+            data[name] = pl.Series(name, [None if v is None else float(v) for v in values], dtype=pl.Float64)
+        elif kinds in (set(), {'str'}):
+            data[name] = pl.Series(name, values, dtype=pl.Utf8)
+        else:
+            # Nested or mixed-type values
+            data[name] = pl.Series(name, [json.dumps(v, default=_json_default) for v in values], dtype=pl.Utf8)
+            json_columns.append(name)
+
+    absent = [
+        json.dumps([name for name in columns if name not in record])
+        if len(record) != len(columns) else None
+        for record in records
+    ]
+    if any(a is not None for a in absent):
+        data[ABSENT_COLUMN] = pl.Series(ABSENT_COLUMN, absent, dtype=pl.Utf8)
+
+    return pl.DataFrame(data), json_columns
+
+
+def _split(obj: Any, blobs: List[bytes], tables: List[Dict[str, Any]]) -> Any:
+    """
+    Replace large record collections with table placeholders.
+
+    Args:
+        obj: Object to encode
+        blobs: Output list of IPC blobs
+        tables: Output list of table descriptors
+
+    Returns:
+        JSON-compatible skeleton
+    """
+    # Columnar collections (e.g. InsightTable) provide their record layout directly
+    if hasattr(obj, 'to_records_frame') and len(obj) >= MIN_TABLE_ROWS:
+        frame, json_columns = obj.to_records_frame()
+        return _add_table(frame, 'list', json_columns, blobs, tables)
+
+    if _is_lazy(obj):
+        obj = obj.materialize()
+
+    if isinstance(obj, Mapping):
+        values = list(obj.values())
+        if _is_record_collection(values) and all(isinstance(k, str) for k in obj):
+            frame, json_columns = _records_to_frame(values, keys=list(obj.keys()))
+            return _add_table(frame, 'dict', json_columns, blobs, tables)
+
+        return {str(k): _split(v, blobs, tables) for k, v in obj.items()}
+
+    if isinstance(obj, (list, tuple)):
+        if _is_record_collection(list(obj)):
+            frame, json_columns = _records_to_frame(list(obj))
+            return _add_table(frame, 'list', json_columns, blobs, tables)
+
+        return [_split(v, blobs, tables) for v in obj]
+
+    if isinstance(obj, np.generic):
+        return obj.item()
+
+    return obj
+
+
+def _add_table(
+    frame: pl.DataFrame,
+    kind: str,
+    json_columns: List[str],
+    blobs: List[bytes],
+    tables: List[Dict[str, Any]],
+) -> Dict[str, int]:
+    """
+    Serialize a table to Arrow IPC and register its descriptor.
+
+    Args:
+        frame: Table to write
+        kind: 'dict' (keyed records) or 'list' (ordered records)
+        json_columns: Columns holding JSON-encoded values
+        blobs: Output list of IPC blobs
+        tables: Output list of table descriptors
+
+    Returns:
+        Placeholder referencing the table
+    """
+    buffer = io.BytesIO()
+    frame.write_ipc(buffer, compression='zstd')
+
+    tables.append({
+        'kind': kind,
+        'rows': len(frame),
+        'json_columns': json_columns,
+        'length': buffer.tell(),
+    })
+    blobs.append(buffer.getvalue())
+
+    return {'__table__': len(tables) - 1}
+
+
+def write_artifact(obj: Dict[str, Any], output_path: str) -> None:
+    """
+    Write an artifact in the compact binary format.
+
+    Args:
+        obj: Schema, profile or insights dict
+        output_path: Path to output file
+    """
+    blobs: List[bytes] = []
+    tables: List[Dict[str, Any]] = []
+    skeleton = _split(obj, blobs, tables)
+
+    offset = 0
+    for table in tables:
+        table['offset'] = offset
+        offset += table['length']
+
+    header = json.dumps(
+        {'version': 1, 'root': skeleton, 'tables': tables},
+        separators=(',', ':'),
+        default=_json_default,
+    ).encode('utf-8')
+
+    with open(output_path, 'wb') as f:
+        f.write(ARTIFACT_MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+
+
+class _TableSource:
+    """
+    Reads one table's IPC bytes from an artifact file on first use.
+    """
+
+    def __init__(self, path: str, start: int, descriptor: Dict[str, Any]):
+        self.path = path
+        self.start = start
+        self.descriptor = descriptor
+        self._columns: Optional[Dict[str, List[Any]]] = None
+
+    def frame(self) -> pl.DataFrame:
+        """Decode the table as a Polars DataFrame"""
+        with open(self.path, 'rb') as f:
+            f.seek(self.start + self.descriptor['offset'])
+            data = f.read(self.descriptor['length'])
+        return pl.read_ipc(io.BytesIO(data))
+
+    def columns(self) -> Dict[str, List[Any]]:
+        """Decode the table once into Python column lists"""
+        if self._columns is None:
+            self._columns = self.frame().to_dict(as_series=False)
+        return self._columns
+
+    def _build(self, values: tuple, names: List[str], decode: List[bool], absent: Optional[str]) -> Dict[str, Any]:
+        """Assemble a record from one row of column values"""
+        record = {
+            name: json.loads(value) if is_json and value is not None else value
+            for name, value, is_json in zip(names, values, decode)
+        }
+        if absent:
+            for name in json.loads(absent):
+                del record[name]
+        return record
+
+    def _layout(self) -> Tuple[List[str], List[bool]]:
+        """Record field names and which of them are JSON-encoded"""
+        json_columns = set(self.descriptor['json_columns'])
+        names = [n for n in self.columns() if n not in (KEY_COLUMN, ABSENT_COLUMN)]
+        return names, [n in json_columns for n in names]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Rebuild one record as a plain dict"""
+        columns = self.columns()
+        names, decode = self._layout()
+        absent = columns[ABSENT_COLUMN][index] if ABSENT_COLUMN in columns else None
+        return self._build(tuple(columns[n][index] for n in names), names, decode, absent)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Rebuild every record, column lists zipped once"""
+        columns = self.columns()
+        names, decode = self._layout()
+        absent = columns.get(ABSENT_COLUMN) or [None] * self.descriptor['rows']
+        return [
+            self._build(values, names, decode, missing)
+            for values, missing in zip(zip(*(columns[n] for n in names)), absent)
+        ]
+
+
+class LazyRecords(Mapping):
+    """
+    Read-only mapping of key -> record backed by an artifact table.
+
+    Nothing is decoded until the first lookup; rows are rebuilt on demand.
+    """
+
+    def __init__(self, source: _TableSource):
+        self._source = source
+        self._index: Optional[Dict[str, int]] = None
+
+    def _keys(self) -> Dict[str, int]:
+        if self._index is None:
+            keys = self._source.columns()[KEY_COLUMN]
+            self._index = {key: i for i, key in enumerate(keys)}
+        return self._index
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        return self._source.row(self._keys()[key])
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return self._source.descriptor['rows']
+
+    def to_frame(self) -> pl.DataFrame:
+        """Return the backing table without rebuilding records"""
+        return self._source.frame()
+
+    def materialize(self) -> Dict[str, Dict[str, Any]]:
+        """Convert to a plain dict of dicts"""
+        return dict(zip(self._keys(), self._source.rows()))
+
+
+class LazyRecordList(Sequence):
+    """
+    Read-only list of records backed by an artifact table.
+    """
+
+    def __init__(self, source: _TableSource):
+        self._source = source
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._source.row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('record index out of range')
+        return self._source.row(index)
+
+    def __len__(self) -> int:
+        return self._source.descriptor['rows']
+
+    def to_frame(self) -> pl.DataFrame:
+        """Return the backing table without rebuilding records"""
+        return self._source.frame()
+
+    def materialize(self) -> List[Dict[str, Any]]:
+        """Convert to a plain list of dicts"""
+        return self._source.rows()
+
+
+def _join(obj: Any, path: str, start: int, tables: List[Dict[str, Any]]) -> Any:
+    """
+    Replace table placeholders with lazy record views.
+
+    Args:
+        obj: Decoded skeleton
+        path: Artifact file path
+        start: Byte offset of the first blob
+        tables: Table descriptors
+
+    Returns:
+        Object with lazy views in place of tables
+    """
+    if isinstance(obj, dict):
+        if set(obj) == {'__table__'}:
+            descriptor = tables[obj['__table__']]
+            source = _TableSource(path, start, descriptor)
+            return LazyRecords(source) if descriptor['kind'] == 'dict' else LazyRecordList(source)
+        return {k: _join(v, path, start, tables) for k, v in obj.items()}
+
+    if isinstance(obj, list):
+        return [_join(v, path, start, tables) for v in obj]
+
+    return obj
+
+
+def is_artifact(path: str) -> bool:
+    """
+    Check whether a file is in the binary artifact format.
+
+    Args:
+        path: File path
+
+    Returns:
+        True if the file starts with the artifact magic bytes
+    """
+    with open(path, 'rb') as f:
+        return f.read(len(ARTIFACT_MAGIC)) == ARTIFACT_MAGIC
+
+
+def read_artifact(input_path: str) -> Dict[str, Any]:
+    """
+    Read a binary artifact, leaving record tables to load lazily.
+
+    Args:
+        input_path: Path to artifact file
+
+    Returns:
+        Artifact dict with LazyRecords / LazyRecordList in place of tables
+    """
+    with open(input_path, 'rb') as f:
+        if f.read(len(ARTIFACT_MAGIC)) != ARTIFACT_MAGIC:
+            raise ValueError(f"Not an artifact file: {input_path}")
+
+        (header_length,) = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(header_length))
+
+    start = len(ARTIFACT_MAGIC) + 8 + header_length
+    return _join(header['root'], str(input_path), start, header['tables'])
+
+
+def materialize(obj: Any) -> Any:
+    """
+    Recursively convert lazy record views into plain dicts and lists.
+
+    Args:
+        obj: Artifact object
+
+    Returns:
+        Plain JSON-compatible object
+    """
+    if _is_lazy(obj):
+        obj = obj.materialize()
+
+    if isinstance(obj, Mapping):
+        return {k: materialize(v) for k, v in obj.items()}
+
+    if isinstance(obj, list):
+        return [materialize(v) for v in obj]
+
+    return obj
+
+
+def save(obj: Dict[str, Any], output_path: str) -> None:
+    """
+    Save an artifact, choosing the format from the file suffix.
+
+    A .json suffix writes pretty-printed JSON (the explicit export); any
+    other suffix writes the compact binary format.
+
+    Args:
+        obj: Artifact dict
+        output_path: Path to output file
+    """
+    if Path(output_path).suffix.lower() == '.json':
+        with open(output_path, 'w') as f:
+            json.dump(materialize(obj), f, indent=2, default=_json_default)
+    else:
+        write_artifact(obj, output_path)
+
+
+def load(input_path: str) -> Dict[str, Any]:
+    """
+    Load an artifact written as either binary or JSON.
+
+    Args:
+        input_path: Path to input file
+
+    Returns:
+        Artifact dict (binary artifacts load their tables lazily)
+    """
+    if is_artifact(input_path):
+        return read_artifact(input_path)
+
+    with open(input_path, 'r') as f:
+        return json.load(f)
@@ -55,6 +55,129 @@ DEFAULT_SETTINGS = {
     'correlation_min_abs': 0.3,
     'max_insights_to_surface': 8,
 
+    # Trend detection
+    'trend_resample': 'auto',  # 'auto', True or False
+    'trend_resample_min_rows': 1_000_000,  # 'auto' resamples at or above this many rows
+    'trend_max_periods': 10_000,
+
+    # Panel trends (one trend per segment, e.g. store or site)
+    'panel_trend_min_segments': 3,
+    'panel_trend_max_segments': 100_000,  # Segment columns with more levels are skipped
+    'panel_trend_top_k': 5,  # Strongest and divergent segments reported per measure
+    'panel_trend_min_heterogeneity': 0.25,  # Min I² of segment slopes to report trends that only differ in rate
+
+    # Seasonality detection (periodogram)
+    'seasonality_max_periods': 1_000_000,  # Resampled to the cadence, widened above this many periods
+    'seasonality_min_periods': 24,
+    'seasonality_min_cycles': 3,  # Full cycles the series must span
+    'seasonality_max_cycles': 2,  # Cycles reported per measure (harmonics excluded)
+    'seasonality_min_strength': 0.05,  # Min adjusted variance share of the average cycle
+    'seasonality_min_completeness': 0.8,  # Min share of periods with a value
+
+    # Changepoint detection (level shifts)
+    'changepoint_max_periods': 1_000_000,  # Resampled to the cadence, widened above this many periods
+    'changepoint_min_periods': 24,
+    'changepoint_min_segment': 5,  # Periods
+    'changepoint_min_segment_fraction': 0.01,  # Of the series length, if larger
+    'changepoint_max_changes': 5,  # Per measure
+    'changepoint_penalty': 2.0,  # Multiplier of noise variance x log(periods) (2 = BIC)
+    'changepoint_min_effect': 0.5,  # Min |Cohen's d| between adjacent segments
+
+    # Anomaly detection (rolling median/MAD)
+    'anomaly_max_periods': 1_000_000,  # Periods are the cadence, widened above this many periods
+    'anomaly_window': 48,  # Trailing periods behind the expected value and band
+    'anomaly_min_history': 24,  # Periods with a value in the window before scoring
+    'anomaly_threshold': 3.5,  # Robust z-score that flags a period
+    'anomaly_max_gap': 1,  # Normal periods allowed inside one event
+    'anomaly_max_events': 5,  # Reported per measure
+    'anomaly_max_events_kept': 1000,  # Kept in saved state per measure (most extreme)
+    'anomaly_state_dir': None,  # Saves per-measure state here and resumes from it on the next run
+
+    # Group detection
+    'group_max_levels': 10,  # Columns with more levels are collapsed (or skipped)
+    'group_collapse_high_cardinality': True,  # Compare the top levels plus an 'Other' bucket
+    'group_min_top_coverage': 0.5,  # Skip collapsing when the top levels cover fewer rows
+
+    # Robust regression (Theil-Sen)
+    'theil_sen_max_rows': 1_000_000,  # Rows feeding the estimator (random subsample above)
+    'theil_sen_exact_max_n': 2000,  # Exact all-pairs median up to this many rows
+    'theil_sen_pairs': 200_000,  # Sampled pairs for larger inputs
+
+    # Bootstrap confidence intervals (top insights)
+    'bootstrap_resamples': 1000,  # 0 disables intervals
+    'bootstrap_confidence': 0.95,
+    'bootstrap_max_rows': 5000,  # Larger samples use a rescaled m-out-of-n bootstrap
+
+    # Permutation tests (groups below min_sample_for_parametrics, correlations under 100 pairs)
+    'permutation_tests': True,
+    'permutation_min_group_size': 5,  # Smallest group compared by permutation
+    'permutation_max_rows': 5000,  # Larger comparisons drop small groups instead
+    'permutation_max': 10_000,  # Permutations before stopping undecided
+    'permutation_block': 500,  # Permutations per vectorized block
+    'permutation_confidence': 0.99,  # Stop once the p-value interval excludes alpha
+
+    # Subgroup discovery (conjunctions of categorical conditions)
+    'subgroup_max_depth': 3,  # Max conditions per subgroup
+    'subgroup_min_depth': 2,  # Single conditions are left to the group detector
+    'subgroup_beam_width': 10,
+    'subgroup_max_levels': 20,  # Condition columns with more levels are skipped
+    'subgroup_min_support': 0.02,  # Smallest subgroup as a fraction of rows (and >= min_sample_for_parametrics)
+    'subgroup_min_effect': 0.2,  # Min |Cohen's d| against the remaining rows
+    'subgroup_top_k': 2,  # Subgroups reported per measure
+    'subgroup_max_overlap': 0.5,  # Max row overlap (Jaccard) with a segment already reported
+    'subgroup_time_budget_seconds': 5.0,  # Per measure; None = search to max depth
+
+    # Driver analysis (standardized regression on the profiled covariance)
+    'driver_targets': [],  # Columns to explain; driver analysis is skipped without one
+    'driver_predictors': None,  # None = every other numeric column
+    'driver_max_predictors': 50,  # Most correlated with the target, if more
+    'driver_min_dof': 30,  # Min observations minus predictors
+    'driver_min_r_squared': 0.1,
+    'driver_top_k': 10,  # Drivers reported per target
+
+    # Clustering (mini-batch k-means on standardized numeric columns)
+    'cluster_max_columns': 20,  # Most complete columns, if more
+    'cluster_max_k': 8,
+    'cluster_sample_size': 10_000,  # Rows used to choose k
+    'cluster_batch_rows': 65_536,  # Rows per mini-batch
+    'cluster_epochs': 1,  # Mini-batch passes over the table
+    'cluster_min_rows': 100,  # Complete rows required
+    'cluster_min_gap': 0.1,  # Min silhouette gain over a Gaussian reference without clusters
+    'cluster_min_silhouette': 0.25,
+    'cluster_min_between_gain': 0.1,  # Min between-cluster variance share above the reference's
+    'cluster_top_columns': 3,  # Distinguishing columns reported per cluster
+
+    # Covariance matrix (profiling; streamed in slices)
+    'covariance_max_columns': 200,  # Tables with more numeric columns get no covariance
+    'covariance_chunk_cells': 5_000_000,  # Values per slice
+
+    # Missingness patterns (profiling; bit-packed null masks)
+    'missingness_max_patterns': 10,  # Most frequent patterns reported
+    'missingness_max_exact_patterns': 4096,  # Above this, co-missing counts use bitsets
+    'missingness_min_jaccard': 0.8,  # Min overlap for columns to count as missing together
+
+    # Pairwise screening
+    'progressive_screening': False,
+    'screening_initial_sample': 1000,
+    'screening_confidence': 0.99,
+    'screening_max_sample': 1_000_000,  # Rows ambiguous pairs may grow to; None = every row
+    'wide_mode': 'auto',
+    'wide_mode_min_columns': 200,
+    'wide_max_pairs': 2000,
+    'wide_screen_sample': 5000,
+    'wide_sketch_dim': 1024,
+    'wide_min_eta_squared': 0.01,
+
+    # Detector execution
+    'detector_workers': None,  # None = one thread per CPU core; 1 = serial
+    'detection_budget_seconds': None,  # Anytime scheduler budget; None = run to completion
+    'enabled_detectors': ['distribution', 'trend', 'panel_trend', 'seasonality', 'changepoint', 'anomaly', 'group', 'relationship', 'driver', 'subgroup', 'cluster'],
+    'detector_params': {},  # Per-detector settings overrides, keyed by detector name
+    'plugins_dir': None,  # None = the bundled plugins/ package
+    'plugin_isolation': True,
+    'plugin_timeout_seconds': 120,
+    'plugin_memory_limit_mb': 2048,
+
     # Optional features
     'enable_local_llm': False,
     'llm_model_path': None,
@@ -4,7 +4,6 @@ Handles CSV loading, schema inference, type fixing, PII scanning, and dialect de
 """
 
 import re
-import json
 import hashlib
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
@@ -13,6 +12,8 @@ from datetime import datetime
 import polars as pl
 import chardet
 
+from . import artifacts
+
 
 # PII Detection Patterns
 PII_PATTERNS = {
@@ -294,14 +295,29 @@ def load_csv(
 
 def save_schema(schema: Dict[str, Any], output_path: str) -> None:
     """
-    Save schema to JSON file.
+    Save schema to file.
+
+    A .json path writes a pretty-printed JSON export; any other path
+    (e.g. schema.cira) writes the compact binary artifact format.
 
     Args:
         schema: Schema dictionary
-        output_path: Path to output JSON file
+        output_path: Path to output file
+    """
+    artifacts.save(schema, output_path)
+
+
+def load_schema(input_path: str) -> Dict[str, Any]:
+    """
+    Load schema from a binary artifact or JSON file.
+
+    Args:
+        input_path: Path to schema file
+
+    Returns:
+        Schema dictionary
     """
-    with open(output_path, 'w') as f:
-        json.dump(schema, f, indent=2)
+    return artifacts.load(input_path)
 
 
 def compute_dataset_hash(df: pl.DataFrame) -> str:
@@ -0,0 +1,664 @@
+"""
+Anomaly Insight Detector
+Flags anomalous periods in time series data and groups them into events.
+
+Each measure is averaged per period of the time index cadence and scored
+against a trailing window of earlier periods: the rolling median is the
+expected value, and the rolling median of the periods' absolute
+deviations (a streaming MAD) sets the band width. Both are Polars
+rolling expressions over the period column, so a whole series is scored
+in one pass. Consecutive anomalous periods form events.
+
+The band assumes a roughly symmetric, normal-tailed measure, so skewed
+measures (amounts, durations, counts near zero) are scored after a
+Yeo-Johnson power transform of their distance from the lowest value
+(the highest, if skewed to the left). It is fitted once, on up to the
+first POWER_FIT_PERIODS periods, as soon as anomaly_min_history periods
+exist and so before any period can be flagged, and kept in the saved
+state. The rolling median maps back exactly; the band maps back
+asymmetrically.
+
+AnomalyMonitor keeps only the last window of periods, the open event
+and the events found so far. Its state can be saved after a run and
+resumed with new rows (anomaly_state_dir), so a daily refresh scores the
+new day against the stored window without reading the history again.
+"""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+import polars as pl
+import numpy as np
+from scipy import stats
+from .base import BaseDetector, Insight
+from .changepoints import _format_time
+from .clusters import POWER_IDENTITY_TOLERANCE
+from .trends import _parse_cadence
+
+
+# Scale factor turning a MAD into a normal-consistent standard deviation
+MAD_SCALE = 1.4826
+
+# Scale factor turning a mean absolute deviation into a standard deviation
+MEAN_AD_SCALE = 1.2533
+
+# Periods the power transform is fitted on, at most (the earliest ones)
+POWER_FIT_PERIODS = 10_000
+
+# Skewness (of values clipped to their 1st-99th percentiles) below which a measure is scored as it is
+POWER_MIN_SKEW = 0.25
+
+# Exponents in this range keep the transform unbounded both ways, so a spike of any size still maps to a large z
+POWER_RANGE = (0.0, 2.0)
+
+# No transform
+IDENTITY_POWER = {'lambda': 1.0, 'sign': 1.0, 'offset': 0.0, 'scale': 1.0}
+
+# Bump when the saved state layout changes
+STATE_VERSION = 2
+
+
+def _fit_power(values: np.ndarray) -> Dict[str, float]:
+    """
+    Fit a Yeo-Johnson exponent to skewed period values.
+
+    The transform is applied to the distance from the lowest value (from
+    the highest, mirrored, for left skew) divided by its 1% quantile
+    above zero, so it is close to a Box-Cox transform of that distance:
+    about log(x) for lognormal data and a cube root for exponential
+    data. Measures with little skew are left as they are; skew is judged
+    on values clipped to their 1st-99th percentiles, so a few spikes in
+    the fitted periods do not count.
+
+    Args:
+        values: Period values (NaN-free)
+
+    Returns:
+        Dict with lambda (1.0 = no transform), sign, offset and scale
+    """
+    skew = float(stats.skew(np.clip(values, *np.quantile(values, [0.01, 0.99])))) if len(values) > 2 else 0.0
+    if not abs(skew) >= POWER_MIN_SKEW:
+        return IDENTITY_POWER
+
+    sign = 1.0 if skew > 0 else -1.0
+    offset = float((sign * values).min())
+    distance = sign * values - offset
+    positive = distance[distance > 0]
+    if len(positive) == 0:
+        return IDENTITY_POWER
+
+    scale = float(np.quantile(positive, 0.01))
+    lam = float(np.clip(stats.yeojohnson_normmax(distance / scale), *POWER_RANGE))
+    if abs(lam - 1) < POWER_IDENTITY_TOLERANCE:
+        return IDENTITY_POWER
+
+    return {'lambda': lam, 'sign': sign, 'offset': offset, 'scale': scale}
+
+
+def _power_expr(value: pl.Expr, power: Optional[Dict[str, float]]) -> pl.Expr:
+    """Yeo-Johnson transform of a value expression (identity without a fitted exponent)"""
+    if power is None or power['lambda'] == 1.0:
+        return value
+
+    lam, sign = power['lambda'], power['sign']
+    t = (sign * value - power['offset']) / power['scale']
+    upper = ((t + 1).pow(lam) - 1) / lam if lam != 0 else t.log1p()
+    lower = -((1 - t).pow(2 - lam) - 1) / (2 - lam) if lam != 2 else -(-t).log1p()
+
+    return sign * pl.when(t >= 0).then(upper).otherwise(lower)
+
+
+def _power_inverse(y: Optional[float], power: Optional[Dict[str, float]]) -> Optional[float]:
+    """
+    Map a transformed value back to the measure's units.
+
+    Args:
+        y: Value on the transformed scale
+        power: Fitted transform, or None
+
+    Returns:
+        Value in original units
+    """
+    if power is None or power['lambda'] == 1.0 or y is None:
+        return y
+
+    lam, sign = power['lambda'], power['sign']
+    y = sign * y
+    with np.errstate(over='ignore'):
+        if y >= 0:
+            t = float(np.expm1(y)) if lam == 0 else float(np.power(1 + lam * y, 1 / lam)) - 1
+        else:
+            t = float(-np.expm1(-y)) if lam == 2 else 1 - float(np.power(1 - (2 - lam) * y, 1 / (2 - lam)))
+
+    return sign * (t * power['scale'] + power['offset'])
+
+
+def _time_from_us(us: int) -> str:
+    """Format an epoch-microsecond period start"""
+    return _format_time(datetime(1970, 1, 1) + timedelta(microseconds=int(us)))
+
+
+class AnomalyMonitor:
+    """
+    Rolling median/MAD anomaly scoring of one measure that can resume from saved state.
+
+    Usage:
+        monitor = AnomalyMonitor('sales', every_us, settings)
+        monitor.update(rows, 'date')          # any number of times, rows in time order
+        monitor.events()                      # closed and ongoing events
+        state = monitor.to_state()            # JSON-serializable
+        monitor = AnomalyMonitor.from_state(state, settings)
+    """
+
+    def __init__(self, measure: str, every_us: int, settings: Dict[str, Any]):
+        """
+        Initialize an empty monitor.
+
+        Args:
+            measure: Measure column
+            every_us: Period length in microseconds
+            settings: Settings dict ('anomaly_window', 'anomaly_threshold',
+                'anomaly_min_history', 'anomaly_max_gap', 'anomaly_max_events_kept')
+        """
+        self.measure = measure
+        self.every_us = int(every_us)
+        self.window = settings.get('anomaly_window', 48)
+        self.threshold = settings.get('anomaly_threshold', 3.5)
+        self.min_history = settings.get('anomaly_min_history', 24)
+        self.max_gap = settings.get('anomaly_max_gap', 1)
+        self.max_events = settings.get('anomaly_max_events_kept', 1000)
+
+        # Trailing periods (start, sum, count, deviation); the last one may still grow
+        self.tail = pl.DataFrame(
+            schema={'period': pl.Int64, 'sum': pl.Float64, 'count': pl.Int64, 'dev': pl.Float64}
+        )
+        self.power: Optional[Dict[str, float]] = None  # Yeo-Johnson fit, once min_history periods are seen
+        self.flagged: List[Dict[str, Any]] = []  # Anomalous periods not yet closed into an event
+        self.closed: List[Dict[str, Any]] = []
+        self.last_time: Optional[int] = None  # Latest raw timestamp seen (epoch us)
+        self.periods_seen = 0
+        self.rows_seen = 0
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        """Parameters a saved state must match to be resumed"""
+        return {
+            'measure': self.measure,
+            'every_us': self.every_us,
+            'window': self.window,
+            'threshold': self.threshold,
+            'min_history': self.min_history,
+            'max_gap': self.max_gap,
+        }
+
+    def update(self, frame: pl.DataFrame, time_col: str) -> int:
+        """
+        Score the periods touched by new rows.
+
+        Rows at or before the latest timestamp already seen are ignored,
+        so passing overlapping batches is safe.
+
+        Args:
+            frame: Rows with time_col and the measure
+            time_col: Time index column (date or datetime)
+
+        Returns:
+            Number of new rows used
+        """
+        W = self.window * self.every_us
+
+        rows = frame.select(
+            pl.col(time_col).dt.epoch('us').alias('time'),
+            pl.col(self.measure).cast(pl.Float64).fill_nan(None).alias('value'),
+        ).filter(pl.col('time').is_not_null())
+        if self.last_time is not None:
+            rows = rows.filter(pl.col('time') > self.last_time)
+        if len(rows) == 0:
+            return 0
+
+        totals = (
+            rows
+            .group_by((pl.col('time') // self.every_us * self.every_us).alias('period'))
+            .agg(pl.col('value').sum().alias('sum'), pl.col('value').count().cast(pl.Int64).alias('count'))
+            .with_columns(pl.lit(None, dtype=pl.Float64).alias('dev'))
+        )
+
+        boundary = self.tail['period'].max() if len(self.tail) else None
+        n_before = len(self.tail)
+
+        # New rows in the last stored period add to its totals
+        combined = (
+            pl.concat([self.tail, totals])
+            .group_by('period')
+            .agg(pl.col('sum').sum(), pl.col('count').sum(), pl.col('dev').first())
+            .sort('period')
+            .with_columns(pl.col('period').set_sorted())
+        )
+        value = pl.when(pl.col('count') > 0).then(pl.col('sum') / pl.col('count'))
+
+        # Fix the transform once min_history periods exist, before any can be flagged;
+        # deviations stored so far are redone on its scale
+        if self.power is None:
+            values = combined.select(value.fill_nan(None).drop_nulls()).to_series()
+            if len(values) >= self.min_history:
+                self.power = _fit_power(values.head(POWER_FIT_PERIODS).to_numpy())
+                combined = combined.with_columns(pl.lit(None, dtype=pl.Float64).alias('dev'))
+
+        rescore = pl.col('dev').is_null()
+
+        window = f"{W}i"
+        scored = (
+            combined
+            .with_columns(value.alias('value'))
+            .with_columns(_power_expr(pl.col('value'), self.power).alias('level'))
+            .with_columns(
+                pl.col('level').rolling_median_by('period', window, closed='left').alias('expected'),
+                pl.col('level').is_not_null().cast(pl.Int64).rolling_sum_by('period', window, closed='left').alias('history'),
+                rescore.alias('rescore'),
+            )
+            .with_columns(pl.coalesce('dev', (pl.col('level') - pl.col('expected')).abs()).alias('dev'))
+            .with_columns(
+                pl.col('dev').rolling_median_by('period', window, closed='left').alias('mad'),
+                pl.col('dev').rolling_mean_by('period', window, closed='left').alias('mean_ad'),
+            )
+            .with_columns(
+                pl.when(pl.col('mad') > 0)
+                .then(pl.col('mad') * MAD_SCALE)
+                .otherwise(pl.col('mean_ad') * MEAN_AD_SCALE)
+                .alias('scale')
+            )
+            .with_columns(
+                pl.when(pl.col('scale') > 0)
+                .then((pl.col('level') - pl.col('expected')) / pl.col('scale'))
+                .alias('z')
+            )
+        )
+
+        new = scored.filter(pl.col('rescore'))
+        anomalous = new.filter(
+            (pl.col('history') >= self.min_history) & (pl.col('z').abs() > self.threshold)
+        )
+
+        # The re-scored boundary period replaces its earlier verdict
+        if boundary is not None:
+            self.flagged = [p for p in self.flagged if p['period'] < boundary]
+        self.flagged.extend(
+            {
+                'period': row['period'],
+                'value': row['value'],
+                'expected': _power_inverse(row['expected'], self.power),
+                'band_lower': _power_inverse(row['expected'] - self.threshold * row['scale'], self.power),
+                'band_upper': _power_inverse(row['expected'] + self.threshold * row['scale'], self.power),
+                'z': row['z'],
+            }
+            for row in anomalous.select('period', 'value', 'expected', 'scale', 'z').iter_rows(named=True)
+        )
+
+        last_period = int(scored['period'][-1])
+        self.tail = (
+            scored
+            .filter(pl.col('period') >= last_period - W)
+            .select(
+                'period', 'sum', 'count',
+                pl.when(pl.col('period') == last_period).then(None).otherwise(pl.col('dev')).alias('dev'),
+            )
+        )
+        self.last_time = int(rows['time'].max())
+        self.periods_seen += len(combined) - n_before
+        self.rows_seen += len(rows)
+        self._close_events(last_period)
+
+        return len(rows)
+
+    def _close_events(self, last_period: int) -> None:
+        """
+        Group flagged periods into events and close those that have ended.
+
+        Args:
+            last_period: Start of the latest period scored
+        """
+        step = self.every_us * (self.max_gap + 1)
+        groups: List[List[Dict[str, Any]]] = []
+        for period in sorted(self.flagged, key=lambda p: p['period']):
+            if groups and period['period'] - groups[-1][-1]['period'] <= step:
+                groups[-1].append(period)
+            else:
+                groups.append([period])
+
+        open_periods = []
+        for group in groups:
+            if last_period - group[-1]['period'] <= self.every_us * self.max_gap:
+                open_periods.extend(group)
+            else:
+                self.closed.append(self._event(group, ongoing=False))
+
+        self.flagged = open_periods
+
+        # Beyond the cap, keep the most extreme events
+        if len(self.closed) > self.max_events:
+            largest = sorted(self.closed, key=lambda e: abs(e['peak_z']), reverse=True)[:self.max_events]
+            self.closed = sorted(largest, key=lambda e: e['start_us'])
+
+    def _event(self, periods: List[Dict[str, Any]], ongoing: bool) -> Dict[str, Any]:
+        """
+        Describe an event from its anomalous periods.
+
+        Args:
+            periods: Anomalous periods, in time order
+            ongoing: Whether the event reaches the latest periods
+
+        Returns:
+            Event dict
+        """
+        peak = max(periods, key=lambda p: abs(p['z']))
+
+        return {
+            'start': _time_from_us(periods[0]['period']),
+            'end': _time_from_us(periods[-1]['period']),
+            'start_us': periods[0]['period'],
+            'end_us': periods[-1]['period'],
+            'n_periods': len(periods),
+            'peak_at': _time_from_us(peak['period']),
+            'peak_value': peak['value'],
+            'expected': peak['expected'],
+            'band_lower': peak['band_lower'],
+            'band_upper': peak['band_upper'],
+            'peak_z': peak['z'],
+            'direction': 'high' if peak['z'] > 0 else 'low',
+            'ongoing': ongoing,
+        }
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Closed events plus any ongoing one, in time order"""
+        ongoing = [self._event(self.flagged, ongoing=True)] if self.flagged else []
+        return self.closed + ongoing
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serializable state for resuming later"""
+        return {
+            'version': STATE_VERSION,
+            'params': self.params,
+            'tail': self.tail.to_dict(as_series=False),
+            'power': self.power,
+            'flagged': self.flagged,
+            'closed': self.closed,
+            'last_time': self.last_time,
+            'periods_seen': self.periods_seen,
+            'rows_seen': self.rows_seen,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any], settings: Dict[str, Any]) -> Optional['AnomalyMonitor']:
+        """
+        Resume a monitor from saved state.
+
+        Args:
+            state: Dict from to_state()
+            settings: Settings dict
+
+        Returns:
+            AnomalyMonitor, or None if the state was saved with other parameters
+        """
+        params = state.get('params', {})
+        monitor = cls(params.get('measure', ''), params.get('every_us', 1), settings)
+
+        if state.get('version') != STATE_VERSION or monitor.params != params:
+            return None
+
+        monitor.tail = pl.DataFrame(state['tail'], schema=monitor.tail.schema)
+        monitor.power = state['power']
+        monitor.flagged = state['flagged']
+        monitor.closed = state['closed']
+        monitor.last_time = state['last_time']
+        monitor.periods_seen = state['periods_seen']
+        monitor.rows_seen = state['rows_seen']
+
+        return monitor
+
+
+class AnomalyDetector(BaseDetector):
+    """
+    Detects anomalous periods using rolling median/MAD bands.
+    """
+
+    name = 'anomaly'
+    id_prefix = 'A'
+
+    def plan(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[tuple]:
+        """
+        List measures to monitor along the time index.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+
+        Returns:
+            List of (time_col, measure, period length in microseconds) items
+        """
+        time_index_info = profile.get('time_index')
+        if not time_index_info:
+            return []
+
+        time_col = time_index_info['column']
+
+        numeric_cols = [
+            col['normalized_name']
+            for col in schema['columns']
+            if col['type'] in ['int', 'float'] and col['normalized_name'] != time_col
+        ]
+
+        if not numeric_cols:
+            return []
+
+        # The cadence, widened so the series has at most anomaly_max_periods periods
+        bounds = df.select(
+            pl.col(time_col).dt.epoch('us').min().alias('first'),
+            pl.col(time_col).dt.epoch('us').max().alias('last'),
+        ).row(0)
+        if bounds[0] is None:
+            return []
+
+        every_us = max(
+            _parse_cadence(time_index_info.get('typical_cadence')),
+            -(-(bounds[1] - bounds[0]) // self.settings.get('anomaly_max_periods', 1_000_000)),
+            1,
+        )
+
+        return [(time_col, measure, every_us) for measure in numeric_cols]
+
+    def estimate(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Tuple[float, float]:
+        """
+        Expected value and cost of monitoring one measure.
+
+        The value assumes prior_effect over all rows; the cost is a few
+        rolling passes over the rows.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, measure, period length) from plan()
+
+        Returns:
+            Tuple of (expected quality score, estimated cost)
+        """
+        n = len(df)
+        missingness = profile['missingness'][item[1]]['fraction']
+
+        value = self.compute_quality_score(n, self.prior_effect, missingness)
+        cost = n * np.log2(max(self.settings.get('anomaly_window', 48), 2))
+
+        return value, float(max(cost, 1))
+
+    def item_columns(self, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[str]:
+        """Time and measure columns"""
+        return [item[0], item[1]]
+
+    def detect_item(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[Insight]:
+        """
+        Detect anomaly insights for one measure.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, measure, period length) from plan()
+
+        Returns:
+            List of detected Insight objects, in time order
+        """
+        return self.select(df, schema, profile, item, self.candidates(df, schema, profile, item))
+
+    def _state_path(self, item: tuple) -> Optional[Path]:
+        """State file of one measure, if anomaly_state_dir is set"""
+        state_dir = self.settings.get('anomaly_state_dir')
+        if not state_dir:
+            return None
+        time_col, measure, _ = item
+        return Path(state_dir) / f"{time_col}__{measure}.json"
+
+    def candidates(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Score one measure's periods and group anomalies into events.
+
+        With anomaly_state_dir set, the saved monitor is resumed and only
+        rows after its latest timestamp are read; the updated state is
+        saved again.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, measure, period length) from plan()
+
+        Returns:
+            Dict with events, periods_seen, rows_scored and resumed
+        """
+        time_col, measure, every_us = item
+        path = self._state_path(item)
+
+        monitor = None
+        if path is not None and path.exists():
+            monitor = AnomalyMonitor.from_state(json.loads(path.read_text()), self.settings)
+        resumed = monitor is not None
+        if monitor is None:
+            monitor = AnomalyMonitor(measure, every_us, self.settings)
+
+        rows = df.select(time_col, measure)
+        if monitor.last_time is not None:
+            rows = rows.filter(pl.col(time_col).dt.epoch('us') > monitor.last_time)
+
+        rows_scored = monitor.update(rows, time_col)
+
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(monitor.to_state()))
+
+        return {
+            'events': monitor.events(),
+            'periods_seen': monitor.periods_seen,
+            'rows_scored': rows_scored,
+            'resumed': resumed,
+            'every': str(timedelta(microseconds=monitor.every_us)),
+            'power_lambda': monitor.power['lambda'] if monitor.power else 1.0,
+        }
+
+    def select(
+        self,
+        df: pl.DataFrame,
+        schema: Dict[str, Any],
+        profile: Dict[str, Any],
+        item: tuple,
+        candidates: Optional[Dict[str, Any]],
+    ) -> List[Insight]:
+        """
+        Report a measure's most extreme anomaly events.
+
+        Events must clear a Bonferroni cut for the number of periods
+        scored, so long series do not report noise. Robust z-scores from a
+        short window have heavier tails than the normal, so the cut uses a
+        t distribution with half the window as degrees of freedom. Quality
+        grows with the excess over that cut, so a marginal exceedance
+        scores low.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, measure, period length) from plan()
+            candidates: Events from candidates()
+
+        Returns:
+            List of detected Insight objects, in time order
+        """
+        insights = []
+
+        if candidates is None or not candidates['events']:
+            return insights
+
+        time_col, measure, _ = item
+        max_events = self.settings.get('anomaly_max_events', 5)
+        threshold = self.settings.get('anomaly_threshold', 3.5)
+        window = self.settings.get('anomaly_window', 48)
+
+        dof = max(window // 2, 1)
+        periods = max(candidates['periods_seen'], 1)
+        critical_z = max(threshold, float(stats.t.isf(0.025 / periods, dof)))
+
+        events = [e for e in candidates['events'] if abs(e['peak_z']) >= critical_z]
+        events = sorted(events, key=lambda e: abs(e['peak_z']), reverse=True)[:max_events]
+
+        for event in sorted(events, key=lambda e: e['start_us']):
+            high = event['direction'] == 'high'
+
+            if event['n_periods'] == 1:
+                title = f"{measure} {'spiked' if high else 'dropped'} at {event['start']}"
+            else:
+                title = f"{measure} was unusually {event['direction']} from {event['start']} to {event['end']}"
+
+            caveats = [
+                f"Expected values are the median of the previous {window} periods of {candidates['every']}.",
+                'Anomalies flag unusual values, not their cause; check for data errors first.',
+            ]
+            if event['ongoing']:
+                caveats.append('The event continues into the latest data.')
+            if candidates['power_lambda'] != 1.0:
+                caveats.append(
+                    f"{measure} is skewed, so periods were scored after a power transform "
+                    f"(λ={candidates['power_lambda']:.2f}); the band is asymmetric."
+                )
+
+            p_value = min(1.0, float(2 * stats.t.sf(abs(event['peak_z']), dof)) * periods)
+
+            insights.append(Insight(
+                id='',
+                title=title,
+                rationale=(
+                    f"At {event['peak_at']}, {measure} was {event['peak_value']:.4g} against an expected "
+                    f"{event['expected']:.4g} (band {event['band_lower']:.4g} to {event['band_upper']:.4g}, "
+                    f"robust z={event['peak_z']:.1f})."
+                ),
+                primary_columns=[time_col, measure],
+                statistics={
+                    **{k: v for k, v in event.items() if not k.endswith('_us')},
+                    'p_value_adjusted': p_value,
+                    'threshold': threshold,
+                    'critical_z': critical_z,
+                    'window_periods': window,
+                    'every': candidates['every'],
+                    'periods_seen': candidates['periods_seen'],
+                    'power_lambda': candidates['power_lambda'],
+                },
+                quality_score=self.compute_quality_score(
+                    candidates['periods_seen'],
+                    (abs(event['peak_z']) - critical_z) / critical_z,
+                    profile['missingness'][measure]['fraction'],
+                ),
+                suggested_visuals=['line_with_band', 'line'],
+                caveats=caveats,
+                detector_type='anomaly',
+            ))
+
+        return insights
@@ -2,11 +2,11 @@
 Base classes for insight detectors.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Insight:
     """
     Represents a single insight detected from the data.
@@ -43,8 +43,22 @@ class Insight:
 class BaseDetector:
     """
     Base class for all insight detectors.
+
+    Detectors split their work into independent items: plan() lists them
+    and detect_item() turns one item into insights. Items may run in any
+    order or concurrently; assign_ids() numbers the insights afterwards
+    in plan order, so IDs do not depend on scheduling.
     """
 
+    # Detector name used in timings and settings
+    name = 'base'
+
+    # Letter prefix of insight IDs (e.g. 'D' gives D001, D002, ...)
+    id_prefix = 'X'
+
+    # Effect size assumed by estimate() when the profile has no screening stat
+    prior_effect = 0.2
+
     def __init__(self, settings: Dict[str, Any]):
         """
         Initialize detector with settings.
@@ -54,6 +68,134 @@ class BaseDetector:
         """
         self.settings = settings
 
+    def plan(self, df, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[Any]:
+        """
+        List the independent work items of this detector.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+
+        Returns:
+            List of work items (e.g. columns or column pairs)
+        """
+        return [None]
+
+    def detect_item(self, df, schema: Dict[str, Any], profile: Dict[str, Any], item: Any) -> List[Insight]:
+        """
+        Detect insights for a single work item.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: Work item from plan()
+
+        Returns:
+            List of Insight objects (IDs are assigned later)
+        """
+        raise NotImplementedError("Subclasses must implement detect_item() or detect()")
+
+    def candidates(self, df, schema: Dict[str, Any], profile: Dict[str, Any], item: Any) -> Any:
+        """
+        Threshold-free statistics of a work item: the part that reads the data.
+
+        Detectors that split detection override this and select(), so a
+        threshold change re-runs only select() on cached candidates. The
+        default treats all of detect_item() as data work.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: Work item from plan()
+
+        Returns:
+            Candidate statistics passed to select()
+        """
+        return self.detect_item(df, schema, profile, item)
+
+    def select(self, df, schema: Dict[str, Any], profile: Dict[str, Any], item: Any, candidates: Any) -> List[Insight]:
+        """
+        Apply thresholds to candidate statistics, without reading the data.
+
+        Args:
+            df: Input DataFrame (for its shape only)
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: Work item from plan()
+            candidates: Result of candidates()
+
+        Returns:
+            List of Insight objects (IDs are assigned later)
+        """
+        return list(candidates)
+
+    def item_key(self, item: Any) -> str:
+        """
+        Stable identity of a work item across runs, for caching candidates.
+
+        Args:
+            item: Work item from plan()
+
+        Returns:
+            Key string
+        """
+        return repr(item)
+
+    def item_columns(self, schema: Dict[str, Any], profile: Dict[str, Any], item: Any) -> Optional[List[str]]:
+        """
+        Data columns a work item's candidates() reads.
+
+        Args:
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: Work item from plan()
+
+        Returns:
+            Column names, or None if it may read any column
+        """
+        return None
+
+    def estimate(self, df, schema: Dict[str, Any], profile: Dict[str, Any], item: Any) -> Tuple[float, float]:
+        """
+        Expected value and cost of a work item, for anytime scheduling.
+
+        Value is the quality score the item's best insight is expected to
+        reach; cost is a rough count of row operations. The default assumes
+        a prior_effect-sized effect at the cost of one pass over the rows.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: Work item from plan()
+
+        Returns:
+            Tuple of (expected quality score, estimated cost)
+        """
+        return self.compute_quality_score(len(df), self.prior_effect, 0.0), float(max(len(df), 1))
+
+    def assign_ids(self, item_results: List[List[Insight]], offset: int = 0) -> List[Insight]:
+        """
+        Flatten per-item results in plan order and number them.
+
+        Args:
+            item_results: detect_item() results, one list per planned item
+            offset: Insights already numbered in earlier items (for
+                numbering a run incrementally)
+
+        Returns:
+            List of Insight objects with sequential IDs
+        """
+        insights = [insight for result in item_results for insight in result]
+
+        for counter, insight in enumerate(insights, start=offset + 1):
+            insight.id = f"{self.id_prefix}{counter:03d}"
+
+        return insights
+
     def detect(self, df, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[Insight]:
         """
         Detect insights from the data.
@@ -66,7 +208,8 @@ class BaseDetector:
         Returns:
             List of detected Insight objects
         """
-        raise NotImplementedError("Subclasses must implement detect()")
+        items = self.plan(df, schema, profile)
+        return self.assign_ids([self.detect_item(df, schema, profile, item) for item in items])
 
     def compute_quality_score(
         self,
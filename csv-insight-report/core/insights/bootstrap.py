@@ -0,0 +1,629 @@
+"""
+Bootstrap Confidence Intervals
+Percentile intervals for the effect sizes of surfaced insights.
+
+Resamples are drawn as one (resamples x n) index matrix per batch and
+turned into a matrix of row counts, so sums over every resample are one
+matrix product and ranks within every resample are running sums of the
+counts along the sorted rows; thousands of resamples cost a few array
+operations. Group effects resample within each group (group sizes stay
+fixed); contingency tables are resampled as multinomial cell counts,
+which is equivalent to resampling rows at any n.
+
+Each insight draws from its own generator seeded with the recipe seed
+and a hash of its columns, so intervals are reproducible whatever the
+ranking, the worker count or the order in which insights finish.
+"""
+
+import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Optional, Tuple
+import numpy as np
+import polars as pl
+from .trends import TrendDetector, _parse_cadence
+
+
+# Recipe seed (see provenance.save_recipe)
+BOOTSTRAP_SEED = 42
+
+# Max values (resamples x rows) drawn together in one batch
+BOOTSTRAP_BATCH_CELLS = 4_000_000
+
+
+def seeded_rng(key: str) -> np.random.Generator:
+    """
+    Generator seeded with the recipe seed and a key, reproducible per key.
+
+    Args:
+        key: Identity of the resampled quantity (e.g. its columns)
+
+    Returns:
+        Seeded NumPy generator
+    """
+    return np.random.default_rng([BOOTSTRAP_SEED, zlib.crc32(key.encode('utf-8'))])
+
+
+def _rng(insight: Dict[str, Any]) -> np.random.Generator:
+    """
+    Generator for one insight, independent of its ID and rank.
+
+    Args:
+        insight: Insight dict
+
+    Returns:
+        Seeded NumPy generator
+    """
+    return seeded_rng('|'.join([insight['detector_type']] + list(insight['primary_columns'])))
+
+
+def _batches(resamples: int, n: int) -> List[Tuple[int, int]]:
+    """
+    Split resamples into batches of at most BOOTSTRAP_BATCH_CELLS drawn values.
+
+    Args:
+        resamples: Number of resamples
+        n: Values drawn per resample
+
+    Returns:
+        List of (start, stop) resample ranges
+    """
+    size = max(1, BOOTSTRAP_BATCH_CELLS // max(n, 1))
+    return [(start, min(start + size, resamples)) for start in range(0, resamples, size)]
+
+
+def resample_counts(rng: np.random.Generator, n: int, resamples: int) -> np.ndarray:
+    """
+    Draw bootstrap resamples as a matrix of row counts.
+
+    Row indices are drawn as one (resamples x n) matrix and turned into
+    how often each row appears in each resample, so that sums over a
+    resample become one matrix product.
+
+    Args:
+        rng: Random generator
+        n: Rows in the sample
+        resamples: Number of resamples (keep resamples x n within BOOTSTRAP_BATCH_CELLS)
+
+    Returns:
+        Float array (resamples x n) of counts; each row sums to n
+    """
+    index = rng.integers(0, n, size=(resamples, n))
+    index += np.arange(resamples)[:, None] * n
+
+    return np.bincount(index.ravel(), minlength=resamples * n).reshape(resamples, n).astype(np.float64)
+
+
+def resample_statistic(
+    statistic: Callable[..., np.ndarray],
+    columns: List[np.ndarray],
+    rng: np.random.Generator,
+    resamples: int,
+) -> np.ndarray:
+    """
+    Bootstrap distribution of a statistic of paired columns.
+
+    Args:
+        statistic: Function of (counts matrix, *columns) returning one
+            value per resample (row of counts)
+        columns: Equal-length 1-D arrays, resampled by the same rows
+        rng: Random generator
+        resamples: Number of resamples
+
+    Returns:
+        Array of resampled statistic values
+    """
+    n = len(columns[0])
+    values = np.empty(resamples)
+
+    for start, stop in _batches(resamples, n):
+        values[start:stop] = statistic(resample_counts(rng, n, stop - start), *columns)
+
+    return values
+
+
+def _weighted_pearson(weights: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlation of resamples given as row counts.
+
+    Args:
+        weights: Counts (resamples x n)
+        x: Values (n,) or per-resample values (resamples x n)
+        y: Values (n,) or per-resample values (resamples x n)
+
+    Returns:
+        Correlation per resample (NaN for constant resamples)
+    """
+    n = weights.sum(axis=1)
+
+    if x.ndim == 1 and y.ndim == 1:
+        sums = weights @ np.column_stack([x, y, x * x, y * y, x * y])
+        sx, sy, sxx, syy, sxy = sums.T
+    else:
+        x, y = np.broadcast_to(x, weights.shape), np.broadcast_to(y, weights.shape)
+        wx, wy = weights * x, weights * y
+        sx, sy = wx.sum(axis=1), wy.sum(axis=1)
+        sxx = np.einsum('ij,ij->i', wx, x)
+        syy = np.einsum('ij,ij->i', wy, y)
+        sxy = np.einsum('ij,ij->i', wx, y)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r = (sxy - sx * sy / n) / np.sqrt((sxx - sx * sx / n) * (syy - sy * sy / n))
+
+    return np.clip(r, -1.0, 1.0)
+
+
+def _pearson(weights: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Pearson correlation per resample (columns standardized for stable sums)"""
+    return _weighted_pearson(weights, (x - x.mean()) / (x.std() or 1.0), (y - y.mean()) / (y.std() or 1.0))
+
+
+def _resample_ranks(weights: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Average ranks of every row within every resample, without sorting resamples.
+
+    With the rows in sorted order, a row's rank within a resample is the
+    count of resampled rows before its tie block plus (copies in the
+    block + 1) / 2, i.e. a running sum of the counts. Already sorted
+    values (e.g. a time axis) skip the column permutations.
+
+    Args:
+        weights: Counts (resamples x n)
+        x: Values (n,)
+
+    Returns:
+        Float array (resamples x n) of ranks, in the original row order
+    """
+    order = None if np.all(x[1:] >= x[:-1]) else np.argsort(x, kind='stable')
+    ordered = x if order is None else x[order]
+    counts = weights if order is None else np.take(weights, order, axis=1)
+
+    ranks = np.cumsum(counts, axis=1)
+    starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+
+    if len(starts) == len(x):
+        # No ties: a row's copies sit right before the running count
+        ranks -= 0.5 * counts
+        ranks += 0.5
+    else:
+        ends = np.r_[starts[1:], len(x)] - 1
+        before = ranks[:, starts] - counts[:, starts]
+        block_ranks = before + (ranks[:, ends] - before + 1) / 2.0
+        ranks = np.repeat(block_ranks, np.diff(np.r_[starts, len(x)]), axis=1)
+
+    if order is None:
+        return ranks
+
+    return np.take(ranks, np.argsort(order), axis=1)
+
+
+def _spearman(weights: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Spearman correlation per resample (average ranks for ties)"""
+    return _weighted_pearson(weights, _resample_ranks(weights, x), _resample_ranks(weights, y))
+
+
+def resample_group_sums(
+    x: np.ndarray,
+    rng: np.random.Generator,
+    resamples: int,
+    max_rows: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bootstrap distribution of a group's sum and sum of squares.
+
+    Groups of up to max_rows rows are resampled directly. For larger
+    groups the pair (sum, sum of squares) of a resample is drawn from its
+    normal limit, whose mean and covariance follow exactly from the
+    group's first four moments.
+
+    Args:
+        x: Group values (standardized, no NaN)
+        rng: Random generator
+        resamples: Number of resamples
+        max_rows: Largest group resampled row by row
+
+    Returns:
+        Tuple of (sums, sums of squares), one value per resample
+    """
+    n = len(x)
+    moments = np.column_stack([x, x * x])
+
+    if n <= max_rows:
+        sums = np.vstack([
+            resample_counts(rng, n, stop - start) @ moments
+            for start, stop in _batches(resamples, n)
+        ])
+        return sums[:, 0], sums[:, 1]
+
+    draws = rng.multivariate_normal(n * moments.mean(axis=0), n * np.cov(moments.T, bias=True), size=resamples)
+
+    return draws[:, 0], draws[:, 1]
+
+
+def _cohens_d(n1: int, s1: np.ndarray, q1: np.ndarray, n2: int, s2: np.ndarray, q2: np.ndarray) -> np.ndarray:
+    """
+    Cohen's d from group sums, with the pooled SD used by GroupDetector.
+
+    Args:
+        n1, s1, q1: Size, sums and sums of squares of the first group
+        n2, s2, q2: Size, sums and sums of squares of the second group
+
+    Returns:
+        Cohen's d per resample
+    """
+    m1, m2 = s1 / n1, s2 / n2
+    ss1, ss2 = q1 - s1 * m1, q2 - s2 * m2
+
+    # GroupDetector pools ddof=0 SDs with (n - 1) weights
+    pooled = np.sqrt(((n1 - 1) * ss1 / n1 + (n2 - 1) * ss2 / n2) / (n1 + n2 - 2))
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(pooled > 0, (m1 - m2) / pooled, 0.0)
+
+
+def _eta_squared(sizes: np.ndarray, sums: np.ndarray, squares: np.ndarray) -> np.ndarray:
+    """
+    Eta-squared from group sums.
+
+    Args:
+        sizes: Group sizes (groups,)
+        sums: Sums (groups x resamples)
+        squares: Sums of squares (groups x resamples)
+
+    Returns:
+        Eta-squared per resample
+    """
+    n_total = sizes.sum()
+    grand = sums.sum(axis=0) / n_total
+    ss_between = (sums ** 2 / sizes[:, None]).sum(axis=0) - n_total * grand ** 2
+    ss_total = squares.sum(axis=0) - n_total * grand ** 2
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(ss_total > 0, np.clip(ss_between / ss_total, 0.0, 1.0), 0.0)
+
+
+def _cramers_v(counts: np.ndarray, yates: bool) -> np.ndarray:
+    """
+    Cramér's V of many contingency tables, as computed by the profile.
+
+    Rows and columns that are empty in a resample are left out, as they
+    would be from its observed table.
+
+    Args:
+        counts: Cell counts (resamples x rows x columns)
+        yates: Apply Yates' continuity correction (2 x 2 tables, as scipy does)
+
+    Returns:
+        Cramér's V per resample
+    """
+    n = counts.sum(axis=(1, 2)).astype(np.float64)
+    row_totals = counts.sum(axis=2)
+    col_totals = counts.sum(axis=1)
+    expected = row_totals[:, :, None] * col_totals[:, None, :] / n[:, None, None]
+
+    diff = np.abs(counts - expected)
+    if yates:
+        diff = diff - np.minimum(0.5, diff)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        chi2 = np.where(expected > 0, diff ** 2 / expected, 0.0).sum(axis=(1, 2))
+        min_dim = np.minimum((row_totals > 0).sum(axis=1), (col_totals > 0).sum(axis=1))
+        v = np.sqrt(chi2 / (n * (min_dim - 1)))
+
+    return np.where(min_dim > 1, np.clip(v, 0.0, 1.0), 0.0)
+
+
+class BootstrapIntervals:
+    """
+    Computes bootstrap confidence intervals for insight dicts.
+
+    Usage:
+        BootstrapIntervals(df, profile, settings).add(insights)
+    """
+
+    def __init__(self, df: pl.DataFrame, profile: Optional[Dict[str, Any]], settings: Dict[str, Any]):
+        """
+        Initialize the engine.
+
+        Args:
+            df: Input DataFrame
+            profile: Profile dict from profiling
+            settings: Settings dict from config
+        """
+        self.df = df
+        self.profile = profile or {}
+        self.settings = settings
+        self.resamples = int(settings.get('bootstrap_resamples', 1000) or 0)
+        self.level = settings.get('bootstrap_confidence', 0.95)
+        self.max_rows = settings.get('bootstrap_max_rows', 5000)
+
+    def add(self, insights: List[Dict[str, Any]]) -> None:
+        """
+        Add intervals to the statistics of insight dicts, in place.
+
+        For each supported statistic S, 'S_ci_lower' and 'S_ci_upper' are
+        added, plus a 'bootstrap' dict describing the resampling.
+        Insights run on a thread pool; NumPy releases the GIL in the
+        heavy kernels.
+
+        Args:
+            insights: Insight dicts (e.g. the top insights)
+        """
+        if self.resamples <= 0 or not insights:
+            return
+
+        workers = self.settings.get('detector_workers') or os.cpu_count() or 1
+
+        if workers > 1 and len(insights) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self.intervals, insights))
+        else:
+            results = [self.intervals(insight) for insight in insights]
+
+        for insight, result in zip(insights, results):
+            if result is None:
+                continue
+            intervals, rows = result
+            for name, (lower, upper) in intervals.items():
+                insight['statistics'][f"{name}_ci_lower"] = lower
+                insight['statistics'][f"{name}_ci_upper"] = upper
+            insight['statistics']['bootstrap'] = {
+                'method': 'percentile',
+                'confidence': self.level,
+                'resamples': self.resamples,
+                'seed': BOOTSTRAP_SEED,
+                'rows': rows,
+            }
+
+    def intervals(self, insight: Dict[str, Any]) -> Optional[Tuple[Dict[str, Tuple[float, float]], int]]:
+        """
+        Intervals for one insight.
+
+        Args:
+            insight: Insight dict
+
+        Returns:
+            Tuple of (statistic name -> (lower, upper), rows resampled), or
+            None if the insight has no supported effect size
+        """
+        stats = insight['statistics']
+        detector_type = insight['detector_type']
+
+        if detector_type == 'group' and ('cohens_d' in stats or 'eta_squared' in stats):
+            return self._group(insight)
+        if detector_type == 'relationship' and 'pearson_r' in stats:
+            return self._correlation(insight)
+        if detector_type == 'relationship' and 'cramers_v' in stats:
+            return self._association(insight)
+        if detector_type == 'trend' and 'spearman_r' in stats:
+            return self._trend(insight)
+
+        return None
+
+    def _interval(self, values: np.ndarray) -> Tuple[float, float]:
+        """
+        Percentile interval of a bootstrap distribution.
+
+        Args:
+            values: Resampled statistic values
+
+        Returns:
+            Tuple of (lower, upper)
+        """
+        alpha = 1 - self.level
+        lower, upper = np.nanquantile(values, [alpha / 2, 1 - alpha / 2])
+        return float(lower), float(upper)
+
+    def _paired(
+        self,
+        insight: Dict[str, Any],
+        columns: List[np.ndarray],
+        statistics: Dict[str, Callable[..., np.ndarray]],
+        n_reported: int,
+    ) -> Tuple[Dict[str, Tuple[float, float]], int]:
+        """
+        Intervals for statistics of paired columns (correlations).
+
+        Above bootstrap_max_rows rows, an m-out-of-n bootstrap is used: a
+        subsample of m rows is resampled and the spread of the resampled
+        values around the subsample estimate is scaled by sqrt(m / n),
+        where n is the sample size behind the reported estimate.
+
+        Args:
+            insight: Insight dict
+            columns: Equal-length 1-D arrays (no NaN)
+            statistics: Statistic name -> function of (counts, *columns)
+            n_reported: Sample size of the reported estimates
+
+        Returns:
+            Tuple of (intervals, rows resampled)
+        """
+        rng = _rng(insight)
+        n = len(columns[0])
+        subsampled = n > self.max_rows
+
+        if subsampled:
+            keep = np.sort(rng.choice(n, size=self.max_rows, replace=False))
+            columns = [column[keep] for column in columns]
+
+        # Rows in order of the first column, so its resample ranks need no permutation
+        order = np.argsort(columns[0], kind='stable')
+        columns = [column[order] for column in columns]
+
+        m = len(columns[0])
+        intervals = {}
+
+        for name, statistic in statistics.items():
+            values = resample_statistic(statistic, columns, rng, self.resamples)
+
+            if subsampled:
+                estimate = float(statistic(np.ones((1, m)), *columns)[0])
+                scale = np.sqrt(m / max(n_reported, m))
+                values = insight['statistics'][name] + scale * (values - estimate)
+
+            lower, upper = self._interval(np.clip(values, -1.0, 1.0))
+            intervals[name] = (lower, upper)
+
+        return intervals, m
+
+    def _correlation(self, insight: Dict[str, Any]) -> Tuple[Dict[str, Tuple[float, float]], int]:
+        """Pearson and Spearman intervals of a correlated pair"""
+        col1, col2 = insight['primary_columns']
+        pairs = self.df.select(
+            pl.col(col1).cast(pl.Float64), pl.col(col2).cast(pl.Float64)
+        ).drop_nulls().drop_nans()
+
+        return self._paired(
+            insight,
+            [pairs[col1].to_numpy(), pairs[col2].to_numpy()],
+            {'pearson_r': _pearson, 'spearman_r': _spearman},
+            insight['statistics']['n'],
+        )
+
+    def _trend(self, insight: Dict[str, Any]) -> Tuple[Dict[str, Tuple[float, float]], int]:
+        """
+        Spearman interval of a trend, resampling (time, value) pairs.
+
+        The series is rebuilt as TrendDetector tested it, including the
+        per-period averages of resampled series.
+        """
+        time_col, measure_col = insight['primary_columns']
+        stats = insight['statistics']
+
+        frame = self.df.select(
+            pl.col(time_col), pl.col(measure_col).cast(pl.Float64)
+        ).filter(pl.col(time_col).is_not_null()).sort(time_col)
+
+        resampled = stats.get('resampled')
+        if resampled:
+            every_us = max(_parse_cadence(resampled['every']), 1)
+            frame = frame.group_by_dynamic(time_col, every=f"{every_us}us").agg(pl.col(measure_col).mean())
+
+        epoch = pl.col(time_col).dt.epoch('us')
+        series = frame.select(
+            ((epoch - epoch.first()) / 86_400_000_000).alias(TrendDetector.TIME_AXIS),
+            pl.col(measure_col),
+        ).drop_nulls().drop_nans()
+
+        return self._paired(
+            insight,
+            [series[TrendDetector.TIME_AXIS].to_numpy(), series[measure_col].to_numpy()],
+            {'spearman_r': _spearman},
+            stats['n_periods'],
+        )
+
+    def _group(self, insight: Dict[str, Any]) -> Tuple[Dict[str, Tuple[float, float]], int]:
+        """Cohen's d or eta-squared interval, resampling within each group"""
+        group_col, measure_col = insight['primary_columns']
+        stats = insight['statistics']
+        labels = list(stats['groups'])
+        rng = _rng(insight)
+
+        frame = self.df.select(
+            pl.col(group_col), pl.col(measure_col).cast(pl.Float64)
+        ).drop_nulls().drop_nans()
+
+        codes = self._group_codes(frame[group_col], labels, stats.get('collapsed'))
+        x = frame[measure_col].to_numpy()
+
+        # d and eta-squared are location and scale free; standardizing keeps sums of squares exact
+        std = x.std()
+        x = (x - x.mean()) / (std if std > 0 else 1.0)
+
+        groups = [x[codes == g] for g in range(len(labels))]
+        sizes = np.array([len(values) for values in groups], dtype=np.float64)
+        sums, squares = zip(*[
+            resample_group_sums(values, rng, self.resamples, self.max_rows)
+            for values in groups
+        ])
+
+        if 'cohens_d' in stats:
+            values = _cohens_d(sizes[0], sums[0], squares[0], sizes[1], sums[1], squares[1])
+            name = 'cohens_d'
+        else:
+            values = _eta_squared(sizes, np.vstack(sums), np.vstack(squares))
+            name = 'eta_squared'
+
+        return {name: self._interval(values)}, int(sizes.sum())
+
+    @staticmethod
+    def _group_codes(
+        groups: pl.Series,
+        labels: List[str],
+        collapsed: Optional[Dict[str, Any]],
+    ) -> np.ndarray:
+        """
+        Index of each row's group among the reported groups (-1 if not reported).
+
+        Reported groups are keyed by str() of the group value, or by the
+        text value with levels outside the top k pooled into the 'Other'
+        bucket when the column was collapsed.
+
+        Args:
+            groups: Group column (no nulls)
+            labels: Reported group keys, in reported order
+            collapsed: 'collapsed' statistics of the insight, if any
+
+        Returns:
+            Integer codes per row
+        """
+        top = set(collapsed['levels']) if collapsed else None
+
+        uniques = groups.unique()
+        keys = uniques.cast(pl.Utf8).to_list()
+        position = {label: g for g, label in enumerate(labels)}
+
+        codes = []
+        for value, key in zip(uniques.to_list(), keys):
+            label = str(value) if top is None else (key if key in top else collapsed['other_label'])
+            codes.append(position.get(label, -1))
+
+        return groups.cast(pl.Utf8).replace_strict(keys, codes, return_dtype=pl.Int64).to_numpy()
+
+    def _association(self, insight: Dict[str, Any]) -> Tuple[Dict[str, Tuple[float, float]], int]:
+        """
+        Cramér's V interval, resampling contingency table cells.
+
+        Cell probabilities come from all rows; each resample has as many
+        rows as the reported test (the profile may test a sample).
+        """
+        col1, col2 = insight['primary_columns']
+        rng = _rng(insight)
+
+        # Null is a level of its own, as in the profile's contingency tables
+        crosstab = self.df.group_by([col1, col2]).len()
+        rows = {value: i for i, value in enumerate(dict.fromkeys(crosstab[col1].to_list()))}
+        cols = {value: j for j, value in enumerate(dict.fromkeys(crosstab[col2].to_list()))}
+
+        table = np.zeros((len(rows), len(cols)))
+        for value1, value2, count in crosstab.iter_rows():
+            table[rows[value1], cols[value2]] = count
+
+        n = insight['statistics']['n']
+        yates = table.shape == (2, 2)
+        probabilities = table.ravel() / table.sum()
+
+        values = np.empty(self.resamples)
+        for start, stop in _batches(self.resamples, table.size):
+            counts = rng.multinomial(n, probabilities, size=stop - start).reshape(-1, *table.shape)
+            values[start:stop] = _cramers_v(counts, yates)
+
+        return {'cramers_v': self._interval(values)}, n
+
+
+def add_confidence_intervals(
+    insights: List[Dict[str, Any]],
+    df: pl.DataFrame,
+    profile: Optional[Dict[str, Any]],
+    settings: Dict[str, Any],
+) -> None:
+    """
+    Add bootstrap confidence intervals to insight dicts, in place.
+
+    Args:
+        insights: Insight dicts (e.g. the top insights)
+        df: Input DataFrame
+        profile: Profile dict from profiling
+        settings: Settings dict ('bootstrap_resamples' of 0 disables intervals)
+    """
+    BootstrapIntervals(df, profile, settings).add(insights)
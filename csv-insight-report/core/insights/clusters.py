@@ -0,0 +1,498 @@
+"""
+Cluster Insight Detector
+Finds natural segments of rows in the numeric columns.
+
+Columns are standardized with the profiled means and standard
+deviations, then Gaussianized by a Yeo-Johnson power transform fitted
+per column on a sample (a log for log-normal columns, about linear for
+symmetric ones), so the long tail of a skewed column does not split off
+as a cluster. k is
+chosen on a sample by the silhouette gap: the simplified silhouette of
+k-means on the sample minus that on a Gaussian sample with the same
+covariance, which has no clusters. Cut points of a single elongated
+cloud score well on plain silhouette but gain nothing over the
+reference. The chosen centers are then refined by mini-batch k-means
+over slices of the full table, and a last streamed pass assigns every
+row and measures the clusters (in profiled standard deviations), so
+memory stays bounded by the slice size.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+import polars as pl
+import numpy as np
+from scipy import stats
+from .base import BaseDetector, Insight
+from .bootstrap import seeded_rng
+
+
+def _sq_distances(X: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """
+    Squared Euclidean distances from rows to centers.
+
+    Args:
+        X: Rows (n x d)
+        centers: Centers (k x d)
+
+    Returns:
+        Distances (n x k)
+    """
+    d = (X * X).sum(axis=1)[:, None] - 2 * X @ centers.T + (centers * centers).sum(axis=1)[None, :]
+    return np.maximum(d, 0.0)
+
+
+def _kmeans_plus_plus(X: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    """Initial centers by k-means++ seeding"""
+    centers = [X[rng.integers(len(X))]]
+    closest = _sq_distances(X, centers[0][None, :])[:, 0]
+
+    for _ in range(1, k):
+        total = closest.sum()
+        index = rng.choice(len(X), p=closest / total) if total > 0 else rng.integers(len(X))
+        centers.append(X[index])
+        closest = np.minimum(closest, _sq_distances(X, X[index][None, :])[:, 0])
+
+    return np.array(centers)
+
+
+def kmeans(X: np.ndarray, k: int, rng: np.random.Generator, n_init: int = 3, max_iter: int = 50) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Lloyd's k-means with k-means++ seeding, best of n_init starts.
+
+    Args:
+        X: Rows (n x d)
+        k: Number of clusters
+        rng: Random generator
+        n_init: Starts
+        max_iter: Max iterations per start
+
+    Returns:
+        Tuple of (centers, labels, inertia)
+    """
+    best = None
+
+    for _ in range(n_init):
+        centers = _kmeans_plus_plus(X, k, rng)
+
+        for _ in range(max_iter):
+            labels = _sq_distances(X, centers).argmin(axis=1)
+            counts = np.bincount(labels, minlength=k)
+            sums = np.stack([np.bincount(labels, weights=X[:, j], minlength=k) for j in range(X.shape[1])], axis=1)
+            updated = np.where(counts[:, None] > 0, sums / np.maximum(counts, 1)[:, None], centers)
+
+            if np.allclose(updated, centers, atol=1e-6):
+                break
+            centers = updated
+
+        distances = _sq_distances(X, centers)
+        labels = distances.argmin(axis=1)
+        inertia = float(distances[np.arange(len(X)), labels].sum())
+
+        if best is None or inertia < best[2]:
+            best = (centers, labels, inertia)
+
+    return best
+
+
+# Bounds on the fitted Yeo-Johnson exponents (keeps extreme values finite)
+POWER_RANGE = (-3.0, 3.0)
+
+# Exponents this close to 1 (the identity) leave the column untransformed
+POWER_IDENTITY_TOLERANCE = 0.1
+
+
+class PowerTransform:
+    """
+    Per-column Yeo-Johnson transform fitted on a sample, then rescaled to
+    zero mean and unit variance on that sample.
+    """
+
+    def __init__(self, S: np.ndarray):
+        """
+        Fit the exponents by maximum likelihood.
+
+        Args:
+            S: Standardized sample rows (n x d)
+        """
+        lambdas = np.array([
+            np.clip(stats.yeojohnson_normmax(S[:, j]), *POWER_RANGE) if np.ptp(S[:, j]) > 0 else 1.0
+            for j in range(S.shape[1])
+        ])
+        self.lambdas = np.where(np.abs(lambdas - 1) < POWER_IDENTITY_TOLERANCE, 1.0, lambdas)
+        self.skewed = np.flatnonzero(self.lambdas != 1.0)
+        T = self._power(S)
+        self.center = T.mean(axis=0)
+        self.scale = np.where(T.std(axis=0) > 0, T.std(axis=0), 1.0)
+
+    def _power(self, X: np.ndarray) -> np.ndarray:
+        """Yeo-Johnson transform of each column with its exponent (skipped where it is 1)"""
+        T = X.copy()
+        for j in self.skewed:
+            T[:, j] = stats.yeojohnson(X[:, j], self.lambdas[j])
+        return T
+
+    def __call__(self, X: np.ndarray) -> np.ndarray:
+        """Transform standardized rows (n x d)"""
+        return (self._power(X) - self.center) / self.scale
+
+
+def _between_share(X: np.ndarray, inertia: float) -> float:
+    """Share of the total sum of squares between clusters, given the within-cluster inertia"""
+    total = float(((X - X.mean(axis=0)) ** 2).sum())
+    return 1 - inertia / total if total > 0 else 0.0
+
+
+def simplified_silhouette(X: np.ndarray, centers: np.ndarray, labels: np.ndarray) -> float:
+    """
+    Mean silhouette with distances to centers instead of to all points.
+
+    O(n k) rather than O(n^2); close to the full silhouette for compact
+    clusters.
+
+    Args:
+        X: Rows (n x d)
+        centers: Centers (k x d)
+        labels: Cluster of each row
+
+    Returns:
+        Mean simplified silhouette in [-1, 1]
+    """
+    distances = np.sqrt(_sq_distances(X, centers))
+    rows = np.arange(len(X))
+    a = distances[rows, labels]
+    distances[rows, labels] = np.inf
+    b = distances.min(axis=1)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        s = np.where(np.maximum(a, b) > 0, (b - a) / np.maximum(a, b), 0.0)
+
+    return float(s.mean())
+
+
+class ClusterDetector(BaseDetector):
+    """
+    Detects natural row segments with mini-batch k-means.
+    """
+
+    name = 'cluster'
+    id_prefix = 'M'
+
+    def plan(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[tuple]:
+        """
+        Choose the numeric columns to cluster on.
+
+        Identifier-like integer columns (almost all values distinct) are
+        skipped; above cluster_max_columns, the most complete columns are
+        kept.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+
+        Returns:
+            List with one (column tuple,) item, or empty
+        """
+        columns = [
+            col['normalized_name']
+            for col in schema['columns']
+            if col['type'] in ['int', 'float']
+            and not (col['type'] == 'int' and col['unique_count'] >= 0.95 * len(df))
+            and (profile['distributions'].get(col['normalized_name']) or {}).get('std')
+        ]
+
+        max_columns = self.settings.get('cluster_max_columns', 20)
+        if len(columns) > max_columns:
+            completeness = sorted(columns, key=lambda c: profile['missingness'][c]['fraction'])
+            columns = [c for c in columns if c in completeness[:max_columns]]
+
+        if len(columns) < 2:
+            return []
+
+        return [(tuple(columns),)]
+
+    def estimate(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Tuple[float, float]:
+        """
+        Expected value and cost of clustering.
+
+        The value assumes prior_effect; the cost is distance evaluations of
+        the sample search, the mini-batch epochs and the final pass.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (column tuple,) from plan()
+
+        Returns:
+            Tuple of (expected quality score, estimated cost)
+        """
+        columns = item[0]
+        n = len(df)
+        max_k = self.settings.get('cluster_max_k', 8)
+        sample = min(n, self.settings.get('cluster_sample_size', 10_000))
+
+        value = self.compute_quality_score(n, self.prior_effect, 0.0)
+        cost = len(columns) * max_k * (sample * max_k * 50 + n * (self.settings.get('cluster_epochs', 1) + 1))
+
+        return value, float(max(cost, 1))
+
+    def item_columns(self, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[str]:
+        """Clustered columns"""
+        return list(item[0])
+
+    def detect_item(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[Insight]:
+        """
+        Detect cluster insights.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (column tuple,) from plan()
+
+        Returns:
+            List with at most one Insight object
+        """
+        return self.select(df, schema, profile, item, self.candidates(df, schema, profile, item))
+
+    def _slices(self, frame: pl.DataFrame):
+        """Complete rows (unscaled), cluster_batch_rows at a time"""
+        for chunk in frame.iter_slices(n_rows=self.settings.get('cluster_batch_rows', 65_536)):
+            X = chunk.drop_nulls().to_numpy()
+            if len(X):
+                yield X
+
+    def _choose_k(self, S: np.ndarray, rng: np.random.Generator) -> Dict[str, Any]:
+        """
+        Pick k on a transformed sample by the silhouette gap: the smallest
+        k within 90% of the best gap.
+
+        Args:
+            S: Power-transformed sample rows
+            rng: Random generator
+
+        Returns:
+            Dict with k, centers, silhouette, the reference's between-cluster
+            variance share at k, and per-k scores
+        """
+        # Reference without clusters: a Gaussian with the sample's covariance
+        reference = rng.multivariate_normal(S.mean(axis=0), np.cov(S.T), size=len(S), method='cholesky' if len(S) > S.shape[1] else 'svd')
+
+        fits = []
+        scores = []
+
+        for k in range(2, self.settings.get('cluster_max_k', 8) + 1):
+            if k >= len(S):
+                break
+
+            centers, labels, _ = kmeans(S, k, rng)
+            silhouette = simplified_silhouette(S, centers, labels)
+            ref_centers, ref_labels, ref_inertia = kmeans(reference, k, rng, n_init=1)
+            gap = silhouette - simplified_silhouette(reference, ref_centers, ref_labels)
+
+            scores.append({'k': k, 'silhouette': silhouette, 'gap': gap})
+            fits.append({
+                'k': k,
+                'centers': centers,
+                'silhouette': silhouette,
+                'gap': gap,
+                'sizes': np.bincount(labels, minlength=k),
+                'reference_between_share': _between_share(reference, ref_inertia),
+            })
+
+        # The smallest k within 90% of the best gap (extra clusters that barely help are not kept)
+        best_gap = max(fit['gap'] for fit in fits)
+        chosen = next(fit for fit in fits if fit['gap'] >= 0.9 * best_gap) if best_gap > 0 else max(fits, key=lambda fit: fit['gap'])
+        chosen['scores'] = scores
+        return chosen
+
+    def candidates(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Choose k on a sample, refine by mini-batch k-means and measure the clusters.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (column tuple,) from plan()
+
+        Returns:
+            Dict with k, silhouette, gap, per-k scores, between-cluster
+            variance share (of the transformed columns, and of the Gaussian
+            reference), row count and per-cluster sizes and means (in
+            standard deviations), or None with too few complete rows
+        """
+        columns = list(item[0])
+        rng = seeded_rng('cluster|' + '|'.join(columns))
+
+        mean = np.array([profile['distributions'][c]['mean'] for c in columns])
+        std = np.array([profile['distributions'][c]['std'] for c in columns])
+        frame = df.select([pl.col(c).cast(pl.Float64).fill_nan(None) for c in columns])
+
+        sample_size = self.settings.get('cluster_sample_size', 10_000)
+        sample = frame.drop_nulls()
+        if len(sample) > sample_size:
+            sample = sample.sample(n=sample_size, seed=int(rng.integers(2 ** 31)))
+        if len(sample) < self.settings.get('cluster_min_rows', 100):
+            return None
+
+        transform = PowerTransform((sample.to_numpy() - mean) / std)
+        S = transform((sample.to_numpy() - mean) / std)
+        chosen = self._choose_k(S, rng)
+        k = chosen['k']
+        centers = chosen['centers'].copy()
+
+        # Mini-batch k-means: per-center learning rate 1 / rows assigned so far
+        counts = chosen['sizes'].astype(np.float64)
+        for _ in range(self.settings.get('cluster_epochs', 1)):
+            for X in self._slices(frame):
+                Z = transform((X - mean) / std)
+                labels = _sq_distances(Z, centers).argmin(axis=1)
+                batch_counts = np.bincount(labels, minlength=k)
+                sums = np.stack([np.bincount(labels, weights=Z[:, j], minlength=k) for j in range(len(columns))], axis=1)
+                counts += batch_counts
+                centers += (sums - batch_counts[:, None] * centers) / np.maximum(counts, 1)[:, None]
+
+        # Final pass: assign every complete row; variance shares on the transformed
+        # columns, cluster means in profiled standard deviations
+        sizes = np.zeros(k)
+        sums = np.zeros((k, len(columns)))
+        z_sums = np.zeros((k, len(columns)))
+        z_squares = np.zeros((k, len(columns)))
+        for X in self._slices(frame):
+            X = (X - mean) / std
+            Z = transform(X)
+            labels = _sq_distances(Z, centers).argmin(axis=1)
+            sizes += np.bincount(labels, minlength=k)
+            for j in range(len(columns)):
+                sums[:, j] += np.bincount(labels, weights=X[:, j], minlength=k)
+                z_sums[:, j] += np.bincount(labels, weights=Z[:, j], minlength=k)
+                z_squares[:, j] += np.bincount(labels, weights=Z[:, j] ** 2, minlength=k)
+
+        n = sizes.sum()
+        within = (z_squares - z_sums ** 2 / np.maximum(sizes, 1)[:, None]).sum()
+        total = (z_squares.sum(axis=0) - z_sums.sum(axis=0) ** 2 / n).sum()
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cluster_means = sums / sizes[:, None]
+
+        return {
+            'k': k,
+            'silhouette': simplified_silhouette(S, centers, _sq_distances(S, centers).argmin(axis=1)),
+            'gap': chosen['gap'],
+            'scores': chosen['scores'],
+            'between_share': float(1 - within / total) if total > 0 else 0.0,
+            'reference_between_share': chosen['reference_between_share'],
+            'power_lambdas': transform.lambdas.tolist(),
+            'n_rows': int(n),
+            'sizes': sizes,
+            'means': cluster_means,  # Standardized, relative to the profiled means
+            'overall': sums.sum(axis=0) / n,
+        }
+
+    def select(
+        self,
+        df: pl.DataFrame,
+        schema: Dict[str, Any],
+        profile: Dict[str, Any],
+        item: tuple,
+        candidates: Optional[Dict[str, Any]],
+    ) -> List[Insight]:
+        """
+        Report the segments if they are clearly separated.
+
+        k-means splits any cloud into parts that account for much of its
+        variance, so the clusters' between-cluster variance share must
+        exceed that of the Gaussian reference at the same k by
+        cluster_min_between_gain.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (column tuple,) from plan()
+            candidates: Clustering from candidates()
+
+        Returns:
+            List with at most one Insight object
+        """
+        if candidates is None:
+            return []
+
+        if (
+            candidates['gap'] < self.settings.get('cluster_min_gap', 0.1)
+            or candidates['silhouette'] < self.settings.get('cluster_min_silhouette', 0.25)
+            or candidates['between_share'] - candidates['reference_between_share']
+            < self.settings.get('cluster_min_between_gain', 0.1)
+        ):
+            return []
+
+        columns = list(item[0])
+        top_columns = self.settings.get('cluster_top_columns', 3)
+        n = candidates['n_rows']
+
+        clusters = []
+        for c in np.argsort(-candidates['sizes'], kind='stable'):
+            if candidates['sizes'][c] == 0:
+                continue
+
+            # Distinguishing columns: cluster mean furthest from the overall mean, in SDs
+            shift = candidates['means'][c] - candidates['overall']
+            distinguishing = [
+                {
+                    'column': columns[j],
+                    'mean': float(profile['distributions'][columns[j]]['mean'] + candidates['means'][c][j] * profile['distributions'][columns[j]]['std']),
+                    'overall_mean': float(profile['distributions'][columns[j]]['mean']),
+                    'z': float(shift[j]),
+                    'direction': 'high' if shift[j] > 0 else 'low',
+                }
+                for j in np.argsort(-np.abs(shift), kind='stable')[:top_columns]
+            ]
+
+            clusters.append({
+                'cluster': len(clusters) + 1,
+                'size': int(candidates['sizes'][c]),
+                'share': float(candidates['sizes'][c] / n),
+                'distinguishing': distinguishing,
+            })
+
+        k = candidates['k']
+        top = clusters[0]['distinguishing'][0]
+
+        caveats = [
+            'Clusters depend on the columns included and their scaling (standardized and power-transformed here).',
+            'k-means favors compact, similarly sized clusters; elongated or nested groups may be split or merged.',
+            'Rows with any missing clustered value are not assigned.',
+        ]
+
+        return [Insight(
+            id='',
+            title=f"Rows fall into {k} distinct segments, separated most by {top['column']}",
+            rationale=(
+                f"Mini-batch k-means on {len(columns)} standardized, power-transformed columns finds {k} segments "
+                f"(silhouette={candidates['silhouette']:.2f}, {candidates['gap']:.2f} above a cluster-free reference); "
+                f"they account for {candidates['between_share']:.0%} of the variance."
+            ),
+            primary_columns=columns,
+            statistics={
+                'k': k,
+                'silhouette': candidates['silhouette'],
+                'silhouette_gap': candidates['gap'],
+                'k_scores': candidates['scores'],
+                'between_share': candidates['between_share'],
+                'reference_between_share': candidates['reference_between_share'],
+                'power_lambdas': dict(zip(columns, candidates['power_lambdas'])),
+                'n_rows': n,
+                'n_rows_skipped': len(df) - n,
+                'clusters': clusters,
+                'method': 'minibatch_kmeans',
+            },
+            quality_score=self.compute_quality_score(
+                n,
+                candidates['silhouette'],
+                1 - n / len(df) if len(df) else 0.0,
+            ),
+            suggested_visuals=['cluster_profile_heatmap', 'scatter_by_cluster'],
+            caveats=caveats,
+            detector_type='cluster',
+        )]
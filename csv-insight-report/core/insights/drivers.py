@@ -0,0 +1,371 @@
+"""
+Driver Insight Detector
+Explains a user-named target with a standardized multivariate regression.
+
+The regression needs only the covariance matrix, which profiling computes
+once in a streaming pass when driver_targets is set (profile['covariance'],
+shared with the correlation engine's co-moment sums). Standardized betas come from one
+Cholesky solve on the predictor correlation matrix, so the cost does not
+depend on the row count. Relative importance uses Johnson's relative
+weights, which split R² across correlated predictors and closely
+approximate general dominance weights at a fraction of the cost.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+import polars as pl
+import numpy as np
+from scipy import linalg, stats
+from .base import BaseDetector, Insight
+from ..profile import compute_covariance
+
+
+# Diagonal ridges tried when the correlation matrix is not positive definite
+RIDGES = (0.0, 1e-10, 1e-8, 1e-6, 1e-4)
+
+
+def relative_weights(Rxx: np.ndarray, rxy: np.ndarray) -> np.ndarray:
+    """
+    Johnson's relative weights of predictors.
+
+    Predictors are replaced by their closest orthogonal counterparts
+    Z = X Rxx^(-1/2); the target is regressed on Z and each Z's share is
+    mapped back to the predictors through the squared loadings. The
+    weights sum to R².
+
+    Args:
+        Rxx: Predictor correlation matrix (p x p)
+        rxy: Predictor-target correlations (p,)
+
+    Returns:
+        Relative weight of each predictor (p,)
+    """
+    eigenvalues, vectors = np.linalg.eigh(Rxx)
+    root = np.sqrt(np.clip(eigenvalues, 0.0, None))
+
+    loadings = (vectors * root) @ vectors.T  # Rxx^(1/2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inverse_root = np.where(root > 0, 1.0 / root, 0.0)
+    beta_z = (vectors * inverse_root) @ vectors.T @ rxy
+
+    return (loadings ** 2) @ (beta_z ** 2)
+
+
+def standardized_regression(Rxx: np.ndarray, rxy: np.ndarray, n: int) -> Dict[str, Any]:
+    """
+    Standardized OLS from correlations, by Cholesky factorization.
+
+    Args:
+        Rxx: Predictor correlation matrix (p x p)
+        rxy: Predictor-target correlations (p,)
+        n: Observations behind the correlations
+
+    Returns:
+        Dict with beta, se, p_value, vif (arrays), r_squared,
+        adjusted_r_squared, f_statistic, f_p_value and ridge
+    """
+    p = len(rxy)
+    identity = np.eye(p)
+
+    for ridge in RIDGES:
+        try:
+            factor = linalg.cho_factor(Rxx + ridge * identity)
+            break
+        except linalg.LinAlgError:
+            continue
+    else:
+        raise linalg.LinAlgError('correlation matrix is not positive definite')
+
+    beta = linalg.cho_solve(factor, rxy)
+    vif = np.diag(linalg.cho_solve(factor, identity))
+
+    r_squared = float(np.clip(beta @ rxy, 0.0, 1.0 - 1e-12))
+    dof = n - p - 1
+
+    se = np.sqrt((1 - r_squared) / dof * vif)
+    t = beta / se
+    f_statistic = (r_squared / p) / ((1 - r_squared) / dof)
+
+    return {
+        'beta': beta,
+        'se': se,
+        'p_value': 2 * stats.t.sf(np.abs(t), dof),
+        'vif': vif,
+        'r_squared': r_squared,
+        'adjusted_r_squared': 1 - (1 - r_squared) * (n - 1) / dof,
+        'f_statistic': float(f_statistic),
+        'f_p_value': float(stats.f.sf(f_statistic, p, dof)),
+        'ridge': ridge,
+    }
+
+
+class DriverDetector(BaseDetector):
+    """
+    Detects which variables jointly explain a target (key driver analysis).
+    """
+
+    name = 'driver'
+    id_prefix = 'K'
+
+    def plan(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[tuple]:
+        """
+        List the configured targets with their candidate predictors.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+
+        Returns:
+            List of (target, predictor columns) items
+        """
+        targets = self.settings.get('driver_targets') or []
+        if isinstance(targets, str):
+            targets = [targets]
+
+        numeric_cols = [
+            col['normalized_name']
+            for col in schema['columns']
+            if col['type'] in ['int', 'float']
+        ]
+
+        predictors = self.settings.get('driver_predictors') or numeric_cols
+        predictors = [c for c in predictors if c in numeric_cols]
+
+        items = []
+        for target in targets:
+            if target not in numeric_cols:
+                continue
+
+            candidates = tuple(c for c in predictors if c != target)
+            if candidates:
+                items.append((target, candidates))
+
+        return items
+
+    def estimate(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Tuple[float, float]:
+        """
+        Expected value and cost of one driver model.
+
+        The value assumes prior_effect; with a profiled covariance the cost
+        is the p x p factorizations, otherwise one pass over the rows.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (target, predictor columns) from plan()
+
+        Returns:
+            Tuple of (expected quality score, estimated cost)
+        """
+        target, predictors = item
+        p = len(predictors) + 1
+
+        value = self.compute_quality_score(len(df), self.prior_effect, profile['missingness'][target]['fraction'])
+        cost = p ** 3
+        if self._covariance(profile, [target, *predictors]) is None:
+            cost += len(df) * p * p
+
+        return value, float(max(cost, 1))
+
+    def item_columns(self, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[str]:
+        """Target and predictor columns"""
+        target, predictors = item
+        return [target] + list(predictors)
+
+    def detect_item(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[Insight]:
+        """
+        Detect driver insights for one target.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (target, predictor columns) from plan()
+
+        Returns:
+            List with at most one Insight object
+        """
+        return self.select(df, schema, profile, item, self.candidates(df, schema, profile, item))
+
+    @staticmethod
+    def _covariance(profile: Dict[str, Any], columns: List[str]) -> Optional[Dict[str, Any]]:
+        """The profiled covariance, if it covers columns"""
+        covariance = profile.get('covariance')
+        if covariance and set(columns) <= set(covariance['columns']):
+            return covariance
+        return None
+
+    def candidates(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Fit the standardized regression of the target on its predictors.
+
+        Uses the profiled covariance, computing it in a streaming pass only
+        if the profile has none for these columns. Constant predictors are
+        dropped; above driver_max_predictors, the predictors most correlated
+        with the target are kept.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (target, predictor columns) from plan()
+
+        Returns:
+            Dict with the standardized_regression() result, predictors,
+            relative weights, unstandardized coefficients, n and whether
+            covariances are pairwise-complete over unequal rows; None if no
+            model can be fitted
+        """
+        target, predictors = item
+        columns = [target, *predictors]
+
+        covariance = self._covariance(profile, columns)
+        if covariance is None:
+            subset = {'columns': [col for col in schema['columns'] if col['normalized_name'] in columns]}
+            covariance = compute_covariance(
+                df, subset,
+                max_columns=len(columns),
+                chunk_cells=self.settings.get('covariance_chunk_cells', 5_000_000),
+            )
+            if covariance is None:
+                return None
+
+        index = [covariance['columns'].index(c) for c in columns]
+        cov = np.asarray(covariance['cov'], dtype=np.float64)[np.ix_(index, index)]
+        counts = np.asarray(covariance['n'], dtype=np.float64)[np.ix_(index, index)]
+        sd = np.sqrt(np.diag(cov))
+
+        # Drop constant or undefined predictors
+        usable = np.isfinite(cov).all(axis=0) & (sd > 0)
+        if not usable[0]:
+            return None
+        keep = [k for k in range(1, len(columns)) if usable[k]]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            R = cov / np.outer(sd, sd)
+
+        max_predictors = self.settings.get('driver_max_predictors', 50)
+        if len(keep) > max_predictors:
+            keep = sorted(keep, key=lambda k: -abs(R[0, k]))[:max_predictors]
+            keep.sort()
+
+        model = [0] + keep
+        n = int(counts[np.ix_(model, model)].min())
+
+        if not keep or n - len(keep) - 1 < self.settings.get('driver_min_dof', 30):
+            return None
+
+        Rxx = R[np.ix_(keep, keep)]
+        rxy = R[0, keep]
+
+        try:
+            fit = standardized_regression(Rxx, rxy, n)
+        except linalg.LinAlgError:
+            return None
+
+        return {
+            **fit,
+            'predictors': [columns[k] for k in keep],
+            'relative_weights': relative_weights(Rxx, rxy),
+            'coefficients': fit['beta'] * sd[0] / sd[keep],
+            'n': n,
+            'n_dropped': len(predictors) - len(keep),
+            'pairwise': bool(counts[np.ix_(model, model)].max() > n),
+        }
+
+    def select(
+        self,
+        df: pl.DataFrame,
+        schema: Dict[str, Any],
+        profile: Dict[str, Any],
+        item: tuple,
+        candidates: Optional[Dict[str, Any]],
+    ) -> List[Insight]:
+        """
+        Report a target's drivers if the model explains enough of it.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (target, predictor columns) from plan()
+            candidates: Fitted model from candidates()
+
+        Returns:
+            List with at most one Insight object
+        """
+        if candidates is None:
+            return []
+
+        target, _ = item
+        r_squared = candidates['r_squared']
+
+        if candidates['f_p_value'] >= 0.05 or r_squared < self.settings.get('driver_min_r_squared', 0.1):
+            return []
+
+        weights = candidates['relative_weights']
+        order = np.argsort(-weights, kind='stable')[:self.settings.get('driver_top_k', 10)]
+
+        drivers = [
+            {
+                'column': candidates['predictors'][k],
+                'relative_weight': float(weights[k]),
+                'share': float(weights[k] / r_squared) if r_squared > 0 else 0.0,
+                'beta': float(candidates['beta'][k]),
+                'se': float(candidates['se'][k]),
+                'p_value': float(candidates['p_value'][k]),
+                'coefficient': float(candidates['coefficients'][k]),
+                'vif': float(candidates['vif'][k]),
+            }
+            for k in order
+        ]
+
+        leading = [d for d in drivers if d['p_value'] < 0.05][:3] or drivers[:1]
+        names = [d['column'] for d in leading]
+        names_text = names[0] if len(names) == 1 else f"{', '.join(names[:-1])} and {names[-1]}"
+        verb = 'is' if len(names) == 1 else 'are'
+
+        caveats = [
+            'Drivers are associations in a linear model, not causes.',
+            'Relative weights approximate dominance analysis; they split shared variance between correlated predictors.',
+        ]
+        collinear = [d['column'] for d in drivers if d['vif'] > 10]
+        if collinear:
+            caveats.append(f"{', '.join(collinear)} are collinear with other predictors (VIF > 10); their betas are unstable.")
+        if candidates['pairwise']:
+            caveats.append('Covariances use pairwise-complete rows; predictors are missing on different rows.')
+        if candidates['ridge'] > 0:
+            caveats.append(f"A ridge of {candidates['ridge']:g} was added to make the correlation matrix invertible.")
+
+        return [Insight(
+            id='',
+            title=f"{names_text} {verb} the main driver{'s' if len(names) > 1 else ''} of {target}",
+            rationale=(
+                f"Together, {len(candidates['predictors'])} predictors explain {r_squared:.1%} of the variance in {target} "
+                f"(F={candidates['f_statistic']:.1f}, p={candidates['f_p_value']:.4f}); "
+                f"{drivers[0]['column']} accounts for {drivers[0]['share']:.0%} of the explained variance."
+            ),
+            primary_columns=[target] + [d['column'] for d in drivers],
+            statistics={
+                'target': target,
+                'r_squared': r_squared,
+                'adjusted_r_squared': float(candidates['adjusted_r_squared']),
+                'f_statistic': candidates['f_statistic'],
+                'f_p_value': candidates['f_p_value'],
+                'n': candidates['n'],
+                'n_predictors': len(candidates['predictors']),
+                'n_predictors_dropped': candidates['n_dropped'],
+                'drivers': drivers,
+                'method': 'relative_weights',
+                'ridge': candidates['ridge'],
+            },
+            quality_score=self.compute_quality_score(
+                candidates['n'],
+                r_squared,
+                profile['missingness'][target]['fraction'],
+            ),
+            suggested_visuals=['importance_bar', 'coefficient_plot'],
+            caveats=caveats,
+            detector_type='driver',
+        )]
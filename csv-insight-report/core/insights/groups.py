@@ -3,11 +3,14 @@ Group Differences Insight Detector
 Detects significant differences between groups using statistical tests.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import polars as pl
 import numpy as np
 from scipy import stats
 from .base import BaseDetector, Insight
+from .bootstrap import seeded_rng
+from .permutation import PermutationTest
+from ..screening import collapse_levels, group_columns
 
 
 class GroupDetector(BaseDetector):
@@ -15,9 +18,15 @@ class GroupDetector(BaseDetector):
     Detects significant differences between categorical groups.
     """
 
-    def detect(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[Insight]:
+    name = 'group'
+    id_prefix = 'G'
+
+    # Label of the bucket pooling levels outside the top k
+    OTHER_LABEL = 'Other'
+
+    def plan(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[tuple]:
         """
-        Detect group difference insights.
+        List grouping columns with the measures to compare across their groups.
 
         Args:
             df: Input DataFrame
@@ -25,21 +34,11 @@ class GroupDetector(BaseDetector):
             profile: Profile dict from profiling
 
         Returns:
-            List of detected Insight objects
+            List of (group_col, measure columns, kept levels) items; kept
+            levels is None unless the column is collapsed to its top levels
         """
-        insights = []
-        insight_counter = 0
-
-        min_group_size = self.settings.get('min_sample_for_parametrics', 20)
-
-        # Get categorical columns with reasonable cardinality
-        categorical_cols = [
-            col['normalized_name']
-            for col in schema['columns']
-            if col['type'] in ['categorical', 'string', 'bool']
-            and col['unique_count'] >= 2
-            and col['unique_count'] <= 10  # Reasonable number of groups
-        ]
+        # Get categorical columns with reasonable cardinality, or collapsible to it
+        categorical_cols = group_columns(schema, profile.get('cardinality', {}), self.settings)
 
         # Get numeric columns
         numeric_cols = [
@@ -48,130 +47,495 @@ class GroupDetector(BaseDetector):
             if col['type'] in ['int', 'float']
         ]
 
-        # Test each combination
-        for group_col in categorical_cols:
-            for measure_col in numeric_cols:
-                # Get groups
-                groups_data = df.select([group_col, measure_col]).drop_nulls()
+        # Wide tables: only test the group × measure pairs kept by the profile screen
+        wide_screen = profile.get('wide_screen')
+        candidates = {tuple(pair) for pair in wide_screen['group_pairs']} if wide_screen else None
 
-                if len(groups_data) < min_group_size:
-                    continue
+        items = []
+        for group_col, levels in categorical_cols.items():
+            measures = [
+                measure_col for measure_col in numeric_cols
+                if candidates is None or (group_col, measure_col) in candidates
+            ]
+            if measures:
+                items.append((group_col, measures, levels))
 
-                # Get unique groups
-                unique_groups = groups_data[group_col].unique().to_list()
+        return items
 
-                if len(unique_groups) < 2:
-                    continue
+    def estimate(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Tuple[float, float]:
+        """
+        Expected value and cost of one grouping column.
+
+        There is no cheap effect-size screen for group differences, so the
+        value assumes prior_effect; the cost is one group_by plus one sort
+        per measure.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (group_col, measure columns, kept levels) from plan()
+
+        Returns:
+            Tuple of (expected quality score, estimated cost)
+        """
+        group_col, measures, _ = item
+        n = len(df)
+        missingness = profile['missingness'][group_col]['fraction']
+
+        value = self.compute_quality_score(n * (1 - missingness), self.prior_effect, missingness)
+        cost = n * (1 + len(measures) * np.log2(max(n, 2)))
+
+        return value, float(max(cost, 1))
+
+    def item_columns(self, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[str]:
+        """Grouping column and its measures"""
+        group_col, measures, _ = item
+        return [group_col] + list(measures)
+
+    def detect_item(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[Insight]:
+        """
+        Detect group difference insights for one grouping column.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (group_col, measure columns, kept levels) from plan()
+
+        Returns:
+            List of detected Insight objects
+        """
+        return self.select(df, schema, profile, item, self.candidates(df, schema, profile, item))
+
+    def candidates(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[Dict[str, Any]]:
+        """
+        Group statistics and test results for every measure of a grouping column.
+
+        One group_by over the grouping column covers every measure.
 
-                # Extract data for each group
-                group_arrays = []
-                group_stats = {}
-
-                for group in unique_groups:
-                    group_data = groups_data.filter(pl.col(group_col) == group)[measure_col].to_numpy()
-                    if len(group_data) >= min_group_size:
-                        group_arrays.append(group_data)
-                        group_stats[str(group)] = {
-                            'n': len(group_data),
-                            'mean': float(np.mean(group_data)),
-                            'std': float(np.std(group_data)),
-                            'median': float(np.median(group_data)),
-                        }
-
-                if len(group_arrays) < 2:
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (group_col, measure columns, kept levels) from plan()
+
+        Returns:
+            List of per-measure candidate dicts
+        """
+        candidates = []
+
+        group_col, measures, levels = item
+        min_group_size = self.settings.get('min_sample_for_parametrics', 20)
+        permutation = self.settings.get('permutation_tests', True)
+        min_permutation_size = self.settings.get('permutation_min_group_size', 5)
+        max_permutation_rows = self.settings.get('permutation_max_rows', 5000)
+
+        group = pl.col(group_col)
+        collapsed = None
+        if levels is not None:
+            # Pool levels outside the top k into one bucket, in the same single pass
+            other = self.OTHER_LABEL if self.OTHER_LABEL not in levels else f"({self.OTHER_LABEL})"
+            group = collapse_levels(group_col, levels, other)
+            collapsed = {'top_k': len(levels), 'levels': levels, 'other_label': other}
+
+        frame = df.select([group] + measures).filter(pl.col(group_col).is_not_null())
+        aggregates = self._group_aggregates(frame, group_col, measures)
+
+        # Groups kept per measure, in sorted group order
+        kept = {}
+        permuted = set()  # Measures with groups too small for parametric p-values
+        for measure_col in measures:
+            counts = aggregates[f"{measure_col}__n"].to_list()
+
+            # Small groups are kept when a permutation test over all kept rows is affordable
+            if permutation:
+                rows = [i for i, n in enumerate(counts) if n >= min_permutation_size]
+                if (
+                    len(rows) >= 2
+                    and any(counts[i] < min_group_size for i in rows)
+                    and sum(counts[i] for i in rows) <= max_permutation_rows
+                ):
+                    kept[measure_col] = rows
+                    permuted.add(measure_col)
                     continue
 
-                # Perform appropriate test
-                if len(group_arrays) == 2:
-                    # Two groups: Welch's t-test
-                    t_stat, p_value = stats.ttest_ind(group_arrays[0], group_arrays[1], equal_var=False)
-
-                    # Compute Cohen's d
-                    n1, n2 = len(group_arrays[0]), len(group_arrays[1])
-                    s1, s2 = np.std(group_arrays[0]), np.std(group_arrays[1])
-                    pooled_std = np.sqrt(((n1 - 1) * s1**2 + (n2 - 1) * s2**2) / (n1 + n2 - 2))
-                    cohens_d = (np.mean(group_arrays[0]) - np.mean(group_arrays[1])) / pooled_std if pooled_std > 0 else 0
-
-                    # Effect size interpretation
-                    effect_size = abs(cohens_d)
-                    effect_label = "large" if effect_size > 0.8 else ("medium" if effect_size > 0.5 else "small")
-
-                    if p_value < 0.05 or effect_size > 0.5:
-                        insight_counter += 1
-
-                        group_names = list(group_stats.keys())
-                        missingness = profile['missingness'][measure_col]['fraction']
-
-                        insights.append(Insight(
-                            id=f"G{insight_counter:03d}",
-                            title=f"{measure_col} differs significantly between {group_col} groups",
-                            rationale=f"Welch's t-test shows {effect_label} effect (d={cohens_d:.3f}, p={p_value:.4f}) between {group_names[0]} and {group_names[1]}.",
-                            primary_columns=[group_col, measure_col],
-                            statistics={
-                                't_statistic': float(t_stat),
-                                'p_value': float(p_value),
-                                'cohens_d': float(cohens_d),
-                                'effect_size_label': effect_label,
-                                'groups': group_stats,
-                                'n_total': sum(len(g) for g in group_arrays),
-                            },
-                            quality_score=self.compute_quality_score(
-                                sum(len(g) for g in group_arrays),
-                                effect_size,
-                                missingness
-                            ),
-                            suggested_visuals=['grouped_bar', 'boxplot_by_group', 'violin_by_group'],
-                            caveats=[
-                                'Welch\'s t-test assumes approximately normal distributions.',
-                                'Outliers may influence results significantly.',
-                            ],
-                            detector_type='group',
-                        ))
-
-                else:
-                    # More than two groups: Brown-Forsythe ANOVA (more robust than standard ANOVA)
-                    # Using Kruskal-Wallis as a simpler alternative
-                    h_stat, p_value = stats.kruskal(*group_arrays)
-
-                    # Compute eta-squared (effect size for ANOVA)
-                    grand_mean = np.mean(np.concatenate(group_arrays))
-                    ss_between = sum(len(g) * (np.mean(g) - grand_mean)**2 for g in group_arrays)
-                    ss_total = sum((x - grand_mean)**2 for g in group_arrays for x in g)
-                    eta_squared = ss_between / ss_total if ss_total > 0 else 0
-
-                    effect_size = eta_squared
-                    effect_label = "large" if effect_size > 0.14 else ("medium" if effect_size > 0.06 else "small")
-
-                    if p_value < 0.05 or effect_size > 0.06:
-                        insight_counter += 1
-
-                        missingness = profile['missingness'][measure_col]['fraction']
-
-                        insights.append(Insight(
-                            id=f"G{insight_counter:03d}",
-                            title=f"{measure_col} varies significantly across {group_col} groups",
-                            rationale=f"Kruskal-Wallis test shows {effect_label} effect (η²={eta_squared:.3f}, p={p_value:.4f}) across {len(group_arrays)} groups.",
-                            primary_columns=[group_col, measure_col],
-                            statistics={
-                                'h_statistic': float(h_stat),
-                                'p_value': float(p_value),
-                                'eta_squared': float(eta_squared),
-                                'effect_size_label': effect_label,
-                                'groups': group_stats,
-                                'n_total': sum(len(g) for g in group_arrays),
-                                'n_groups': len(group_arrays),
-                            },
-                            quality_score=self.compute_quality_score(
-                                sum(len(g) for g in group_arrays),
-                                effect_size,
-                                missingness
-                            ),
-                            suggested_visuals=['grouped_bar', 'boxplot_by_group', 'violin_by_group'],
-                            caveats=[
-                                'Kruskal-Wallis is a non-parametric test suitable for non-normal data.',
-                                'Post-hoc tests needed to identify specific group differences.',
-                            ],
-                            detector_type='group',
-                        ))
+            if sum(counts) < min_group_size:
+                continue
+
+            rows = [i for i, n in enumerate(counts) if n >= min_group_size]
+            if len(rows) >= 2:
+                kept[measure_col] = rows
+
+        rank_sums = self._rank_sums(
+            frame, group_col,
+            {m: rows for m, rows in kept.items() if len(rows) > 2},
+        )
+
+        for measure_col, rows in kept.items():
+            group_stats = {}
+            moments = []
+
+            for i in rows:
+                group = aggregates[group_col][i]
+                n = aggregates[f"{measure_col}__n"][i]
+                mean = aggregates[f"{measure_col}__mean"][i]
+                var = aggregates[f"{measure_col}__var"][i] or 0.0
+                group_stats[str(group)] = {
+                    'n': n,
+                    'mean': float(mean),
+                    'std': float(np.sqrt(var * (n - 1) / n)),
+                    'median': float(aggregates[f"{measure_col}__median"][i]),
+                }
+                moments.append((n, mean, var))
+
+            n_total = sum(n for n, _, _ in moments)
+
+            # A constant measure has no differences to test
+            grand_mean = sum(n * mean for n, mean, _ in moments) / n_total
+            if all(var == 0 and mean == grand_mean for _, mean, var in moments):
+                continue
+
+            candidate = {'measure': measure_col, 'groups': group_stats, 'n_total': n_total}
+            if collapsed:
+                other_n = group_stats.get(collapsed['other_label'], {}).get('n', 0)
+                candidate['collapsed'] = {**collapsed, 'other_fraction': other_n / n_total if n_total else 0.0}
+
+            # Perform appropriate test
+            if len(moments) == 2:
+                # Two groups: Welch's t-test from the group moments
+                (n1, m1, v1), (n2, m2, v2) = moments
+                t_stat, p_value = self._welch_t(n1, m1, v1, n2, m2, v2)
+
+                # Compute Cohen's d
+                s1, s2 = [g['std'] for g in group_stats.values()]
+                pooled_std = np.sqrt(((n1 - 1) * s1**2 + (n2 - 1) * s2**2) / (n1 + n2 - 2))
+                cohens_d = (m1 - m2) / pooled_std if pooled_std > 0 else 0
+
+                candidate.update(test='welch_t', statistic=t_stat, p_value=p_value, effect=cohens_d)
+
+            else:
+                # More than two groups: Brown-Forsythe ANOVA (more robust than standard ANOVA)
+                # Using Kruskal-Wallis as a simpler alternative
+                h_stat, p_value = self._kruskal(moments, rank_sums[measure_col])
+
+                # Compute eta-squared (effect size for ANOVA) from sums of squares
+                ss_between = sum(n * (mean - grand_mean)**2 for n, mean, _ in moments)
+                ss_within = sum((n - 1) * var for n, _, var in moments)
+                ss_total = ss_between + ss_within
+                eta_squared = ss_between / ss_total if ss_total > 0 else 0
+
+                candidate.update(test='kruskal', statistic=h_stat, p_value=p_value, effect=eta_squared)
+
+            if measure_col in permuted:
+                result = self._permutation_test(frame, group_col, measure_col, rows, candidate['test'])
+                candidate.update(p_value=result['p_value'], permutation=result)
+
+            candidates.append(candidate)
+
+        return candidates
+
+    def select(
+        self,
+        df: pl.DataFrame,
+        schema: Dict[str, Any],
+        profile: Dict[str, Any],
+        item: tuple,
+        candidates: List[Dict[str, Any]],
+    ) -> List[Insight]:
+        """
+        Turn per-measure test results into insights for notable differences.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (group_col, measure columns, kept levels) from plan()
+            candidates: Per-measure results from candidates()
+
+        Returns:
+            List of detected Insight objects
+        """
+        insights = []
+
+        group_col = item[0]
+
+        for candidate in candidates:
+            measure_col = candidate['measure']
+            group_stats = candidate['groups']
+            n_total = candidate['n_total']
+            p_value = candidate['p_value']
+            permutation = candidate.get('permutation')
+            p_label = 'permutation p' if permutation else 'p'
+            insight = None
+
+            if candidate['test'] == 'welch_t':
+                t_stat, cohens_d = candidate['statistic'], candidate['effect']
+
+                # Effect size interpretation
+                effect_size = abs(cohens_d)
+                effect_label = "large" if effect_size > 0.8 else ("medium" if effect_size > 0.5 else "small")
+
+                if (p_value < 0.05 or effect_size > 0.5) and (permutation is None or p_value < 0.05):
+                    group_names = list(group_stats.keys())
+                    missingness = profile['missingness'][measure_col]['fraction']
+
+                    insight = Insight(
+                        id='',
+                        title=f"{measure_col} differs significantly between {group_col} groups",
+                        rationale=f"Welch's t-test shows {effect_label} effect (d={cohens_d:.3f}, {p_label}={p_value:.4f}) between {group_names[0]} and {group_names[1]}.",
+                        primary_columns=[group_col, measure_col],
+                        statistics={
+                            't_statistic': float(t_stat),
+                            'p_value': float(p_value),
+                            'cohens_d': float(cohens_d),
+                            'effect_size_label': effect_label,
+                            'groups': group_stats,
+                            'n_total': n_total,
+                        },
+                        quality_score=self.compute_quality_score(
+                            n_total,
+                            effect_size,
+                            missingness
+                        ),
+                        suggested_visuals=['grouped_bar', 'boxplot_by_group', 'violin_by_group'],
+                        caveats=[
+                            'Welch\'s t-test assumes approximately normal distributions.',
+                            'Outliers may influence results significantly.',
+                        ],
+                        detector_type='group',
+                    )
+
+            else:
+                h_stat, eta_squared = candidate['statistic'], candidate['effect']
+
+                effect_size = eta_squared
+                effect_label = "large" if effect_size > 0.14 else ("medium" if effect_size > 0.06 else "small")
+
+                if (p_value < 0.05 or effect_size > 0.06) and (permutation is None or p_value < 0.05):
+                    missingness = profile['missingness'][measure_col]['fraction']
+
+                    insight = Insight(
+                        id='',
+                        title=f"{measure_col} varies significantly across {group_col} groups",
+                        rationale=f"Kruskal-Wallis test shows {effect_label} effect (η²={eta_squared:.3f}, {p_label}={p_value:.4f}) across {len(group_stats)} groups.",
+                        primary_columns=[group_col, measure_col],
+                        statistics={
+                            'h_statistic': float(h_stat),
+                            'p_value': float(p_value),
+                            'eta_squared': float(eta_squared),
+                            'effect_size_label': effect_label,
+                            'groups': group_stats,
+                            'n_total': n_total,
+                            'n_groups': len(group_stats),
+                        },
+                        quality_score=self.compute_quality_score(
+                            n_total,
+                            effect_size,
+                            missingness
+                        ),
+                        suggested_visuals=['grouped_bar', 'boxplot_by_group', 'violin_by_group'],
+                        caveats=[
+                            'Kruskal-Wallis is a non-parametric test suitable for non-normal data.',
+                            'Post-hoc tests needed to identify specific group differences.',
+                        ],
+                        detector_type='group',
+                    )
+
+            if insight is None:
+                continue
+
+            if permutation:
+                insight.statistics['p_value_method'] = 'permutation'
+                insight.statistics['permutations'] = permutation['permutations']
+                insight.caveats.append(
+                    f"Some groups have fewer than {self.settings.get('min_sample_for_parametrics', 20)} values; "
+                    f"the p-value comes from {permutation['permutations']} random label permutations."
+                )
+
+            collapsed = candidate.get('collapsed')
+            if collapsed:
+                insight.statistics['collapsed'] = collapsed
+                insight.caveats.append(
+                    f"{group_col} was limited to its {collapsed['top_k']} most frequent levels; "
+                    f"the rest ({collapsed['other_fraction']:.0%} of rows) are pooled as '{collapsed['other_label']}'."
+                )
+
+            insights.append(insight)
 
         return insights
+
+    def _group_aggregates(self, frame: pl.DataFrame, group_col: str, measures: List[str]) -> pl.DataFrame:
+        """
+        Per-group count, mean, variance and median of every measure in one pass.
+
+        Args:
+            frame: Rows with a non-null group
+            group_col: Grouping column
+            measures: Numeric measure columns
+
+        Returns:
+            DataFrame with one row per group, sorted by group
+        """
+        aggs = []
+        for measure_col in measures:
+            col = pl.col(measure_col).cast(pl.Float64)
+            aggs.extend([
+                col.count().alias(f"{measure_col}__n"),
+                col.mean().alias(f"{measure_col}__mean"),
+                col.var(ddof=1).alias(f"{measure_col}__var"),
+                col.median().alias(f"{measure_col}__median"),
+            ])
+
+        return frame.group_by(group_col).agg(aggs).sort(group_col)
+
+    def _rank_sums(
+        self,
+        frame: pl.DataFrame,
+        group_col: str,
+        kept: Dict[str, List[int]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Kruskal-Wallis rank sums and tie terms, one sort per measure.
+
+        Each measure is ranked over the rows of its kept groups only.
+
+        Args:
+            frame: Rows with a non-null group
+            group_col: Grouping column
+            kept: Measure -> row indices of the kept groups in the sorted aggregates
+
+        Returns:
+            Dict mapping measure to {'rank_sums': [...], 'tie_term': float}
+        """
+        if not kept:
+            return {}
+
+        codes = self._group_codes(frame, group_col)
+        results = {}
+
+        for measure_col, rows in kept.items():
+            values = frame[measure_col].cast(pl.Float64).to_numpy()
+            mask = ~np.isnan(values) & np.isin(codes, rows)
+            values, groups = values[mask], codes[mask]
+
+            # Ties share an average rank, so an unstable sort is enough
+            order = np.argsort(values)
+            ordered = values[order]
+            starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+            lengths = np.diff(np.r_[starts, len(ordered)])
+
+            # Average 1-based rank of each tie block, spread over its members
+            ranks = np.repeat(starts + (lengths + 1) / 2.0, lengths)
+            rank_sums = np.bincount(groups[order], weights=ranks, minlength=max(rows) + 1)
+
+            lengths = lengths.astype(np.float64)
+            results[measure_col] = {
+                'rank_sums': rank_sums[rows].tolist(),
+                'tie_term': float(np.sum(lengths ** 3 - lengths)),
+            }
+
+        return results
+
+    @staticmethod
+    def _group_codes(frame: pl.DataFrame, group_col: str) -> np.ndarray:
+        """
+        Index of each row's group among the sorted aggregate rows.
+
+        Args:
+            frame: Rows with a non-null group
+            group_col: Grouping column
+
+        Returns:
+            Integer codes per row (dense ranks follow the aggregates' sort order)
+        """
+        return frame.select(pl.col(group_col).rank('dense')).to_series().to_numpy().astype(np.int64) - 1
+
+    def _permutation_test(
+        self,
+        frame: pl.DataFrame,
+        group_col: str,
+        measure_col: str,
+        rows: List[int],
+        test: str,
+    ) -> Dict[str, Any]:
+        """
+        Permutation p-value of Welch's t or Kruskal-Wallis H over the kept groups.
+
+        Args:
+            frame: Rows with a non-null group
+            group_col: Grouping column
+            measure_col: Measure column
+            rows: Row indices of the kept groups in the sorted aggregates
+            test: 'welch_t' or 'kruskal'
+
+        Returns:
+            PermutationTest result dict
+        """
+        values = frame[measure_col].cast(pl.Float64).to_numpy()
+        codes = self._group_codes(frame, group_col)
+
+        # Renumber kept groups 0..k-1 and drop other groups and missing values
+        position = np.full(codes.max() + 1, -1)
+        position[rows] = np.arange(len(rows))
+        codes = position[codes]
+        mask = (codes >= 0) & ~np.isnan(values)
+        values, codes = values[mask], codes[mask]
+
+        tester = PermutationTest(self.settings)
+        rng = seeded_rng(f"group|{group_col}|{measure_col}")
+
+        if test == 'welch_t':
+            return tester.two_groups(values, codes, rng)
+        return tester.k_groups(values, codes, len(rows), rng)
+
+    @staticmethod
+    def _welch_t(n1: int, m1: float, v1: float, n2: int, m2: float, v2: float) -> tuple[float, float]:
+        """
+        Welch's t-test from group sizes, means and (ddof=1) variances.
+
+        Args:
+            n1, m1, v1: Size, mean and variance of the first group
+            n2, m2, v2: Size, mean and variance of the second group
+
+        Returns:
+            Tuple of (t statistic, two-sided p-value)
+        """
+        se1, se2 = v1 / n1, v2 / n2
+        se = np.sqrt(se1 + se2)
+
+        if se == 0:
+            return float('nan'), float('nan')
+
+        t_stat = (m1 - m2) / se
+        dof = (se1 + se2) ** 2 / (se1 ** 2 / (n1 - 1) + se2 ** 2 / (n2 - 1))
+        p_value = 2 * stats.t.sf(abs(t_stat), dof)
+
+        return float(t_stat), float(p_value)
+
+    @staticmethod
+    def _kruskal(moments: List[tuple], ranks: Dict[str, Any]) -> tuple[float, float]:
+        """
+        Kruskal-Wallis H test from rank sums, with tie correction.
+
+        Args:
+            moments: (n, mean, var) per kept group
+            ranks: Rank sums per kept group and the tie term sum(t**3 - t)
+
+        Returns:
+            Tuple of (H statistic, p-value)
+        """
+        sizes = np.array([n for n, _, _ in moments], dtype=np.float64)
+        rank_sums = np.array(ranks['rank_sums'], dtype=np.float64)
+        n_total = sizes.sum()
+
+        h_stat = 12.0 / (n_total * (n_total + 1)) * np.sum(rank_sums ** 2 / sizes) - 3 * (n_total + 1)
+        correction = 1 - ranks['tie_term'] / (n_total ** 3 - n_total)
+
+        if correction == 0:
+            return float('nan'), float('nan')
+
+        h_stat /= correction
+        p_value = stats.chi2.sf(h_stat, len(moments) - 1)
+
+        return float(h_stat), float(p_value)
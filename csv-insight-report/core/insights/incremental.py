@@ -0,0 +1,450 @@
+"""
+Incremental Insight Detection
+Reruns only the detector work whose inputs changed since the last run.
+
+Each plan() and candidates() call runs against recording views of the
+settings, schema and profile, which log every value read (by key path,
+with a fingerprint). Work items also declare the data columns they read
+(item_columns()), fingerprinted with one hash pass per DataFrame. On a
+rerun, a cached plan or candidate is reused when every input it read is
+unchanged, and select() re-applies thresholds to cached candidates
+without touching the data. Settings read only by ranking or narrative
+(max_insights_to_surface, expertise, audience, ...) are never read by
+plan() or candidates(), so changing them triggers no data work.
+Bootstrap intervals of the top insights are cached by a fingerprint of
+the insight, its columns' data and the bootstrap settings, so a ranking
+change only computes intervals for insights new to the top.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+import numpy as np
+import polars as pl
+from .base import BaseDetector
+from .bootstrap import BootstrapIntervals
+from .registry import create_detectors
+from .runner import build_output
+
+
+# Path suffix recording that a mapping's keys were listed or tested
+KEYS = '__keys__'
+
+# Fingerprint of a path that did not exist when read
+MISSING = '__missing__'
+
+# Cached variants kept per work item (e.g. results under old and new thresholds)
+VARIANTS_PER_ITEM = 4
+
+# Settings the bootstrap intervals depend on
+BOOTSTRAP_SETTINGS = ('bootstrap_resamples', 'bootstrap_confidence', 'bootstrap_max_rows')
+
+# Cached bootstrap results kept (most recent first)
+INTERVALS_CACHED = 256
+
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback for values in settings and profiles"""
+    if isinstance(value, np.ndarray):
+        return [str(value.dtype), value.shape, hashlib.blake2b(value.tobytes(), digest_size=16).hexdigest()]
+    if isinstance(value, Mapping):
+        return dict(value)
+    return repr(value)
+
+
+def _fingerprint(value: Any) -> str:
+    """
+    Content hash of a settings, schema or profile value.
+
+    Args:
+        value: JSON-like value
+
+    Returns:
+        Hex digest
+    """
+    encoded = json.dumps(value, sort_keys=True, default=_json_default).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class _Recorder(Mapping):
+    """
+    Read-only view of a nested dict that logs the paths read.
+
+    Leaf values are logged when read; nested mappings come back as
+    recorders of their own. Listing keys or testing membership logs the
+    key set. Pickling (e.g. for an isolated plugin process) logs the
+    whole value, since reads in another process cannot be seen.
+    """
+
+    def __init__(self, data: Mapping, reads: Dict[tuple, str], path: tuple = ()):
+        self._data = data
+        self._reads = reads
+        self._path = path
+
+    def __getitem__(self, key: Any) -> Any:
+        path = self._path + (key,)
+        try:
+            value = self._data[key]
+        except KeyError:
+            self._reads[path] = MISSING
+            raise
+
+        if isinstance(value, Mapping):
+            return _Recorder(value, self._reads, path)
+
+        self._reads[path] = _fingerprint(value)
+        return value
+
+    def _read_keys(self) -> None:
+        self._reads[self._path + (KEYS,)] = _fingerprint(sorted(map(repr, self._data)))
+
+    def __iter__(self):
+        self._read_keys()
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        self._read_keys()
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        self._read_keys()
+        return key in self._data
+
+    def __reduce__(self):
+        self._reads[self._path] = _fingerprint(self._data)
+        return (dict, (dict(self._data),))
+
+
+def _resolve(root: Mapping, path: tuple) -> str:
+    """
+    Fingerprint of the value at a recorded path in the current inputs.
+
+    Args:
+        root: Settings, schema or profile dict
+        path: Key path logged by _Recorder
+
+    Returns:
+        Fingerprint (MISSING if the path does not exist)
+    """
+    value = root
+    for k, key in enumerate(path):
+        if key == KEYS and k == len(path) - 1:
+            return _fingerprint(sorted(map(repr, value)))
+        try:
+            value = value[key]
+        except (KeyError, IndexError, TypeError):
+            return MISSING
+
+    return _fingerprint(value)
+
+
+def _tracked_call(detector: BaseDetector, method: str, df: pl.DataFrame,
+                  schema: Dict[str, Any], profile: Dict[str, Any], *args) -> tuple:
+    """
+    Call a detector method while recording the settings, schema and profile it reads.
+
+    Args:
+        detector: Detector instance
+        method: 'plan' or 'candidates'
+        df: Input DataFrame
+        schema: Schema dict from ingest
+        profile: Profile dict from profiling
+        *args: Extra arguments (the work item)
+
+    Returns:
+        Tuple of (result, reads dict, elapsed seconds)
+    """
+    reads = {'settings': {}, 'schema': {}, 'profile': {}}
+
+    # A shallow copy keeps concurrent items of one detector from sharing the recorder
+    tracked = copy.copy(detector)
+    tracked.settings = _Recorder(detector.settings, reads['settings'])
+
+    start = time.perf_counter()
+    result = getattr(tracked, method)(
+        df,
+        _Recorder(schema, reads['schema']),
+        _Recorder(profile, reads['profile']),
+        *args,
+    )
+    seconds = time.perf_counter() - start
+
+    if hasattr(tracked, 'status'):
+        detector.status = tracked.status
+
+    return result, reads, seconds
+
+
+class IncrementalRunner:
+    """
+    run_all() with a cache of plans and candidate statistics across runs.
+
+    Usage:
+        runner = IncrementalRunner()
+        insights = runner.run(df, schema, profile, settings)
+        settings['correlation_min_abs'] = 0.5
+        insights = runner.run(df, schema, profile, settings)  # re-thresholds cached pairs
+    """
+
+    def __init__(self):
+        """Initialize an empty cache"""
+        # Detector slot -> {'plan': entry, 'items': {item key: [entries, most recent first]}}
+        self.cache: Dict[str, Dict[str, Any]] = {}
+        # Insight fingerprint -> statistics added by the bootstrap
+        self.intervals: Dict[str, Dict[str, Any]] = {}
+        self._frame: Optional[pl.DataFrame] = None
+        self._column_fingerprints: Dict[str, str] = {}
+
+    def run(
+        self,
+        df: pl.DataFrame,
+        schema: Dict[str, Any],
+        profile: Dict[str, Any],
+        settings: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Run all enabled detectors, reusing cached work whose inputs are unchanged.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            settings: Settings dict from config
+
+        Returns:
+            Insights dict as from run_all(), plus 'incremental' reuse counts
+        """
+        detectors = create_detectors(settings)
+        workers = settings.get('detector_workers') or os.cpu_count() or 1
+
+        start = time.perf_counter()
+        self._fingerprint_frame(df)
+
+        costs = {}
+        plans = []
+        tasks = []
+
+        for d, detector in enumerate(detectors):
+            cache = self.cache.setdefault(self._cache_key(detector), {'plan': None, 'items': {}})
+            costs[detector.name] = {'plan_seconds': 0.0, 'item_seconds': 0.0, 'reused_plan': True, 'reused_items': 0}
+
+            entry = cache['plan']
+            if entry is None or not self._valid(entry, detector, schema, profile):
+                items, reads, seconds = _tracked_call(detector, 'plan', df, schema, profile)
+                cache['plan'] = entry = {'items': items, 'reads': reads, 'columns': None}
+                self._stamp_columns(entry)
+                costs[detector.name].update(plan_seconds=seconds, reused_plan=False)
+
+            items = entry['items']
+            keys = [detector.item_key(item) for item in items]
+            plans.append((items, keys))
+            costs[detector.name]['work_items'] = len(items)
+
+            for i, key in enumerate(keys):
+                variants = cache['items'].setdefault(key, [])
+                valid = [entry for entry in variants if self._valid(entry, detector, schema, profile)]
+                if valid:
+                    # Most recently used variant first
+                    variants.remove(valid[0])
+                    variants.insert(0, valid[0])
+                    costs[detector.name]['reused_items'] += 1
+                else:
+                    tasks.append((d, i))
+
+        # Recompute the stale candidates on the worker pool
+        def compute(task):
+            d, i = task
+            return _tracked_call(detectors[d], 'candidates', df, schema, profile, plans[d][0][i])
+
+        if workers > 1 and len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(compute, tasks))
+        else:
+            outcomes = [compute(task) for task in tasks]
+
+        for (d, i), (candidates, reads, seconds) in zip(tasks, outcomes):
+            detector = detectors[d]
+            items, keys = plans[d]
+            entry = {
+                'candidates': candidates,
+                'reads': reads,
+                'columns': detector.item_columns(schema, profile, items[i]),
+            }
+            self._stamp_columns(entry)
+            variants = self.cache[self._cache_key(detector)]['items'][keys[i]]
+            variants.insert(0, entry)
+            del variants[VARIANTS_PER_ITEM:]
+            costs[detector.name]['item_seconds'] += seconds
+
+        # Thresholds and insight construction always run; they never read the data
+        all_insights = []
+        for d, detector in enumerate(detectors):
+            items, keys = plans[d]
+            cached = self.cache[self._cache_key(detector)]['items']
+            item_results = [
+                detector.select(df, schema, profile, item, cached[key][0]['candidates'])
+                for item, key in zip(items, keys)
+            ]
+            insights = detector.assign_ids(item_results)
+            all_insights.extend(insights)
+            costs[detector.name]['insights'] = len(insights)
+            costs[detector.name].update(getattr(detector, 'status', {}))
+
+        detection_seconds = time.perf_counter() - start
+
+        insights_output = build_output(all_insights, settings, {
+            'detector_costs': costs,
+            'detection_seconds': detection_seconds,
+            'detector_workers': workers,
+            'incremental': {
+                'plans_reused': sum(c['reused_plan'] for c in costs.values()),
+                'items_reused': sum(c['reused_items'] for c in costs.values()),
+                'items_computed': len(tasks),
+            },
+        })
+        insights_output['incremental']['intervals_computed'] = self._add_confidence_intervals(
+            insights_output['top_insights'], df, profile, settings
+        )
+
+        return insights_output
+
+    def _add_confidence_intervals(
+        self,
+        insights: List[Dict[str, Any]],
+        df: pl.DataFrame,
+        profile: Dict[str, Any],
+        settings: Dict[str, Any],
+    ) -> int:
+        """
+        Add bootstrap intervals to insight dicts in place, reusing cached ones.
+
+        Args:
+            insights: Top insight dicts
+            df: Input DataFrame
+            profile: Profile dict from profiling
+            settings: Settings dict from config
+
+        Returns:
+            Number of insights whose intervals were computed
+        """
+        engine = BootstrapIntervals(df, profile, settings)
+        if engine.resamples <= 0 or not insights:
+            return 0
+
+        keys = [self._interval_key(insight, profile, settings) for insight in insights]
+        missing = [insight for insight, key in zip(insights, keys) if key not in self.intervals]
+        before = [set(insight['statistics']) for insight in missing]
+
+        engine.add(missing)
+
+        added = {
+            id(insight): {name: value for name, value in insight['statistics'].items() if name not in names}
+            for insight, names in zip(missing, before)
+        }
+        for insight, key in zip(insights, keys):
+            if id(insight) in added:
+                self.intervals[key] = added[id(insight)]
+            else:
+                insight['statistics'].update(copy.deepcopy(self.intervals[key]))
+            self.intervals[key] = self.intervals.pop(key)  # Most recently used last
+
+        for key in list(self.intervals)[:-INTERVALS_CACHED]:
+            del self.intervals[key]
+
+        return len(missing)
+
+    def _interval_key(self, insight: Dict[str, Any], profile: Dict[str, Any], settings: Dict[str, Any]) -> str:
+        """
+        Fingerprint of everything an insight's bootstrap intervals depend on.
+
+        Args:
+            insight: Insight dict (before intervals are added)
+            profile: Profile dict (top values of collapsed group columns)
+            settings: Settings dict from config
+
+        Returns:
+            Hex digest
+        """
+        columns = list(insight['primary_columns'])
+        return _fingerprint([
+            insight['detector_type'],
+            columns,
+            insight['statistics'],
+            [settings.get(name) for name in BOOTSTRAP_SETTINGS],
+            [self._column_fingerprints.get(c, MISSING) for c in columns],
+            [profile.get('cardinality', {}).get(c, {}).get('top_values') for c in columns],
+        ])
+
+    @staticmethod
+    def _cache_key(detector: BaseDetector) -> str:
+        """Cache slot of a detector: its name and implementation"""
+        spec = getattr(detector, 'spec', None)
+        target = spec.target if spec is not None else f"{type(detector).__module__}.{type(detector).__qualname__}"
+        return f"{detector.name}:{target}"
+
+    def _fingerprint_frame(self, df: pl.DataFrame) -> None:
+        """
+        Hash every column once per DataFrame (skipped when df is the cached frame).
+
+        Hashes are order-sensitive: each value hash is mixed with a hash of
+        its row index before summing.
+
+        Args:
+            df: Input DataFrame
+        """
+        if df is self._frame:
+            return
+
+        row_hash = pl.int_range(pl.len(), dtype=pl.UInt64).hash(1)
+        hashes = df.select([
+            (pl.col(c).hash(0) ^ row_hash).sum().alias(c)
+            for c in df.columns
+        ]).row(0) if df.width else ()
+
+        self._frame = df
+        self._column_fingerprints = {
+            c: f"{df.schema[c]}:{len(df)}:{h}"
+            for c, h in zip(df.columns, hashes)
+        }
+        self._column_fingerprints[None] = _fingerprint([df.columns, list(self._column_fingerprints.values())])
+
+    def _stamp_columns(self, entry: Dict[str, Any]) -> None:
+        """
+        Record the current fingerprints of the columns a cache entry read.
+
+        Args:
+            entry: Cache entry with 'columns' (None for all columns)
+        """
+        columns = entry['columns']
+        names = [None] if columns is None else columns
+        entry['column_fingerprints'] = {c: self._column_fingerprints.get(c, MISSING) for c in names}
+
+    def _valid(self, entry: Dict[str, Any], detector: BaseDetector,
+               schema: Dict[str, Any], profile: Dict[str, Any]) -> bool:
+        """
+        Whether every input a cache entry read is unchanged.
+
+        Args:
+            entry: Plan or candidate cache entry
+            detector: Detector instance (its settings are the current ones)
+            schema: Current schema dict
+            profile: Current profile dict
+
+        Returns:
+            True if the entry can be reused
+        """
+        for c, fingerprint in entry['column_fingerprints'].items():
+            if self._column_fingerprints.get(c, MISSING) != fingerprint:
+                return False
+
+        sources = {'settings': detector.settings, 'schema': schema, 'profile': profile}
+        return all(
+            _resolve(sources[source], path) == fingerprint
+            for source, reads in entry['reads'].items()
+            for path, fingerprint in reads.items()
+        )
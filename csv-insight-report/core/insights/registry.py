@@ -0,0 +1,434 @@
+"""
+Detector Registry
+Discovers built-in, entry-point and plugins/ detectors and creates the enabled ones.
+
+Detectors are described by DetectorSpec objects and imported only when
+enabled in settings:
+- built-in detectors are registered by module path
+- installed packages register detectors under the ENTRY_POINT_GROUP entry point group
+- files in plugins/ are scanned with ast for BaseDetector subclasses, without importing them
+
+Plugin and entry-point detectors run in a separate worker process with a
+timeout and memory limit (see IsolatedDetector), so a slow or crashing
+plugin cannot stall a report.
+"""
+
+import ast
+import importlib
+import importlib.util
+import io
+import multiprocessing
+import re
+import sys
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+import polars as pl
+from .base import BaseDetector, Insight
+
+
+ENTRY_POINT_GROUP = 'csv_insight_report.detectors'
+
+PLUGINS_DIR = Path(__file__).resolve().parents[2] / 'plugins'
+
+# Built-in detectors, in default run order
+BUILTIN_DETECTORS = {
+    'distribution': '.distributions:DistributionDetector',
+    'trend': '.trends:TrendDetector',
+    'panel_trend': '.trends:PanelTrendDetector',
+    'seasonality': '.seasonality:SeasonalityDetector',
+    'changepoint': '.changepoints:ChangepointDetector',
+    'anomaly': '.anomalies:AnomalyDetector',
+    'group': '.groups:GroupDetector',
+    'relationship': '.relationships:RelationshipDetector',
+    'driver': '.drivers:DriverDetector',
+    'subgroup': '.subgroups:SubgroupDetector',
+    'cluster': '.clusters:ClusterDetector',
+}
+
+DEFAULT_ENABLED = list(BUILTIN_DETECTORS)
+
+
+@dataclass
+class DetectorSpec:
+    """
+    Describes a detector without importing it.
+    """
+    name: str
+    target: str  # 'module:ClassName' (module relative to this package for built-ins)
+    source: str  # 'builtin', 'entry_point' or 'plugin'
+    path: Optional[str] = None  # Source file of plugins/ detectors
+    _cls: Optional[type] = field(default=None, repr=False, compare=False)
+
+    @property
+    def isolated(self) -> bool:
+        """Whether the detector runs in a worker process"""
+        return self.source != 'builtin'
+
+    def load(self) -> type:
+        """
+        Import the detector class.
+
+        Returns:
+            BaseDetector subclass
+
+        Raises:
+            TypeError: If the target is not a BaseDetector subclass
+        """
+        if self._cls is None:
+            module_name, class_name = self.target.split(':')
+
+            if self.path is not None:
+                module = _import_file(module_name, self.path)
+            else:
+                module = importlib.import_module(module_name, __package__)
+
+            cls = getattr(module, class_name)
+            if not (isinstance(cls, type) and issubclass(cls, BaseDetector)):
+                raise TypeError(f"Detector '{self.name}' ({self.target}) is not a BaseDetector subclass")
+
+            self._cls = cls
+
+        return self._cls
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for provenance records"""
+        return {
+            'name': self.name,
+            'target': self.target,
+            'source': self.source,
+        }
+
+
+def _import_file(module_name: str, path: str):
+    """
+    Import a module from a file path (cached in sys.modules).
+
+    Args:
+        module_name: Name to register the module under
+        path: Path to the .py file
+
+    Returns:
+        Imported module
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _default_name(class_name: str) -> str:
+    """
+    Detector name derived from a class name (OutlierDetector -> outlier).
+
+    Args:
+        class_name: Detector class name
+
+    Returns:
+        snake_case detector name
+    """
+    base = re.sub(r'Detector$', '', class_name) or class_name
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', base).lower()
+
+
+def scan_plugins(plugins_dir: Optional[str] = None) -> List[DetectorSpec]:
+    """
+    Find detector classes in plugins/ by parsing, not importing, the files.
+
+    A class counts as a detector when one of its bases is named
+    BaseDetector or ends in 'Detector'. Its name is the literal `name`
+    class attribute if present, else derived from the class name.
+
+    Args:
+        plugins_dir: Directory to scan (defaults to the repo's plugins/)
+
+    Returns:
+        List of DetectorSpec objects in file and definition order
+    """
+    directory = Path(plugins_dir) if plugins_dir else PLUGINS_DIR
+    if not directory.is_dir():
+        return []
+
+    specs = []
+    for path in sorted(directory.glob('*.py')):
+        if path.name.startswith('_'):
+            continue
+
+        try:
+            tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+        except (SyntaxError, UnicodeDecodeError):
+            continue
+
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+
+            base_names = [
+                base.attr if isinstance(base, ast.Attribute) else getattr(base, 'id', '')
+                for base in node.bases
+            ]
+            if not any(name == 'BaseDetector' or name.endswith('Detector') for name in base_names):
+                continue
+
+            name = _default_name(node.name)
+            for statement in node.body:
+                if (
+                    isinstance(statement, ast.Assign)
+                    and any(isinstance(t, ast.Name) and t.id == 'name' for t in statement.targets)
+                    and isinstance(statement.value, ast.Constant)
+                    and isinstance(statement.value.value, str)
+                ):
+                    name = statement.value.value
+
+            specs.append(DetectorSpec(
+                name=name,
+                target=f"plugins.{path.stem}:{node.name}",
+                source='plugin',
+                path=str(path),
+            ))
+
+    return specs
+
+
+def available_detectors(settings: Optional[Dict[str, Any]] = None) -> Dict[str, DetectorSpec]:
+    """
+    All known detectors, keyed by name.
+
+    Built-ins come first and cannot be shadowed; entry points come before
+    plugins/ files.
+
+    Args:
+        settings: Optional settings dict ('plugins_dir' overrides the scan directory)
+
+    Returns:
+        Dict mapping detector name to DetectorSpec
+    """
+    settings = settings or {}
+    specs = {
+        name: DetectorSpec(name=name, target=target, source='builtin')
+        for name, target in BUILTIN_DETECTORS.items()
+    }
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        specs.setdefault(entry_point.name, DetectorSpec(
+            name=entry_point.name,
+            target=entry_point.value,
+            source='entry_point',
+        ))
+
+    for spec in scan_plugins(settings.get('plugins_dir')):
+        specs.setdefault(spec.name, spec)
+
+    return specs
+
+
+def enabled_specs(settings: Dict[str, Any]) -> List[DetectorSpec]:
+    """
+    Specs of the detectors enabled in settings, in run order.
+
+    Args:
+        settings: Settings dict ('enabled_detectors' lists names)
+
+    Returns:
+        List of DetectorSpec objects
+
+    Raises:
+        ValueError: If an enabled detector is unknown
+    """
+    names = settings.get('enabled_detectors') or DEFAULT_ENABLED
+    specs = available_detectors(settings)
+
+    unknown = [name for name in names if name not in specs]
+    if unknown:
+        raise ValueError(f"Unknown detectors enabled: {unknown}. Available: {sorted(specs)}")
+
+    return [specs[name] for name in names]
+
+
+def detector_settings(settings: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """
+    Settings for one detector: global settings overlaid with its parameters.
+
+    Args:
+        settings: Settings dict ('detector_params' maps name to a params dict)
+        name: Detector name
+
+    Returns:
+        Settings dict for the detector
+    """
+    params = (settings.get('detector_params') or {}).get(name, {})
+    return {**settings, **params}
+
+
+def create_detectors(settings: Dict[str, Any]) -> List[BaseDetector]:
+    """
+    Instantiate the enabled detectors.
+
+    Built-ins are imported and instantiated directly; plugin and
+    entry-point detectors are wrapped in IsolatedDetector and only
+    imported inside their worker process.
+
+    Args:
+        settings: Settings dict
+
+    Returns:
+        List of detector instances in run order
+    """
+    detectors = []
+
+    for spec in enabled_specs(settings):
+        spec_settings = detector_settings(settings, spec.name)
+
+        if spec.isolated and settings.get('plugin_isolation', True):
+            detectors.append(IsolatedDetector(spec, spec_settings))
+        else:
+            detectors.append(spec.load()(spec_settings))
+            detectors[-1].name = spec.name
+
+    return detectors
+
+
+def describe_detectors(settings: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Names, origins and parameters of the enabled detectors, for recipes.
+
+    Args:
+        settings: Settings dict
+
+    Returns:
+        List of detector description dicts
+    """
+    params = settings.get('detector_params') or {}
+    return [
+        {**spec.to_dict(), 'params': params.get(spec.name, {})}
+        for spec in enabled_specs(settings)
+    ]
+
+
+def _isolated_worker(spec: DetectorSpec, settings: Dict[str, Any], frame: bytes,
+                     schema: Dict[str, Any], profile: Dict[str, Any], conn) -> None:
+    """
+    Worker process entry point: apply the memory limit, import and run a detector.
+
+    Args:
+        spec: Detector spec
+        settings: Detector settings
+        frame: DataFrame as Arrow IPC bytes
+        schema: Schema dict from ingest
+        profile: Profile dict from profiling
+        conn: Pipe end for sending results back
+    """
+    memory_mb = settings.get('plugin_memory_limit_mb')
+
+    try:
+        if memory_mb:
+            try:
+                import resource
+                limit = int(memory_mb) * 1024 * 1024
+                resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+            except (ImportError, ValueError, OSError):
+                pass  # Not supported on this platform
+
+        detector = spec.load()(settings)
+        df = pl.read_ipc(io.BytesIO(frame))
+        insights = detector.detect(df, schema, profile)
+        conn.send({'insights': [insight.to_dict() for insight in insights]})
+
+    except MemoryError:
+        conn.send({'error': f"memory limit of {memory_mb} MB exceeded"})
+    except Exception as e:
+        conn.send({'error': f"{type(e).__name__}: {e}"})
+    finally:
+        conn.close()
+
+
+class IsolatedDetector(BaseDetector):
+    """
+    Runs a plugin detector in a spawned worker process.
+
+    The plugin is imported only in the worker. It gets the DataFrame as
+    Arrow IPC bytes, and its insights come back as dicts with the IDs the
+    plugin assigned. A run that exceeds 'plugin_timeout_seconds' is
+    terminated; errors and timeouts produce no insights and are reported
+    in `status`.
+    """
+
+    def __init__(self, spec: DetectorSpec, settings: Dict[str, Any]):
+        """
+        Initialize the wrapper.
+
+        Args:
+            spec: Spec of the wrapped detector
+            settings: Detector settings
+        """
+        super().__init__(settings)
+        self.spec = spec
+        self.name = spec.name
+        self.status: Dict[str, Any] = {}
+
+    def detect_item(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: Any) -> List[Insight]:
+        """
+        Run the wrapped detector in a worker process.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: Unused (the whole detector is one work item)
+
+        Returns:
+            List of Insight objects from the plugin
+        """
+        timeout = self.settings.get('plugin_timeout_seconds', 120)
+
+        buffer = io.BytesIO()
+        df.write_ipc(buffer)
+
+        context = multiprocessing.get_context('spawn')
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_isolated_worker,
+            args=(self.spec, self.settings, buffer.getvalue(), schema, profile, sender),
+            daemon=True,
+        )
+
+        process.start()
+        sender.close()
+
+        # poll() also returns when the worker dies and closes its end
+        timed_out = not receiver.poll(timeout)
+        result = None
+        if not timed_out:
+            try:
+                result = receiver.recv()
+            except EOFError:
+                pass
+
+        process.join(0 if timed_out else 5)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+        if timed_out:
+            self.status = {'status': 'timeout', 'error': f"no result within {timeout}s"}
+            return []
+
+        if result is None:
+            self.status = {'status': 'failed', 'error': f"worker exited with code {process.exitcode}"}
+            return []
+
+        if 'error' in result:
+            self.status = {'status': 'failed', 'error': result['error']}
+            return []
+
+        self.status = {'status': 'ok'}
+        return [Insight(**insight) for insight in result['insights']]
+
+    def assign_ids(self, item_results: List[List[Insight]], offset: int = 0) -> List[Insight]:
+        """Keep the IDs assigned by the plugin itself"""
+        return [insight for result in item_results for insight in result]
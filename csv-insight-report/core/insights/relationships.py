@@ -3,11 +3,97 @@ Relationship Insight Detector
 Detects correlations and associations between variables.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import polars as pl
 import numpy as np
 from scipy import stats
 from .base import BaseDetector, Insight
+from .bootstrap import seeded_rng
+from .permutation import PermutationTest
+
+
+# Confidence level of the rank-error bound reported for sampled Theil-Sen slopes
+THEIL_SEN_CONFIDENCE = 0.999
+
+
+def theil_sen(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_rows: Optional[int] = 1_000_000,
+    exact_max_n: int = 2000,
+    n_pairs: int = 200_000,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    """
+    Theil-Sen slope and intercept without the O(n²) cost on large inputs.
+
+    Up to exact_max_n rows, stats.theilslopes computes the exact median of
+    all pairwise slopes. Above that, the median is taken over n_pairs
+    uniformly sampled pairs (pairs with equal x are skipped, as in
+    theilslopes). By the Dvoretzky-Kiefer-Wolfowitz inequality the sampled
+    median lies between the (0.5 - eps) and (0.5 + eps) quantiles of all
+    pairwise slopes with probability THEIL_SEN_CONFIDENCE, where
+    eps = sqrt(ln(2 / (1 - confidence)) / (2 * pairs)); eps is reported
+    as rank_error. Inputs above max_rows are first subsampled.
+
+    Args:
+        x: Predictor values (no NaN)
+        y: Response values (no NaN)
+        max_rows: Cap on rows used (None for no cap)
+        exact_max_n: Largest n computed exactly
+        n_pairs: Number of sampled pairs for large n
+        seed: Random seed
+
+    Returns:
+        Dict with slope, intercept, method ('exact' or 'sampled_pairs'),
+        n (rows used), pairs and rank_error
+    """
+    rng = np.random.default_rng(seed)
+
+    if max_rows and len(x) > max_rows:
+        keep = np.sort(rng.choice(len(x), size=max_rows, replace=False))
+        x, y = x[keep], y[keep]
+
+    n = len(x)
+    result = {'slope': np.nan, 'intercept': np.nan, 'method': 'exact', 'n': n, 'pairs': 0, 'rank_error': 0.0}
+
+    if n < 2:
+        return result
+
+    if n <= exact_max_n:
+        try:
+            slope, intercept = stats.theilslopes(y, x)[:2]
+        except ValueError:
+            return result
+        result.update(slope=slope, intercept=intercept, pairs=n * (n - 1) // 2)
+        return result
+
+    # Draw pairs in batches until enough have distinct x values
+    slopes = []
+    collected = 0
+    for _ in range(20):
+        i = rng.integers(0, n, size=n_pairs)
+        j = rng.integers(0, n, size=n_pairs)
+        dx = x[j] - x[i]
+        valid = dx != 0
+        batch = (y[j][valid] - y[i][valid]) / dx[valid]
+        slopes.append(batch[:n_pairs - collected])
+        collected += len(slopes[-1])
+        if collected >= n_pairs:
+            break
+
+    if collected == 0:
+        return result
+
+    slope = float(np.median(np.concatenate(slopes)))
+    result.update(
+        slope=slope,
+        intercept=float(np.median(y) - slope * np.median(x)),
+        method='sampled_pairs',
+        pairs=collected,
+        rank_error=float(np.sqrt(np.log(2 / (1 - THEIL_SEN_CONFIDENCE)) / (2 * collected))),
+    )
+    return result
 
 
 class RelationshipDetector(BaseDetector):
@@ -15,141 +101,324 @@ class RelationshipDetector(BaseDetector):
     Detects relationships between numeric and categorical variables.
     """
 
-    def detect(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[Insight]:
+    name = 'relationship'
+    id_prefix = 'R'
+
+    # Minimum pairs (or rows) for a relationship insight with a parametric p-value;
+    # smaller correlated pairs are tested by permutation (see 'permutation_tests')
+    MIN_N = 100
+
+    def plan(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[tuple]:
+        """
+        List significant numeric and categorical pairs from the profile.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+
+        Returns:
+            List of ('correlation' | 'chi_square', pair_key) items
+        """
+        corr_pairs = profile.get('correlations', {}).get('significant_pairs', [])
+        chi2_pairs = profile.get('chi_square', {}).get('significant_pairs', [])
+
+        return (
+            [('correlation', pair_key) for pair_key in corr_pairs]
+            + [('chi_square', pair_key) for pair_key in chi2_pairs]
+        )
+
+    def detect_item(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[Insight]:
         """
-        Detect relationship insights.
+        Detect a relationship insight for one significant pair.
 
         Args:
             df: Input DataFrame
             schema: Schema dict from ingest
             profile: Profile dict from profiling
+            item: ('correlation' | 'chi_square', pair_key) from plan()
 
         Returns:
             List of detected Insight objects
         """
+        return self.select(df, schema, profile, item, self.candidates(df, schema, profile, item))
+
+    def candidates(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Theil-Sen fit of a correlated pair; association pairs need no data work.
+
+        Pairs with fewer than MIN_N values also get a permutation test.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: ('correlation' | 'chi_square', pair_key) from plan()
+
+        Returns:
+            Dict with 'theil_sen' (theil_sen() result) and 'permutation'
+            (PermutationTest result or None), or None
+        """
+        kind, pair_key = item
+
+        if kind != 'correlation':
+            return None
+
+        corr_info = profile['correlations']['correlations'][pair_key]
+        small = corr_info['n_pairs'] < self.MIN_N
+        if small and not self.settings.get('permutation_tests', True):
+            return None
+
+        col1, col2 = corr_info['col1'], corr_info['col2']
+
+        # Compute Theil-Sen slope for robust regression
+        pairs_df = df.select([col1, col2]).drop_nulls()
+        x = pairs_df[col1].cast(pl.Float64).to_numpy()
+        y = pairs_df[col2].cast(pl.Float64).to_numpy()
+
+        permutation = None
+        if small:
+            permutation = PermutationTest(self.settings).correlation(x, y, seeded_rng(f"relationship|{col1}|{col2}"))
+
+        return {
+            'theil_sen': theil_sen(
+                x, y,
+                max_rows=self.settings.get('theil_sen_max_rows', 1_000_000),
+                exact_max_n=self.settings.get('theil_sen_exact_max_n', 2000),
+                n_pairs=self.settings.get('theil_sen_pairs', 200_000),
+            ),
+            'permutation': permutation,
+        }
+
+    def select(
+        self,
+        df: pl.DataFrame,
+        schema: Dict[str, Any],
+        profile: Dict[str, Any],
+        item: tuple,
+        fit: Optional[Dict[str, Any]],
+    ) -> List[Insight]:
+        """
+        Build the insight for a pair if it passes the thresholds.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: ('correlation' | 'chi_square', pair_key) from plan()
+            fit: Theil-Sen fit and permutation test from candidates()
+
+        Returns:
+            List with at most one Insight
+        """
+        kind, pair_key = item
+
+        if kind == 'correlation':
+            return self._correlation_insights(profile, pair_key, fit)
+
+        return self._association_insights(profile, pair_key)
+
+    def item_columns(self, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[str]:
+        """Both columns of a correlated pair; association pairs read only the profile"""
+        kind, pair_key = item
+
+        if kind != 'correlation':
+            return []
+
+        corr_info = profile['correlations']['correlations'][pair_key]
+        return [corr_info['col1'], corr_info['col2']]
+
+    def estimate(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Tuple[float, float]:
+        """
+        Expected value and cost of one pair from its profiled statistics.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: ('correlation' | 'chi_square', pair_key) from plan()
+
+        Returns:
+            Tuple of (expected quality score, estimated cost)
+        """
+        kind, pair_key = item
+
+        if kind == 'correlation':
+            info = profile['correlations']['correlations'][pair_key]
+            effect, n = abs(info['pearson_r']), info['n_pairs']
+
+            # Theil-Sen: all pairs up to the exact limit, else one pass plus sampled pairs
+            rows = min(n, self.settings.get('theil_sen_max_rows', 1_000_000) or n)
+            if rows <= self.settings.get('theil_sen_exact_max_n', 2000):
+                cost = rows * (rows - 1) / 2
+            else:
+                cost = len(df) + self.settings.get('theil_sen_pairs', 200_000)
+        else:
+            info = profile['chi_square']['tests'][pair_key]
+            effect, n, cost = info['cramers_v'], info['n'], 1.0
+
+        missingness = (
+            profile['missingness'][info['col1']]['fraction']
+            + profile['missingness'][info['col2']]['fraction']
+        ) / 2
+
+        return self.compute_quality_score(n, effect, missingness), float(max(cost, 1))
+
+    def _correlation_insights(self, profile: Dict[str, Any], pair_key: str, fit: Optional[Dict[str, Any]]) -> List[Insight]:
+        """
+        Numeric-numeric correlation insight with a Theil-Sen slope.
+
+        Args:
+            profile: Profile dict from profiling
+            pair_key: Key into profile['correlations']['correlations']
+            fit: Theil-Sen fit and permutation test from candidates() (None
+                below MIN_N pairs when permutation tests are off)
+
+        Returns:
+            List with at most one Insight
+        """
         insights = []
-        insight_counter = 0
 
-        min_n = 100
         min_abs_r = self.settings.get('correlation_min_abs', 0.3)
 
-        # Process numeric-numeric correlations
-        corr_data = profile.get('correlations', {})
-        significant_pairs = corr_data.get('significant_pairs', [])
-
-        for pair_key in significant_pairs:
-            corr_info = corr_data['correlations'][pair_key]
-
-            if corr_info['n_pairs'] < min_n:
-                continue
-
-            col1 = corr_info['col1']
-            col2 = corr_info['col2']
-
-            pearson_r = corr_info['pearson_r']
-            pearson_p = corr_info['pearson_p']
-            spearman_r = corr_info['spearman_r']
-
-            # Determine strength
-            abs_r = abs(pearson_r)
-            strength = "strong" if abs_r > 0.7 else ("moderate" if abs_r > 0.5 else "weak")
-            direction = "positive" if pearson_r > 0 else "negative"
-
-            if abs_r >= min_abs_r or pearson_p < 0.05:
-                insight_counter += 1
-
-                # Get missingness for quality score
-                miss1 = profile['missingness'][col1]['fraction']
-                miss2 = profile['missingness'][col2]['fraction']
-                avg_missingness = (miss1 + miss2) / 2
-
-                # Compute Theil-Sen slope for robust regression
-                pairs_df = df.select([col1, col2]).drop_nulls()
-                x = pairs_df[col1].to_numpy()
-                y = pairs_df[col2].to_numpy()
-
-                # Theil-Sen estimator
-                try:
-                    ts_slope, ts_intercept = stats.theilslopes(y, x)[:2]
-                except:
-                    ts_slope, ts_intercept = np.nan, np.nan
-
-                insights.append(Insight(
-                    id=f"R{insight_counter:03d}",
-                    title=f"{strength.capitalize()} {direction} correlation between {col1} and {col2}",
-                    rationale=f"Pearson r={pearson_r:.3f} (p={pearson_p:.4f}) indicates a {strength} {direction} linear relationship.",
-                    primary_columns=[col1, col2],
-                    statistics={
-                        'pearson_r': float(pearson_r),
-                        'pearson_p': float(pearson_p),
-                        'spearman_r': float(spearman_r),
-                        'r_squared': float(pearson_r ** 2),
-                        'theil_sen_slope': float(ts_slope) if not np.isnan(ts_slope) else None,
-                        'theil_sen_intercept': float(ts_intercept) if not np.isnan(ts_intercept) else None,
-                        'n': corr_info['n_pairs'],
-                    },
-                    quality_score=self.compute_quality_score(
-                        corr_info['n_pairs'],
-                        abs_r,
-                        avg_missingness
-                    ),
-                    suggested_visuals=['scatter_with_regression', 'hexbin', 'scatter_with_theilsen'],
-                    caveats=[
-                        'Correlation does not imply causation.',
-                        'Outliers can strongly influence Pearson correlation.',
-                        'Relationship may be non-linear; inspect scatter plot.',
-                    ],
-                    detector_type='relationship',
-                ))
-
-        # Process categorical-categorical associations
-        chi2_data = profile.get('chi_square', {})
-        chi2_significant = chi2_data.get('significant_pairs', [])
-
-        for pair_key in chi2_significant:
-            test_info = chi2_data['tests'][pair_key]
-
-            if test_info['n'] < min_n:
-                continue
-
-            col1 = test_info['col1']
-            col2 = test_info['col2']
-
-            cramers_v = test_info['cramers_v']
-            p_value = test_info['p_value']
-
-            # Strength interpretation for Cramér's V
-            strength = "strong" if cramers_v > 0.5 else ("moderate" if cramers_v > 0.3 else "weak")
-
-            if p_value < 0.05 and cramers_v > 0.3:
-                insight_counter += 1
-
-                miss1 = profile['missingness'][col1]['fraction']
-                miss2 = profile['missingness'][col2]['fraction']
-                avg_missingness = (miss1 + miss2) / 2
-
-                insights.append(Insight(
-                    id=f"R{insight_counter:03d}",
-                    title=f"{strength.capitalize()} association between {col1} and {col2}",
-                    rationale=f"Chi-square test shows {strength} association (Cramér's V={cramers_v:.3f}, p={p_value:.4f}).",
-                    primary_columns=[col1, col2],
-                    statistics={
-                        'chi2': float(test_info['chi2']),
-                        'p_value': float(p_value),
-                        'cramers_v': float(cramers_v),
-                        'n': test_info['n'],
-                    },
-                    quality_score=self.compute_quality_score(
-                        test_info['n'],
-                        cramers_v,
-                        avg_missingness
-                    ),
-                    suggested_visuals=['grouped_bar', 'heatmap', 'mosaic'],
-                    caveats=[
-                        'Association does not imply causation.',
-                        'Chi-square test assumes sufficient cell counts.',
-                    ],
-                    detector_type='relationship',
-                ))
+        corr_info = profile['correlations']['correlations'][pair_key]
+
+        if fit is None:
+            return insights
+
+        robust = fit['theil_sen']
+        permutation = fit['permutation']
+
+        col1 = corr_info['col1']
+        col2 = corr_info['col2']
+
+        pearson_r = corr_info['pearson_r']
+        pearson_p = corr_info['pearson_p']
+        spearman_r = corr_info['spearman_r']
+
+        # Small samples: decide significance on the permutation p-value
+        p_value = permutation['p_value'] if permutation else pearson_p
+        p_label = 'permutation p' if permutation else 'p'
+
+        # Determine strength
+        abs_r = abs(pearson_r)
+        strength = "strong" if abs_r > 0.7 else ("moderate" if abs_r > 0.5 else "weak")
+        direction = "positive" if pearson_r > 0 else "negative"
+
+        # Small samples are only reported when the permutation test is significant
+        if (abs_r >= min_abs_r or p_value < 0.05) and (permutation is None or p_value < 0.05):
+
+            # Get missingness for quality score
+            miss1 = profile['missingness'][col1]['fraction']
+            miss2 = profile['missingness'][col2]['fraction']
+            avg_missingness = (miss1 + miss2) / 2
+
+            ts_slope, ts_intercept = robust['slope'], robust['intercept']
+
+            insight = Insight(
+                id='',
+                title=f"{strength.capitalize()} {direction} correlation between {col1} and {col2}",
+                rationale=f"Pearson r={pearson_r:.3f} ({p_label}={p_value:.4f}) indicates a {strength} {direction} linear relationship.",
+                primary_columns=[col1, col2],
+                statistics={
+                    'pearson_r': float(pearson_r),
+                    'pearson_p': float(pearson_p),
+                    'spearman_r': float(spearman_r),
+                    'r_squared': float(pearson_r ** 2),
+                    'theil_sen_slope': float(ts_slope) if not np.isnan(ts_slope) else None,
+                    'theil_sen_intercept': float(ts_intercept) if not np.isnan(ts_intercept) else None,
+                    'theil_sen_method': robust['method'],
+                    'theil_sen_n': robust['n'],
+                    'theil_sen_rank_error': robust['rank_error'],
+                    'n': corr_info['n_pairs'],
+                },
+                quality_score=self.compute_quality_score(
+                    corr_info['n_pairs'],
+                    abs_r,
+                    avg_missingness
+                ),
+                suggested_visuals=['scatter_with_regression', 'hexbin', 'scatter_with_theilsen'],
+                caveats=[
+                    'Correlation does not imply causation.',
+                    'Outliers can strongly influence Pearson correlation.',
+                    'Relationship may be non-linear; inspect scatter plot.',
+                ],
+                detector_type='relationship',
+            )
+
+            if corr_info.get('spearman_method') == 'pooled_within_shard':
+                insight.statistics['spearman_method'] = corr_info['spearman_method']
+                insight.caveats.append(
+                    'Spearman correlation is pooled from within-shard ranks of a distributed profile and is approximate.'
+                )
+
+            if permutation:
+                insight.statistics['permutation_p'] = permutation['p_value']
+                insight.statistics['p_value_method'] = 'permutation'
+                insight.statistics['permutations'] = permutation['permutations']
+                insight.caveats.append(
+                    f"Only {corr_info['n_pairs']} pairs; the p-value comes from "
+                    f"{permutation['permutations']} random permutations of the pairing."
+                )
+
+            insights.append(insight)
+
+        return insights
+
+    def _association_insights(self, profile: Dict[str, Any], pair_key: str) -> List[Insight]:
+        """
+        Categorical-categorical association insight from a chi-square test.
+
+        Args:
+            profile: Profile dict from profiling
+            pair_key: Key into profile['chi_square']['tests']
+
+        Returns:
+            List with at most one Insight
+        """
+        insights = []
+
+        test_info = profile['chi_square']['tests'][pair_key]
+
+        if test_info['n'] < self.MIN_N:
+            return insights
+
+        col1 = test_info['col1']
+        col2 = test_info['col2']
+
+        cramers_v = test_info['cramers_v']
+        p_value = test_info['p_value']
+
+        # Strength interpretation for Cramér's V
+        strength = "strong" if cramers_v > 0.5 else ("moderate" if cramers_v > 0.3 else "weak")
+
+        if p_value < 0.05 and cramers_v > 0.3:
+            miss1 = profile['missingness'][col1]['fraction']
+            miss2 = profile['missingness'][col2]['fraction']
+            avg_missingness = (miss1 + miss2) / 2
+
+            insights.append(Insight(
+                id='',
+                title=f"{strength.capitalize()} association between {col1} and {col2}",
+                rationale=f"Chi-square test shows {strength} association (Cramér's V={cramers_v:.3f}, p={p_value:.4f}).",
+                primary_columns=[col1, col2],
+                statistics={
+                    'chi2': float(test_info['chi2']),
+                    'p_value': float(p_value),
+                    'cramers_v': float(cramers_v),
+                    'n': test_info['n'],
+                },
+                quality_score=self.compute_quality_score(
+                    test_info['n'],
+                    cramers_v,
+                    avg_missingness
+                ),
+                suggested_visuals=['grouped_bar', 'heatmap', 'mosaic'],
+                caveats=[
+                    'Association does not imply causation.',
+                    'Chi-square test assumes sufficient cell counts.',
+                ],
+                detector_type='relationship',
+            ))
 
         return insights
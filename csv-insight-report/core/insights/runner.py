@@ -3,90 +3,209 @@ Insight Detection Runner
 Coordinates all insight detectors and ranks results.
 """
 
-import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 import polars as pl
-from .base import Insight
-from .distributions import DistributionDetector
-from .trends import TrendDetector
-from .groups import GroupDetector
-from .relationships import RelationshipDetector
+from .. import artifacts
+from .base import BaseDetector, Insight
+from .bootstrap import add_confidence_intervals
+from .registry import create_detectors
+from .store import InsightTable
 
 
-def run_all(
+def _timed_item(
+    detector: BaseDetector,
     df: pl.DataFrame,
     schema: Dict[str, Any],
     profile: Dict[str, Any],
-    settings: Dict[str, Any]
-) -> Dict[str, Any]:
+    item: Any,
+) -> tuple[List[Insight], float]:
     """
-    Run all insight detectors and rank results.
+    Run one detector work item and time it.
 
     Args:
+        detector: Detector instance
         df: Input DataFrame
         schema: Schema dict from ingest
         profile: Profile dict from profiling
-        settings: Settings dict from config
+        item: Work item from detector.plan()
 
     Returns:
-        Insights dict with all detected insights ranked by quality
+        Tuple of (insights, elapsed seconds)
     """
-    all_insights = []
+    start = time.perf_counter()
+    insights = detector.detect_item(df, schema, profile, item)
+    return insights, time.perf_counter() - start
 
-    # Initialize detectors
-    detectors = [
-        DistributionDetector(settings),
-        TrendDetector(settings),
-        GroupDetector(settings),
-        RelationshipDetector(settings),
-    ]
 
-    # Run each detector
+def run_detectors(
+    detectors: List[BaseDetector],
+    df: pl.DataFrame,
+    schema: Dict[str, Any],
+    profile: Dict[str, Any],
+    workers: int = 1,
+) -> tuple[List[Insight], Dict[str, Dict[str, Any]]]:
+    """
+    Run detectors with their work items spread over a thread pool.
+
+    Work items of all detectors share one pool; Polars, NumPy and SciPy
+    release the GIL in their heavy kernels. Results are collected per
+    detector in plan order before IDs are assigned, so the output is
+    identical to a serial run whatever the number of workers.
+
+    Args:
+        detectors: Detector instances, in reporting order
+        df: Input DataFrame
+        schema: Schema dict from ingest
+        profile: Profile dict from profiling
+        workers: Number of worker threads (1 runs inline)
+
+    Returns:
+        Tuple of (insights in detector order, per-detector cost dict)
+    """
+    plans = []
+    costs = {}
+
     for detector in detectors:
-        detector_insights = detector.detect(df, schema, profile)
-        all_insights.extend(detector_insights)
+        start = time.perf_counter()
+        items = detector.plan(df, schema, profile)
+        plans.append(items)
+        costs[detector.name] = {
+            'plan_seconds': time.perf_counter() - start,
+            'work_items': len(items),
+        }
+
+    tasks = [(d, item) for d, items in enumerate(plans) for item in items]
+
+    if workers > 1 and len(tasks) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_timed_item, detectors[d], df, schema, profile, item)
+                for d, item in tasks
+            ]
+            outcomes = [future.result() for future in futures]
+    else:
+        outcomes = [_timed_item(detectors[d], df, schema, profile, item) for d, item in tasks]
+
+    # Regroup per detector, keeping plan order
+    item_results = [[] for _ in detectors]
+    item_seconds = [0.0 for _ in detectors]
+    for (d, _), (insights, seconds) in zip(tasks, outcomes):
+        item_results[d].append(insights)
+        item_seconds[d] += seconds
+
+    all_insights = []
+    for d, detector in enumerate(detectors):
+        insights = detector.assign_ids(item_results[d])
+        all_insights.extend(insights)
+        costs[detector.name]['item_seconds'] = item_seconds[d]
+        costs[detector.name]['insights'] = len(insights)
+        costs[detector.name].update(getattr(detector, 'status', {}))
+
+    return all_insights, costs
+
+
+def build_output(
+    all_insights: List[Insight],
+    settings: Dict[str, Any],
+    extra: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Rank insights and build the insights output structure.
+
+    Ranking never reads the data; bootstrap intervals for the top insights
+    are a separate step (add_confidence_intervals).
+
+    Args:
+        all_insights: Insights with IDs assigned
+        settings: Settings dict from config
+        extra: Run details added to the output (costs, timings, ...)
 
-    # Sort by quality score descending
-    all_insights.sort(key=lambda x: x.quality_score, reverse=True)
+    Returns:
+        Insights dict with top and appendix insights (lists of dicts)
+    """
+    # Sort by quality score descending, as a columnar table
+    table = InsightTable.from_insights(all_insights).rank()
 
     # Limit to top candidates
     max_insights = settings.get('max_insights_to_surface', 8)
-    top_insights = all_insights[:max_insights]
-    appendix_insights = all_insights[max_insights:]
+    top_insights = table[:max_insights].to_dicts()
 
-    # Build output structure
+    # Build output structure (plain dicts, so it stays JSON-serializable)
     insights_output = {
         'version': '1.0',
-        'top_insights': [ins.to_dict() for ins in top_insights],
-        'appendix_insights': [ins.to_dict() for ins in appendix_insights],
-        'total_detected': len(all_insights),
+        'top_insights': top_insights,
+        'appendix_insights': table[max_insights:].to_dicts(),
+        'total_detected': len(table),
         'settings': settings,
     }
+    insights_output.update(extra)
+
+    return insights_output
+
+
+def run_all(
+    df: pl.DataFrame,
+    schema: Dict[str, Any],
+    profile: Dict[str, Any],
+    settings: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Run all insight detectors and rank results.
+
+    Args:
+        df: Input DataFrame
+        schema: Schema dict from ingest
+        profile: Profile dict from profiling
+        settings: Settings dict from config
+
+    Returns:
+        Insights dict with all detected insights ranked by quality, the top
+        insights with bootstrap confidence intervals
+    """
+    # Initialize the detectors enabled in settings (built-ins by default)
+    detectors = create_detectors(settings)
+
+    workers = settings.get('detector_workers') or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    all_insights, detector_costs = run_detectors(detectors, df, schema, profile, workers)
+    detection_seconds = time.perf_counter() - start
+
+    insights_output = build_output(all_insights, settings, {
+        'detector_costs': detector_costs,
+        'detection_seconds': detection_seconds,
+        'detector_workers': workers,
+    })
+    add_confidence_intervals(insights_output['top_insights'], df, profile, settings)
 
     return insights_output
 
 
 def save_insights(insights: Dict[str, Any], output_path: str) -> None:
     """
-    Save insights to JSON file.
+    Save insights to file.
+
+    A .json path writes a pretty-printed JSON export; any other path
+    (e.g. insights.cira) writes the compact binary artifact format.
 
     Args:
         insights: Insights dictionary
-        output_path: Path to output JSON file
+        output_path: Path to output file
     """
-    with open(output_path, 'w') as f:
-        json.dump(insights, f, indent=2)
+    artifacts.save(insights, output_path)
 
 
 def load_insights(input_path: str) -> Dict[str, Any]:
     """
-    Load insights from JSON file.
+    Load insights from a binary artifact or JSON file.
 
     Args:
-        input_path: Path to input JSON file
+        input_path: Path to input file
 
     Returns:
-        Insights dictionary
+        Insights dictionary (binary artifacts load large lists lazily)
     """
-    with open(input_path, 'r') as f:
-        return json.load(f)
+    return artifacts.load(input_path)
@@ -0,0 +1,274 @@
+"""
+Anytime Detection Scheduler
+Runs detector work items best-first under a wall-clock budget.
+
+Each work item gets an expected value and cost from its detector's
+estimate() (cheap profile statistics such as |r|, Cramér's V, skew or
+outlier fraction). Items run in descending value per cost until the
+deadline; the insights found so far are ranked as usual and labeled with
+coverage. The scheduler keeps the remaining items, so a later run() call
+resumes the work, and once coverage is complete the output is identical
+to run_all().
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Any, Optional
+import polars as pl
+from .base import BaseDetector, Insight
+from .registry import create_detectors
+from .runner import _timed_item, build_output
+
+
+class AnytimeScheduler:
+    """
+    Best-first detector execution that can stop at a deadline and resume.
+
+    Usage:
+        scheduler = AnytimeScheduler(df, schema, profile, settings)
+        quick = scheduler.run(budget_seconds=5)   # best insights within 5s
+        full = scheduler.run()                     # finish the remaining work
+    """
+
+    def __init__(
+        self,
+        df: pl.DataFrame,
+        schema: Dict[str, Any],
+        profile: Dict[str, Any],
+        settings: Dict[str, Any],
+        detectors: Optional[List[BaseDetector]] = None,
+    ):
+        """
+        Initialize the scheduler. No detector work happens until run().
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            settings: Settings dict from config
+            detectors: Detector instances (defaults to the enabled detectors)
+        """
+        self.df = df
+        self.schema = schema
+        self.profile = profile
+        self.settings = settings
+        self.detectors = detectors if detectors is not None else create_detectors(settings)
+        self.workers = settings.get('detector_workers') or os.cpu_count() or 1
+
+        self.plans: List[Optional[List[Any]]] = [None] * len(self.detectors)
+        self.results: Dict[tuple, List[Insight]] = {}  # (detector index, item index) -> insights
+        self.estimates: Dict[tuple, tuple] = {}  # (detector index, item index) -> (value, cost)
+        self.costs: Dict[str, Dict[str, Any]] = {
+            detector.name: {'plan_seconds': 0.0, 'work_items': 0, 'item_seconds': 0.0}
+            for detector in self.detectors
+        }
+        self.elapsed = 0.0
+        self.runs = 0
+
+    @property
+    def complete(self) -> bool:
+        """Whether every detector is planned and every work item has run"""
+        return all(plan is not None for plan in self.plans) and not self.pending()
+
+    def pending(self) -> List[tuple]:
+        """
+        Planned work items that have not run yet, best first.
+
+        Returns:
+            List of (detector index, item index) keys by descending value per cost
+        """
+        keys = [
+            (d, i)
+            for d, plan in enumerate(self.plans) if plan is not None
+            for i in range(len(plan))
+            if (d, i) not in self.results
+        ]
+
+        # Ties keep detector and plan order
+        return sorted(keys, key=lambda key: -self.estimates[key][0] / self.estimates[key][1])
+
+    def run(self, budget_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run work items until the budget is spent or all work is done.
+
+        Items already started when the deadline passes are allowed to
+        finish, so a run may overshoot the budget by the longest item.
+
+        Args:
+            budget_seconds: Wall-clock budget for this call (None uses the
+                'detection_budget_seconds' setting; None there means no limit)
+
+        Returns:
+            Insights dict as from run_all(), plus 'coverage'
+        """
+        if budget_seconds is None:
+            budget_seconds = self.settings.get('detection_budget_seconds')
+
+        start = time.perf_counter()
+        deadline = start + budget_seconds if budget_seconds is not None else float('inf')
+
+        self._plan(deadline)
+        self._execute(deadline)
+
+        self.elapsed += time.perf_counter() - start
+        self.runs += 1
+
+        return self.output()
+
+    def _plan(self, deadline: float) -> None:
+        """
+        Plan and estimate detectors not planned yet, while time remains.
+
+        Args:
+            deadline: perf_counter() time to stop at
+        """
+        for d, detector in enumerate(self.detectors):
+            if self.plans[d] is not None:
+                continue
+            if time.perf_counter() >= deadline:
+                return
+
+            plan_start = time.perf_counter()
+            items = detector.plan(self.df, self.schema, self.profile)
+
+            for i, item in enumerate(items):
+                value, cost = detector.estimate(self.df, self.schema, self.profile, item)
+                self.estimates[(d, i)] = (max(value, 0.0), max(cost, 1e-9))
+
+            self.plans[d] = items
+            self.costs[detector.name]['plan_seconds'] = time.perf_counter() - plan_start
+            self.costs[detector.name]['work_items'] = len(items)
+
+    def _execute(self, deadline: float) -> None:
+        """
+        Run pending items best-first on a thread pool until the deadline.
+
+        New items are only started before the deadline; at most `workers`
+        items are in flight at a time.
+
+        Args:
+            deadline: perf_counter() time to stop starting new items
+        """
+        queue = iter(self.pending())
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            in_flight = {}
+
+            while True:
+                while len(in_flight) < self.workers and time.perf_counter() < deadline:
+                    key = next(queue, None)
+                    if key is None:
+                        break
+                    d, i = key
+                    future = pool.submit(
+                        _timed_item, self.detectors[d], self.df, self.schema, self.profile, self.plans[d][i]
+                    )
+                    in_flight[future] = key
+
+                if not in_flight:
+                    return
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    d, i = in_flight.pop(future)
+                    insights, seconds = future.result()
+                    self.results[(d, i)] = insights
+                    self.costs[self.detectors[d].name]['item_seconds'] += seconds
+
+    def coverage(self) -> Dict[str, Any]:
+        """
+        How much of the detection work has run.
+
+        'value_fraction' is the share of the total estimated value covered,
+        a guide to how close the current ranking is to the final one.
+
+        Returns:
+            Coverage dict with overall and per-detector counts
+        """
+        by_detector = {}
+        for d, detector in enumerate(self.detectors):
+            plan = self.plans[d]
+            by_detector[detector.name] = {
+                'planned': plan is not None,
+                'work_items': len(plan) if plan is not None else None,
+                'completed': sum(1 for key in self.results if key[0] == d),
+            }
+
+        total_value = sum(value for value, _ in self.estimates.values())
+        done_value = sum(self.estimates[key][0] for key in self.results)
+        total_items = len(self.estimates)
+
+        return {
+            'complete': self.complete,
+            'work_items_completed': len(self.results),
+            'work_items_planned': total_items,
+            'fraction': len(self.results) / total_items if total_items else float(self.complete),
+            'value_fraction': done_value / total_value if total_value > 0 else float(self.complete),
+            'detectors': by_detector,
+            'elapsed_seconds': self.elapsed,
+            'runs': self.runs,
+        }
+
+    def output(self) -> Dict[str, Any]:
+        """
+        Rank the insights found so far.
+
+        IDs are assigned per detector in plan order over the completed
+        items, so they are final once coverage is complete.
+
+        No bootstrap intervals are added: they read the data and would run
+        past the deadline. Call add_confidence_intervals() on
+        'top_insights' afterwards if they are needed.
+
+        Returns:
+            Insights dict as from run_all() (without intervals), plus 'coverage'
+        """
+        all_insights = []
+        for d, detector in enumerate(self.detectors):
+            if self.plans[d] is None:
+                continue
+            item_results = [
+                self.results[(d, i)]
+                for i in range(len(self.plans[d]))
+                if (d, i) in self.results
+            ]
+            insights = detector.assign_ids(item_results)
+            all_insights.extend(insights)
+            self.costs[detector.name]['insights'] = len(insights)
+            self.costs[detector.name].update(getattr(detector, 'status', {}))
+
+        return build_output(all_insights, self.settings, {
+            'detector_costs': self.costs,
+            'detection_seconds': self.elapsed,
+            'detector_workers': self.workers,
+            'coverage': self.coverage(),
+        })
+
+
+def run_anytime(
+    df: pl.DataFrame,
+    schema: Dict[str, Any],
+    profile: Dict[str, Any],
+    settings: Dict[str, Any],
+    budget_seconds: Optional[float] = None,
+    scheduler: Optional[AnytimeScheduler] = None,
+) -> tuple[Dict[str, Any], AnytimeScheduler]:
+    """
+    Run detection within a budget, or resume an earlier partial run.
+
+    Args:
+        df: Input DataFrame
+        schema: Schema dict from ingest
+        profile: Profile dict from profiling
+        settings: Settings dict from config
+        budget_seconds: Wall-clock budget (None uses 'detection_budget_seconds')
+        scheduler: Scheduler returned by an earlier call, to resume its work
+
+    Returns:
+        Tuple of (insights dict with 'coverage', scheduler for resuming)
+    """
+    if scheduler is None:
+        scheduler = AnytimeScheduler(df, schema, profile, settings)
+
+    return scheduler.run(budget_seconds), scheduler
@@ -0,0 +1,536 @@
+"""
+Seasonality Insight Detector
+Detects repeating cycles (daily, weekly, yearly, ...) in time series data.
+
+Measures are resampled to the time index cadence and laid on a regular
+grid of periods, linearly detrended, and transformed together with one
+real FFT along the time axis. The strongest periodogram peak of each
+measure is tested with Fisher's g statistic (its share of the spectrum's
+power), then refined to a whole number of periods, preferring calendar
+cycles near the peak, by folding the series at that period: the share of
+variance explained by the average cycle is the seasonal strength.
+"""
+
+from datetime import timedelta
+from typing import Dict, List, Any, Optional, Tuple
+import polars as pl
+import numpy as np
+from scipy import fft
+from .base import BaseDetector, Insight
+from .changepoints import _format_time
+from .trends import time_frame, resample_series, _parse_cadence
+
+
+# Max values (measures x periods) transformed together in one batch
+SEASONALITY_BATCH_CELLS = 4_000_000
+
+# Calendar cycles, in microseconds
+CALENDAR_CYCLES = {
+    'hourly': 3_600 * 10 ** 6,
+    'daily': 86_400 * 10 ** 6,
+    'weekly': 7 * 86_400 * 10 ** 6,
+    'monthly': int(30.4375 * 86_400 * 10 ** 6),
+    'quarterly': int(91.3125 * 86_400 * 10 ** 6),
+    'yearly': int(365.25 * 86_400 * 10 ** 6),
+}
+
+
+def _fisher_p(g: np.ndarray, m: int) -> np.ndarray:
+    """
+    P-value of Fisher's g test for a periodogram peak (first term, accurate when small).
+
+    Args:
+        g: Peak power as a fraction of total power
+        m: Number of frequencies tested
+
+    Returns:
+        Array of p-values
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.clip(m * np.exp((m - 1) * np.log1p(-np.minimum(g, 1 - 1e-16))), 0.0, 1.0)
+
+
+def _format_duration(us: int) -> str:
+    """Duration in the largest whole unit, e.g. '7 days' or '90 minutes'"""
+    for unit, size in (('day', 86_400 * 10 ** 6), ('hour', 3_600 * 10 ** 6), ('minute', 60 * 10 ** 6), ('second', 10 ** 6)):
+        if us >= size and us % size == 0:
+            count = us // size
+            return f"{count} {unit}{'s' if count != 1 else ''}"
+    return str(timedelta(microseconds=us))
+
+
+class SeasonalityDetector(BaseDetector):
+    """
+    Detects periodic cycles using a batched periodogram.
+    """
+
+    name = 'seasonality'
+    id_prefix = 'P'
+
+    # Column holding each resampled period's position on the regular grid
+    GRID_INDEX = '__period__'
+
+    def plan(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[tuple]:
+        """
+        Resample measures to the time index cadence and batch them.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+
+        Returns:
+            List of (time_col, measure columns, series frame, resampling info) items
+        """
+        time_index_info = profile.get('time_index')
+        if not time_index_info:
+            return []
+
+        time_col = time_index_info['column']
+
+        numeric_cols = [
+            col['normalized_name']
+            for col in schema['columns']
+            if col['type'] in ['int', 'float'] and col['normalized_name'] != time_col
+        ]
+
+        if not numeric_cols:
+            return []
+
+        frame = time_frame(df, time_col, numeric_cols)
+        if len(frame) == 0:
+            return []
+
+        frame, resampled = resample_series(
+            frame,
+            time_col,
+            numeric_cols,
+            time_index_info.get('typical_cadence'),
+            self.settings.get('seasonality_max_periods', 1_000_000),
+        )
+
+        # Windows start on multiples of the period, so positions are exact integers
+        every_us = max(_parse_cadence(resampled['every']), 1)
+        epoch = pl.col(time_col).dt.epoch('us')
+        frame = frame.with_columns(((epoch - epoch.first()) // every_us).alias(self.GRID_INDEX))
+        resampled = {**resampled, 'grid_periods': int(frame[self.GRID_INDEX][-1]) + 1}
+
+        batch = max(1, SEASONALITY_BATCH_CELLS // resampled['grid_periods'])
+
+        return [
+            (time_col, numeric_cols[i:i + batch], frame, resampled)
+            for i in range(0, len(numeric_cols), batch)
+        ]
+
+    def estimate(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Tuple[float, float]:
+        """
+        Expected value and cost of one measure batch.
+
+        The value assumes prior_effect over the series length; the cost is
+        one FFT per measure.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, measure columns, series frame, resampling info) from plan()
+
+        Returns:
+            Tuple of (expected quality score, estimated cost)
+        """
+        _, measures, _, resampled = item
+        n = resampled['grid_periods']
+
+        value = self.compute_quality_score(n, self.prior_effect, 0.0)
+        cost = n * len(measures) * np.log2(max(n, 2))
+
+        return value, float(max(cost, 1))
+
+    def item_key(self, item: tuple) -> str:
+        """Identify a batch by its columns and resampling, not its frame"""
+        time_col, measures, _, resampled = item
+        return repr((time_col, measures, resampled))
+
+    def item_columns(self, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[str]:
+        """Time and measure columns of a batch"""
+        return [item[0]] + list(item[1])
+
+    def detect_item(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[Insight]:
+        """
+        Detect seasonality insights for a batch of measures.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, measure columns, series frame, resampling info) from plan()
+
+        Returns:
+            List of detected Insight objects, in measure order
+        """
+        return self.select(df, schema, profile, item, self.candidates(df, schema, profile, item))
+
+    def candidates(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Periodogram peaks of every measure in a batch.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, measure columns, series frame, resampling info) from plan()
+
+        Returns:
+            Dict with n_periods, completeness (per measure) and 'cycles'
+            (per measure, strongest first), or None for short series
+        """
+        time_col, measures, frame, resampled = item
+        n = resampled['grid_periods']
+        min_cycles = self.settings.get('seasonality_min_cycles', 3)
+
+        if n < max(self.settings.get('seasonality_min_periods', 24), 2 * min_cycles):
+            return None
+
+        # Regular grid (measures x periods), NaN where a period has no value
+        index = frame[self.GRID_INDEX].to_numpy()
+        Y = np.full((len(measures), n), np.nan)
+        Y[:, index] = frame.select([pl.col(m).cast(pl.Float64) for m in measures]).to_numpy().T
+
+        present = ~np.isnan(Y)
+        counts = present.sum(axis=1).astype(np.float64)
+        residuals = self._detrend(Y, present, counts)
+
+        # One real FFT for the whole batch; bins with 2+ periods and min_cycles+ cycles
+        power = np.abs(fft.rfft(residuals, axis=1)) ** 2
+        k_min, k_max = min_cycles, n // 2
+        if k_max < k_min:
+            return None
+        power = power[:, k_min:k_max + 1] / self._red_noise(residuals, np.arange(k_min, k_max + 1) / n)
+
+        every_us = max(_parse_cadence(resampled['every']), 1)
+        start = frame[time_col][0]
+
+        cycles = []
+        for j in range(len(measures)):
+            if counts[j] < 2 or not power[j].any():
+                cycles.append([])
+                continue
+            cycles.append(self._peaks(residuals[j], present[j], power[j], k_min, n, n // min_cycles, every_us, start))
+
+        return {
+            'n_periods': n,
+            'completeness': (counts / n).tolist(),
+            'cycles': cycles,
+        }
+
+    @staticmethod
+    def _detrend(Y: np.ndarray, present: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """
+        Residuals of a per-measure straight-line fit, zero where missing.
+
+        Args:
+            Y: Values (measures x periods), NaN where missing
+            present: Boolean mask of present values
+            counts: Present values per measure
+
+        Returns:
+            Residuals (measures x periods)
+        """
+        x = np.broadcast_to(np.arange(Y.shape[1], dtype=np.float64), Y.shape)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x_mean = np.where(present, x, 0.0).sum(axis=1) / counts
+            y_mean = np.where(present, Y, 0.0).sum(axis=1) / counts
+            xc = np.where(present, x - x_mean[:, None], 0.0)
+            yc = np.where(present, Y - y_mean[:, None], 0.0)
+            slope = np.einsum('ij,ij->i', xc, yc) / np.einsum('ij,ij->i', xc, xc)
+
+        return np.where(present, yc - np.nan_to_num(slope)[:, None] * xc, 0.0)
+
+    @staticmethod
+    def _red_noise(residuals: np.ndarray, frequencies: np.ndarray) -> np.ndarray:
+        """
+        AR(1) background spectrum of each measure, relative to white noise.
+
+        Dividing the periodogram by it keeps slow drifts (random walks,
+        autocorrelated noise) from passing as long cycles.
+
+        Args:
+            residuals: Detrended values (measures x periods)
+            frequencies: Frequencies in cycles per period
+
+        Returns:
+            Spectrum shape (measures x frequencies)
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            phi = np.einsum('ij,ij->i', residuals[:, 1:], residuals[:, :-1]) / np.einsum('ij,ij->i', residuals, residuals)
+        phi = np.clip(np.nan_to_num(phi), -0.99, 0.99)[:, None]
+
+        return (1 - phi ** 2) / (1 + phi ** 2 - 2 * phi * np.cos(2 * np.pi * frequencies)[None, :])
+
+    def _peaks(
+        self,
+        residuals: np.ndarray,
+        present: np.ndarray,
+        power: np.ndarray,
+        k_min: int,
+        n: int,
+        max_length: int,
+        every_us: int,
+        start: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Strongest cycles of one measure, skipping harmonics of cycles already found.
+
+        Args:
+            residuals: Detrended values on the grid (0 where missing)
+            present: Boolean mask of present values
+            power: Periodogram from bin k_min upward, relative to red noise
+            k_min: Frequency bin of power[0]
+            n: Grid periods
+            max_length: Longest cycle length (n / seasonality_min_cycles)
+            every_us: Period length in microseconds
+            start: Time of the first period
+
+        Returns:
+            List of cycle dicts, strongest first
+        """
+        max_cycles = self.settings.get('seasonality_max_cycles', 2)
+        remaining = power.astype(np.float64).copy()
+        m = len(power)
+        found = []
+
+        for _ in range(4 * max_cycles):
+            if len(found) == max_cycles or not remaining.any():
+                break
+
+            peak = int(np.argmax(remaining))
+            k = peak + k_min
+            g = remaining[peak] / remaining.sum()
+            p_value = float(_fisher_p(np.array([g]), m)[0])
+
+            # The peak and its leakage into neighboring bins
+            remaining[max(peak - 1, 0):peak + 2] = 0.0
+
+            length, strength, profile = self._fold(
+                residuals, present, n / k, n / (k + 1), n / max(k - 1, 1), max_length, every_us
+            )
+
+            if length == 0 or any(self._is_harmonic(length, cycle['length']) for cycle in found):
+                continue
+
+            found.append(self._describe(length, strength, profile, g, p_value, every_us, start))
+
+        return found
+
+    def _fold(
+        self,
+        residuals: np.ndarray,
+        present: np.ndarray,
+        period: float,
+        low: float,
+        high: float,
+        max_length: int,
+        every_us: int,
+    ) -> Tuple[int, float, np.ndarray]:
+        """
+        Best whole-number cycle length for a periodogram peak.
+
+        Candidates are the peak's rounded period, calendar cycles between
+        the neighboring bins' periods, and calendar cycles that are whole
+        multiples of the peak (a spiky daily pattern peaks at its harmonics).
+        Each is scored by the variance share of the average cycle, adjusted
+        for its number of phases; the shortest candidate within 90% of the
+        best score wins.
+
+        Args:
+            residuals: Detrended values on the grid (0 where missing)
+            present: Boolean mask of present values
+            period: Peak period in grid periods (n / k)
+            low: Period of the next higher frequency bin
+            high: Period of the next lower frequency bin
+            max_length: Longest cycle length
+            every_us: Period length in microseconds
+
+        Returns:
+            Tuple of (cycle length, adjusted seasonal strength, mean per phase)
+        """
+        lengths = {int(round(period))}
+        for cycle_us in CALENDAR_CYCLES.values():
+            length = cycle_us / every_us
+            multiple = length / period
+            if low <= length <= high or (multiple >= 1.5 and abs(multiple - round(multiple)) <= 0.05 * multiple):
+                lengths.add(int(round(length)))
+
+        values = residuals[present]
+        positions = np.flatnonzero(present)
+        total = float(values @ values)
+        n_values = len(values)
+
+        scored = []
+        for length in sorted(lengths):
+            if length < 2 or length > max_length or length >= n_values - 1:
+                continue
+            phase = positions % length
+            sums = np.bincount(phase, weights=values, minlength=length)
+            counts = np.bincount(phase, minlength=length)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means = np.where(counts > 0, sums / counts, 0.0)
+            r_squared = float((counts * means ** 2).sum() / total) if total > 0 else 0.0
+            adjusted = 1 - (1 - r_squared) * (n_values - 1) / (n_values - length)
+            scored.append((length, adjusted, means))
+
+        if not scored:
+            return 0, 0.0, np.zeros(1)
+
+        best = max(scored, key=lambda entry: entry[1])
+        if best[1] <= 0:
+            return best
+        return next(entry for entry in scored if entry[1] >= 0.9 * best[1])
+
+    @staticmethod
+    def _is_harmonic(length: int, base: int) -> bool:
+        """Whether a cycle length divides (or equals) a longer one, within 5%"""
+        if length > base:
+            return False
+        ratio = base / length
+        return abs(ratio - round(ratio)) <= 0.05 * ratio
+
+    @staticmethod
+    def _describe(
+        length: int,
+        strength: float,
+        profile: np.ndarray,
+        g: float,
+        p_value: float,
+        every_us: int,
+        start: Any,
+    ) -> Dict[str, Any]:
+        """
+        Cycle dict for one detected period.
+
+        Args:
+            length: Cycle length in grid periods
+            strength: Variance share of the average cycle
+            profile: Mean detrended value per phase
+            g: Peak's share of periodogram power
+            p_value: Fisher's g test p-value
+            every_us: Period length in microseconds
+            start: Time of the first period
+
+        Returns:
+            Cycle dict
+        """
+        duration_us = length * every_us
+        name = next(
+            (name for name, cycle_us in CALENDAR_CYCLES.items() if abs(duration_us - cycle_us) <= 0.05 * cycle_us),
+            None,
+        )
+        peak, trough = int(np.argmax(profile)), int(np.argmin(profile))
+
+        cycle = {
+            'length': length,
+            'period': _format_duration(duration_us),
+            'calendar_cycle': name,
+            'power_share': float(g),
+            'p_value': p_value,
+            'strength': strength,
+            'amplitude': float(profile.max() - profile.min()),
+            'peak_at': _format_time(start + timedelta(microseconds=peak * every_us)),
+            'trough_at': _format_time(start + timedelta(microseconds=trough * every_us)),
+        }
+        if length <= 400:
+            cycle['profile'] = profile.tolist()
+
+        return cycle
+
+    def select(
+        self,
+        df: pl.DataFrame,
+        schema: Dict[str, Any],
+        profile: Dict[str, Any],
+        item: tuple,
+        candidates: Optional[Dict[str, Any]],
+    ) -> List[Insight]:
+        """
+        Keep measures with a significant, strong cycle.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, measure columns, series frame, resampling info) from plan()
+            candidates: Periodogram peaks from candidates()
+
+        Returns:
+            List of detected Insight objects, in measure order
+        """
+        insights = []
+
+        if candidates is None:
+            return insights
+
+        time_col, measures, _, resampled = item
+        min_strength = self.settings.get('seasonality_min_strength', 0.05)
+        min_completeness = self.settings.get('seasonality_min_completeness', 0.8)
+
+        for j, measure_col in enumerate(measures):
+            completeness = candidates['completeness'][j]
+            if completeness < min_completeness:
+                continue
+
+            cycles = [
+                cycle for cycle in candidates['cycles'][j]
+                if cycle['p_value'] < 0.05 and cycle['strength'] >= min_strength
+            ]
+            if not cycles:
+                continue
+
+            dominant = cycles[0]
+            if dominant['calendar_cycle']:
+                title = f"{measure_col} follows a {dominant['calendar_cycle']} cycle"
+            else:
+                title = f"{measure_col} repeats every {dominant['period']}"
+            strength = dominant['strength']
+            strength_label = "strong" if strength > 0.5 else ("moderate" if strength > 0.25 else "weak")
+
+            caveats = [
+                'Cycle lengths are limited to whole numbers of resampled periods.',
+                "Fisher's g test assumes noise without autocorrelation; slow drifts can look like long cycles.",
+            ]
+            if resampled['periods'] < resampled['raw_rows']:
+                caveats.append(f"Values were averaged per {resampled['every']} period before the analysis.")
+
+            insights.append(Insight(
+                id='',
+                title=title,
+                rationale=(
+                    f"The average {dominant['period']} cycle explains {strength:.0%} of the variation in "
+                    f"{measure_col} after removing the trend ({strength_label} seasonality, "
+                    f"Fisher's g p={dominant['p_value']:.4f}); it peaks around {dominant['peak_at']}."
+                ),
+                primary_columns=[time_col, measure_col],
+                statistics={
+                    'dominant_period': dominant['period'],
+                    'dominant_length': dominant['length'],
+                    'calendar_cycle': dominant['calendar_cycle'],
+                    'seasonal_strength': strength,
+                    'strength_label': strength_label,
+                    'p_value': dominant['p_value'],
+                    'cycles': cycles,
+                    'n_periods': candidates['n_periods'],
+                    'completeness': completeness,
+                    'every': resampled['every'],
+                    'resampled': resampled,
+                },
+                quality_score=self.compute_quality_score(
+                    candidates['n_periods'] * completeness,
+                    np.sqrt(strength),
+                    profile['missingness'][measure_col]['fraction'],
+                ),
+                suggested_visuals=['seasonal_decomposition', 'cycle_plot', 'line'],
+                caveats=caveats,
+                detector_type='seasonality',
+            ))
+
+        return insights
@@ -0,0 +1,356 @@
+"""
+Insight Store
+Columnar table of insights for ranking, filtering and export at scale.
+
+Core fields are columns of one Polars DataFrame. Statistics live in one
+typed table per detector type: scalar statistics are native columns and
+nested ones are JSON strings, keyed by row. Ranking, filtering and
+slicing are DataFrame operations. Python objects are built only for the
+rows actually read, either as plain dicts (the Insight.to_dict() layout)
+or as InsightView objects.
+"""
+
+import json
+from collections.abc import Sequence
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+import polars as pl
+from ..artifacts import ABSENT_COLUMN, _records_to_frame
+from .base import Insight
+
+
+# Position of an insight in the table it was built from; links core rows to statistics
+ROW_COLUMN = '__row__'
+
+# Fields in Insight.to_dict() order; list fields are List(Utf8) columns
+FIELDS = [
+    'id', 'title', 'rationale', 'primary_columns', 'secondary_columns', 'statistics',
+    'quality_score', 'suggested_visuals', 'caveats', 'query', 'detector_type',
+]
+LIST_FIELDS = ['primary_columns', 'secondary_columns', 'suggested_visuals', 'caveats']
+
+# Joins list fields for _string_lists (ASCII unit separator, absent from column names and text)
+LIST_SEPARATOR = '\x1f'
+
+# Rows rebuilt per batch when iterating
+ITER_BATCH = 1024
+
+
+def _string_lists(name: str, values: List[List[str]]) -> pl.Series:
+    """
+    Build a List(Utf8) column from Python lists of strings.
+
+    Each list is joined with a separator and split in Polars, which is
+    much faster than converting the lists one by one.
+
+    Args:
+        name: Column name
+        values: Lists of strings
+
+    Returns:
+        List(Utf8) Series
+    """
+    if any(LIST_SEPARATOR in item for value in values for item in value):
+        return pl.Series(name, values, dtype=pl.List(pl.Utf8))
+
+    joined = [LIST_SEPARATOR.join(value) if value else None for value in values]
+
+    return (
+        pl.Series(name, joined, dtype=pl.Utf8).str.split(LIST_SEPARATOR)
+        .fill_null(pl.Series([[]], dtype=pl.List(pl.Utf8)))
+    )
+
+
+class InsightView:
+    """
+    Lightweight read-only insight with the same fields as Insight.
+    """
+
+    __slots__ = tuple(FIELDS)
+
+    def __init__(self, record: Dict[str, Any]):
+        """
+        Initialize from an Insight.to_dict()-style record.
+
+        Args:
+            record: Insight record
+        """
+        for name in FIELDS:
+            object.__setattr__(self, name, record[name])
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("InsightView is read-only")
+
+    def __repr__(self) -> str:
+        return f"InsightView(id={self.id!r}, quality_score={self.quality_score:.3f}, title={self.title!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {name: getattr(self, name) for name in FIELDS}
+
+
+class InsightTable(Sequence):
+    """
+    Columnar insight collection.
+
+    Behaves as a read-only sequence of insight dicts (so it can stand in
+    for the 'appendix_insights' list); slicing returns a table.
+    """
+
+    def __init__(
+        self,
+        frame: pl.DataFrame,
+        statistics: Dict[str, pl.DataFrame],
+        json_columns: Dict[str, List[str]],
+    ):
+        """
+        Initialize from prebuilt tables (see from_insights()).
+
+        Args:
+            frame: Core fields plus ROW_COLUMN, one row per insight in table order
+            statistics: detector_type -> statistics table keyed by ROW_COLUMN
+            json_columns: detector_type -> JSON-encoded statistic columns
+        """
+        self.frame = frame
+        self.statistics = statistics
+        self.json_columns = json_columns
+
+    @classmethod
+    def from_insights(cls, insights: Iterable[Insight]) -> 'InsightTable':
+        """
+        Build a table from Insight objects (or objects with the same fields).
+
+        Args:
+            insights: Insights in table order
+
+        Returns:
+            InsightTable
+        """
+        insights = list(insights)
+
+        frame = pl.DataFrame({
+            ROW_COLUMN: pl.Series(ROW_COLUMN, range(len(insights)), dtype=pl.Int64),
+            **{
+                name: _string_lists(name, [getattr(insight, name) for insight in insights])
+                if name in LIST_FIELDS
+                else pl.Series(
+                    name,
+                    [getattr(insight, name) for insight in insights],
+                    dtype=pl.Float64 if name == 'quality_score' else pl.Utf8,
+                )
+                for name in FIELDS if name != 'statistics'
+            },
+        })
+
+        # One typed statistics table per detector type
+        rows_by_type: Dict[str, List[int]] = {}
+        for row, insight in enumerate(insights):
+            rows_by_type.setdefault(insight.detector_type, []).append(row)
+
+        statistics = {}
+        json_columns = {}
+        for detector_type, rows in rows_by_type.items():
+            stats_frame, encoded = _records_to_frame([insights[row].statistics for row in rows])
+            statistics[detector_type] = stats_frame.insert_column(
+                0, pl.Series(ROW_COLUMN, rows, dtype=pl.Int64)
+            )
+            json_columns[detector_type] = encoded
+
+        return cls(frame, statistics, json_columns)
+
+    def _with_frame(self, frame: pl.DataFrame) -> 'InsightTable':
+        """Table over the same statistics with different core rows"""
+        return InsightTable(frame, self.statistics, self.json_columns)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self._with_frame(self.frame[index])
+            return self._with_frame(self.frame.slice(start, max(stop - start, 0)))
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('insight index out of range')
+
+        return self._records(self.frame.slice(index, 1))[0]
+
+    def __iter__(self):
+        for offset in range(0, len(self), ITER_BATCH):
+            yield from self._records(self.frame.slice(offset, ITER_BATCH))
+
+    def __repr__(self) -> str:
+        return f"InsightTable({len(self)} insights, types={sorted(self.statistics)})"
+
+    def rank(self) -> 'InsightTable':
+        """
+        Sort by quality score, best first; ties keep table order.
+
+        Returns:
+            Ranked InsightTable
+        """
+        return self._with_frame(self.frame.sort('quality_score', descending=True, maintain_order=True))
+
+    def filter(self, predicate: pl.Expr) -> 'InsightTable':
+        """
+        Keep insights matching a predicate over the core columns.
+
+        Args:
+            predicate: Polars expression (e.g. pl.col('quality_score') > 0.7)
+
+        Returns:
+            Filtered InsightTable
+        """
+        return self._with_frame(self.frame.filter(predicate))
+
+    def filter_statistics(self, detector_type: str, predicate: pl.Expr) -> 'InsightTable':
+        """
+        Keep insights of one detector type whose statistics match a predicate.
+
+        Args:
+            detector_type: Detector type whose statistics table to query
+            predicate: Polars expression over statistic columns (e.g. pl.col('p_value') < 0.01)
+
+        Returns:
+            Filtered InsightTable
+        """
+        stats_frame = self.statistics.get(detector_type)
+        if stats_frame is None:
+            return self._with_frame(self.frame.clear())
+
+        rows = stats_frame.filter(predicate).select(ROW_COLUMN)
+        return self._with_frame(self.frame.join(rows, on=ROW_COLUMN, how='semi', maintain_order='left'))
+
+    def top(self, k: int) -> List[InsightView]:
+        """
+        Views of the first k insights (call rank() first for the best k).
+
+        Args:
+            k: Number of insights
+
+        Returns:
+            List of InsightView objects
+        """
+        return [InsightView(record) for record in self._records(self.frame.slice(0, k))]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """
+        All insights as Insight.to_dict()-style records, in table order.
+
+        Returns:
+            List of insight dicts
+        """
+        return self._records(self.frame)
+
+    def materialize(self) -> List[Dict[str, Any]]:
+        """Convert to a plain list of dicts (used by artifact export)"""
+        return self.to_dicts()
+
+    def to_frame(self, detector_type: Optional[str] = None) -> pl.DataFrame:
+        """
+        Flat table for analysis or spreadsheet export.
+
+        Args:
+            detector_type: If given, keep that type's insights and join its
+                statistics as typed columns
+
+        Returns:
+            DataFrame in table order
+        """
+        if detector_type is None:
+            return self.frame.drop(ROW_COLUMN)
+
+        stats_frame = self.statistics.get(detector_type)
+        frame = self.frame.filter(pl.col('detector_type') == detector_type)
+        if stats_frame is not None:
+            frame = frame.join(stats_frame.drop(ABSENT_COLUMN, strict=False), on=ROW_COLUMN, how='left', maintain_order='left')
+
+        return frame.drop(ROW_COLUMN)
+
+    def to_records_frame(self) -> Tuple[pl.DataFrame, List[str]]:
+        """
+        Table in the artifact record layout, without building insight dicts.
+
+        Statistics become one JSON column; list fields stay List(Utf8).
+
+        Returns:
+            Tuple of (DataFrame with Insight.to_dict() columns, JSON-encoded column names)
+        """
+        encoded = [json.dumps(statistics) for statistics in self._statistics_rows(self.frame)]
+
+        frame = self.frame.with_columns(
+            pl.Series('statistics', encoded, dtype=pl.Utf8)
+        ).select(FIELDS)
+
+        return frame, ['statistics']
+
+    def _statistics_rows(self, frame: pl.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Rebuild the statistics dicts of some core rows.
+
+        Each detector type's statistics are fetched with one semi-join, so
+        the cost grows with the rows requested, not the table size.
+
+        Args:
+            frame: Slice of self.frame
+
+        Returns:
+            Statistics dicts in frame order
+        """
+        by_row: Dict[int, Dict[str, Any]] = {}
+
+        for detector_type, stats_frame in self.statistics.items():
+            wanted = frame.filter(pl.col('detector_type') == detector_type).select(ROW_COLUMN)
+            if len(wanted) == 0:
+                continue
+
+            for values in stats_frame.join(wanted, on=ROW_COLUMN, how='semi').iter_rows(named=True):
+                row = values[ROW_COLUMN]
+                by_row[row] = self._decode(detector_type, values)
+
+        return [by_row.get(row, {}) for row in frame[ROW_COLUMN].to_list()]
+
+    def _decode(self, detector_type: str, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Turn a statistics table row back into the original dict.
+
+        Args:
+            detector_type: Detector type of the row
+            values: Row as a column -> value dict
+
+        Returns:
+            Statistics dict
+        """
+        json_columns = self.json_columns[detector_type]
+        absent = values.pop(ABSENT_COLUMN, None)
+        values.pop(ROW_COLUMN)
+
+        for name in json_columns:
+            if values[name] is not None:
+                values[name] = json.loads(values[name])
+
+        if absent:
+            for name in json.loads(absent):
+                del values[name]
+
+        return values
+
+    def _records(self, frame: pl.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Build insight dicts for some core rows.
+
+        Args:
+            frame: Slice of self.frame
+
+        Returns:
+            List of insight dicts
+        """
+        records = []
+        for values, statistics in zip(frame.iter_rows(named=True), self._statistics_rows(frame)):
+            values['statistics'] = statistics
+            records.append({name: values[name] for name in FIELDS})
+
+        return records
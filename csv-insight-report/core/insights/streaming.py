@@ -0,0 +1,239 @@
+"""
+Streaming Insight Detection
+Yields insights as detectors produce them, for progressive display.
+
+Detectors are planned one after another on the worker pool, and each
+plan's work items are queued as soon as it is ready, so the first cheap
+items finish while later detectors are still planning. An insight is
+released once every earlier item of its detector has finished; it then
+carries its final ID, and the running top-k equals run_all()'s ranking
+once the stream ends.
+"""
+
+import asyncio
+import heapq
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Iterator, AsyncIterator
+import polars as pl
+from .base import BaseDetector, Insight
+from .bootstrap import add_confidence_intervals
+from .registry import create_detectors
+from .runner import _timed_item, build_output
+
+
+@dataclass
+class InsightEvent:
+    """
+    One streamed insight with a snapshot of progress.
+    """
+    insight: Insight
+    top_insights: List[Insight]  # Current top-k by quality_score, best first
+    work_items_completed: int
+    work_items_planned: int
+    detectors_planned: int
+    detectors_total: int
+    elapsed_seconds: float
+
+
+class InsightStream:
+    """
+    Iterate over insights as they are detected.
+
+    Usage:
+        stream = InsightStream(df, schema, profile, settings)
+        for event in stream:
+            render(event.insight, event.top_insights)
+        insights = stream.result()  # same ranking as run_all()
+    """
+
+    def __init__(
+        self,
+        df: pl.DataFrame,
+        schema: Dict[str, Any],
+        profile: Dict[str, Any],
+        settings: Dict[str, Any],
+        detectors: Optional[List[BaseDetector]] = None,
+    ):
+        """
+        Initialize the stream. Detection starts on iteration.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            settings: Settings dict from config
+            detectors: Detector instances (defaults to the enabled detectors)
+        """
+        self.df = df
+        self.schema = schema
+        self.profile = profile
+        self.settings = settings
+        self.detectors = detectors if detectors is not None else create_detectors(settings)
+        self.workers = settings.get('detector_workers') or os.cpu_count() or 1
+        self.top_k = settings.get('max_insights_to_surface', 8)
+
+        self.insights: List[List[Insight]] = [[] for _ in self.detectors]
+        self.costs: Dict[str, Dict[str, Any]] = {}
+        self.detection_seconds: Optional[float] = None
+
+    def __iter__(self) -> Iterator[InsightEvent]:
+        """
+        Run the detectors, yielding each insight once its ID is final.
+
+        Yields:
+            InsightEvent per insight, in release order
+        """
+        start = time.perf_counter()
+        n_detectors = len(self.detectors)
+
+        plans: List[Optional[List[Any]]] = [None] * n_detectors
+        results: List[Dict[int, List[Insight]]] = [{} for _ in self.detectors]
+        released = [0] * n_detectors  # Items whose insights have been yielded
+        item_seconds = [0.0] * n_detectors
+        completed = 0
+        planned = 0
+
+        # Min-heap of the best k insights; ties rank by detector, then release order
+        heap: List[tuple] = []
+        sequence = 0
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self._timed_plan, 0): ('plan', 0, None)} if n_detectors else {}
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    kind, d, i = futures.pop(future)
+
+                    if kind == 'plan':
+                        plans[d], seconds = future.result()
+                        planned += len(plans[d])
+                        self.costs[self.detectors[d].name] = {
+                            'plan_seconds': seconds,
+                            'work_items': len(plans[d]),
+                        }
+                        for i, item in enumerate(plans[d]):
+                            item_future = pool.submit(
+                                _timed_item, self.detectors[d], self.df, self.schema, self.profile, item
+                            )
+                            futures[item_future] = ('item', d, i)
+                        if d + 1 < n_detectors:
+                            futures[pool.submit(self._timed_plan, d + 1)] = ('plan', d + 1, None)
+                        continue
+
+                    results[d][i], seconds = future.result()
+                    item_seconds[d] += seconds
+                    completed += 1
+
+                    # Release this detector's finished prefix of items, in plan order
+                    while released[d] in results[d]:
+                        item_insights = self.detectors[d].assign_ids(
+                            [results[d].pop(released[d])], offset=len(self.insights[d])
+                        )
+                        released[d] += 1
+
+                        for insight in item_insights:
+                            self.insights[d].append(insight)
+                            sequence += 1
+                            entry = (insight.quality_score, -d, -sequence, insight)
+                            if len(heap) < self.top_k:
+                                heapq.heappush(heap, entry)
+                            elif entry[:3] > heap[0][:3]:
+                                heapq.heapreplace(heap, entry)
+
+                            yield InsightEvent(
+                                insight=insight,
+                                top_insights=[e[3] for e in sorted(heap, key=lambda e: e[:3], reverse=True)],
+                                work_items_completed=completed,
+                                work_items_planned=planned,
+                                detectors_planned=sum(plan is not None for plan in plans),
+                                detectors_total=n_detectors,
+                                elapsed_seconds=time.perf_counter() - start,
+                            )
+
+        for d, detector in enumerate(self.detectors):
+            self.costs[detector.name]['item_seconds'] = item_seconds[d]
+            self.costs[detector.name]['insights'] = len(self.insights[d])
+            self.costs[detector.name].update(getattr(detector, 'status', {}))
+
+        self.detection_seconds = time.perf_counter() - start
+
+    async def __aiter__(self) -> AsyncIterator[InsightEvent]:
+        """
+        Async variant: detection runs in a worker thread between events.
+
+        Yields:
+            InsightEvent per insight, in release order
+        """
+        loop = asyncio.get_running_loop()
+        iterator = iter(self)
+        finished = object()
+
+        while True:
+            event = await loop.run_in_executor(None, next, iterator, finished)
+            if event is finished:
+                return
+            yield event
+
+    def _timed_plan(self, d: int) -> tuple[List[Any], float]:
+        """
+        Plan one detector and time it.
+
+        Args:
+            d: Detector index
+
+        Returns:
+            Tuple of (work items, elapsed seconds)
+        """
+        start = time.perf_counter()
+        items = self.detectors[d].plan(self.df, self.schema, self.profile)
+        return items, time.perf_counter() - start
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Ranked insights of the finished stream, as returned by run_all().
+
+        Returns:
+            Insights dict
+
+        Raises:
+            RuntimeError: If the stream has not been fully consumed
+        """
+        if self.detection_seconds is None:
+            raise RuntimeError("InsightStream.result() called before the stream was exhausted")
+
+        all_insights = [insight for insights in self.insights for insight in insights]
+
+        insights_output = build_output(all_insights, self.settings, {
+            'detector_costs': self.costs,
+            'detection_seconds': self.detection_seconds,
+            'detector_workers': self.workers,
+        })
+        add_confidence_intervals(insights_output['top_insights'], self.df, self.profile, self.settings)
+
+        return insights_output
+
+
+def stream_insights(
+    df: pl.DataFrame,
+    schema: Dict[str, Any],
+    profile: Dict[str, Any],
+    settings: Dict[str, Any]
+) -> InsightStream:
+    """
+    Detect insights incrementally.
+
+    Args:
+        df: Input DataFrame
+        schema: Schema dict from ingest
+        profile: Profile dict from profiling
+        settings: Settings dict from config
+
+    Returns:
+        InsightStream to iterate (sync or async); call result() at the end
+    """
+    return InsightStream(df, schema, profile, settings)
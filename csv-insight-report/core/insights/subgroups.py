@@ -0,0 +1,571 @@
+"""
+Subgroup Discovery Insight Detector
+Finds conjunctions of categorical conditions whose rows differ strongly on a measure.
+
+Each measure is searched separately with a beam search over conditions
+of the form column = value. Condition columns are encoded once as
+integer codes and every condition becomes a packed bitset of rows, so
+refining a subgroup is one bitwise AND and its size one popcount.
+Subgroups are scored by sqrt(n / N) times their mean standardized
+measure; a subgroup is not refined further when an optimistic estimate
+of what any refinement could score falls below the current top results.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+import polars as pl
+import numpy as np
+from scipy import stats
+from ..profile import popcount
+from .base import BaseDetector, Insight
+
+
+def _pack(mask: np.ndarray) -> np.ndarray:
+    """
+    Pack a boolean row mask into 64-bit words.
+
+    Args:
+        mask: Boolean array (n,)
+
+    Returns:
+        uint64 array of ceil(n / 64) words
+    """
+    packed = np.packbits(mask, bitorder='little')
+    padding = (-len(packed)) % 8
+    if padding:
+        packed = np.concatenate([packed, np.zeros(padding, dtype=np.uint8)])
+    return packed.view(np.uint64)
+
+
+def _unpack(bits: np.ndarray, n: int) -> np.ndarray:
+    """
+    Boolean row mask of a packed bitset.
+
+    Args:
+        bits: uint64 words from _pack()
+        n: Number of rows
+
+    Returns:
+        Boolean array (n,)
+    """
+    return np.unpackbits(bits.view(np.uint8), count=n, bitorder='little').view(bool)
+
+
+@dataclass
+class _Subgroup:
+    """
+    A conjunction of conditions with its rows and score.
+    """
+    conditions: Tuple[int, ...]  # Sorted condition indices
+    bits: np.ndarray
+    n: int
+    quality: float  # sqrt(n / N) * mean standardized measure
+
+    @property
+    def score(self) -> float:
+        return abs(self.quality)
+
+
+class _SubgroupSearch:
+    """
+    Scoring state of one measure's search (conditions, standardized values, evaluated subgroups).
+    """
+
+    def __init__(self, z: np.ndarray, conditions: List[Dict[str, Any]], min_size: int):
+        """
+        Initialize the search.
+
+        Args:
+            z: Standardized measure values
+            conditions: Condition dicts from SubgroupDetector._encode_conditions()
+            min_size: Smallest subgroup size
+        """
+        self.z = z
+        self.conditions = conditions
+        self.min_size = min_size
+        self.n_total = len(z)
+        self.evaluated: Dict[Tuple[int, ...], _Subgroup] = {}
+
+    def root(self) -> _Subgroup:
+        """Subgroup of all rows"""
+        return _Subgroup((), _pack(np.ones(self.n_total, dtype=bool)), self.n_total, 0.0)
+
+    def refine(self, parent: _Subgroup, c: int) -> Optional[_Subgroup]:
+        """
+        Add one condition to a subgroup.
+
+        Args:
+            parent: Subgroup to refine
+            c: Condition index
+
+        Returns:
+            The refined subgroup, or None if too small or identical to its parent
+        """
+        bits = parent.bits & self.conditions[c]['bits']
+        n = popcount(bits)
+
+        if n < self.min_size or n == parent.n:
+            return None
+
+        return self._store(tuple(sorted(parent.conditions + (c,))), bits, n)
+
+    def score(self, key: Tuple[int, ...]) -> _Subgroup:
+        """
+        Evaluate a conjunction, e.g. a generalization the search pruned.
+
+        Args:
+            key: Sorted condition indices
+
+        Returns:
+            Subgroup with its score
+        """
+        if key in self.evaluated:
+            return self.evaluated[key]
+
+        bits = self.conditions[key[0]]['bits']
+        for c in key[1:]:
+            bits = bits & self.conditions[c]['bits']
+
+        return self._store(key, bits, popcount(bits))
+
+    def _store(self, key: Tuple[int, ...], bits: np.ndarray, n: int) -> _Subgroup:
+        """Score a subgroup from its rows and remember it"""
+        total = float(self.z[self.mask(bits)].sum()) if n else 0.0
+        subgroup = _Subgroup(key, bits, n, total / math.sqrt(max(n, 1) * self.n_total))
+        self.evaluated[key] = subgroup
+        return subgroup
+
+    def mask(self, bits: np.ndarray) -> np.ndarray:
+        """Boolean row mask of a bitset"""
+        return _unpack(bits, self.n_total)
+
+    def optimistic_estimate(self, subgroup: _Subgroup) -> float:
+        """
+        Highest score any refinement of a subgroup could reach.
+
+        A refinement keeps some k of the subgroup's rows; its score is
+        largest when those are the k most extreme values, so the bound is
+        the best sqrt(k / N) * mean of the top (or bottom) k values.
+
+        Args:
+            subgroup: Subgroup to bound
+
+        Returns:
+            Upper bound on the score of any refinement
+        """
+        values = np.sort(self.z[self.mask(subgroup.bits)])
+        k = np.arange(1, len(values) + 1, dtype=np.float64)
+        scale = np.sqrt(k * self.n_total)
+
+        highest = np.cumsum(values[::-1])[self.min_size - 1:] / scale[self.min_size - 1:]
+        lowest = -np.cumsum(values)[self.min_size - 1:] / scale[self.min_size - 1:]
+
+        return float(max(highest.max(initial=0.0), lowest.max(initial=0.0)))
+
+
+class SubgroupDetector(BaseDetector):
+    """
+    Detects segments (e.g. region = West AND channel = Online) with unusual measure values.
+    """
+
+    name = 'subgroup'
+    id_prefix = 'S'
+
+    def plan(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[tuple]:
+        """
+        List measures to search, with the categorical columns usable as conditions.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+
+        Returns:
+            List of (measure, condition columns) items
+        """
+        max_levels = self.settings.get('subgroup_max_levels', 20)
+
+        condition_cols = tuple(
+            col['normalized_name']
+            for col in schema['columns']
+            if col['type'] in ['categorical', 'string', 'bool'] and 2 <= col['unique_count'] <= max_levels
+        )
+
+        # Conjunctions need at least two columns
+        if len(condition_cols) < 2:
+            return []
+
+        return [
+            (col['normalized_name'], condition_cols)
+            for col in schema['columns']
+            if col['type'] in ['int', 'float']
+        ]
+
+    def item_columns(self, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[str]:
+        """Measure and condition columns"""
+        measure, condition_cols = item
+        return [measure] + list(condition_cols)
+
+    def estimate(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Tuple[float, float]:
+        """
+        Expected value and cost of searching one measure.
+
+        The value assumes prior_effect; the cost is one pass over the rows
+        per condition and search level.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (measure, condition columns) from plan()
+
+        Returns:
+            Tuple of (expected quality score, estimated cost)
+        """
+        measure, condition_cols = item
+        n = len(df)
+        missingness = profile['missingness'][measure]['fraction']
+        levels = sum(
+            col['unique_count'] for col in schema['columns']
+            if col['normalized_name'] in condition_cols
+        )
+
+        value = self.compute_quality_score(n * (1 - missingness), self.prior_effect, missingness)
+        cost = n * levels * self.settings.get('subgroup_max_depth', 3)
+
+        return value, float(max(cost, 1))
+
+    def detect_item(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[Insight]:
+        """
+        Detect subgroup insights for one measure.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (measure, condition columns) from plan()
+
+        Returns:
+            List of detected Insight objects
+        """
+        return self.select(df, schema, profile, item, self.candidates(df, schema, profile, item))
+
+    def candidates(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Beam search for the best-scoring subgroups of one measure.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (measure, condition columns) from plan()
+
+        Returns:
+            Dict with 'subgroups' (best first, with test statistics) and
+            'search' (evaluated, pruned, complete, seconds), or None
+        """
+        measure, condition_cols = item
+
+        max_depth = self.settings.get('subgroup_max_depth', 3)
+        beam_width = self.settings.get('subgroup_beam_width', 10)
+        budget = self.settings.get('subgroup_time_budget_seconds', 5.0)
+        min_sample = self.settings.get('min_sample_for_parametrics', 20)
+
+        start = time.perf_counter()
+        deadline = start + budget if budget is not None else float('inf')
+
+        frame = df.select(
+            [pl.col(measure).cast(pl.Float64)]
+            + [pl.col(c).cast(pl.Utf8).cast(pl.Categorical) for c in condition_cols]
+        ).filter(pl.col(measure).is_not_null() & pl.col(measure).is_not_nan())
+
+        n_total = len(frame)
+        y = frame[measure].to_numpy()
+        min_size = max(min_sample, math.ceil(self.settings.get('subgroup_min_support', 0.02) * n_total))
+
+        if n_total < 2 * min_size or np.std(y) == 0:
+            return None
+
+        # Standardized measure: subgroup quality is comparable across measures
+        mean, std = float(y.mean()), float(y.std())
+        conditions = self._encode_conditions(frame, condition_cols, min_size)
+        if not conditions:
+            return None
+
+        search = _SubgroupSearch((y - mean) / std, conditions, min_size)
+
+        # Results: the best subgroups seen, kept sorted by score
+        keep = max(beam_width, 4 * self.settings.get('subgroup_top_k', 2))
+        results: List[_Subgroup] = []
+        pruned = 0
+        complete = True
+        beam = [search.root()]
+
+        for depth in range(1, max_depth + 1):
+            level: Dict[Tuple[int, ...], _Subgroup] = {}
+
+            for parent in beam:
+                used = {conditions[c]['column'] for c in parent.conditions}
+
+                for c, condition in enumerate(conditions):
+                    key = tuple(sorted(parent.conditions + (c,)))
+                    if condition['column'] in used or key in search.evaluated:
+                        continue
+
+                    subgroup = search.refine(parent, c)
+                    if subgroup is not None:
+                        level[key] = subgroup
+
+                if time.perf_counter() > deadline:
+                    complete = False
+                    break
+
+            results = sorted(results + list(level.values()), key=lambda s: s.score, reverse=True)[:keep]
+            threshold = results[-1].score if len(results) == keep else 0.0
+
+            if not complete or depth == max_depth:
+                break
+
+            # Next beam: best subgroups whose refinements could still enter the results
+            beam = []
+            for subgroup in sorted(level.values(), key=lambda s: s.score, reverse=True):
+                if len(beam) == beam_width:
+                    break
+                if search.optimistic_estimate(subgroup) <= threshold:
+                    pruned += 1
+                    continue
+                beam.append(subgroup)
+
+            if not beam:
+                break
+
+        # Bonferroni adjustment for every subgroup the search scored
+        subgroups = [self._describe(search, subgroup, y) for subgroup in results]
+        for subgroup in subgroups:
+            subgroup['p_value_adjusted'] = min(1.0, subgroup['p_value'] * len(search.evaluated))
+
+        return {
+            'subgroups': subgroups,
+            'n_total': n_total,
+            'mean': mean,
+            'search': {
+                'conditions': len(conditions),
+                'evaluated': len(search.evaluated),
+                'pruned': pruned,
+                'complete': complete,
+                'seconds': time.perf_counter() - start,
+            },
+        }
+
+    def _encode_conditions(self, frame: pl.DataFrame, condition_cols: tuple, min_size: int) -> List[Dict[str, Any]]:
+        """
+        Build one row bitset per column = value from the columns' categorical codes.
+
+        Args:
+            frame: Rows with a present measure
+            condition_cols: Condition columns (cast to Categorical)
+            min_size: Smallest subgroup size
+
+        Returns:
+            List of condition dicts (column, value, bits, n)
+        """
+        n_total = len(frame)
+        conditions = []
+
+        for col in condition_cols:
+            series = frame[col]
+            codes = series.to_physical().fill_null(-1).cast(pl.Int64).to_numpy()
+            levels = series.drop_nulls().unique()
+
+            # Physical codes index a shared category table; map only the levels present
+            for label, code in sorted(zip(levels.cast(pl.Utf8).to_list(), levels.to_physical().to_list())):
+                mask = codes == code
+                n = int(np.count_nonzero(mask))
+                if min_size <= n < n_total:
+                    conditions.append({
+                        'column': col,
+                        'value': label,
+                        'bits': _pack(mask),
+                        'n': n,
+                    })
+
+        return conditions
+
+    @staticmethod
+    def _describe(search: _SubgroupSearch, subgroup: _Subgroup, y: np.ndarray) -> Dict[str, Any]:
+        """
+        Statistics of a subgroup against the remaining rows.
+
+        Args:
+            search: Search the subgroup came from
+            subgroup: Subgroup found by the search
+            y: Measure values
+
+        Returns:
+            Candidate dict (with the row bitset, for overlap checks)
+        """
+        mask = search.mask(subgroup.bits)
+        inside, outside = y[mask], y[~mask]
+
+        n1, n2 = len(inside), len(outside)
+        m1, m2 = inside.mean(), outside.mean()
+        s1, s2 = inside.std(ddof=1), outside.std(ddof=1)
+        t_stat, p_value = stats.ttest_ind_from_stats(m1, s1, n1, m2, s2, n2, equal_var=False)
+
+        pooled = np.sqrt(((n1 - 1) * s1 ** 2 + (n2 - 1) * s2 ** 2) / (n1 + n2 - 2))
+        cohens_d = (m1 - m2) / pooled if pooled > 0 else 0.0
+
+        # Scores of the generalizations obtained by dropping one condition
+        parents = [
+            search.score(tuple(c for c in subgroup.conditions if c != dropped)).score
+            for dropped in subgroup.conditions
+            if len(subgroup.conditions) > 1
+        ]
+
+        return {
+            'conditions': [
+                {'column': search.conditions[c]['column'], 'value': search.conditions[c]['value']}
+                for c in subgroup.conditions
+            ],
+            'bits': subgroup.bits,
+            'n': n1,
+            'mean': float(m1),
+            'std': float(s1),
+            'rest_n': n2,
+            'rest_mean': float(m2),
+            'rest_std': float(s2),
+            'quality': subgroup.quality,
+            'parent_quality': max(parents) if parents else 0.0,
+            'cohens_d': float(cohens_d),
+            't_statistic': float(t_stat),
+            'p_value': float(p_value),
+        }
+
+    def select(
+        self,
+        df: pl.DataFrame,
+        schema: Dict[str, Any],
+        profile: Dict[str, Any],
+        item: tuple,
+        candidates: Optional[Dict[str, Any]],
+    ) -> List[Insight]:
+        """
+        Report the best significant conjunctions that beat all their generalizations.
+
+        Significance uses p-values Bonferroni-adjusted for the number of
+        subgroups evaluated. Segments overlapping an already reported one by more than
+        subgroup_max_overlap (Jaccard) are skipped.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (measure, condition columns) from plan()
+            candidates: Search result from candidates()
+
+        Returns:
+            List of detected Insight objects, best first
+        """
+        insights = []
+
+        if candidates is None:
+            return insights
+
+        measure = item[0]
+        min_depth = self.settings.get('subgroup_min_depth', 2)
+        min_effect = self.settings.get('subgroup_min_effect', 0.2)
+        top_k = self.settings.get('subgroup_top_k', 2)
+        max_overlap = self.settings.get('subgroup_max_overlap', 0.5)
+
+        reported = []
+        for subgroup in candidates['subgroups']:
+            if len(insights) == top_k:
+                break
+
+            if len(subgroup['conditions']) < min_depth:
+                continue
+            if subgroup['p_value_adjusted'] >= 0.05 or abs(subgroup['cohens_d']) < min_effect:
+                continue
+            if abs(subgroup['quality']) <= subgroup['parent_quality']:
+                continue
+            # Skip segments covering mostly the same rows as one already reported
+            if any(self._overlap(subgroup['bits'], other) > max_overlap for other in reported):
+                continue
+
+            reported.append(subgroup['bits'])
+            insights.append(self._insight(measure, subgroup, candidates, profile))
+
+        return insights
+
+    @staticmethod
+    def _overlap(first: np.ndarray, second: np.ndarray) -> float:
+        """Jaccard overlap of two row bitsets"""
+        union = popcount(first | second)
+        return popcount(first & second) / union if union else 0.0
+
+    def _insight(self, measure: str, subgroup: Dict[str, Any], candidates: Dict[str, Any], profile: Dict[str, Any]) -> Insight:
+        """
+        Build the insight for one subgroup.
+
+        Args:
+            measure: Measure column
+            subgroup: Subgroup candidate dict
+            candidates: Search result (for totals and search details)
+            profile: Profile dict from profiling
+
+        Returns:
+            Insight object
+        """
+        conditions = subgroup['conditions']
+        description = ' and '.join(f"{c['column']} = {c['value']}" for c in conditions)
+        direction = 'higher' if subgroup['cohens_d'] > 0 else 'lower'
+        share = subgroup['n'] / candidates['n_total']
+        effect_size = abs(subgroup['cohens_d'])
+        effect_label = "large" if effect_size > 0.8 else ("medium" if effect_size > 0.5 else "small")
+
+        def quote(value: str) -> str:
+            return "'" + value.replace("'", "''") + "'"
+
+        return Insight(
+            id='',
+            title=f"{measure} is {direction} where {description}",
+            rationale=(
+                f"Rows with {description} (n={subgroup['n']}, {share:.1%} of rows) average "
+                f"{subgroup['mean']:.4g} versus {subgroup['rest_mean']:.4g} elsewhere "
+                f"({effect_label} effect, d={subgroup['cohens_d']:.3f}, adjusted p={subgroup['p_value_adjusted']:.4f})."
+            ),
+            primary_columns=[measure] + [c['column'] for c in conditions],
+            statistics={
+                'conditions': conditions,
+                'depth': len(conditions),
+                'n': subgroup['n'],
+                'share': share,
+                'mean': subgroup['mean'],
+                'std': subgroup['std'],
+                'rest_n': subgroup['rest_n'],
+                'rest_mean': subgroup['rest_mean'],
+                'rest_std': subgroup['rest_std'],
+                'cohens_d': subgroup['cohens_d'],
+                'effect_size_label': effect_label,
+                't_statistic': subgroup['t_statistic'],
+                'p_value': subgroup['p_value'],
+                'p_value_adjusted': subgroup['p_value_adjusted'],
+                'subgroup_quality': subgroup['quality'],
+                'best_generalization_quality': subgroup['parent_quality'],
+                'search': candidates['search'],
+            },
+            quality_score=self.compute_quality_score(
+                subgroup['n'],
+                effect_size,
+                profile['missingness'][measure]['fraction'],
+            ),
+            suggested_visuals=['subgroup_bar', 'boxplot_subgroup_vs_rest'],
+            caveats=[
+                'Segments were found by searching many condition combinations; the adjusted p-value accounts for this, the raw p-value does not.',
+                'Segment differences describe association, not causation.',
+            ],
+            query=' AND '.join(f"{c['column']} = {quote(c['value'])}" for c in conditions),
+            detector_type='subgroup',
+        )
@@ -3,21 +3,278 @@ Trend Insight Detector
 Detects temporal trends in time series data.
 """
 
-from typing import Dict, List, Any
+from datetime import timedelta
+import re
+from typing import Dict, List, Any, Optional, Tuple
 import polars as pl
 import numpy as np
 from scipy import stats
 from .base import BaseDetector, Insight
 
 
+# Max values (rows x measures) tested together in one batch
+TREND_BATCH_CELLS = 4_000_000
+
+
+def _time_ranks(t: np.ndarray, present: np.ndarray) -> np.ndarray:
+    """
+    Rank a sorted time axis within every measure's subset of present rows.
+
+    Ties are blocks of equal time values. Within one measure, a block's
+    average rank is the number of present rows before the block plus
+    (present rows in the block + 1) / 2, so one cumulative count per
+    measure ranks the shared time axis for all measures at once.
+
+    Args:
+        t: Ascending time values (n,)
+        present: Boolean mask of present values (measures x n)
+
+    Returns:
+        Float array (measures x n) of average time ranks (meaningful where present)
+    """
+    running = np.cumsum(present, axis=1, dtype=np.float64)
+
+    starts = np.flatnonzero(np.r_[True, t[1:] != t[:-1]])
+
+    # Distinct timestamps: the rank is just the running count of present rows
+    if len(starts) == len(t):
+        return running
+
+    lengths = np.diff(np.r_[starts, len(t)])
+    block_first = np.repeat(starts, lengths)
+    block_last = np.repeat(np.r_[starts[1:], len(t)] - 1, lengths)
+
+    before = running[:, block_first] - present[:, block_first]
+    in_block = running[:, block_last] - before
+
+    return before + (in_block + 1) / 2.0
+
+
+def _row_ranks(Y: np.ndarray) -> np.ndarray:
+    """
+    Average ranks within every row, ignoring NaN (NaN keeps rank NaN).
+
+    Same result as stats.rankdata(Y, axis=1, nan_policy='omit'), but ties
+    are resolved after an unstable sort, which is several times faster
+    than the stable sort rankdata needs.
+
+    Args:
+        Y: Values (measures x n), NaN where missing
+
+    Returns:
+        Float array (measures x n) of ranks
+    """
+    n = Y.shape[1]
+    order = np.argsort(Y, axis=1)
+    ordered = np.take_along_axis(Y, order, axis=1)
+
+    # Tie blocks along each sorted row; a block's rank is the mean of its first and last position
+    position = np.arange(1, n + 1, dtype=np.float64)
+    new_block = np.ones(Y.shape, dtype=bool)
+    new_block[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    block_end = np.ones(Y.shape, dtype=bool)
+    block_end[:, :-1] = new_block[:, 1:]
+
+    first = np.maximum.accumulate(np.where(new_block, position, 0.0), axis=1)
+    last = np.minimum.accumulate(np.where(block_end, position, np.inf)[:, ::-1], axis=1)[:, ::-1]
+    ordered_ranks = np.where(np.isnan(ordered), np.nan, (first + last) / 2.0)
+
+    ranks = np.empty(Y.shape)
+    np.put_along_axis(ranks, order, ordered_ranks, axis=1)
+    return ranks
+
+
+def _masked_pearson(x: np.ndarray, y: np.ndarray, present: np.ndarray, n: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Per-row centered sums and Pearson r over present values.
+
+    Args:
+        x: Values (measures x n), any value where absent
+        y: Values (measures x n), any value where absent
+        present: Boolean mask (measures x n)
+        n: Present values per row (measures,)
+
+    Returns:
+        Dict with sxx, syy, sxy and r per row
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        xc = np.where(present, x - (np.where(present, x, 0.0).sum(axis=1) / n)[:, None], 0.0)
+        yc = np.where(present, y - (np.where(present, y, 0.0).sum(axis=1) / n)[:, None], 0.0)
+
+        sxx = np.einsum('ij,ij->i', xc, xc)
+        syy = np.einsum('ij,ij->i', yc, yc)
+        sxy = np.einsum('ij,ij->i', xc, yc)
+        r = np.clip(sxy / np.sqrt(sxx * syy), -1.0, 1.0)
+
+    return {'sxx': sxx, 'syy': syy, 'sxy': sxy, 'r': r}
+
+
+def _correlation_pvalue(r: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """
+    Two-sided p-values of correlations (t distribution, n - 2 dof), as in scipy.
+
+    Args:
+        r: Correlation coefficients
+        n: Sample sizes
+
+    Returns:
+        Array of p-values
+    """
+    dof = n - 2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = r * np.sqrt(dof / ((1.0 - r) * (1.0 + r)))
+        p = 2 * stats.t.sf(np.abs(t), dof)
+
+    return np.where(np.abs(r) >= 1.0, 0.0, p)
+
+
+def trend_statistics(t: np.ndarray, Y: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Spearman and OLS trend statistics of many measures against one time axis.
+
+    Equivalent to calling stats.spearmanr and stats.linregress per column
+    on the rows where that column is present, but ranks the time axis once
+    and evaluates every column with array operations.
+
+    Args:
+        t: Ascending time values (n,)
+        Y: Measure values (n x p), NaN where missing
+
+    Returns:
+        Dict of per-column arrays: n, spearman_r, spearman_p, slope,
+        intercept, r, stderr
+    """
+    # Work measure-major so that every reduction runs over contiguous memory
+    Y = np.ascontiguousarray(Y.T, dtype=np.float64)
+    present = ~np.isnan(Y)
+    n = present.sum(axis=1).astype(np.float64)
+    T = np.broadcast_to(t, Y.shape)
+
+    # Spearman: Pearson correlation of ranks within each measure's present rows
+    spearman_r = _masked_pearson(_time_ranks(t, present), _row_ranks(Y), present, n)['r']
+
+    # OLS slope of measure on time
+    sums = _masked_pearson(T, Y, present, n)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = sums['sxy'] / sums['sxx']
+        t_mean = np.where(present, T, 0.0).sum(axis=1) / n
+        y_mean = np.where(present, Y, 0.0).sum(axis=1) / n
+        stderr = np.sqrt((1 - sums['r'] ** 2) * sums['syy'] / sums['sxx'] / (n - 2))
+
+    return {
+        'n': n,
+        'spearman_r': spearman_r,
+        'spearman_p': _correlation_pvalue(spearman_r, n),
+        'slope': slope,
+        'intercept': y_mean - slope * t_mean,
+        'r': sums['r'],
+        'stderr': stderr,
+    }
+
+
+def _parse_cadence(cadence: Optional[str]) -> int:
+    """
+    Parse a typical_cadence string (str of a timedelta) into microseconds.
+
+    Args:
+        cadence: e.g. '1:00:00', '1 day, 0:00:00' or '0:00:00.500000'
+
+    Returns:
+        Cadence in microseconds, or 0 if missing or unparseable
+    """
+    match = re.match(r'^(?:(\d+) days?, )?(\d+):(\d{2}):(\d{2})(?:\.(\d{6}))?$', cadence or '')
+    if not match:
+        return 0
+
+    days, hours, minutes, seconds, micros = (int(g) if g else 0 for g in match.groups())
+    return (((days * 24 + hours) * 60 + minutes) * 60 + seconds) * 1_000_000 + micros
+
+
+def time_frame(df: pl.DataFrame, time_col: str, measures: List[str]) -> pl.DataFrame:
+    """
+    Time and measure columns ordered by time, sorting only if needed.
+
+    Args:
+        df: Input DataFrame
+        time_col: Time index column
+        measures: Measure columns
+
+    Returns:
+        DataFrame with non-null time values in ascending order
+    """
+    frame = df.select([time_col] + measures).filter(pl.col(time_col).is_not_null())
+
+    # The profile usually reports a monotonic index; skip the sort then
+    if frame[time_col].is_sorted():
+        return frame.with_columns(pl.col(time_col).set_sorted())
+
+    return frame.sort(time_col)
+
+
+def resample_series(
+    frame: pl.DataFrame,
+    time_col: str,
+    measures: List[str],
+    cadence: Optional[str],
+    max_periods: int,
+) -> tuple[pl.DataFrame, Dict[str, Any]]:
+    """
+    Average measures per period with group_by_dynamic.
+
+    The period is the detected cadence, widened so that the series has
+    at most max_periods periods.
+
+    Args:
+        frame: Time-sorted DataFrame
+        time_col: Time index column
+        measures: Measure columns
+        cadence: typical_cadence string from the profile (str of a timedelta)
+        max_periods: Max periods after resampling
+
+    Returns:
+        Tuple of (resampled DataFrame, resampling info)
+    """
+    bounds = frame.select(
+        pl.col(time_col).dt.epoch('us').min().alias('first'),
+        pl.col(time_col).dt.epoch('us').max().alias('last'),
+    ).row(0)
+    span_us = (bounds[1] - bounds[0]) if bounds[0] is not None else 0
+
+    every_us = max(
+        _parse_cadence(cadence),
+        -(-span_us // max_periods),  # ceil division
+        1,
+    )
+
+    resampled = (
+        frame
+        .group_by_dynamic(time_col, every=f"{every_us}us")
+        .agg([pl.col(m).mean() for m in measures])
+    )
+
+    info = {
+        'every': str(timedelta(microseconds=every_us)),
+        'raw_rows': len(frame),
+        'periods': len(resampled),
+    }
+
+    return resampled, info
+
+
 class TrendDetector(BaseDetector):
     """
     Detects trends over time using Spearman correlation and basic time series analysis.
     """
 
-    def detect(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[Insight]:
+    name = 'trend'
+    id_prefix = 'T'
+
+    # Column holding the shared time axis (days since the first observation)
+    TIME_AXIS = '__days__'
+
+    def plan(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[tuple]:
         """
-        Detect trend insights.
+        Build the shared time axis and list measures to test against it.
 
         Args:
             df: Input DataFrame
@@ -25,18 +282,14 @@ class TrendDetector(BaseDetector):
             profile: Profile dict from profiling
 
         Returns:
-            List of detected Insight objects
+            List of (time_col, measure columns, series frame, resampling info) items
         """
-        insights = []
-        insight_counter = 0
-
         # Get time index info
         time_index_info = profile.get('time_index')
         if not time_index_info:
-            return insights  # No time index detected
+            return []  # No time index detected
 
         time_col = time_index_info['column']
-        min_periods = self.settings.get('trend_min_periods', 12)
 
         # Get numeric columns
         numeric_cols = [
@@ -45,72 +298,595 @@ class TrendDetector(BaseDetector):
             if col['type'] in ['int', 'float'] and col['normalized_name'] != time_col
         ]
 
-        # Sort by time
-        df_sorted = df.sort(time_col)
+        if not numeric_cols:
+            return []
 
-        for measure_col in numeric_cols:
-            # Get clean time series
-            ts_data = df_sorted.select([time_col, measure_col]).drop_nulls()
+        frame = time_frame(df, time_col, numeric_cols)
+        resampled = None
 
-            if len(ts_data) < min_periods:
-                continue
+        if self._should_resample(len(frame)):
+            frame, resampled = self._resample(frame, time_col, numeric_cols, time_index_info.get('typical_cadence'))
 
-            # Extract values
-            time_values = ts_data[time_col].to_numpy()
-            measure_values = ts_data[measure_col].to_numpy()
+        # Time axis as days since the first observation, computed once in Polars
+        if len(frame) > 0:
+            epoch = pl.col(time_col).dt.epoch('us')
+            frame = frame.with_columns(
+                ((epoch - epoch.first()) / 86_400_000_000).alias(self.TIME_AXIS)
+            ).drop(time_col)
 
-            # Convert time to numeric (days since first observation)
-            if hasattr(time_values[0], 'timestamp'):
-                time_numeric = np.array([(t - time_values[0]).total_seconds() / 86400 for t in time_values])
-            else:
-                time_numeric = np.arange(len(time_values))
+        # Batch measures so that one batch stays within TREND_BATCH_CELLS values
+        batch = max(1, TREND_BATCH_CELLS // max(len(frame), 1))
+
+        return [
+            (time_col, numeric_cols[i:i + batch], frame, resampled)
+            for i in range(0, len(numeric_cols), batch)
+        ]
 
-            # Compute Spearman correlation
-            spearman_r, spearman_p = stats.spearmanr(time_numeric, measure_values)
+    def _should_resample(self, n_rows: int) -> bool:
+        """
+        Whether to aggregate into periods before testing.
+
+        Args:
+            n_rows: Rows with a non-null time value
 
-            # Compute linear regression for slope
-            slope, intercept, r_value, p_value, std_err = stats.linregress(time_numeric, measure_values)
+        Returns:
+            True if resampling applies
+        """
+        mode = self.settings.get('trend_resample', 'auto')
+
+        if mode == 'auto':
+            return n_rows >= self.settings.get('trend_resample_min_rows', 1_000_000)
+
+        return bool(mode)
+
+    def _resample(
+        self,
+        frame: pl.DataFrame,
+        time_col: str,
+        measures: List[str],
+        cadence: Optional[str],
+    ) -> tuple[pl.DataFrame, Dict[str, Any]]:
+        """Average measures per period, with at most trend_max_periods periods"""
+        return resample_series(frame, time_col, measures, cadence, self.settings.get('trend_max_periods', 10_000))
+
+    def estimate(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Tuple[float, float]:
+        """
+        Expected value and cost of one measure batch.
+
+        Trends have no cheap screen, so the value assumes prior_effect over
+        the series length; the cost is one rank sort per measure.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, measure columns, series frame, resampling info) from plan()
+
+        Returns:
+            Tuple of (expected quality score, estimated cost)
+        """
+        _, measures, frame, _ = item
+        n = len(frame)
+
+        value = self.compute_quality_score(n, self.prior_effect, 0.0)
+        cost = n * len(measures) * np.log2(max(n, 2))
+
+        return value, float(max(cost, 1))
+
+    def item_key(self, item: tuple) -> str:
+        """Identify a batch by its columns and resampling, not its frame"""
+        time_col, measures, _, resampled = item
+        return repr((time_col, measures, resampled))
+
+    def item_columns(self, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[str]:
+        """Time and measure columns of a batch"""
+        return [item[0]] + list(item[1])
+
+    def detect_item(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[Insight]:
+        """
+        Detect trend insights for a batch of measures.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, measure columns, series frame, resampling info) from plan()
+
+        Returns:
+            List of detected Insight objects, in measure order
+        """
+        return self.select(df, schema, profile, item, self.candidates(df, schema, profile, item))
+
+    def candidates(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Trend statistics of every measure in a batch.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, measure columns, series frame, resampling info) from plan()
+
+        Returns:
+            trend_statistics() result, or None for an empty series
+        """
+        _, measures, frame, _ = item
+
+        if len(frame) == 0:
+            return None
+
+        # Time axis is days since the first observation; nulls become NaN
+        time_numeric = frame[self.TIME_AXIS].to_numpy()
+        Y = frame.select([pl.col(m).cast(pl.Float64) for m in measures]).to_numpy()
+
+        return trend_statistics(time_numeric, Y)
+
+    def select(
+        self,
+        df: pl.DataFrame,
+        schema: Dict[str, Any],
+        profile: Dict[str, Any],
+        item: tuple,
+        results: Optional[Dict[str, np.ndarray]],
+    ) -> List[Insight]:
+        """
+        Keep measures with enough periods and a notable trend.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, measure columns, series frame, resampling info) from plan()
+            results: Statistics from candidates()
+
+        Returns:
+            List of detected Insight objects, in measure order
+        """
+        insights = []
+
+        time_col, measures, _, resampled = item
+        min_periods = self.settings.get('trend_min_periods', 12)
+        min_abs_rho = self.settings.get('correlation_min_abs', 0.3)
+
+        if results is None:
+            return insights
+
+        for j, measure_col in enumerate(measures):
+            n_periods = int(results['n'][j])
+
+            if n_periods < min_periods:
+                continue
+
+            spearman_r = results['spearman_r'][j]
+            spearman_p = results['spearman_p'][j]
+            slope = results['slope'][j]
+            r_value = results['r'][j]
 
             # Compute confidence interval for slope (95%)
-            conf_interval = 1.96 * std_err
+            conf_interval = 1.96 * results['stderr'][j]
 
             # Check if trend is significant
-            min_abs_rho = self.settings.get('correlation_min_abs', 0.3)
-
             if abs(spearman_r) >= min_abs_rho or spearman_p < 0.05:
-                insight_counter += 1
-
                 direction = "increasing" if spearman_r > 0 else "decreasing"
                 strength = "strong" if abs(spearman_r) > 0.7 else ("moderate" if abs(spearman_r) > 0.5 else "weak")
 
                 missingness = profile['missingness'][measure_col]['fraction']
 
+                caveats = [
+                    'Correlation does not imply causation.',
+                    'Trend may not be linear; consider visual inspection.',
+                ]
+                statistics = {
+                    'spearman_r': float(spearman_r),
+                    'spearman_p': float(spearman_p),
+                    'slope': float(slope),
+                    'slope_ci_lower': float(slope - conf_interval),
+                    'slope_ci_upper': float(slope + conf_interval),
+                    'slope_unit': 'per day',
+                    'r_squared': float(r_value ** 2),
+                    'n_periods': n_periods,
+                    'completeness': float(n_periods / len(df)),
+                }
+
+                if resampled:
+                    statistics['completeness'] = float(n_periods / resampled['periods'])
+                    statistics['resampled'] = resampled
+                    caveats.append(f"Values were averaged per {resampled['every']} period before testing.")
+
                 insights.append(Insight(
-                    id=f"T{insight_counter:03d}",
+                    id='',
                     title=f"{measure_col} shows {strength} {direction} trend over time",
                     rationale=f"Spearman correlation of {spearman_r:.3f} (p={spearman_p:.4f}) indicates a {strength} {direction} trend.",
                     primary_columns=[time_col, measure_col],
-                    statistics={
-                        'spearman_r': float(spearman_r),
-                        'spearman_p': float(spearman_p),
-                        'slope': float(slope),
-                        'slope_ci_lower': float(slope - conf_interval),
-                        'slope_ci_upper': float(slope + conf_interval),
-                        'r_squared': float(r_value ** 2),
-                        'n_periods': len(ts_data),
-                        'completeness': float(len(ts_data) / len(df)),
-                    },
+                    statistics=statistics,
                     quality_score=self.compute_quality_score(
-                        len(ts_data),
+                        n_periods,
                         abs(spearman_r),
                         missingness
                     ),
                     suggested_visuals=['line', 'area', 'scatter_with_trend'],
-                    caveats=[
-                        'Correlation does not imply causation.',
-                        'Trend may not be linear; consider visual inspection.',
-                    ],
+                    caveats=caveats,
                     detector_type='trend',
                 ))
 
         return insights
+
+
+class PanelTrendDetector(BaseDetector):
+    """
+    Detects per-segment trends in panel data (many series, one per segment).
+
+    TrendDetector pools all rows, which blends segments that move in
+    different directions. Here every segment column (e.g. store or site)
+    gets one grouped Polars pass that computes each segment's Spearman
+    correlation and OLS slope against time for every measure, so 10k
+    segments cost one group_by rather than 10k Python-level fits.
+    """
+
+    name = 'panel_trend'
+    id_prefix = 'N'
+
+    # Column holding the shared time axis (days since the first observation)
+    TIME_AXIS = '__days__'
+
+    def plan(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any]) -> List[tuple]:
+        """
+        List segment columns with the measures to trend within each segment.
+
+        Segment columns are categorical columns whose segments average at
+        least trend_min_periods rows.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+
+        Returns:
+            List of (time_col, segment_col, measure columns) items
+        """
+        time_index_info = profile.get('time_index')
+        if not time_index_info:
+            return []
+
+        time_col = time_index_info['column']
+        min_segments = self.settings.get('panel_trend_min_segments', 3)
+        max_segments = self.settings.get('panel_trend_max_segments', 100_000)
+        min_periods = self.settings.get('trend_min_periods', 12)
+
+        segment_cols = [
+            col['normalized_name']
+            for col in schema['columns']
+            if col['type'] in ['categorical', 'string']
+            and min_segments <= col['unique_count'] <= max_segments
+            and len(df) / col['unique_count'] >= min_periods
+        ]
+
+        numeric_cols = tuple(
+            col['normalized_name']
+            for col in schema['columns']
+            if col['type'] in ['int', 'float'] and col['normalized_name'] != time_col
+        )
+
+        if not numeric_cols:
+            return []
+
+        return [(time_col, segment_col, numeric_cols) for segment_col in segment_cols]
+
+    def estimate(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Tuple[float, float]:
+        """
+        Expected value and cost of one segment column.
+
+        The value assumes prior_effect over all rows; the cost is one rank
+        sort per measure within segments.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, segment_col, measure columns) from plan()
+
+        Returns:
+            Tuple of (expected quality score, estimated cost)
+        """
+        _, segment_col, measures = item
+        n = len(df)
+        segments = next(
+            (col['unique_count'] for col in schema['columns'] if col['normalized_name'] == segment_col), 1
+        )
+
+        value = self.compute_quality_score(n, self.prior_effect, 0.0)
+        cost = n * len(measures) * np.log2(max(n / max(segments, 1), 2))
+
+        return value, float(max(cost, 1))
+
+    def item_columns(self, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[str]:
+        """Time, segment and measure columns"""
+        time_col, segment_col, measures = item
+        return [time_col, segment_col] + list(measures)
+
+    def detect_item(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> List[Insight]:
+        """
+        Detect panel trend insights for one segment column.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, segment_col, measure columns) from plan()
+
+        Returns:
+            List of detected Insight objects, in measure order
+        """
+        return self.select(df, schema, profile, item, self.candidates(df, schema, profile, item))
+
+    def candidates(self, df: pl.DataFrame, schema: Dict[str, Any], profile: Dict[str, Any], item: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Per-segment trend statistics of every measure, in one grouped pass.
+
+        Each measure uses only the rows where it is present, via filters
+        inside the aggregations.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, segment_col, measure columns) from plan()
+
+        Returns:
+            Dict with 'segments' (segment values) and, per measure, a dict of
+            per-segment arrays (n, spearman_r, spearman_p, slope, stderr)
+            plus pooled statistics (spearman_r, n, slope); None without timed rows
+        """
+        time_col, segment_col, measures = item
+
+        epoch = pl.col(time_col).dt.epoch('us')
+        frame = df.select(
+            pl.col(segment_col),
+            ((epoch - epoch.min()) / 86_400_000_000).alias(self.TIME_AXIS),
+            *[pl.col(m).cast(pl.Float64).fill_nan(None) for m in measures],
+        ).filter(pl.col(self.TIME_AXIS).is_not_null() & pl.col(segment_col).is_not_null())
+
+        if len(frame) == 0:
+            return None
+
+        t = pl.col(self.TIME_AXIS)
+        aggs = []
+        for j, m in enumerate(measures):
+            present = pl.col(m).is_not_null()
+            tm, ym = t.filter(present), pl.col(m).filter(present)
+            aggs += [
+                present.sum().alias(f"n{j}"),
+                pl.corr(tm, ym, method='spearman').alias(f"rho{j}"),
+                pl.corr(tm, ym).alias(f"r{j}"),
+                pl.cov(tm, ym).alias(f"cov{j}"),
+                tm.var().alias(f"vt{j}"),
+                ym.var().alias(f"vy{j}"),
+            ]
+
+        grouped = frame.group_by(segment_col).agg(aggs).sort(segment_col)
+        pooled = frame.select(aggs).row(0, named=True)
+
+        results = {'segments': grouped[segment_col].to_list()}
+        for j, m in enumerate(measures):
+            n = grouped[f"n{j}"].to_numpy().astype(np.float64)
+            rho = grouped[f"rho{j}"].fill_null(np.nan).to_numpy()
+            r = grouped[f"r{j}"].fill_null(np.nan).to_numpy()
+            vt = grouped[f"vt{j}"].fill_null(np.nan).to_numpy()
+            vy = grouped[f"vy{j}"].fill_null(np.nan).to_numpy()
+
+            with np.errstate(invalid='ignore', divide='ignore'):
+                slope = grouped[f"cov{j}"].fill_null(np.nan).to_numpy() / vt
+                stderr = np.sqrt((1 - r ** 2) * vy / vt / (n - 2))
+
+            results[m] = {
+                'n': n,
+                'spearman_r': rho,
+                'spearman_p': _correlation_pvalue(rho, n),
+                'slope': slope,
+                'stderr': stderr,
+                'pooled_spearman_r': pooled[f"rho{j}"],
+                'pooled_n': pooled[f"n{j}"],
+                'pooled_slope': pooled[f"cov{j}"] / pooled[f"vt{j}"] if pooled[f"vt{j}"] else None,
+            }
+
+        return results
+
+    def select(
+        self,
+        df: pl.DataFrame,
+        schema: Dict[str, Any],
+        profile: Dict[str, Any],
+        item: tuple,
+        results: Optional[Dict[str, Any]],
+    ) -> List[Insight]:
+        """
+        Report measures whose segment trends diverge from the pooled trend.
+
+        A segment trend counts when its Benjamini-Hochberg adjusted p-value
+        is below 0.05 and |rho| reaches correlation_min_abs. Segments that
+        merely share the pooled trend are left to TrendDetector; a measure
+        is reported only when significant segments trend against a
+        significant pooled trend, when there is no pooled trend, or when
+        Cochran's Q rejects equal slopes with I² of at least
+        panel_trend_min_heterogeneity. A segment is divergent when its rho
+        differs from the median segment rho (0 without a pooled trend) by
+        at least correlation_min_abs, adjusted p < 0.05 on Fisher's z.
+
+        Args:
+            df: Input DataFrame
+            schema: Schema dict from ingest
+            profile: Profile dict from profiling
+            item: (time_col, segment_col, measure columns) from plan()
+            results: Statistics from candidates()
+
+        Returns:
+            List of detected Insight objects, in measure order
+        """
+        insights = []
+
+        if results is None:
+            return insights
+
+        time_col, segment_col, measures = item
+        min_periods = self.settings.get('trend_min_periods', 12)
+        min_segments = self.settings.get('panel_trend_min_segments', 3)
+        min_abs_rho = self.settings.get('correlation_min_abs', 0.3)
+        min_i2 = self.settings.get('panel_trend_min_heterogeneity', 0.25)
+        top_k = self.settings.get('panel_trend_top_k', 5)
+        segments = results['segments']
+
+        for measure_col in measures:
+            res = results[measure_col]
+            tested = (res['n'] >= min_periods) & np.isfinite(res['spearman_r']) & np.isfinite(res['slope'])
+            idx = np.flatnonzero(tested)
+
+            if len(idx) < min_segments:
+                continue
+
+            rho = res['spearman_r'][idx]
+            slope = res['slope'][idx]
+            stderr = res['stderr'][idx]
+            n = res['n'][idx]
+            p_adjusted = stats.false_discovery_control(res['spearman_p'][idx])
+
+            significant = (p_adjusted < 0.05) & (np.abs(rho) >= min_abs_rho)
+            if not significant.any():
+                continue
+
+            n_up = int((significant & (rho > 0)).sum())
+            n_down = int((significant & (rho < 0)).sum())
+
+            pooled_rho = res['pooled_spearman_r']
+            pooled_p = None
+            if pooled_rho is not None and np.isfinite(pooled_rho):
+                pooled_p = float(_correlation_pvalue(np.array([pooled_rho]), np.array([float(res['pooled_n'])]))[0])
+            pooled_trend = pooled_p is not None and pooled_p < 0.05 and abs(pooled_rho) >= min_abs_rho
+
+            # Direction and rho that segments are compared against
+            typical = float(np.sign(pooled_rho)) if pooled_trend else (1.0 if n_up >= n_down else -1.0)
+            reference = float(np.median(rho)) if pooled_trend else 0.0
+            against = significant & (np.sign(rho) == -typical)
+
+            # Cochran's Q: do slopes differ by more than their standard errors allow?
+            usable = np.isfinite(stderr) & (stderr > 0)
+            q, q_p, i2 = None, None, 0.0
+            if usable.sum() >= 2:
+                weights = 1 / stderr[usable] ** 2
+                mean_slope = (weights * slope[usable]).sum() / weights.sum()
+                q = float((weights * (slope[usable] - mean_slope) ** 2).sum())
+                q_p = float(stats.chi2.sf(q, usable.sum() - 1))
+                i2 = max(0.0, 1 - (usable.sum() - 1) / q) if q > 0 else 0.0
+            heterogeneous = q_p is not None and q_p < 0.05 and i2 >= min_i2
+
+            if pooled_trend and not against.any() and not heterogeneous:
+                continue
+
+            # Segments whose rho differs from the reference (Fisher z, Spearman variance 1.06 / (n - 3))
+            difference = rho - reference
+            with np.errstate(invalid='ignore', divide='ignore'):
+                z = (np.arctanh(np.clip(rho, -0.9999, 0.9999)) - np.arctanh(reference)) * np.sqrt((n - 3) / 1.06)
+            difference_p = stats.false_discovery_control(np.nan_to_num(2 * stats.norm.sf(np.abs(z)), nan=1.0))
+            divergent = (difference_p < 0.05) & (np.abs(difference) >= min_abs_rho)
+
+            def describe(mask: np.ndarray, order: np.ndarray) -> List[Dict[str, Any]]:
+                return [
+                    {
+                        'segment': segments[idx[k]],
+                        'spearman_r': float(rho[k]),
+                        'p_value_adjusted': float(p_adjusted[k]),
+                        'difference_from_typical': float(difference[k]),
+                        'slope': float(slope[k]),
+                        'n_periods': int(n[k]),
+                    }
+                    for k in order if mask[k]
+                ][:top_k]
+
+            by_difference = np.argsort(-np.abs(difference), kind='stable')
+            strongest = describe(significant, np.argsort(-np.abs(rho), kind='stable'))
+            most_divergent = describe(divergent | against, by_difference)
+            divergence = float(np.abs(difference[significant | divergent]).max())
+            share = float(significant.sum() / len(idx))
+
+            if pooled_trend and against.any():
+                reason = 'against_pooled'
+            elif not pooled_trend:
+                reason = 'no_pooled_trend'
+            else:
+                reason = 'heterogeneous'
+
+            named = ", ".join(str(s['segment']) for s in (most_divergent or describe(tested[idx], by_difference))[:3])
+            word = "rising" if typical > 0 else "falling"
+            if reason == 'against_pooled':
+                title = (
+                    f"{measure_col} is {'falling' if typical > 0 else 'rising'} in {segment_col} {named} "
+                    f"against an overall {word} trend"
+                )
+            elif reason == 'no_pooled_trend' and n_up and n_down:
+                title = f"{measure_col} trends offset across {segment_col}: {n_up} rising, {n_down} falling, none overall"
+            elif reason == 'no_pooled_trend':
+                title = f"{measure_col} is {word} in {segment_col} {named} without an overall trend"
+            else:
+                title = f"{measure_col} is {word} at different rates across {segment_col}, most unlike the rest in {named}"
+
+            rationale = (
+                f"{n_up + n_down} of {len(idx)} {segment_col} segments have a significant trend "
+                f"(FDR 5%, |rho| ≥ {min_abs_rho}); the strongest is {strongest[0]['segment']} "
+                f"(rho={strongest[0]['spearman_r']:.3f})."
+            )
+            if most_divergent:
+                rationale += (
+                    f" Most divergent: {most_divergent[0]['segment']} "
+                    f"(rho={most_divergent[0]['spearman_r']:.3f} vs {reference:.3f} for the typical segment)."
+                )
+            if pooled_rho is not None:
+                rationale += f" Pooled over all segments, rho={pooled_rho:.3f}."
+            if q is not None:
+                rationale += f" Cochran's Q p={q_p:.3g}, I²={i2:.2f}."
+
+            caveats = [
+                'Correlation does not imply causation.',
+                f"Segments with fewer than {min_periods} values are not tested.",
+            ]
+            if not pooled_trend:
+                caveats.append('The pooled trend is weak; segment trends offset or dilute each other.')
+
+            insights.append(Insight(
+                id='',
+                title=title,
+                rationale=rationale,
+                primary_columns=[time_col, measure_col, segment_col],
+                statistics={
+                    'segment_col': segment_col,
+                    'reason': reason,
+                    'n_segments': len(idx),
+                    'n_segments_skipped': len(segments) - len(idx),
+                    'n_increasing': n_up,
+                    'n_decreasing': n_down,
+                    'n_against_pooled': int(against.sum()),
+                    'n_divergent': int(divergent.sum()),
+                    'share_significant': share,
+                    'typical_direction': 'increasing' if typical > 0 else 'decreasing',
+                    'median_spearman_r': float(np.median(rho)),
+                    'median_slope': float(np.median(slope)),
+                    'pooled_spearman_r': float(pooled_rho) if pooled_rho is not None else None,
+                    'pooled_p_value': pooled_p,
+                    'pooled_slope': float(res['pooled_slope']) if res['pooled_slope'] is not None else None,
+                    'heterogeneity_q': q,
+                    'heterogeneity_p': q_p,
+                    'heterogeneity_i2': i2,
+                    'divergence': divergence,
+                    'strongest_segments': strongest,
+                    'divergent_segments': most_divergent,
+                    'slope_unit': 'per day',
+                },
+                quality_score=self.compute_quality_score(
+                    int(n.sum()),
+                    max(divergence, i2 * abs(strongest[0]['spearman_r'])),
+                    profile['missingness'][measure_col]['fraction'],
+                ),
+                suggested_visuals=['small_multiples_line', 'segment_slope_dot'],
+                caveats=caveats,
+                detector_type='panel_trend',
+            ))
+
+        return insights
@@ -37,6 +37,29 @@ def format_number(value: float, decimals: int = 1, expertise: ExpertiseLevel = E
         return f"{value:.{decimals + 2}f}"
 
 
+def format_interval(stats: Dict[str, Any], name: str, decimals: int, expertise: ExpertiseLevel) -> str:
+    """
+    Format the bootstrap confidence interval of a statistic, if present.
+
+    Args:
+        stats: Insight statistics
+        name: Statistic with '<name>_ci_lower' and '<name>_ci_upper' entries
+        decimals: Number of decimal places
+        expertise: Audience expertise level
+
+    Returns:
+        Text such as " (95% CI [0.41, 0.56])", or an empty string
+    """
+    bootstrap = stats.get('bootstrap')
+    if not bootstrap or f"{name}_ci_lower" not in stats:
+        return ""
+
+    return (
+        f" ({bootstrap['confidence']:.0%} CI [{format_number(stats[f'{name}_ci_lower'], decimals, expertise)}, "
+        f"{format_number(stats[f'{name}_ci_upper'], decimals, expertise)}])"
+    )
+
+
 def render_distribution_narrative(
     insight: Dict[str, Any],
     settings: Dict[str, Any],
@@ -158,7 +181,8 @@ def render_trend_narrative(
     else:  # TECHNICAL
         text = f"Time series analysis of {measure_col} (n={stats['n_periods']} periods, "
         text += f"completeness={format_number(stats['completeness'], 3, expertise)}): "
-        text += f"Spearman ρ={format_number(stats['spearman_r'], 4, expertise)} "
+        text += f"Spearman ρ={format_number(stats['spearman_r'], 4, expertise)}"
+        text += f"{format_interval(stats, 'spearman_r', 4, expertise)} "
         text += f"(p={format_number(stats['spearman_p'], 6, expertise)}). "
         text += f"OLS regression: slope={format_number(stats['slope'], 4, expertise)}, "
         text += f"R²={format_number(stats['r_squared'], 4, expertise)}, "
@@ -168,6 +192,231 @@ def render_trend_narrative(
     return text
 
 
+def render_panel_trend_narrative(
+    insight: Dict[str, Any],
+    settings: Dict[str, Any],
+    profile: Dict[str, Any]
+) -> str:
+    """
+    Generate narrative for panel (per-segment) trend insight.
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+        profile: Profile dict
+
+    Returns:
+        Narrative text
+    """
+    expertise = ExpertiseLevel(settings.get('expertise', 'executive'))
+    time_col, measure_col, segment_col = insight['primary_columns']
+    stats = insight['statistics']
+    top = stats['strongest_segments'][0]
+    divergent = stats['divergent_segments']
+
+    if expertise == ExpertiseLevel.EXECUTIVE:
+        text = f"Across {stats['n_segments']} {segment_col} segments, {measure_col} is clearly rising in "
+        text += f"{stats['n_increasing']} and falling in {stats['n_decreasing']}. "
+        if divergent:
+            names = ", ".join(str(s['segment']) for s in divergent[:3])
+            text += f"Segments that stand apart from the rest include {names}."
+        else:
+            text += f"The clearest case is {top['segment']}."
+
+    elif expertise == ExpertiseLevel.PRACTITIONER:
+        text = f"{stats['n_increasing'] + stats['n_decreasing']} of {stats['n_segments']} {segment_col} segments "
+        text += f"({format_number(100 * stats['share_significant'], 1, expertise)}%) have a significant {measure_col} trend. "
+        text += "Strongest: " + "; ".join(
+            f"{s['segment']} (ρ={format_number(s['spearman_r'], 2, expertise)}, "
+            f"slope={format_number(s['slope'], 3, expertise)}/day)"
+            for s in stats['strongest_segments']
+        ) + ". "
+        if divergent:
+            text += "Most divergent: " + "; ".join(
+                f"{s['segment']} (ρ={format_number(s['spearman_r'], 2, expertise)} vs "
+                f"{format_number(s['spearman_r'] - s['difference_from_typical'], 2, expertise)} typical)"
+                for s in divergent[:3]
+            ) + ". "
+        if stats['pooled_spearman_r'] is not None:
+            text += f"Pooled over all segments, ρ={format_number(stats['pooled_spearman_r'], 2, expertise)}; "
+            text += "compare segments rather than the total when they disagree."
+
+    else:  # TECHNICAL
+        text = f"Per-segment Spearman ρ and OLS slope of {measure_col} on {time_col} within each of "
+        text += f"{stats['n_segments']} {segment_col} segments ({stats['n_segments_skipped']} skipped for too few values); "
+        text += "Benjamini-Hochberg FDR 5%: "
+        text += f"{stats['n_increasing']} increasing, {stats['n_decreasing']} decreasing, "
+        reference = "majority" if stats['reason'] == 'no_pooled_trend' else "pooled"
+        text += f"{stats['n_against_pooled']} against the {reference} direction, {stats['n_divergent']} with ρ differing from "
+        text += f"the typical segment's by ≥ {settings.get('correlation_min_abs', 0.3)} (Fisher z, FDR 5%). "
+        text += f"Median ρ={format_number(stats['median_spearman_r'], 4, expertise)}, "
+        text += f"median slope={format_number(stats['median_slope'], 4, expertise)}/day. "
+        if stats['heterogeneity_q'] is not None:
+            text += f"Cochran's Q={format_number(stats['heterogeneity_q'], 4, expertise)} "
+            text += f"(p={format_number(stats['heterogeneity_p'], 6, expertise)}, "
+            text += f"I²={format_number(stats['heterogeneity_i2'], 4, expertise)}) for equal slopes across segments."
+
+    return text
+
+
+def render_seasonality_narrative(
+    insight: Dict[str, Any],
+    settings: Dict[str, Any],
+    profile: Dict[str, Any]
+) -> str:
+    """
+    Generate narrative for seasonality insight.
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+        profile: Profile dict
+
+    Returns:
+        Narrative text
+    """
+    expertise = ExpertiseLevel(settings.get('expertise', 'executive'))
+    measure_col = insight['primary_columns'][1]
+    stats = insight['statistics']
+    dominant = stats['cycles'][0]
+    cycle = f"{stats['calendar_cycle']} " if stats['calendar_cycle'] else ""
+
+    if expertise == ExpertiseLevel.EXECUTIVE:
+        if stats['calendar_cycle']:
+            text = f"{measure_col} follows a repeating {stats['calendar_cycle']} pattern. "
+        else:
+            text = f"{measure_col} follows a pattern that repeats every {stats['dominant_period']}. "
+        text += f"It tends to peak around {dominant['peak_at']} and repeat from there; "
+        text += f"the cycle accounts for about {format_number(stats['seasonal_strength'] * 100, 0, expertise)}% of its variation."
+
+    elif expertise == ExpertiseLevel.PRACTITIONER:
+        text = f"{measure_col} has a {stats['strength_label']} {cycle}cycle of {stats['dominant_period']} "
+        text += f"(seasonal strength {format_number(stats['seasonal_strength'], 3, expertise)}, "
+        text += f"p={format_number(stats['p_value'], 4, expertise)}), peaking around {dominant['peak_at']} "
+        text += f"and lowest around {dominant['trough_at']}; "
+        text += f"peak-to-trough amplitude {format_number(dominant['amplitude'], 2, expertise)}. "
+        if len(stats['cycles']) > 1:
+            text += f"A secondary cycle of {stats['cycles'][1]['period']} is also present. "
+        text += "Compare like periods of the cycle (or remove it) before reading trends."
+
+    else:  # TECHNICAL
+        text = f"Periodogram of linearly detrended {measure_col} ({stats['n_periods']} periods of {stats['every']}, "
+        text += f"completeness={format_number(stats['completeness'], 3, expertise)}), whitened by an AR(1) background: "
+        for c in stats['cycles']:
+            text += f"period {c['period']} (g={format_number(c['power_share'], 4, expertise)}, "
+            text += f"Fisher p={format_number(c['p_value'], 6, expertise)}, "
+            text += f"adjusted R² of the mean cycle={format_number(c['strength'], 4, expertise)}). "
+        text += "Harmonics of a reported cycle are not listed separately."
+
+    return text
+
+
+def render_changepoint_narrative(
+    insight: Dict[str, Any],
+    settings: Dict[str, Any],
+    profile: Dict[str, Any]
+) -> str:
+    """
+    Generate narrative for changepoint (level shift) insight.
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+        profile: Profile dict
+
+    Returns:
+        Narrative text
+    """
+    expertise = ExpertiseLevel(settings.get('expertise', 'executive'))
+    measure_col = insight['primary_columns'][1]
+    stats = insight['statistics']
+    largest = stats['largest_change']
+
+    if expertise == ExpertiseLevel.EXECUTIVE:
+        direction = "rose" if largest['change'] > 0 else "fell"
+        text = f"{measure_col} {direction} around {largest['time']}, "
+        text += f"from about {format_number(largest['before_mean'], 1, expertise)} "
+        text += f"to {format_number(largest['after_mean'], 1, expertise)}. "
+        if stats['n_changepoints'] > 1:
+            text += f"In total, its level shifted {stats['n_changepoints']} times."
+
+    elif expertise == ExpertiseLevel.PRACTITIONER:
+        text = f"{measure_col} shows {stats['n_changepoints']} level shift(s): "
+        text += "; ".join(
+            f"{cp['time']} ({format_number(cp['before_mean'], 2, expertise)} → "
+            f"{format_number(cp['after_mean'], 2, expertise)}, d={format_number(cp['cohens_d'], 2, expertise)})"
+            for cp in stats['changepoints']
+        )
+        text += ". Check whether these dates match process, pricing or data collection changes."
+
+    else:  # TECHNICAL
+        resampled = stats['resampled']
+        text = f"Binary segmentation of {measure_col} (change in mean, squared-error cost) over "
+        text += f"{stats['n_periods']} periods of {resampled['every']}: "
+        text += f"penalty={format_number(stats['penalty'], 4, expertise)} "
+        text += f"(noise σ={format_number(stats['noise_std'], 4, expertise)} around the segment means, "
+        text += f"lag-1 autocorrelation {format_number(stats['autocorrelation'], 2, expertise)}). "
+        for cp in stats['changepoints']:
+            text += f"{cp['time']}: μ {format_number(cp['before_mean'], 4, expertise)} → "
+            text += f"{format_number(cp['after_mean'], 4, expertise)} "
+            text += f"(n={cp['before_periods']}/{cp['after_periods']}, d={format_number(cp['cohens_d'], 4, expertise)}, "
+            text += f"Welch p={format_number(cp['p_value'], 6, expertise)}). "
+        text += "p-values are conditional on the estimated locations."
+
+    return text
+
+
+def render_anomaly_narrative(
+    insight: Dict[str, Any],
+    settings: Dict[str, Any],
+    profile: Dict[str, Any]
+) -> str:
+    """
+    Generate narrative for anomaly (unusual period) insight.
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+        profile: Profile dict
+
+    Returns:
+        Narrative text
+    """
+    expertise = ExpertiseLevel(settings.get('expertise', 'executive'))
+    measure_col = insight['primary_columns'][1]
+    stats = insight['statistics']
+    when = stats['start'] if stats['n_periods'] == 1 else f"from {stats['start']} to {stats['end']}"
+
+    if expertise == ExpertiseLevel.EXECUTIVE:
+        word = "higher" if stats['direction'] == 'high' else "lower"
+        text = f"{measure_col} was much {word} than usual {'at ' if stats['n_periods'] == 1 else ''}{when}: "
+        text += f"{format_number(stats['peak_value'], 1, expertise)} "
+        text += f"where about {format_number(stats['expected'], 1, expertise)} was expected."
+        if stats['ongoing']:
+            text += " This is still happening in the latest data."
+
+    elif expertise == ExpertiseLevel.PRACTITIONER:
+        text = f"{measure_col} left its normal range ({format_number(stats['band_lower'], 2, expertise)} to "
+        text += f"{format_number(stats['band_upper'], 2, expertise)}) for {stats['n_periods']} period(s) {when}, "
+        text += f"peaking at {format_number(stats['peak_value'], 2, expertise)} on {stats['peak_at']}. "
+        text += "Check for data errors, outages or one-off events before acting on it."
+
+    else:  # TECHNICAL
+        text = f"Rolling median/MAD scoring of {measure_col} per {stats['every']} period over a trailing "
+        text += f"window of {stats['window_periods']} periods"
+        if stats.get('power_lambda', 1.0) != 1.0:
+            text += f", after a Yeo-Johnson transform (λ={format_number(stats['power_lambda'], 4, expertise)})"
+        text += ": peak robust z="
+        text += f"{format_number(stats['peak_z'], 4, expertise)} at {stats['peak_at']} "
+        text += f"(value {format_number(stats['peak_value'], 4, expertise)}, median "
+        text += f"{format_number(stats['expected'], 4, expertise)}), {stats['n_periods']} period(s) "
+        text += f"beyond |z|>{stats['threshold']}. Reported above |z|={format_number(stats['critical_z'], 4, expertise)}, "
+        text += f"the Bonferroni cut over {stats['periods_seen']} periods "
+        text += f"(adjusted p={format_number(stats['p_value_adjusted'], 6, expertise)})."
+
+    return text
+
+
 def render_group_narrative(
     insight: Dict[str, Any],
     settings: Dict[str, Any],
@@ -220,7 +469,8 @@ def render_group_narrative(
             text = f"Two-sample comparison of {measure_col} by {group_col}: "
             text += f"Welch's t-test t={format_number(stats['t_statistic'], 4, expertise)}, "
             text += f"p={format_number(stats['p_value'], 6, expertise)}; "
-            text += f"Cohen's d={format_number(stats['cohens_d'], 4, expertise)} ({effect_label} effect). "
+            text += f"Cohen's d={format_number(stats['cohens_d'], 4, expertise)}"
+            text += f"{format_interval(stats, 'cohens_d', 4, expertise)} ({effect_label} effect). "
 
             for group, gstats in stats['groups'].items():
                 text += f"{group}: μ={format_number(gstats['mean'], 4, expertise)}, "
@@ -228,7 +478,10 @@ def render_group_narrative(
                 text += f"median={format_number(gstats['median'], 4, expertise)}, "
                 text += f"n={gstats['n']}. "
 
-            text += "Assumptions: approximately normal distributions, unequal variances allowed."
+            if stats.get('p_value_method') == 'permutation':
+                text += f"p-value from {stats['permutations']} label permutations (small groups). "
+            else:
+                text += "Assumptions: approximately normal distributions, unequal variances allowed."
 
     else:
         # Multi-group comparison
@@ -250,9 +503,11 @@ def render_group_narrative(
             text = f"Multi-group comparison of {measure_col} across {stats['n_groups']} {group_col} levels: "
             text += f"Kruskal-Wallis H={format_number(stats['h_statistic'], 4, expertise)} "
             text += f"(p={format_number(stats['p_value'], 6, expertise)}), "
-            text += f"η²={format_number(effect, 4, expertise)}. "
+            text += f"η²={format_number(effect, 4, expertise)}{format_interval(stats, 'eta_squared', 4, expertise)}. "
             text += f"Total n={stats['n_total']}. "
             text += "Non-parametric test used; suitable for non-normal data or ordinal scales."
+            if stats.get('p_value_method') == 'permutation':
+                text += f" p-value from {stats['permutations']} label permutations (small groups)."
 
     return text
 
@@ -299,11 +554,14 @@ def render_relationship_narrative(
 
         else:  # TECHNICAL
             text = f"Correlation analysis ({col1}, {col2}): "
-            text += f"Pearson r={format_number(r, 4, expertise)} "
+            text += f"Pearson r={format_number(r, 4, expertise)}{format_interval(stats, 'pearson_r', 4, expertise)} "
             text += f"(p={format_number(stats['pearson_p'], 6, expertise)}), "
-            text += f"Spearman ρ={format_number(stats['spearman_r'], 4, expertise)}, "
+            text += f"Spearman ρ={format_number(stats['spearman_r'], 4, expertise)}{format_interval(stats, 'spearman_r', 4, expertise)}, "
             text += f"R²={format_number(stats['r_squared'], 4, expertise)}, "
             text += f"n={stats['n']}. "
+            if stats.get('p_value_method') == 'permutation':
+                text += f"Permutation p={format_number(stats['permutation_p'], 6, expertise)} "
+                text += f"({stats['permutations']} permutations). "
             if stats.get('theil_sen_slope'):
                 text += f"Theil-Sen slope={format_number(stats['theil_sen_slope'], 4, expertise)}, "
                 text += f"intercept={format_number(stats.get('theil_sen_intercept', 0), 4, expertise)}. "
@@ -328,7 +586,7 @@ def render_relationship_narrative(
             text = f"Chi-square test of independence ({col1} × {col2}): "
             text += f"χ²={format_number(stats['chi2'], 4, expertise)}, "
             text += f"p={format_number(stats['p_value'], 6, expertise)}, "
-            text += f"Cramér's V={format_number(v, 4, expertise)}, "
+            text += f"Cramér's V={format_number(v, 4, expertise)}{format_interval(stats, 'cramers_v', 4, expertise)}, "
             text += f"n={stats['n']}. "
             text += "Assumption: sufficient expected counts in contingency table cells."
 
@@ -338,6 +596,180 @@ def render_relationship_narrative(
     return text
 
 
+def render_subgroup_narrative(
+    insight: Dict[str, Any],
+    settings: Dict[str, Any],
+    profile: Dict[str, Any]
+) -> str:
+    """
+    Generate narrative for subgroup (segment) insight.
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+        profile: Profile dict
+
+    Returns:
+        Narrative text
+    """
+    expertise = ExpertiseLevel(settings.get('expertise', 'executive'))
+    measure_col = insight['primary_columns'][0]
+    stats = insight['statistics']
+    segment = ' and '.join(f"{c['column']} is {c['value']}" for c in stats['conditions'])
+    direction = "higher" if stats['cohens_d'] > 0 else "lower"
+
+    if expertise == ExpertiseLevel.EXECUTIVE:
+        text = f"When {segment}, {measure_col} is {direction} than elsewhere: "
+        text += f"it averages {format_number(stats['mean'], 1, expertise)} "
+        text += f"compared to {format_number(stats['rest_mean'], 1, expertise)}. "
+        text += f"This segment covers {format_number(stats['share'] * 100, 0, expertise)}% of rows."
+
+    elif expertise == ExpertiseLevel.PRACTITIONER:
+        text = f"The segment where {segment} (n={stats['n']}) has {direction} {measure_col} "
+        text += f"(M={format_number(stats['mean'], 2, expertise)}, SD={format_number(stats['std'], 2, expertise)}) "
+        text += f"than the remaining rows (M={format_number(stats['rest_mean'], 2, expertise)}, "
+        text += f"SD={format_number(stats['rest_std'], 2, expertise)}); "
+        text += f"Cohen's d={format_number(stats['cohens_d'], 3, expertise)}, "
+        text += f"adjusted p={format_number(stats['p_value_adjusted'], 4, expertise)}. "
+        text += "The combination stands out more than any of its conditions alone."
+
+    else:  # TECHNICAL
+        search = stats['search']
+        text = f"Subgroup discovery on {measure_col} (beam search, depth {stats['depth']}): "
+        text += f"segment {insight.get('query') or segment} with n={stats['n']} "
+        text += f"({format_number(stats['share'] * 100, 2, expertise)}% of rows), "
+        text += f"μ={format_number(stats['mean'], 4, expertise)} vs μ={format_number(stats['rest_mean'], 4, expertise)} "
+        text += f"(n={stats['rest_n']}); Welch's t={format_number(stats['t_statistic'], 4, expertise)}, "
+        text += f"p={format_number(stats['p_value'], 6, expertise)} "
+        text += f"(Bonferroni-adjusted p={format_number(stats['p_value_adjusted'], 6, expertise)}), "
+        text += f"Cohen's d={format_number(stats['cohens_d'], 4, expertise)}. "
+        text += f"Quality √(n/N)·Δμ/σ={format_number(stats['subgroup_quality'], 4, expertise)} "
+        text += f"vs {format_number(stats['best_generalization_quality'], 4, expertise)} for the best generalization. "
+        text += f"{search['evaluated']} subgroups evaluated"
+        text += "." if search['complete'] else " before the time budget ran out (search incomplete)."
+
+    return text
+
+
+def render_driver_narrative(
+    insight: Dict[str, Any],
+    settings: Dict[str, Any],
+    profile: Dict[str, Any]
+) -> str:
+    """
+    Generate narrative for driver analysis insight.
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+        profile: Profile dict
+
+    Returns:
+        Narrative text
+    """
+    expertise = ExpertiseLevel(settings.get('expertise', 'executive'))
+    stats = insight['statistics']
+    target = stats['target']
+    drivers = stats['drivers']
+
+    if expertise == ExpertiseLevel.EXECUTIVE:
+        top = drivers[0]
+        text = f"The factors analyzed explain about {format_number(100 * stats['r_squared'], 0, expertise)}% "
+        text += f"of the variation in {target}. {top['column']} matters most, "
+        text += f"accounting for about {format_number(100 * top['share'], 0, expertise)}% of what is explained"
+        if len(drivers) > 1:
+            text += f", followed by {drivers[1]['column']}"
+        text += "."
+
+    elif expertise == ExpertiseLevel.PRACTITIONER:
+        text = f"A multivariate regression explains {format_number(100 * stats['r_squared'], 1, expertise)}% of "
+        text += f"the variance in {target} (n={stats['n']}). Drivers by share of explained variance: "
+        text += "; ".join(
+            f"{d['column']} {format_number(100 * d['share'], 1, expertise)}% "
+            f"(β={format_number(d['beta'], 2, expertise)})"
+            for d in drivers
+        )
+        text += ". Positive β means higher values go with a higher target, holding the other drivers fixed."
+
+    else:  # TECHNICAL
+        text = f"OLS of standardized {target} on {stats['n_predictors']} standardized predictors, solved by Cholesky "
+        text += f"on the pairwise covariance matrix (n={stats['n']}): R²={format_number(stats['r_squared'], 4, expertise)}, "
+        text += f"adjusted R²={format_number(stats['adjusted_r_squared'], 4, expertise)}, "
+        text += f"F={format_number(stats['f_statistic'], 4, expertise)} (p={format_number(stats['f_p_value'], 6, expertise)}). "
+        text += "Johnson's relative weights / β (SE, p, VIF): "
+        text += "; ".join(
+            f"{d['column']} {format_number(d['relative_weight'], 4, expertise)} / "
+            f"{format_number(d['beta'], 4, expertise)} ({format_number(d['se'], 4, expertise)}, "
+            f"{format_number(d['p_value'], 6, expertise)}, {format_number(d['vif'], 2, expertise)})"
+            for d in drivers
+        )
+        text += "."
+
+    return text
+
+
+def render_cluster_narrative(
+    insight: Dict[str, Any],
+    settings: Dict[str, Any],
+    profile: Dict[str, Any]
+) -> str:
+    """
+    Generate narrative for cluster (natural segment) insight.
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+        profile: Profile dict
+
+    Returns:
+        Narrative text
+    """
+    expertise = ExpertiseLevel(settings.get('expertise', 'executive'))
+    stats = insight['statistics']
+
+    def describe(cluster, digits):
+        return ", ".join(
+            f"{d['direction']} {d['column']} ({format_number(d['mean'], digits, expertise)})"
+            for d in cluster['distinguishing']
+        )
+
+    if expertise == ExpertiseLevel.EXECUTIVE:
+        text = f"The records fall into {stats['k']} distinct groups. "
+        text += " ".join(
+            f"Group {c['cluster']} ({format_number(100 * c['share'], 0, expertise)}% of records) has "
+            f"{describe(c, 1)}."
+            for c in stats['clusters'][:3]
+        )
+
+    elif expertise == ExpertiseLevel.PRACTITIONER:
+        text = f"k-means finds {stats['k']} segments (silhouette={format_number(stats['silhouette'], 2, expertise)}) "
+        text += f"explaining {format_number(100 * stats['between_share'], 1, expertise)}% of the variance. "
+        text += " ".join(
+            f"Segment {c['cluster']}: {c['size']} rows ({format_number(100 * c['share'], 1, expertise)}%), {describe(c, 2)}."
+            for c in stats['clusters']
+        )
+        text += " Consider whether the segments match known customer, product or process types."
+
+    else:  # TECHNICAL
+        text = f"Mini-batch k-means (k={stats['k']}) on {len(insight['primary_columns'])} z-scored, Yeo-Johnson transformed columns over "
+        text += f"{stats['n_rows']} complete rows ({stats['n_rows_skipped']} skipped). "
+        text += f"k chosen by simplified silhouette gap against a Gaussian reference with the same covariance: "
+        text += "; ".join(
+            f"k={s['k']}: {format_number(s['silhouette'], 3, expertise)} "
+            f"(gap {format_number(s['gap'], 3, expertise)})"
+            for s in stats['k_scores']
+        )
+        text += f". Between-cluster share of variance={format_number(stats['between_share'], 4, expertise)} "
+        text += f"(reference {format_number(stats['reference_between_share'], 4, expertise)}). "
+        text += " ".join(
+            f"C{c['cluster']} (n={c['size']}): "
+            + ", ".join(f"{d['column']} z={format_number(d['z'], 2, expertise)}" for d in c['distinguishing']) + "."
+            for c in stats['clusters']
+        )
+
+    return text
+
+
 def render(insight: Dict[str, Any], settings: Dict[str, Any], profile: Dict[str, Any]) -> str:
     """
     Main narrative rendering function.
@@ -356,10 +788,24 @@ def render(insight: Dict[str, Any], settings: Dict[str, Any], profile: Dict[str,
         return render_distribution_narrative(insight, settings, profile)
     elif detector_type == 'trend':
         return render_trend_narrative(insight, settings, profile)
+    elif detector_type == 'panel_trend':
+        return render_panel_trend_narrative(insight, settings, profile)
+    elif detector_type == 'seasonality':
+        return render_seasonality_narrative(insight, settings, profile)
+    elif detector_type == 'changepoint':
+        return render_changepoint_narrative(insight, settings, profile)
+    elif detector_type == 'anomaly':
+        return render_anomaly_narrative(insight, settings, profile)
     elif detector_type == 'group':
         return render_group_narrative(insight, settings, profile)
     elif detector_type == 'relationship':
         return render_relationship_narrative(insight, settings, profile)
+    elif detector_type == 'driver':
+        return render_driver_narrative(insight, settings, profile)
+    elif detector_type == 'subgroup':
+        return render_subgroup_narrative(insight, settings, profile)
+    elif detector_type == 'cluster':
+        return render_cluster_narrative(insight, settings, profile)
     else:
         return insight.get('rationale', 'No narrative available.')
 
@@ -389,6 +835,26 @@ def generate_limitations_section(profile: Dict[str, Any], settings: Dict[str, An
             "Insights involving these variables should be interpreted with caution."
         )
 
+    # Columns that go missing together
+    patterns = profile.get('missingness_patterns')
+
+    if patterns:
+        for group in patterns['groups'][:3]:
+            share = group['rows_missing_together'] / patterns['rows'] if patterns['rows'] else 0.0
+            limitations.append(
+                f"Columns {', '.join(group['columns'][:5])} are missing together in "
+                f"{group['rows_missing_together']:,} rows ({share:.1%}), which suggests a shared upstream "
+                "source; treat these gaps as one data-collection issue rather than independent ones."
+            )
+
+        incomplete = [p for p in patterns['top_patterns'] if p['columns']]
+        if incomplete and patterns['complete_rows'] < patterns['rows']:
+            top = incomplete[0]
+            limitations.append(
+                f"{patterns['rows'] - patterns['complete_rows']:,} rows have at least one missing value; "
+                f"the most common gap ({', '.join(top['columns'][:5])}) covers {top['fraction']:.1%} of rows."
+            )
+
     # Sampling note
     limitations.append(
         "Statistical tests assume random sampling and independence of observations. "
@@ -0,0 +1,1223 @@
+"""
+Partial Profile Module
+Mergeable per-shard profiles for profiling data split across several nodes.
+
+Each node calls summarize_partial() on its shard and saves the result. A
+coordinator loads the partials, merges them with merge_partials() and turns
+the merged state into the usual profile dict with finalize_profile(). The
+coordinator never needs the raw rows.
+
+What a partial carries:
+- exact row/null counts and null-run boundary state (missingness)
+- exact value counts up to VALUE_COUNT_CAP plus a HyperLogLog sketch (cardinality)
+- central moments and an equi-depth quantile summary (distributions)
+- sortedness, boundary values and diff counts of date columns (time index)
+- pairwise-complete co-moment sums of values and within-shard ranks (correlations)
+- contingency tables of low-cardinality categorical pairs (chi-square)
+
+Counts, moments, contingency tables and Pearson statistics merge exactly.
+Quantiles, MAD, outlier counts and high unique counts are approximate
+once a column exceeds the sketch sizes. Spearman is pooled from
+within-shard ranks, which matches the global value when shards are
+similarly distributed.
+"""
+
+import base64
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional
+import numpy as np
+import polars as pl
+from scipy import stats
+
+from . import artifacts
+from .profile import _pairwise_moments, _covariance_from_moments
+
+
+PARTIAL_VERSION = '1.0'
+
+# Exact value counts are kept up to this many distinct values per column
+VALUE_COUNT_CAP = 1000
+
+# Points kept by the quantile summary of each numeric column
+QUANTILE_SKETCH_SIZE = 2048
+
+# HyperLogLog precision (2**p registers, ~1.6% standard error at p=12)
+HLL_PRECISION = 12
+
+# Same cardinality limit as compute_chi_square
+CHI_SQUARE_MAX_LEVELS = 50
+
+
+def _encode_array(values: np.ndarray) -> Dict[str, Any]:
+    """
+    Encode a NumPy array as a JSON-compatible dict.
+
+    Args:
+        values: Array to encode
+
+    Returns:
+        Dict with dtype, shape and base64 data
+    """
+    values = np.ascontiguousarray(values)
+    return {
+        'dtype': str(values.dtype),
+        'shape': list(values.shape),
+        'data': base64.b64encode(values.tobytes()).decode('ascii'),
+    }
+
+
+def _decode_array(encoded: Dict[str, Any]) -> np.ndarray:
+    """
+    Decode an array written by _encode_array.
+
+    Args:
+        encoded: Encoded array dict
+
+    Returns:
+        NumPy array
+    """
+    data = base64.b64decode(encoded['data'])
+    return np.frombuffer(data, dtype=encoded['dtype']).reshape(encoded['shape']).copy()
+
+
+# ---------------------------------------------------------------------------
+# Missingness: null counts and null runs
+# ---------------------------------------------------------------------------
+
+def _null_runs(is_null: np.ndarray) -> Dict[str, Any]:
+    """
+    Summarize runs of nulls so that runs spanning shard boundaries can be joined.
+
+    Args:
+        is_null: Boolean null mask in row order
+
+    Returns:
+        Dict with length, leading/trailing run lengths and interior run stats
+    """
+    length = len(is_null)
+
+    if length == 0 or is_null.all():
+        return {'length': length, 'all_null': length > 0, 'leading': length, 'trailing': length,
+                'interior_count': 0, 'interior_total': 0, 'interior_max': 0}
+
+    padded = np.concatenate([[False], is_null, [False]]).astype(np.int8)
+    edges = np.diff(padded)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    lengths = ends - starts
+
+    leading = int(lengths[0]) if len(starts) and starts[0] == 0 else 0
+    trailing = int(lengths[-1]) if len(ends) and ends[-1] == length else 0
+    interior = lengths[(starts > 0) & (ends < length)]
+
+    return {
+        'length': length,
+        'all_null': False,
+        'leading': leading,
+        'trailing': trailing,
+        'interior_count': int(len(interior)),
+        'interior_total': int(interior.sum()),
+        'interior_max': int(interior.max()) if len(interior) else 0,
+    }
+
+
+def _merge_null_runs(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Concatenate the null-run summaries of two consecutive shards.
+
+    Args:
+        a: Summary of the earlier shard
+        b: Summary of the later shard
+
+    Returns:
+        Summary of the concatenated rows
+    """
+    length = a['length'] + b['length']
+
+    if a['all_null'] and b['all_null']:
+        return {**a, 'length': length, 'leading': length, 'trailing': length}
+    if a['length'] == 0:
+        return dict(b)
+    if b['length'] == 0:
+        return dict(a)
+    if a['all_null']:
+        return {**b, 'length': length, 'leading': a['length'] + b['leading']}
+    if b['all_null']:
+        return {**a, 'length': length, 'trailing': a['trailing'] + b['length']}
+
+    joined = a['trailing'] + b['leading']
+    return {
+        'length': length,
+        'all_null': False,
+        'leading': a['leading'],
+        'trailing': b['trailing'],
+        'interior_count': a['interior_count'] + b['interior_count'] + (1 if joined > 0 else 0),
+        'interior_total': a['interior_total'] + b['interior_total'] + joined,
+        'interior_max': max(a['interior_max'], b['interior_max'], joined),
+    }
+
+
+def _finalize_null_runs(runs: Dict[str, Any]) -> tuple[int, float]:
+    """
+    Max and mean null run length from a merged summary.
+
+    Args:
+        runs: Null-run summary
+
+    Returns:
+        Tuple of (max_consecutive_nulls, mean_run_length)
+    """
+    if runs['all_null']:
+        return runs['length'], float(runs['length'])
+
+    lengths = [runs['interior_max']] if runs['interior_count'] else []
+    count = runs['interior_count']
+    total = runs['interior_total']
+
+    for edge in (runs['leading'], runs['trailing']):
+        if edge > 0:
+            lengths.append(edge)
+            count += 1
+            total += edge
+
+    return (max(lengths) if lengths else 0), (total / count if count else 0)
+
+
+# ---------------------------------------------------------------------------
+# Cardinality: exact value counts and HyperLogLog
+# ---------------------------------------------------------------------------
+
+def _hll_registers(series: pl.Series, precision: int = HLL_PRECISION) -> np.ndarray:
+    """
+    HyperLogLog registers for the non-null values of a column.
+
+    Values are hashed as strings so that shards with differently inferred
+    dtypes still agree.
+
+    Args:
+        series: Polars Series
+        precision: Number of index bits
+
+    Returns:
+        uint8 array of 2**precision registers
+    """
+    registers = np.zeros(1 << precision, dtype=np.uint8)
+    hashes = series.drop_nulls().cast(pl.Utf8).hash(seed=0).to_numpy().astype(np.uint64)
+
+    if len(hashes) == 0:
+        return registers
+
+    value_bits = 64 - precision
+    index = (hashes >> np.uint64(value_bits)).astype(np.int64)
+    rest = (hashes & np.uint64((1 << value_bits) - 1)).astype(np.float64)
+    _, exponent = np.frexp(rest)
+    rank = np.where(rest > 0, value_bits - exponent + 1, value_bits + 1).astype(np.uint8)
+
+    order = np.argsort(index, kind='stable')
+    index, rank = index[order], rank[order]
+    starts = np.flatnonzero(np.r_[True, index[1:] != index[:-1]])
+    registers[index[starts]] = np.maximum.reduceat(rank, starts)
+
+    return registers
+
+
+def _hll_estimate(registers: np.ndarray) -> int:
+    """
+    Cardinality estimate from HyperLogLog registers.
+
+    Args:
+        registers: uint8 register array
+
+    Returns:
+        Estimated number of distinct values
+    """
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    raw = alpha * m * m / np.sum(np.power(2.0, -registers.astype(np.float64)))
+    zeros = int(np.sum(registers == 0))
+
+    # Linear counting for small cardinalities
+    if raw <= 2.5 * m and zeros > 0:
+        return int(round(m * np.log(m / zeros)))
+
+    return int(round(raw))
+
+
+def _value_counts(series: pl.Series) -> tuple[List[List[Any]], bool]:
+    """
+    Value counts keyed by str(value), capped at VALUE_COUNT_CAP entries.
+
+    Args:
+        series: Polars Series
+
+    Returns:
+        Tuple of ([value, count] list sorted by count, whether the list is complete)
+    """
+    counts = series.value_counts(sort=True)
+    exact = len(counts) <= VALUE_COUNT_CAP
+
+    values = [
+        [None if value is None else str(value), int(count)]
+        for value, count in counts.head(VALUE_COUNT_CAP).iter_rows()
+    ]
+
+    return values, exact
+
+
+def _merge_value_counts(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge two capped value-count lists.
+
+    Counts of values that fell off a shard's capped list are lost, so a
+    merged list is only marked exact when both inputs were exact and the
+    union still fits under the cap.
+
+    Args:
+        a: Cardinality state with 'values' and 'exact'
+        b: Cardinality state with 'values' and 'exact'
+
+    Returns:
+        Dict with merged 'values' and 'exact'
+    """
+    totals: Dict[Any, int] = {}
+    for value, count in a['values'] + b['values']:
+        totals[value] = totals.get(value, 0) + count
+
+    exact = a['exact'] and b['exact'] and len(totals) <= VALUE_COUNT_CAP
+    top = heapq.nsmallest(
+        VALUE_COUNT_CAP,
+        totals.items(),
+        key=lambda item: (-item[1], item[0] is None, item[0] or ''),
+    )
+
+    return {'values': [[value, count] for value, count in top], 'exact': exact}
+
+
+# ---------------------------------------------------------------------------
+# Distributions: moments and quantile summary
+# ---------------------------------------------------------------------------
+
+def _moments(values: np.ndarray) -> Dict[str, float]:
+    """
+    Count, mean and central moment sums M2..M4 of a sample.
+
+    Args:
+        values: Non-null float values
+
+    Returns:
+        Dict with n, mean, m2, m3, m4, min and max
+    """
+    mean = float(values.mean())
+    centered = values - mean
+    squared = centered ** 2
+
+    return {
+        'n': int(len(values)),
+        'mean': mean,
+        'm2': float(squared.sum()),
+        'm3': float((squared * centered).sum()),
+        'm4': float((squared ** 2).sum()),
+        'min': float(values.min()),
+        'max': float(values.max()),
+    }
+
+
+def _merge_moments(a: Dict[str, float], b: Dict[str, float]) -> Dict[str, float]:
+    """
+    Combine central moment sums of two samples (Chan et al. / Pébay).
+
+    Args:
+        a: Moments of the first sample
+        b: Moments of the second sample
+
+    Returns:
+        Moments of the union
+    """
+    na, nb = a['n'], b['n']
+    if na == 0:
+        return dict(b)
+    if nb == 0:
+        return dict(a)
+
+    n = na + nb
+    delta = b['mean'] - a['mean']
+    delta_n = delta / n
+
+    m2 = a['m2'] + b['m2'] + delta * delta_n * na * nb
+    m3 = (
+        a['m3'] + b['m3']
+        + delta * delta_n ** 2 * na * nb * (na - nb)
+        + 3 * delta_n * (na * b['m2'] - nb * a['m2'])
+    )
+    m4 = (
+        a['m4'] + b['m4']
+        + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+        + 6 * delta_n ** 2 * (na * na * b['m2'] + nb * nb * a['m2'])
+        + 4 * delta_n * (na * b['m3'] - nb * a['m3'])
+    )
+
+    return {
+        'n': n,
+        'mean': a['mean'] + delta_n * nb,
+        'm2': m2,
+        'm3': m3,
+        'm4': m4,
+        'min': min(a['min'], b['min']),
+        'max': max(a['max'], b['max']),
+    }
+
+
+def _compress_sketch(values: np.ndarray, weights: np.ndarray, size: int = QUANTILE_SKETCH_SIZE) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce weighted points to an equi-depth summary of at most `size` points.
+
+    Each kept point stands for total_weight / size observations, so every
+    compression adds at most half a bucket of rank error.
+
+    Args:
+        values: Point values
+        weights: Point weights
+        size: Maximum number of points to keep
+
+    Returns:
+        Tuple of (values, weights) sorted by value
+    """
+    order = np.argsort(values, kind='stable')
+    values, weights = values[order], weights[order]
+
+    if len(values) <= size:
+        return values, weights
+
+    total = weights.sum()
+    targets = (np.arange(size) + 0.5) * total / size
+    positions = np.searchsorted(np.cumsum(weights), targets, side='left')
+
+    return values[np.minimum(positions, len(values) - 1)], np.full(size, total / size)
+
+
+def _sketch_quantile(values: np.ndarray, weights: np.ndarray, exact: bool, q: float) -> float:
+    """
+    Quantile from a summary, matching np.percentile while it is still exact.
+
+    Args:
+        values: Sorted point values
+        weights: Point weights
+        exact: Whether the points are the raw values
+        q: Quantile in [0, 1]
+
+    Returns:
+        Quantile estimate
+    """
+    if exact:
+        return float(np.percentile(values, q * 100))
+
+    midpoints = np.cumsum(weights) - weights / 2
+    return float(np.interp(q * weights.sum(), midpoints, values))
+
+
+# ---------------------------------------------------------------------------
+# Time index
+# ---------------------------------------------------------------------------
+
+def _time_state(series: pl.Series) -> Dict[str, Any]:
+    """
+    Mergeable sortedness and cadence state of a date/datetime column.
+
+    Args:
+        series: Date or Datetime Series
+
+    Returns:
+        Dict with sortedness, boundary values (epoch microseconds) and diff counts
+    """
+    micros = series.dt.epoch('us')
+    clean = micros.drop_nulls()
+    diffs = micros.diff().drop_nulls()
+    diff_counts = diffs.value_counts(sort=True).head(VALUE_COUNT_CAP)
+
+    return {
+        'rows': len(series),
+        'null_count': series.null_count(),
+        'sorted': bool(clean.is_sorted()),
+        'first_value': clean[0] if len(clean) else None,
+        'last_value': clean[-1] if len(clean) else None,
+        'head': micros[0] if len(micros) else None,
+        'tail': micros[-1] if len(micros) else None,
+        'diffs': [[int(d), int(c)] for d, c in diff_counts.iter_rows()],
+    }
+
+
+def _merge_time_state(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Concatenate the time-index state of two consecutive shards.
+
+    Args:
+        a: State of the earlier shard
+        b: State of the later shard
+
+    Returns:
+        State of the concatenated rows
+    """
+    if a['rows'] == 0:
+        return dict(b)
+    if b['rows'] == 0:
+        return dict(a)
+
+    ordered = a['last_value'] is None or b['first_value'] is None or a['last_value'] <= b['first_value']
+
+    diffs: Dict[int, int] = {}
+    for diff, count in a['diffs'] + b['diffs']:
+        diffs[diff] = diffs.get(diff, 0) + count
+
+    # The diff between the last row of a and the first row of b
+    if a['tail'] is not None and b['head'] is not None:
+        boundary = b['head'] - a['tail']
+        diffs[boundary] = diffs.get(boundary, 0) + 1
+
+    top = heapq.nsmallest(VALUE_COUNT_CAP, diffs.items(), key=lambda item: (-item[1], item[0]))
+
+    return {
+        'rows': a['rows'] + b['rows'],
+        'null_count': a['null_count'] + b['null_count'],
+        'sorted': a['sorted'] and b['sorted'] and ordered,
+        'first_value': a['first_value'] if a['first_value'] is not None else b['first_value'],
+        'last_value': b['last_value'] if b['last_value'] is not None else a['last_value'],
+        'head': a['head'],
+        'tail': b['tail'],
+        'diffs': [[diff, count] for diff, count in top],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Correlations: shifted pairwise co-moment sums
+# ---------------------------------------------------------------------------
+
+def _shifted_moments(X: np.ndarray, shift: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Pairwise-complete co-moment sums of X - shift.
+
+    Shifting by a per-column centre keeps the sums well conditioned.
+
+    Args:
+        X: 2D float array with NaN for missing
+        shift: Per-column shift
+
+    Returns:
+        Dict with shift, n, sx, sxx and sxy
+    """
+    moments = _pairwise_moments(X - shift)
+    moments['shift'] = shift
+    return moments
+
+
+def _reshift(moments: Dict[str, np.ndarray], shift: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Re-express shifted co-moment sums relative to a different shift.
+
+    Args:
+        moments: Sums relative to moments['shift']
+        shift: New per-column shift
+
+    Returns:
+        Equivalent sums relative to shift
+    """
+    d = (moments['shift'] - shift)[:, None]
+    n, sx = moments['n'], moments['sx']
+
+    return {
+        'shift': shift,
+        'n': n,
+        'sx': sx + d * n,
+        'sxx': moments['sxx'] + 2 * d * sx + d ** 2 * n,
+        'sxy': moments['sxy'] + d * sx.T + d.T * sx + d * d.T * n,
+    }
+
+
+def _ranks(X: np.ndarray) -> np.ndarray:
+    """
+    Column-wise ranks scaled to (0, 1), NaN preserved.
+
+    Args:
+        X: 2D float array with NaN for missing
+
+    Returns:
+        Array of scaled average ranks
+    """
+    ranks = stats.rankdata(X, axis=0, nan_policy='omit')
+    counts = np.sum(~np.isnan(X), axis=0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (ranks - 0.5) / counts
+
+
+def _correlation_state(df: pl.DataFrame, numeric_cols: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Co-moment sums of values and within-shard ranks for numeric columns.
+
+    Args:
+        df: Shard DataFrame
+        numeric_cols: Numeric column names
+
+    Returns:
+        Correlation state, or None with fewer than two numeric columns
+    """
+    if len(numeric_cols) < 2:
+        return None
+
+    X = df.select([pl.col(c).cast(pl.Float64) for c in numeric_cols]).to_numpy()
+    X = np.asarray(X, dtype=np.float64)
+
+    with np.errstate(invalid='ignore'):
+        centre = np.nan_to_num(np.nanmean(X, axis=0)) if len(X) else np.zeros(len(numeric_cols))
+
+    return {
+        'columns': list(numeric_cols),
+        'values': _shifted_moments(X, centre),
+        'ranks': _shifted_moments(_ranks(X), np.full(len(numeric_cols), 0.5)),
+    }
+
+
+def _align_moments(moments: Dict[str, np.ndarray], columns: List[str], target: List[str]) -> Dict[str, np.ndarray]:
+    """
+    Embed co-moment sums over `columns` into the column order `target`.
+
+    Args:
+        moments: Co-moment sums
+        columns: Columns the sums were computed over
+        target: Superset of columns in the desired order
+
+    Returns:
+        Sums over target, zero for columns the shard did not have
+    """
+    index = np.array([target.index(c) for c in columns])
+    size = len(target)
+
+    aligned = {'shift': np.zeros(size)}
+    aligned['shift'][index] = moments['shift']
+
+    for key in ('n', 'sx', 'sxx', 'sxy'):
+        matrix = np.zeros((size, size))
+        matrix[np.ix_(index, index)] = moments[key]
+        aligned[key] = matrix
+
+    return aligned
+
+
+def _merge_correlation_state(a: Optional[Dict[str, Any]], b: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Add the co-moment sums of two shards.
+
+    Args:
+        a: Correlation state or None
+        b: Correlation state or None
+
+    Returns:
+        Merged correlation state
+    """
+    if a is None or b is None:
+        return a if b is None else b
+
+    columns = a['columns'] + [c for c in b['columns'] if c not in a['columns']]
+    merged = {'columns': columns}
+
+    for key in ('values', 'ranks'):
+        left = _align_moments(a[key], a['columns'], columns)
+        right = _reshift(_align_moments(b[key], b['columns'], columns), left['shift'])
+        merged[key] = {'shift': left['shift'], **{
+            name: left[name] + right[name] for name in ('n', 'sx', 'sxx', 'sxy')
+        }}
+
+    return merged
+
+
+def _correlation_pvalue(r: float, n: float) -> float:
+    """
+    Two-sided p-value of a correlation coefficient (t distribution, n - 2 dof).
+
+    Args:
+        r: Correlation coefficient
+        n: Number of pairs
+
+    Returns:
+        p-value
+    """
+    if abs(r) >= 1.0:
+        return 0.0
+
+    t = r * np.sqrt((n - 2) / (1.0 - r * r))
+    return float(2 * stats.t.sf(abs(t), n - 2))
+
+
+# ---------------------------------------------------------------------------
+# Building, merging and finalizing partials
+# ---------------------------------------------------------------------------
+
+def summarize_partial(df: pl.DataFrame, schema: Dict[str, Any], shard_index: int = 0) -> Dict[str, Any]:
+    """
+    Profile one shard into a mergeable partial profile.
+
+    Args:
+        df: Shard DataFrame
+        schema: Schema dict from ingest
+        shard_index: Position of this shard in the global row order
+
+    Returns:
+        Partial profile dict (JSON-compatible)
+    """
+    columns = [
+        {'normalized_name': col['normalized_name'], 'type': col['type']}
+        for col in schema['columns']
+    ]
+    types = {col['normalized_name']: col['type'] for col in columns}
+
+    missingness = {}
+    for col in df.columns:
+        state = {'null_count': df[col].null_count()}
+        if df[col].dtype in [pl.Datetime, pl.Date]:
+            state['runs'] = _null_runs(df[col].is_null().to_numpy())
+        missingness[col] = state
+
+    cardinality = {}
+    for col in types:
+        values, exact = _value_counts(df[col])
+        cardinality[col] = {
+            'values': values,
+            'exact': exact,
+            'hll': _encode_array(_hll_registers(df[col])),
+        }
+
+    numeric_cols = [c for c, t in types.items() if t in ['int', 'float']]
+    distributions = {}
+    for col in numeric_cols:
+        values = df[col].drop_nulls().cast(pl.Float64).to_numpy()
+        if len(values) == 0:
+            distributions[col] = None
+            continue
+
+        points, weights = _compress_sketch(values, np.ones(len(values)))
+        distributions[col] = {
+            'moments': _moments(values),
+            'exact': len(values) <= QUANTILE_SKETCH_SIZE,
+            'sketch': {'values': _encode_array(points), 'weights': _encode_array(weights)},
+        }
+
+    time_index = {
+        c: _time_state(df[c]) for c, t in types.items() if t in ['datetime', 'date']
+    }
+
+    categorical_cols = [c for c, t in types.items() if t in ['categorical', 'string', 'bool']]
+    eligible = [c for c in categorical_cols if df[c].n_unique() < CHI_SQUARE_MAX_LEVELS]
+    tables = {}
+    for i, col1 in enumerate(eligible):
+        for col2 in eligible[i + 1:]:
+            counts = df.group_by([col1, col2]).len()
+            tables[f"{col1}___{col2}"] = [
+                [None if v1 is None else str(v1), None if v2 is None else str(v2), int(count)]
+                for v1, v2, count in counts.iter_rows()
+            ]
+
+    return {
+        'version': PARTIAL_VERSION,
+        'kind': 'partial_profile',
+        'polars_version': pl.__version__,
+        'shards': [shard_index],
+        'rows': len(df),
+        'columns': columns,
+        'missingness': missingness,
+        'cardinality': cardinality,
+        'distributions': distributions,
+        'time_index': time_index,
+        'correlations': _encode_correlation_state(_correlation_state(df, numeric_cols)),
+        'chi_square': {
+            'ineligible': [c for c in categorical_cols if c not in eligible],
+            'tables': tables,
+        },
+    }
+
+
+def _encode_correlation_state(state: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Encode the arrays of a correlation state for serialization."""
+    if state is None:
+        return None
+
+    return {
+        'columns': state['columns'],
+        **{key: {name: _encode_array(arr) for name, arr in state[key].items()} for key in ('values', 'ranks')},
+    }
+
+
+def _decode_correlation_state(state: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Decode a correlation state written by _encode_correlation_state."""
+    if state is None:
+        return None
+
+    return {
+        'columns': state['columns'],
+        **{key: {name: _decode_array(arr) for name, arr in state[key].items()} for key in ('values', 'ranks')},
+    }
+
+
+def _merge_two(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge the partial of a shard into the partial of the rows preceding it.
+
+    Args:
+        a: Partial covering the earlier rows
+        b: Partial covering the later rows
+
+    Returns:
+        Partial covering both
+    """
+    names = [col['normalized_name'] for col in a['columns']]
+    columns = a['columns'] + [col for col in b['columns'] if col['normalized_name'] not in names]
+
+    missingness = {}
+    for col in list(a['missingness']) + [c for c in b['missingness'] if c not in a['missingness']]:
+        left = a['missingness'].get(col)
+        right = b['missingness'].get(col)
+        if left is None or right is None:
+            missingness[col] = dict(left or right)
+            continue
+
+        state = {'null_count': left['null_count'] + right['null_count']}
+        if 'runs' in left and 'runs' in right:
+            state['runs'] = _merge_null_runs(left['runs'], right['runs'])
+        missingness[col] = state
+
+    cardinality = {}
+    for col in [c['normalized_name'] for c in columns]:
+        left = a['cardinality'].get(col)
+        right = b['cardinality'].get(col)
+        if left is None or right is None:
+            cardinality[col] = left or right
+            continue
+
+        registers = np.maximum(_decode_array(left['hll']), _decode_array(right['hll']))
+        cardinality[col] = {**_merge_value_counts(left, right), 'hll': _encode_array(registers)}
+
+    distributions = {}
+    for col in list(a['distributions']) + [c for c in b['distributions'] if c not in a['distributions']]:
+        left = a['distributions'].get(col)
+        right = b['distributions'].get(col)
+        if left is None or right is None:
+            distributions[col] = left or right
+            continue
+
+        values = np.concatenate([_decode_array(left['sketch']['values']), _decode_array(right['sketch']['values'])])
+        weights = np.concatenate([_decode_array(left['sketch']['weights']), _decode_array(right['sketch']['weights'])])
+        exact = left['exact'] and right['exact'] and len(values) <= QUANTILE_SKETCH_SIZE
+        points, weights = _compress_sketch(values, weights)
+
+        distributions[col] = {
+            'moments': _merge_moments(left['moments'], right['moments']),
+            'exact': exact,
+            'sketch': {'values': _encode_array(points), 'weights': _encode_array(weights)},
+        }
+
+    time_index = {}
+    for col in list(a['time_index']) + [c for c in b['time_index'] if c not in a['time_index']]:
+        left = a['time_index'].get(col)
+        right = b['time_index'].get(col)
+        time_index[col] = _merge_time_state(left, right) if left and right else dict(left or right)
+
+    tables = {}
+    for key in list(a['chi_square']['tables']) + [k for k in b['chi_square']['tables'] if k not in a['chi_square']['tables']]:
+        counts: Dict[tuple, int] = {}
+        for v1, v2, count in a['chi_square']['tables'].get(key, []) + b['chi_square']['tables'].get(key, []):
+            counts[(v1, v2)] = counts.get((v1, v2), 0) + count
+        tables[key] = [[v1, v2, count] for (v1, v2), count in counts.items()]
+
+    ineligible = a['chi_square']['ineligible'] + [
+        c for c in b['chi_square']['ineligible'] if c not in a['chi_square']['ineligible']
+    ]
+
+    correlations = _merge_correlation_state(
+        _decode_correlation_state(a['correlations']),
+        _decode_correlation_state(b['correlations']),
+    )
+
+    return {
+        'version': PARTIAL_VERSION,
+        'kind': 'partial_profile',
+        'polars_version': a['polars_version'],
+        'shards': a['shards'] + b['shards'],
+        'rows': a['rows'] + b['rows'],
+        'columns': columns,
+        'missingness': missingness,
+        'cardinality': cardinality,
+        'distributions': distributions,
+        'time_index': time_index,
+        'correlations': _encode_correlation_state(correlations),
+        'chi_square': {'ineligible': ineligible, 'tables': tables},
+    }
+
+
+def merge_partials(partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge partial profiles into one partial covering all their shards.
+
+    Partials are combined in shard order, so they may be passed in any
+    order and merged hierarchically (merging merged partials is allowed).
+
+    Args:
+        partials: Partial profiles from summarize_partial or merge_partials
+
+    Returns:
+        Merged partial profile
+
+    Raises:
+        ValueError: If no partials are given, a shard appears twice, or the
+            partials were hashed by different Polars versions
+    """
+    if not partials:
+        raise ValueError("No partial profiles to merge")
+
+    shards = [shard for partial in partials for shard in partial['shards']]
+    if len(set(shards)) != len(shards):
+        raise ValueError(f"Duplicate shard indices in partial profiles: {sorted(shards)}")
+
+    versions = {partial['polars_version'] for partial in partials}
+    if len(versions) > 1:
+        raise ValueError(f"Partial profiles were built with different Polars versions: {sorted(versions)}")
+
+    ordered = sorted(partials, key=lambda partial: min(partial['shards']))
+    merged = ordered[0]
+    for partial in ordered[1:]:
+        merged = _merge_two(merged, partial)
+
+    return merged
+
+
+def _finalize_distribution(state: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Distribution stats in the shape of compute_numeric_distribution.
+
+    Args:
+        state: Merged distribution state
+
+    Returns:
+        Dict with distribution stats
+    """
+    if state is None:
+        return {'error': 'No non-null values'}
+
+    m = state['moments']
+    n = m['n']
+    values = _decode_array(state['sketch']['values'])
+    weights = _decode_array(state['sketch']['weights'])
+    exact = state['exact']
+
+    median = _sketch_quantile(values, weights, exact, 0.5)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        skew = float(np.sqrt(n) * m['m3'] / m['m2'] ** 1.5) if m['m2'] > 0 else float('nan')
+        kurtosis = float(n * m['m4'] / m['m2'] ** 2 - 3) if m['m2'] > 0 else float('nan')
+
+    deviations = np.abs(values - median)
+    order = np.argsort(deviations, kind='stable')
+    mad = _sketch_quantile(deviations[order], weights[order], exact, 0.5)
+
+    dist_stats = {
+        'count': n,
+        'mean': m['mean'],
+        'median': median,
+        'std': float(np.sqrt(m['m2'] / n)),
+        'mad': mad,
+        'min': m['min'],
+        'max': m['max'],
+        'q25': _sketch_quantile(values, weights, exact, 0.25),
+        'q75': _sketch_quantile(values, weights, exact, 0.75),
+        'skew': skew,
+        'kurtosis': kurtosis,
+    }
+
+    iqr = dist_stats['q75'] - dist_stats['q25']
+    lower_fence = dist_stats['q25'] - 1.5 * iqr
+    upper_fence = dist_stats['q75'] + 1.5 * iqr
+
+    outliers_low = int(round(weights[values < lower_fence].sum()))
+    outliers_high = int(round(weights[values > upper_fence].sum()))
+
+    dist_stats['iqr'] = iqr
+    dist_stats['outliers_low'] = outliers_low
+    dist_stats['outliers_high'] = outliers_high
+    dist_stats['outlier_fraction'] = (outliers_low + outliers_high) / n
+    dist_stats['heavy_tailed'] = abs(dist_stats['kurtosis']) > 3
+    dist_stats['potentially_multimodal'] = dist_stats['kurtosis'] < -1
+
+    return dist_stats
+
+
+def _finalize_correlations(state: Optional[Dict[str, Any]], numeric_cols: List[str]) -> Dict[str, Any]:
+    """
+    Correlation results in the shape of compute_correlations.
+
+    Args:
+        state: Merged correlation state
+        numeric_cols: Numeric columns in schema order
+
+    Returns:
+        Dict with correlations and significant pairs
+    """
+    state = _decode_correlation_state(state)
+    if state is None or len(numeric_cols) < 2:
+        return {'correlations': {}, 'significant_pairs': []}
+
+    columns = [c for c in numeric_cols if c in state['columns']]
+    index = [state['columns'].index(c) for c in columns]
+
+    def correlation_matrix(moments):
+        sub = {key: moments[key][np.ix_(index, index)] for key in ('n', 'sx', 'sxx', 'sxy')}
+        n, sx, sxx = sub['n'], sub['sx'], sub['sxx']
+        cov = n * sub['sxy'] - sx * sx.T
+        var = n * sxx - sx ** 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return n, np.clip(cov / np.sqrt(var * var.T), -1.0, 1.0)
+
+    n, pearson = correlation_matrix(state['values'])
+    _, spearman = correlation_matrix(state['ranks'])
+
+    correlations = {}
+    significant_pairs = []
+
+    for i in range(len(columns)):
+        for j in range(i + 1, len(columns)):
+            n_pairs = int(round(n[i, j]))
+            if n_pairs < 20 or not np.isfinite(pearson[i, j]):
+                continue
+
+            pearson_r = float(pearson[i, j])
+            pearson_p = _correlation_pvalue(pearson_r, n_pairs)
+            spearman_r = float(spearman[i, j]) if np.isfinite(spearman[i, j]) else float('nan')
+
+            pair_key = f"{columns[i]}___{columns[j]}"
+            correlations[pair_key] = {
+                'col1': columns[i],
+                'col2': columns[j],
+                'pearson_r': pearson_r,
+                'pearson_p': pearson_p,
+                'spearman_r': spearman_r,
+                'spearman_p': _correlation_pvalue(spearman_r, n_pairs),
+                'spearman_method': 'pooled_within_shard',  # Approximate: ranks are within shards
+                'n_pairs': n_pairs,
+            }
+
+            # Exact Pearson statistics only; the pooled Spearman p-value is approximate
+            if abs(pearson_r) >= 0.3 or pearson_p < 0.05:
+                significant_pairs.append(pair_key)
+
+    return {
+        'correlations': correlations,
+        'significant_pairs': significant_pairs,
+    }
+
+
+def _finalize_covariance(state: Optional[Dict[str, Any]], numeric_cols: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Covariance in the shape of compute_covariance, from the value co-moments.
+
+    Args:
+        state: Merged correlation state
+        numeric_cols: Numeric columns in schema order
+
+    Returns:
+        Dict with columns, n, mean and cov, or None
+    """
+    state = _decode_correlation_state(state)
+    if state is None:
+        return None
+
+    columns = [c for c in numeric_cols if c in state['columns']]
+    index = [state['columns'].index(c) for c in columns]
+    moments = {key: state['values'][key][np.ix_(index, index)] for key in ('n', 'sx', 'sxx', 'sxy')}
+    moments['shift'] = state['values']['shift'][index]
+
+    return _covariance_from_moments(moments, columns)
+
+
+def _finalize_chi_square(chi_state: Dict[str, Any], cardinality: Dict[str, Any], categorical_cols: List[str]) -> Dict[str, Any]:
+    """
+    Chi-square results in the shape of compute_chi_square.
+
+    Args:
+        chi_state: Merged contingency tables
+        cardinality: Finalized cardinality stats
+        categorical_cols: Categorical columns in schema order
+
+    Returns:
+        Dict with chi-square tests and significant pairs
+    """
+    eligible = [
+        c for c in categorical_cols
+        if c not in chi_state['ineligible']
+        and cardinality[c]['unique_count'] < CHI_SQUARE_MAX_LEVELS
+    ]
+
+    tests = {}
+    significant_pairs = []
+
+    for i, col1 in enumerate(eligible):
+        for col2 in eligible[i + 1:]:
+            pair_key = f"{col1}___{col2}"
+            counts = chi_state['tables'].get(pair_key)
+            if not counts:
+                continue
+
+            rows = {v1: idx for idx, v1 in enumerate(dict.fromkeys(v1 for v1, _, _ in counts))}
+            cols = {v2: idx for idx, v2 in enumerate(dict.fromkeys(v2 for _, v2, _ in counts))}
+            table = np.zeros((len(rows), len(cols)))
+            for v1, v2, count in counts:
+                table[rows[v1], cols[v2]] += count
+
+            try:
+                chi2, p_value, dof, expected = stats.chi2_contingency(table)
+            except ValueError:
+                continue
+
+            n = table.sum()
+            min_dim = min(table.shape)
+            cramers_v = np.sqrt(chi2 / (n * (min_dim - 1))) if min_dim > 1 else 0
+
+            tests[pair_key] = {
+                'col1': col1,
+                'col2': col2,
+                'chi2': float(chi2),
+                'p_value': float(p_value),
+                'cramers_v': float(cramers_v),
+                'n': int(n),
+            }
+
+            if p_value < 0.05 and cramers_v > 0.3:
+                significant_pairs.append(pair_key)
+
+    return {
+        'tests': tests,
+        'significant_pairs': significant_pairs,
+    }
+
+
+def finalize_profile(partial: Dict[str, Any], top_k: int = 20) -> Dict[str, Any]:
+    """
+    Turn a (merged) partial profile into a profile dict like summarize() returns.
+
+    Args:
+        partial: Partial profile covering all shards
+        top_k: Number of top categories to report per column
+
+    Returns:
+        Complete profile dict
+    """
+    total = partial['rows']
+    types = {col['normalized_name']: col['type'] for col in partial['columns']}
+
+    missingness = {}
+    for col, state in partial['missingness'].items():
+        missingness[col] = {
+            'null_count': state['null_count'],
+            'fraction': state['null_count'] / total if total > 0 else 0,
+        }
+        if 'runs' in state and state['null_count'] > 0:
+            max_run, mean_run = _finalize_null_runs(state['runs'])
+            missingness[col]['max_consecutive_nulls'] = max_run
+            missingness[col]['mean_run_length'] = mean_run
+
+    cardinality = {}
+    for col, col_type in types.items():
+        state = partial['cardinality'][col]
+        if state['exact']:
+            unique_count = len(state['values'])
+        else:
+            has_null = partial['missingness'].get(col, {}).get('null_count', 0) > 0
+            unique_count = max(_hll_estimate(_decode_array(state['hll'])) + int(has_null), len(state['values']))
+            unique_count = min(unique_count, total)  # The sketch can overshoot the row count
+
+        card_info = {
+            'unique_count': unique_count,
+            'unique_fraction': unique_count / total if total > 0 else 0,
+        }
+
+        if col_type in ['categorical', 'string', 'bool'] or unique_count < 50:
+            top_values = [
+                {
+                    'value': None if value is None else str(value),
+                    'count': count,
+                    'fraction': count / total if total > 0 else 0,
+                }
+                for value, count in state['values'][:top_k]
+            ]
+            card_info['top_values'] = top_values
+
+            if top_values:
+                card_info['top_k_coverage'] = sum(v['fraction'] for v in top_values)
+
+        cardinality[col] = card_info
+
+    time_index = None
+    for col, col_type in types.items():
+        state = partial['time_index'].get(col)
+        if col_type not in ['datetime', 'date'] or state is None:
+            continue
+        if state['sorted'] and state['diffs']:
+            mode_diff = state['diffs'][0][0]
+            time_index = {
+                'column': col,
+                'is_monotonic': True,
+                'typical_cadence': str(timedelta(microseconds=mode_diff)),
+                'completeness': 1.0 - (state['null_count'] / state['rows']),
+            }
+            break
+
+    numeric_cols = [c for c, t in types.items() if t in ['int', 'float']]
+    categorical_cols = [c for c, t in types.items() if t in ['categorical', 'string', 'bool']]
+
+    return {
+        'version': '1.0',
+        'timestamp': datetime.now().isoformat(),
+        'missingness': missingness,
+        'missingness_patterns': None,  # Row patterns need the rows; not merged across shards
+        'cardinality': cardinality,
+        'distributions': {
+            col: _finalize_distribution(partial['distributions'].get(col)) for col in numeric_cols
+        },
+        'time_index': time_index,
+        'correlations': _finalize_correlations(partial['correlations'], numeric_cols),
+        'covariance': _finalize_covariance(partial['correlations'], numeric_cols),
+        'chi_square': _finalize_chi_square(partial['chi_square'], cardinality, categorical_cols),
+    }
+
+
+def combine_partials(partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Coordinator step: merge shard partials and finalize the profile.
+
+    Args:
+        partials: Partial profiles of all shards
+
+    Returns:
+        Complete profile dict for run_all
+    """
+    return finalize_profile(merge_partials(partials))
+
+
+def save_partial(partial: Dict[str, Any], output_path: str) -> None:
+    """
+    Save a partial profile (binary artifact, or JSON for a .json path).
+
+    Args:
+        partial: Partial profile dictionary
+        output_path: Path to output file
+    """
+    artifacts.save(partial, output_path)
+
+
+def load_partial(input_path: str) -> Dict[str, Any]:
+    """
+    Load a partial profile saved by save_partial.
+
+    Args:
+        input_path: Path to partial profile file
+
+    Returns:
+        Partial profile dictionary
+    """
+    return artifacts.materialize(artifacts.load(input_path))
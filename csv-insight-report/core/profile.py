@@ -3,11 +3,14 @@ Data Profiling Module
 Computes missingness, cardinality, distributions, time index detection, and pairwise screening.
 """
 
-import json
+from datetime import datetime
 from typing import Dict, List, Any, Optional
 import numpy as np
 import polars as pl
-from scipy import stats
+from scipy import sparse, stats
+
+from . import artifacts
+from .screening import categorical_codes, screen_pairs, use_wide_mode
 
 
 def compute_missingness(df: pl.DataFrame) -> Dict[str, Any]:
@@ -54,6 +57,232 @@ def compute_missingness(df: pl.DataFrame) -> Dict[str, Any]:
     return missingness
 
 
+# Set bits per byte value, for NumPy releases without np.bitwise_count (< 2.0)
+_BYTE_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.int64)
+
+
+def popcount(words: np.ndarray, axis: Optional[int] = None) -> Any:
+    """
+    Count set bits in an array of unsigned 64-bit words.
+
+    Args:
+        words: uint64 bitset array
+        axis: Axis to sum over, or None for the total
+
+    Returns:
+        Total set bits (int), or per-index counts along the remaining axes
+    """
+    if hasattr(np, 'bitwise_count'):
+        counts = np.bitwise_count(words)
+    else:
+        bytes_ = np.ascontiguousarray(words).view(np.uint8).reshape(words.shape + (8,))
+        counts = _BYTE_POPCOUNT[bytes_].sum(axis=-1)
+
+    if axis is None:
+        return int(counts.sum(dtype=np.int64))
+    return counts.sum(axis=axis, dtype=np.int64)
+
+
+def _pattern_keys(n_columns: int) -> np.ndarray:
+    """Fixed random 64-bit keys, one per column, for hashing missingness patterns"""
+    return np.random.default_rng(0x5EED).integers(0, 2 ** 63, size=n_columns, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+
+
+def _union_groups(pairs: List[tuple[int, int]], size: int) -> List[List[int]]:
+    """
+    Connected components of the graph given by index pairs.
+
+    Args:
+        pairs: Edges (i, j)
+        size: Number of nodes
+
+    Returns:
+        Components with at least two nodes, each sorted
+    """
+    parent = list(range(size))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in pairs:
+        parent[find(i)] = find(j)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(size):
+        groups.setdefault(find(i), []).append(i)
+
+    return [sorted(g) for g in groups.values() if len(g) > 1]
+
+
+def compute_missingness_patterns(
+    df: pl.DataFrame,
+    chunk_rows: int = 1 << 20,
+    max_patterns: int = 10,
+    max_exact_patterns: int = 4096,
+    min_jaccard: float = 0.8,
+    max_pairs: int = 50,
+) -> Optional[Dict[str, Any]]:
+    """
+    Which columns go missing together, and the most frequent missingness patterns.
+
+    Rows are read in chunks. In each chunk, every column with nulls has its
+    null mask packed into a uint64 bitset, and every row gets a pattern
+    hash: the XOR of random 64-bit keys of its null columns. Grouping the
+    hashes counts the distinct patterns. The co-missingness matrix (rows
+    where both columns are null) is then exact by the cheapest of:
+    - the count-weighted product of the distinct patterns, when there are
+      at most max_exact_patterns of them (broken feeds: a few patterns)
+    - the popcount of ANDed bitsets, c^2/2 word operations per 64 rows
+      (dense nulls)
+    - a sparse product over the null positions, sum over rows of
+      (nulls in the row)^2 (scattered nulls in many columns)
+
+    Args:
+        df: Input DataFrame
+        chunk_rows: Rows per chunk (a multiple of 64)
+        max_patterns: Most frequent patterns to report
+        max_exact_patterns: Distinct patterns tracked per chunk; beyond
+            this the reported pattern counts are lower bounds
+        min_jaccard: Min overlap (both null / either null) for a column
+            pair to be reported and grouped
+        max_pairs: Max column pairs reported
+
+    Returns:
+        Dict with columns, rows, complete_rows, n_patterns, top_patterns,
+        co_missing_pairs and groups, or None if no column has nulls
+    """
+    columns = [col for col in df.columns if df[col].null_count() > 0]
+    n = len(df)
+
+    if not columns:
+        return None
+
+    c = len(columns)
+    keys = _pattern_keys(c)
+    co_missing = np.zeros((c, c), dtype=np.int64)
+    patterns: Dict[int, List[Any]] = {}  # hash -> [count, column mask]
+    truncated = False
+
+    for chunk in df.select(columns).iter_slices(n_rows=chunk_rows):
+        rows = len(chunk)
+        words = -(-rows // 64)
+        bits = np.zeros((c, words * 8), dtype=np.uint8)
+        row_hash = np.zeros(rows, dtype=np.uint64)
+        positions = []
+
+        for j, col in enumerate(columns):
+            mask = chunk[col].is_null().to_numpy()
+            packed = np.packbits(mask, bitorder='little')
+            bits[j, :len(packed)] = packed
+            positions.append(np.flatnonzero(mask))
+            row_hash[positions[-1]] ^= keys[j]
+
+        bits = bits.view(np.uint64)
+
+        counts = (
+            pl.DataFrame({'hash': row_hash, 'row': np.arange(rows, dtype=np.int64)})
+            .group_by('hash')
+            .agg(pl.len().alias('count'), pl.col('row').first())
+            .sort('count', descending=True)
+        )
+
+        # Decode each pattern's columns from the bitsets at a representative row
+        exact = len(counts) <= max_exact_patterns
+        kept = counts if exact else counts.head(max_exact_patterns)
+        truncated |= not exact
+
+        reps = kept['row'].to_numpy()
+        masks = ((bits[:, reps >> 6] >> (reps & 63).astype(np.uint64)) & np.uint64(1)).astype(bool).T
+        weights = kept['count'].to_numpy()
+
+        if exact:
+            M = masks.astype(np.float64)
+            co_missing += np.rint((M * weights[:, None]).T @ M).astype(np.int64)
+        else:
+            nulls = np.concatenate(positions)
+            per_row = np.bincount(nulls, minlength=rows)
+
+            # A sparse multiply-add costs about as much as 16 popcount words
+            if 16 * float(per_row @ per_row) < c * (c + 1) / 2 * words:
+                indptr = np.r_[0, np.cumsum([len(p) for p in positions])]
+                M = sparse.csc_matrix((np.ones(len(nulls), dtype=np.float64), nulls, indptr), shape=(rows, c))
+                co_missing += np.triu(np.rint((M.T @ M).toarray()).astype(np.int64))
+            else:
+                for i in range(c):
+                    co_missing[i, i:] += popcount(bits[i] & bits[i:], axis=1)
+
+        for h, count, mask in zip(kept['hash'].to_list(), weights.tolist(), masks):
+            if h in patterns:
+                patterns[h][0] += count
+            else:
+                patterns[h] = [count, mask]
+
+        if len(patterns) > 4 * max_exact_patterns:
+            truncated = True
+            patterns = dict(sorted(patterns.items(), key=lambda kv: -kv[1][0])[:max_exact_patterns])
+
+    if truncated:
+        co_missing = np.triu(co_missing) + np.triu(co_missing, 1).T
+
+    null_counts = np.diag(co_missing)
+    union = null_counts[:, None] + null_counts[None, :] - co_missing
+    with np.errstate(divide='ignore', invalid='ignore'):
+        jaccard = np.where(union > 0, co_missing / union, 0.0)
+
+    i_idx, j_idx = np.triu_indices(c, k=1)
+    strong = jaccard[i_idx, j_idx] >= min_jaccard
+    pairs = sorted(
+        zip(i_idx[strong].tolist(), j_idx[strong].tolist()),
+        key=lambda ij: (-jaccard[ij], -co_missing[ij]),
+    )
+
+    co_missing_pairs = [
+        {
+            'col1': columns[i],
+            'col2': columns[j],
+            'both_missing': int(co_missing[i, j]),
+            'jaccard': float(jaccard[i, j]),
+            'lift': float(co_missing[i, j] * n / (null_counts[i] * null_counts[j])),
+        }
+        for i, j in pairs[:max_pairs]
+    ]
+
+    groups = []
+    for group in _union_groups(pairs, c):
+        sub = co_missing[np.ix_(group, group)]
+        groups.append({
+            'columns': [columns[g] for g in group],
+            'min_jaccard': float(jaccard[np.ix_(group, group)].min()),
+            'rows_missing_together': int(sub.min()),  # Upper bound on rows where all are null
+        })
+    groups.sort(key=lambda g: -g['rows_missing_together'])
+
+    complete_hash = 0
+    ranked = sorted(patterns.items(), key=lambda kv: -kv[1][0])
+    top_patterns = [
+        {
+            'columns': [columns[j] for j in np.flatnonzero(mask)],
+            'count': int(count),
+            'fraction': count / n,
+        }
+        for h, (count, mask) in ranked if h != complete_hash
+    ][:max_patterns]
+
+    return {
+        'columns': columns,
+        'rows': n,
+        'complete_rows': int(patterns.get(complete_hash, [0])[0]),
+        'n_patterns': len(patterns),
+        'patterns_truncated': truncated,
+        'top_patterns': top_patterns,
+        'co_missing_pairs': co_missing_pairs,
+        'groups': groups,
+    }
+
+
 def compute_cardinality(df: pl.DataFrame, schema: Dict[str, Any], top_k: int = 20) -> Dict[str, Any]:
     """
     Compute cardinality statistics for each column.
@@ -82,13 +311,13 @@ def compute_cardinality(df: pl.DataFrame, schema: Dict[str, Any], top_k: int = 2
 
         # For categorical or low-cardinality columns, get top values
         if col_type in ['categorical', 'string', 'bool'] or unique_count < 50:
-            value_counts = df[col].value_counts().head(top_k)
+            value_counts = df[col].value_counts(sort=True).head(top_k)
             top_values = []
 
             for row in value_counts.iter_rows():
                 value, count = row
                 top_values.append({
-                    'value': str(value),
+                    'value': None if value is None else str(value),
                     'count': count,
                     'fraction': count / total_count if total_count > 0 else 0,
                 })
@@ -160,6 +389,98 @@ def compute_numeric_distribution(series: pl.Series) -> Dict[str, Any]:
     return dist_stats
 
 
+def compute_numeric_distributions(df: pl.DataFrame, columns: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Compute distribution statistics for many numeric columns in batched queries.
+
+    Produces the same fields as compute_numeric_distribution, but evaluates
+    each statistic for all columns in one Polars select instead of one
+    NumPy/SciPy round trip per column.
+
+    Args:
+        df: Input DataFrame
+        columns: Numeric column names
+
+    Returns:
+        Dict mapping column name to distribution stats
+    """
+    if not columns:
+        return {}
+
+    frame = df.select([pl.col(c).cast(pl.Float64) for c in columns])
+
+    aggregates = [
+        ('count', lambda c: pl.col(c).count()),
+        ('mean', lambda c: pl.col(c).mean()),
+        ('median', lambda c: pl.col(c).median()),
+        ('std', lambda c: pl.col(c).std(ddof=0)),
+        ('min', lambda c: pl.col(c).min()),
+        ('max', lambda c: pl.col(c).max()),
+        ('q25', lambda c: pl.col(c).quantile(0.25, interpolation='linear')),
+        ('q75', lambda c: pl.col(c).quantile(0.75, interpolation='linear')),
+        ('skew', lambda c: pl.col(c).skew(bias=True)),
+        ('kurtosis', lambda c: pl.col(c).kurtosis(fisher=True, bias=True)),
+    ]
+
+    first = frame.select([
+        expr(c).alias(f"{c}__{name}") for c in columns for name, expr in aggregates
+    ]).row(0, named=True)
+
+    # Second pass needs the medians and Tukey fences from the first
+    second_exprs = []
+    for c in columns:
+        if not first[f"{c}__count"]:
+            continue
+
+        iqr = first[f"{c}__q75"] - first[f"{c}__q25"]
+        lower_fence = first[f"{c}__q25"] - 1.5 * iqr
+        upper_fence = first[f"{c}__q75"] + 1.5 * iqr
+
+        second_exprs.extend([
+            (pl.col(c) - first[f"{c}__median"]).abs().median().alias(f"{c}__mad"),
+            (pl.col(c) < lower_fence).sum().alias(f"{c}__outliers_low"),
+            (pl.col(c) > upper_fence).sum().alias(f"{c}__outliers_high"),
+        ])
+
+    second = frame.select(second_exprs).row(0, named=True) if second_exprs else {}
+
+    distributions = {}
+    for c in columns:
+        count = first[f"{c}__count"]
+
+        if not count:
+            distributions[c] = {'error': 'No non-null values'}
+            continue
+
+        dist_stats = {
+            'count': count,
+            'mean': float(first[f"{c}__mean"]),
+            'median': float(first[f"{c}__median"]),
+            'std': float(first[f"{c}__std"]),
+            'mad': float(second[f"{c}__mad"]),
+            'min': float(first[f"{c}__min"]),
+            'max': float(first[f"{c}__max"]),
+            'q25': float(first[f"{c}__q25"]),
+            'q75': float(first[f"{c}__q75"]),
+            'skew': float(first[f"{c}__skew"]) if first[f"{c}__skew"] is not None else float('nan'),
+            'kurtosis': float(first[f"{c}__kurtosis"]) if first[f"{c}__kurtosis"] is not None else float('nan'),
+        }
+
+        outliers_low = int(second[f"{c}__outliers_low"])
+        outliers_high = int(second[f"{c}__outliers_high"])
+
+        dist_stats['iqr'] = dist_stats['q75'] - dist_stats['q25']
+        dist_stats['outliers_low'] = outliers_low
+        dist_stats['outliers_high'] = outliers_high
+        dist_stats['outlier_fraction'] = (outliers_low + outliers_high) / count
+        dist_stats['heavy_tailed'] = abs(dist_stats['kurtosis']) > 3
+        dist_stats['potentially_multimodal'] = dist_stats['kurtosis'] < -1
+
+        distributions[c] = dist_stats
+
+    return distributions
+
+
 def detect_time_index(df: pl.DataFrame, schema: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Detect if there's a suitable time index column.
@@ -204,14 +525,350 @@ def detect_time_index(df: pl.DataFrame, schema: Dict[str, Any]) -> Optional[Dict
     return None
 
 
-def compute_correlations(df: pl.DataFrame, schema: Dict[str, Any], sample_size: int = 10000) -> Dict[str, Any]:
+def _screening_sample(df: pl.DataFrame, columns: List[str], sample_size: Optional[int]) -> pl.DataFrame:
+    """
+    Draw a shuffled sample so that every prefix is itself a random sample.
+
+    Args:
+        df: Input DataFrame
+        columns: Columns to keep
+        sample_size: Max rows to keep, or None for every row
+
+    Returns:
+        Shuffled DataFrame with at most sample_size rows
+    """
+    n = len(df) if sample_size is None else min(len(df), sample_size)
+    return df.select(columns).sample(n=n, seed=42, shuffle=True)
+
+
+def _screening_stages(n_rows: int, initial_sample: int) -> List[int]:
+    """
+    Sample sizes used by progressive screening, doubling up to n_rows.
+
+    Args:
+        n_rows: Rows available in the screening sample
+        initial_sample: Size of the first stage
+
+    Returns:
+        Increasing list of stage sizes ending at n_rows
+    """
+    stages = []
+    size = max(initial_sample, 20)
+
+    while size < n_rows:
+        stages.append(size)
+        size *= 2
+
+    stages.append(n_rows)
+    return stages
+
+
+def _float_matrix(df: pl.DataFrame, columns: List[str]) -> np.ndarray:
+    """Columns as a float64 matrix, nulls as NaN"""
+    return df.select([pl.col(c).cast(pl.Float64) for c in columns]).to_numpy()
+
+
+def _pairwise_moments(X: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute pairwise-complete sufficient statistics for every column pair.
+
+    Missing values are NaN. Entry [i, j] of each matrix is taken over the
+    rows where both column i and column j are present, so one set of
+    matrix products replaces a drop_nulls() per pair.
+
+    Args:
+        X: 2D float array (rows x columns)
+
+    Returns:
+        Dict with n, sx, sxx and sxy matrices
+    """
+    present = ~np.isnan(X)
+    M = present.astype(np.float64)
+    X0 = np.where(present, X, 0.0)
+
+    return {
+        'n': M.T @ M,
+        'sx': X0.T @ M,
+        'sxx': (X0 ** 2).T @ M,
+        'sxy': X0.T @ X0,
+    }
+
+
+def _pearson_from_moments(moments: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Pearson correlation matrix from pairwise sufficient statistics.
+
+    Args:
+        moments: Output of _pairwise_moments
+
+    Returns:
+        Correlation matrix (NaN where undefined)
+    """
+    n = moments['n']
+    sx = moments['sx']
+    sxx = moments['sxx']
+
+    cov = n * moments['sxy'] - sx * sx.T
+    var_x = n * sxx - sx ** 2
+    var_y = var_x.T
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = cov / np.sqrt(var_x * var_y)
+
+    return np.clip(r, -1.0, 1.0)
+
+
+def _covariance_from_moments(moments: Dict[str, np.ndarray], columns: List[str]) -> Dict[str, Any]:
+    """
+    Pairwise-complete covariance matrix from shifted co-moment sums.
+
+    Args:
+        moments: _pairwise_moments of X - shift, with the 'shift' vector added
+        columns: Column names in matrix order
+
+    Returns:
+        Dict with columns, n (pairwise counts), mean and cov (nested lists,
+        NaN where fewer than two pairs)
+    """
+    n, sx = moments['n'], moments['sx']
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = (moments['sxy'] - sx * sx.T / n) / (n - 1)
+        mean = moments['shift'] + np.diag(sx) / np.diag(n)
+
+    cov = np.where(n >= 2, cov, np.nan)
+
+    return {
+        'columns': list(columns),
+        'n': np.rint(n).astype(np.int64).tolist(),
+        'mean': mean.tolist(),
+        'cov': cov.tolist(),
+    }
+
+
+def _correlation_bounds(r: np.ndarray, n: np.ndarray, z_crit: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fisher-z confidence bounds on |r|.
+
+    Args:
+        r: Correlation estimates
+        n: Pair counts behind each estimate
+        z_crit: Normal critical value for the interval
+
+    Returns:
+        Tuple of (lower, upper) bounds on the absolute correlation
+    """
+    z = np.arctanh(np.clip(r, -0.999999, 0.999999))
+    se = 1.0 / np.sqrt(np.maximum(n - 3, 1))
+    lo = np.tanh(z - z_crit * se)
+    hi = np.tanh(z + z_crit * se)
+
+    abs_hi = np.maximum(np.abs(lo), np.abs(hi))
+    abs_lo = np.where((lo > 0) | (hi < 0), np.minimum(np.abs(lo), np.abs(hi)), 0.0)
+
+    return abs_lo, abs_hi
+
+
+def _column_pairs(columns: List[str], candidate_pairs: Optional[List[List[str]]] = None) -> List[tuple[int, int]]:
+    """
+    Index pairs (i < j) to evaluate, either all pairs or a screened subset.
+
+    Args:
+        columns: Ordered column names
+        candidate_pairs: Optional list of [col1, col2] candidates
+
+    Returns:
+        List of (i, j) column index pairs in column order
+    """
+    if candidate_pairs is None:
+        return [(i, j) for i in range(len(columns)) for j in range(i + 1, len(columns))]
+
+    position = {col: idx for idx, col in enumerate(columns)}
+    pairs = set()
+
+    for col1, col2 in candidate_pairs:
+        if col1 in position and col2 in position and col1 != col2:
+            i, j = sorted((position[col1], position[col2]))
+            pairs.add((i, j))
+
+    return sorted(pairs)
+
+
+def _progressive_correlations(
+    sample_df: pl.DataFrame,
+    numeric_cols: List[str],
+    pairs: List[tuple[int, int]],
+    min_abs: float,
+    initial_sample: int,
+    confidence: float,
+) -> Dict[str, Any]:
+    """
+    Screen numeric pairs on growing prefixes of a shuffled sample.
+
+    Each stage computes Pearson r for all still-ambiguous pairs at once.
+    Pairs whose confidence interval lies entirely below min_abs are dropped,
+    pairs clearly above it are settled, and only the rest move on to the next,
+    larger stage. Settled pairs then get exact statistics at the stage size
+    where they were settled.
+
+    Args:
+        sample_df: Shuffled screening sample
+        numeric_cols: Numeric columns to pair
+        pairs: Column index pairs to screen
+        min_abs: Minimum |r| of interest
+        initial_sample: Size of the first stage
+        confidence: Confidence level of the screening intervals
+
+    Returns:
+        Dict with correlations, significant_pairs and screening metadata
+    """
+    stages = _screening_stages(len(sample_df), initial_sample)
+
+    # Center columns on the first stage to keep the raw sums well conditioned
+    first = _float_matrix(sample_df.head(stages[0]), numeric_cols)
+    center = np.nan_to_num(np.nanmean(first, axis=0)) if len(first) else np.zeros(len(numeric_cols))
+    z_crit = float(stats.norm.ppf(0.5 + confidence / 2))
+
+    rows = np.array([i for i, _ in pairs], dtype=np.int64)
+    cols = np.array([j for _, j in pairs], dtype=np.int64)
+    active = np.ones(len(rows), dtype=bool)
+    outcome = np.full(len(rows), '', dtype=object)
+    stage_size = np.zeros(len(rows), dtype=np.int64)
+    screen_r = np.full(len(rows), np.nan)
+    screen_n = np.zeros(len(rows), dtype=np.int64)
+
+    for stage_idx, size in enumerate(stages):
+        if not np.any(active):
+            break
+
+        # Only columns that still take part in an ambiguous pair
+        idx = np.flatnonzero(active)
+        used = np.unique(np.concatenate([rows[idx], cols[idx]]))
+        position = np.full(len(numeric_cols), -1)
+        position[used] = np.arange(len(used))
+
+        # Convert only the prefix and the columns still in play
+        X = _float_matrix(sample_df.head(size), [numeric_cols[c] for c in used])
+        moments = _pairwise_moments(X - center[used])
+        r_mat = _pearson_from_moments(moments)
+
+        a, b = position[rows[idx]], position[cols[idx]]
+        r = r_mat[a, b]
+        n = moments['n'][a, b].astype(np.int64)
+
+        screen_r[idx] = r
+        screen_n[idx] = n
+        stage_size[idx] = size
+
+        # Too few complete pairs at this size: leave for a larger stage
+        enough = n >= 20
+        abs_lo, abs_hi = _correlation_bounds(np.nan_to_num(r), n, z_crit)
+
+        below = enough & (np.isnan(r) | (abs_hi < min_abs))
+        above = enough & ~below & (abs_lo >= min_abs)
+
+        if stage_idx == len(stages) - 1:
+            settled = ~below
+            outcome[idx[settled]] = 'full_sample'
+        else:
+            settled = above
+            outcome[idx[settled]] = 'above_threshold'
+
+        outcome[idx[below]] = 'below_threshold'
+        active[idx[below | settled]] = False
+
+    correlations = {}
+    significant_pairs = []
+
+    for k in range(len(rows)):
+        col1, col2 = numeric_cols[rows[k]], numeric_cols[cols[k]]
+        size = int(stage_size[k])
+
+        if outcome[k] == 'below_threshold':
+            if screen_n[k] < 20:
+                continue
+
+            r = float(screen_r[k]) if not np.isnan(screen_r[k]) else 0.0
+            n = int(screen_n[k])
+            t_stat = r * np.sqrt((n - 2) / max(1 - r ** 2, 1e-12))
+
+            correlations[f"{col1}___{col2}"] = {
+                'col1': col1,
+                'col2': col2,
+                'pearson_r': r,
+                'pearson_p': float(2 * stats.t.sf(abs(t_stat), n - 2)),
+                'spearman_r': None,
+                'spearman_p': None,
+                'n_pairs': n,
+                'sample_size': size,
+                'screening': 'below_threshold',
+            }
+            continue
+
+        # Exact statistics for settled pairs on the prefix they settled at
+        pairs = sample_df.head(size).select([col1, col2]).drop_nulls()
+
+        if len(pairs) < 20:
+            continue
+
+        x = pairs[col1].to_numpy()
+        y = pairs[col2].to_numpy()
+
+        pearson_r, pearson_p = stats.pearsonr(x, y)
+        spearman_r, spearman_p = stats.spearmanr(x, y)
+
+        pair_key = f"{col1}___{col2}"
+        correlations[pair_key] = {
+            'col1': col1,
+            'col2': col2,
+            'pearson_r': float(pearson_r),
+            'pearson_p': float(pearson_p),
+            'spearman_r': float(spearman_r),
+            'spearman_p': float(spearman_p),
+            'n_pairs': len(pairs),
+            'sample_size': size,
+            'screening': outcome[k],
+        }
+
+        if abs(pearson_r) >= min_abs or pearson_p < 0.05:
+            significant_pairs.append(pair_key)
+
+    return {
+        'correlations': correlations,
+        'significant_pairs': significant_pairs,
+        'screening': {
+            'mode': 'progressive',
+            'stages': stages,
+            'confidence': confidence,
+            'min_abs': min_abs,
+        },
+    }
+
+
+def compute_correlations(
+    df: pl.DataFrame,
+    schema: Dict[str, Any],
+    sample_size: int = 10000,
+    progressive: bool = False,
+    min_abs: float = 0.3,
+    initial_sample: int = 1000,
+    confidence: float = 0.99,
+    candidate_pairs: Optional[List[List[str]]] = None,
+    max_sample: Optional[int] = 1_000_000,
+) -> Dict[str, Any]:
     """
     Compute pairwise correlations for numeric columns.
 
     Args:
         df: Input DataFrame
         schema: Schema dict from ingest
-        sample_size: Max rows to use for correlation computation
+        sample_size: Max rows to use for correlation computation (fixed-sample mode)
+        progressive: Screen pairs on growing samples and stop early
+        min_abs: Minimum |r| of interest (progressive mode)
+        initial_sample: First-stage sample size (progressive mode)
+        confidence: Confidence level of screening intervals (progressive mode)
+        candidate_pairs: Optional [col1, col2] pairs to restrict evaluation to
+        max_sample: Rows ambiguous pairs may grow to, or None for every row (progressive mode)
 
     Returns:
         Dict with correlation matrix and significant pairs
@@ -225,6 +882,18 @@ def compute_correlations(df: pl.DataFrame, schema: Dict[str, Any], sample_size:
     if len(numeric_cols) < 2:
         return {'correlations': {}, 'significant_pairs': []}
 
+    pairs = _column_pairs(numeric_cols, candidate_pairs)
+
+    if progressive:
+        return _progressive_correlations(
+            _screening_sample(df, numeric_cols, max_sample),
+            numeric_cols,
+            pairs,
+            min_abs,
+            initial_sample,
+            confidence,
+        )
+
     # Sample if needed
     sample_df = df if len(df) <= sample_size else df.sample(n=sample_size, seed=42)
 
@@ -232,35 +901,36 @@ def compute_correlations(df: pl.DataFrame, schema: Dict[str, Any], sample_size:
     correlations = {}
     significant_pairs = []
 
-    for i, col1 in enumerate(numeric_cols):
-        for col2 in numeric_cols[i+1:]:
-            # Get non-null pairs
-            pairs = sample_df.select([col1, col2]).drop_nulls()
+    for i, j in pairs:
+        col1, col2 = numeric_cols[i], numeric_cols[j]
 
-            if len(pairs) < 20:
-                continue
+        # Get non-null pairs
+        pair_data = sample_df.select([col1, col2]).drop_nulls()
 
-            x = pairs[col1].to_numpy()
-            y = pairs[col2].to_numpy()
+        if len(pair_data) < 20:
+            continue
 
-            # Compute Pearson and Spearman
-            pearson_r, pearson_p = stats.pearsonr(x, y)
-            spearman_r, spearman_p = stats.spearmanr(x, y)
+        x = pair_data[col1].to_numpy()
+        y = pair_data[col2].to_numpy()
 
-            pair_key = f"{col1}___{col2}"
-            correlations[pair_key] = {
-                'col1': col1,
-                'col2': col2,
-                'pearson_r': float(pearson_r),
-                'pearson_p': float(pearson_p),
-                'spearman_r': float(spearman_r),
-                'spearman_p': float(spearman_p),
-                'n_pairs': len(pairs),
-            }
+        # Compute Pearson and Spearman
+        pearson_r, pearson_p = stats.pearsonr(x, y)
+        spearman_r, spearman_p = stats.spearmanr(x, y)
 
-            # Track significant pairs
-            if abs(pearson_r) >= 0.3 or pearson_p < 0.05:
-                significant_pairs.append(pair_key)
+        pair_key = f"{col1}___{col2}"
+        correlations[pair_key] = {
+            'col1': col1,
+            'col2': col2,
+            'pearson_r': float(pearson_r),
+            'pearson_p': float(pearson_p),
+            'spearman_r': float(spearman_r),
+            'spearman_p': float(spearman_p),
+            'n_pairs': len(pair_data),
+        }
+
+        # Track significant pairs
+        if abs(pearson_r) >= 0.3 or pearson_p < 0.05:
+            significant_pairs.append(pair_key)
 
     return {
         'correlations': correlations,
@@ -268,14 +938,204 @@ def compute_correlations(df: pl.DataFrame, schema: Dict[str, Any], sample_size:
     }
 
 
-def compute_chi_square(df: pl.DataFrame, schema: Dict[str, Any], sample_size: int = 10000) -> Dict[str, Any]:
+def compute_covariance(
+    df: pl.DataFrame,
+    schema: Dict[str, Any],
+    max_columns: int = 200,
+    chunk_cells: int = 5_000_000,
+) -> Optional[Dict[str, Any]]:
+    """
+    Pairwise-complete covariance of numeric columns in one streaming pass.
+
+    Rows are read in slices of about chunk_cells values. Each slice adds its
+    co-moment sums (the same _pairwise_moments the correlation engine uses)
+    relative to the first slice's column means, so memory stays bounded and
+    the sums stay well conditioned on large row counts.
+
+    Args:
+        df: Input DataFrame
+        schema: Schema dict from ingest
+        max_columns: Skip tables with more numeric columns
+        chunk_cells: Values per slice
+
+    Returns:
+        Dict with columns, n, mean and cov, or None with fewer than two or
+        more than max_columns numeric columns
+    """
+    numeric_cols = [
+        col['normalized_name']
+        for col in schema['columns']
+        if col['type'] in ['int', 'float']
+    ]
+
+    if not 2 <= len(numeric_cols) <= max_columns:
+        return None
+
+    frame = df.select([pl.col(c).cast(pl.Float64).fill_nan(None) for c in numeric_cols])
+    chunk_rows = max(chunk_cells // len(numeric_cols), 1000)
+
+    totals = None
+    for chunk in frame.iter_slices(n_rows=chunk_rows):
+        X = np.asarray(chunk.to_numpy(), dtype=np.float64)
+
+        if totals is None:
+            with np.errstate(invalid='ignore'):
+                shift = np.nan_to_num(np.nanmean(X, axis=0))
+            totals = _pairwise_moments(X - shift)
+            continue
+
+        for key, value in _pairwise_moments(X - shift).items():
+            totals[key] += value
+
+    if totals is None:
+        return None
+
+    totals['shift'] = shift
+    return _covariance_from_moments(totals, numeric_cols)
+
+
+def _chi_square_table(codes1: np.ndarray, codes2: np.ndarray, k1: int, k2: int) -> np.ndarray:
+    """
+    Build a contingency table from integer codes, dropping empty rows and columns.
+
+    Args:
+        codes1: Codes of the first column
+        codes2: Codes of the second column
+        k1: Number of codes in the first column
+        k2: Number of codes in the second column
+
+    Returns:
+        2D array of observed counts
+    """
+    table = np.bincount(codes1 * k2 + codes2, minlength=k1 * k2).reshape(k1, k2)
+    table = table[table.sum(axis=1) > 0]
+    return table[:, table.sum(axis=0) > 0]
+
+
+def _progressive_chi_square(
+    sample_df: pl.DataFrame,
+    categorical_cols: List[str],
+    pairs: List[tuple[int, int]],
+    min_v: float,
+    initial_sample: int,
+    confidence: float,
+) -> Dict[str, Any]:
+    """
+    Screen categorical pairs on growing prefixes of a shuffled sample.
+
+    Uses a normal approximation to the noncentral chi-square to bound
+    Cramér's V. Pairs clearly below min_v are dropped early, pairs clearly
+    above it (and significant) are settled, and only ambiguous pairs are
+    re-tested on the next, larger stage.
+
+    Args:
+        sample_df: Shuffled screening sample
+        categorical_cols: Categorical columns to pair
+        pairs: Column index pairs to screen
+        min_v: Minimum Cramér's V of interest
+        initial_sample: Size of the first stage
+        confidence: Confidence level of the screening bounds
+
+    Returns:
+        Dict with chi-square tests, significant_pairs and screening metadata
+    """
+    # Dense integer codes; nulls form their own level as in the crosstab path
+    codes, n_levels = categorical_codes(sample_df, categorical_cols)
+
+    stages = _screening_stages(len(codes), initial_sample)
+    z_crit = float(stats.norm.ppf(0.5 + confidence / 2))
+
+    tests = {}
+    significant_pairs = []
+
+    for i, j in pairs:
+        col1, col2 = categorical_cols[i], categorical_cols[j]
+
+        for stage_idx, size in enumerate(stages):
+            table = _chi_square_table(codes[:size, i], codes[:size, j], n_levels[i], n_levels[j])
+            min_dim = min(table.shape)
+
+            if min_dim < 2:
+                result = None
+                break
+
+            chi2, p_value, dof, _ = stats.chi2_contingency(table)
+            n = table.sum()
+            scale = n * (min_dim - 1)
+            cramers_v = np.sqrt(chi2 / scale)
+
+            spread = z_crit * np.sqrt(2 * (dof + 2 * chi2))
+            v_hi = np.sqrt((chi2 + spread) / scale)
+            v_lo = np.sqrt(max(chi2 - dof - spread, 0) / scale)
+
+            if stage_idx == len(stages) - 1:
+                outcome = 'full_sample'
+            elif v_hi < min_v:
+                outcome = 'below_threshold'
+            elif v_lo > min_v and p_value < 0.05:
+                outcome = 'above_threshold'
+            else:
+                continue
+
+            result = (chi2, p_value, cramers_v, n, size, outcome)
+            break
+
+        if result is None:
+            continue
+
+        chi2, p_value, cramers_v, n, size, outcome = result
+
+        pair_key = f"{col1}___{col2}"
+        tests[pair_key] = {
+            'col1': col1,
+            'col2': col2,
+            'chi2': float(chi2),
+            'p_value': float(p_value),
+            'cramers_v': float(cramers_v),
+            'n': int(n),
+            'sample_size': int(size),
+            'screening': outcome,
+        }
+
+        if outcome != 'below_threshold' and p_value < 0.05 and cramers_v > min_v:
+            significant_pairs.append(pair_key)
+
+    return {
+        'tests': tests,
+        'significant_pairs': significant_pairs,
+        'screening': {
+            'mode': 'progressive',
+            'stages': stages,
+            'confidence': confidence,
+            'min_abs': min_v,
+        },
+    }
+
+
+def compute_chi_square(
+    df: pl.DataFrame,
+    schema: Dict[str, Any],
+    sample_size: int = 10000,
+    progressive: bool = False,
+    min_v: float = 0.3,
+    initial_sample: int = 1000,
+    confidence: float = 0.99,
+    candidate_pairs: Optional[List[List[str]]] = None,
+    max_sample: Optional[int] = 1_000_000,
+) -> Dict[str, Any]:
     """
     Compute chi-square tests for categorical pairs.
 
     Args:
         df: Input DataFrame
         schema: Schema dict from ingest
-        sample_size: Max rows to use
+        sample_size: Max rows to use (fixed-sample mode)
+        progressive: Screen pairs on growing samples and stop early
+        min_v: Minimum Cramér's V of interest (progressive mode)
+        initial_sample: First-stage sample size (progressive mode)
+        confidence: Confidence level of screening bounds (progressive mode)
+        candidate_pairs: Optional [col1, col2] pairs to restrict evaluation to
+        max_sample: Rows ambiguous pairs may grow to, or None for every row (progressive mode)
 
     Returns:
         Dict with chi-square test results
@@ -290,47 +1150,60 @@ def compute_chi_square(df: pl.DataFrame, schema: Dict[str, Any], sample_size: in
     if len(categorical_cols) < 2:
         return {'tests': {}, 'significant_pairs': []}
 
+    pairs = _column_pairs(categorical_cols, candidate_pairs)
+
+    if progressive:
+        return _progressive_chi_square(
+            _screening_sample(df, categorical_cols, max_sample),
+            categorical_cols,
+            pairs,
+            min_v,
+            initial_sample,
+            confidence,
+        )
+
     # Sample if needed
     sample_df = df if len(df) <= sample_size else df.sample(n=sample_size, seed=42)
 
     tests = {}
     significant_pairs = []
 
-    for i, col1 in enumerate(categorical_cols):
-        for col2 in categorical_cols[i+1:]:
-            # Create contingency table
-            try:
-                crosstab = sample_df.group_by([col1, col2]).count()
+    for i, j in pairs:
+        col1, col2 = categorical_cols[i], categorical_cols[j]
 
-                # Convert to pivot table
-                pivot = crosstab.pivot(values='count', index=col1, columns=col2)
+        # Create contingency table
+        try:
+            crosstab = sample_df.group_by([col1, col2]).count()
 
-                # Fill nulls with 0
-                pivot_np = pivot.select(pl.all().exclude(col1)).fill_null(0).to_numpy()
+            # Convert to pivot table
+            pivot = crosstab.pivot(values='count', index=col1, columns=col2)
 
-                # Perform chi-square test
-                chi2, p_value, dof, expected = stats.chi2_contingency(pivot_np)
+            # Fill nulls with 0
+            pivot_np = pivot.select(pl.all().exclude(col1)).fill_null(0).to_numpy()
 
-                # Compute Cramér's V
-                n = pivot_np.sum()
-                min_dim = min(pivot_np.shape[0], pivot_np.shape[1])
-                cramers_v = np.sqrt(chi2 / (n * (min_dim - 1))) if min_dim > 1 else 0
+            # Perform chi-square test
+            chi2, p_value, dof, expected = stats.chi2_contingency(pivot_np)
 
-                pair_key = f"{col1}___{col2}"
-                tests[pair_key] = {
-                    'col1': col1,
-                    'col2': col2,
-                    'chi2': float(chi2),
-                    'p_value': float(p_value),
-                    'cramers_v': float(cramers_v),
-                    'n': int(n),
-                }
+            # Compute Cramér's V
+            n = pivot_np.sum()
+            min_dim = min(pivot_np.shape[0], pivot_np.shape[1])
+            cramers_v = np.sqrt(chi2 / (n * (min_dim - 1))) if min_dim > 1 else 0
 
-                if p_value < 0.05 and cramers_v > 0.3:
-                    significant_pairs.append(pair_key)
+            pair_key = f"{col1}___{col2}"
+            tests[pair_key] = {
+                'col1': col1,
+                'col2': col2,
+                'chi2': float(chi2),
+                'p_value': float(p_value),
+                'cramers_v': float(cramers_v),
+                'n': int(n),
+            }
 
-            except Exception:
-                continue
+            if p_value < 0.05 and cramers_v > 0.3:
+                significant_pairs.append(pair_key)
+
+        except Exception:
+            continue
 
     return {
         'tests': tests,
@@ -338,49 +1211,113 @@ def compute_chi_square(df: pl.DataFrame, schema: Dict[str, Any], sample_size: in
     }
 
 
-def summarize(df: pl.DataFrame, schema: Dict[str, Any]) -> Dict[str, Any]:
+def summarize(df: pl.DataFrame, schema: Dict[str, Any], settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Main profiling function that computes all statistics.
 
     Args:
         df: Input DataFrame
         schema: Schema dict from ingest
+        settings: Optional settings dict controlling pairwise screening
 
     Returns:
         Complete profile dict
     """
+    settings = settings or {}
+
+    progressive = settings.get('progressive_screening', False)
+    min_abs = settings.get('correlation_min_abs', 0.3)
+    initial_sample = settings.get('screening_initial_sample', 1000)
+    confidence = settings.get('screening_confidence', 0.99)
+    max_sample = settings.get('screening_max_sample', 1_000_000)
+
+    cardinality = compute_cardinality(df, schema)
+
+    # Wide tables: cheap screen over all pairs, exact statistics for the top candidates
+    wide_screen = screen_pairs(df, schema, settings, cardinality) if use_wide_mode(schema, settings) else None
+
     profile = {
         'version': '1.0',
-        'timestamp': pl.datetime('now').to_list()[0].isoformat(),
+        'timestamp': datetime.now().isoformat(),
         'missingness': compute_missingness(df),
-        'cardinality': compute_cardinality(df, schema),
+        'missingness_patterns': compute_missingness_patterns(
+            df,
+            max_patterns=settings.get('missingness_max_patterns', 10),
+            max_exact_patterns=settings.get('missingness_max_exact_patterns', 4096),
+            min_jaccard=settings.get('missingness_min_jaccard', 0.8),
+        ),
+        'cardinality': cardinality,
         'distributions': {},
         'time_index': detect_time_index(df, schema),
-        'correlations': compute_correlations(df, schema),
-        'chi_square': compute_chi_square(df, schema),
+        'correlations': compute_correlations(
+            df, schema,
+            progressive=progressive,
+            min_abs=min_abs,
+            initial_sample=initial_sample,
+            confidence=confidence,
+            candidate_pairs=wide_screen['numeric_pairs'] if wide_screen else None,
+            max_sample=max_sample,
+        ),
+        'chi_square': compute_chi_square(
+            df, schema,
+            progressive=progressive,
+            min_v=min_abs,
+            initial_sample=initial_sample,
+            confidence=confidence,
+            candidate_pairs=wide_screen['categorical_pairs'] if wide_screen else None,
+            max_sample=max_sample,
+        ),
     }
 
-    # Compute distributions for numeric columns
-    for col_info in schema['columns']:
-        col = col_info['normalized_name']
-        col_type = col_info['type']
+    if wide_screen:
+        profile['wide_screen'] = wide_screen
 
-        if col_type in ['int', 'float']:
-            profile['distributions'][col] = compute_numeric_distribution(df[col])
+    # Only driver analysis reads the covariance, so skip the pass when no target is named
+    profile['covariance'] = compute_covariance(
+        df, schema,
+        max_columns=settings.get('covariance_max_columns', 200),
+        chunk_cells=settings.get('covariance_chunk_cells', 5_000_000),
+    ) if settings.get('driver_targets') else None
+
+    # Compute distributions for numeric columns
+    numeric_cols = [
+        col['normalized_name']
+        for col in schema['columns']
+        if col['type'] in ['int', 'float']
+    ]
+    profile['distributions'] = compute_numeric_distributions(df, numeric_cols)
 
     return profile
 
 
 def save_profile(profile: Dict[str, Any], output_path: str) -> None:
     """
-    Save profile to JSON file.
+    Save profile to file.
+
+    A .json path writes a pretty-printed JSON export; any other path
+    (e.g. profile.cira) writes the compact binary artifact format, with
+    pairwise results stored as compressed Arrow tables.
 
     Args:
         profile: Profile dictionary
-        output_path: Path to output JSON file
+        output_path: Path to output file
+    """
+    artifacts.save(profile, output_path)
+
+
+def load_profile(input_path: str) -> Dict[str, Any]:
+    """
+    Load profile from a binary artifact or JSON file.
+
+    Binary artifacts load their pairwise tables lazily on first access.
+
+    Args:
+        input_path: Path to profile file
+
+    Returns:
+        Profile dictionary
     """
-    with open(output_path, 'w') as f:
-        json.dump(profile, f, indent=2)
+    return artifacts.load(input_path)
 
 
 if __name__ == '__main__':
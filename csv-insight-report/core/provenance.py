@@ -10,6 +10,8 @@ from typing import Dict, List, Any
 from pathlib import Path
 import polars as pl
 
+from .insights.registry import describe_detectors
+
 
 def get_library_versions() -> Dict[str, str]:
     """
@@ -75,6 +77,10 @@ def write_recipe(project_dir: str, project_data: Dict[str, Any]) -> str:
     """
     Generate and write recipe.json for reproducibility.
 
+    Detectors are recorded from the registry: the names in
+    project_data['enabled_detectors'] (built-ins by default), where each
+    comes from, and its project_data['detector_params'] entry.
+
     Args:
         project_dir: Path to project directory
         project_data: Dict containing all project information
@@ -97,12 +103,7 @@ def write_recipe(project_dir: str, project_data: Dict[str, Any]) -> str:
             'horizon': project_data.get('horizon', ''),
         },
         'transforms': project_data.get('transforms', []),
-        'detectors': [
-            {'name': 'distribution', 'params': {}},
-            {'name': 'trend', 'params': {}},
-            {'name': 'group', 'params': {}},
-            {'name': 'relationship', 'params': {}},
-        ],
+        'detectors': describe_detectors(project_data),
         'accepted_insights': project_data.get('accepted_insights', []),
         'libraries': get_library_versions(),
         'seed': 42,
@@ -146,7 +146,7 @@ def recommend_for_distribution(insight: Dict[str, Any], settings: Dict[str, Any]
 
 def recommend_for_trend(insight: Dict[str, Any], settings: Dict[str, Any]) -> List[ChartSpec]:
     """
-    Recommend charts for trend insights.
+    Recommend charts for trend and seasonality insights.
 
     Args:
         insight: Insight dictionary
@@ -160,6 +160,9 @@ def recommend_for_trend(insight: Dict[str, Any], settings: Dict[str, Any]) -> Li
     time_col = insight['primary_columns'][0]
     measure_col = insight['primary_columns'][1]
 
+    if 'dominant_period' in stats:
+        return recommend_for_seasonality(insight, settings)
+
     # Line chart with markers
     specs.append(ChartSpec(
         chart_type='line',
@@ -208,6 +211,245 @@ def recommend_for_trend(insight: Dict[str, Any], settings: Dict[str, Any]) -> Li
     return specs
 
 
+def recommend_for_panel_trend(insight: Dict[str, Any], settings: Dict[str, Any]) -> List[ChartSpec]:
+    """
+    Recommend charts for panel (per-segment) trend insights.
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+
+    Returns:
+        List of up to 2 ChartSpec objects, ordered by priority
+    """
+    specs = []
+    stats = insight['statistics']
+    time_col, measure_col, segment_col = insight['primary_columns']
+    shown = [s['segment'] for s in stats['strongest_segments'] + stats['divergent_segments']]
+    shown = list(dict.fromkeys(shown))
+
+    # Small multiples of the strongest and divergent segments
+    specs.append(ChartSpec(
+        chart_type='small_multiples_line',
+        title=f"{measure_col} over time for selected {segment_col} segments",
+        rationale="One panel per segment shows each trend without the others hiding it",
+        accessibility_checks=check_accessibility('line', {'n_categories': len(shown)}),
+        implementation_params={
+            'x': time_col,
+            'y': measure_col,
+            'facet': segment_col,
+            'facet_values': shown,
+            'trendline': 'ols',
+            'color': COLORBLIND_CATEGORICAL[0],
+        },
+        priority=1,
+    ))
+
+    # Dot plot of every segment's slope
+    specs.append(ChartSpec(
+        chart_type='segment_slope_dot',
+        title=f"Trend of {measure_col} per {segment_col}",
+        rationale="Sorted slopes show how many segments rise or fall and which ones stand apart",
+        accessibility_checks=check_accessibility('scatter', {'n_points': stats['n_segments']}),
+        implementation_params={
+            'x': 'slope',
+            'y': segment_col,
+            'sort': 'slope',
+            'reference_line': stats['median_slope'],
+            'highlight': shown,
+            'palette': COLORBLIND_CATEGORICAL,
+        },
+        priority=2,
+    ))
+
+    return specs
+
+
+def recommend_for_seasonality(insight: Dict[str, Any], settings: Dict[str, Any]) -> List[ChartSpec]:
+    """
+    Recommend charts for seasonality insights (reached through recommend_for_trend).
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+
+    Returns:
+        List of up to 3 ChartSpec objects, ordered by priority
+    """
+    specs = []
+    stats = insight['statistics']
+    time_col = insight['primary_columns'][0]
+    measure_col = insight['primary_columns'][1]
+    cycle = stats['calendar_cycle'] or f"{stats['dominant_period']}"
+
+    # Seasonal decomposition: observed, trend, seasonal and residual panels
+    specs.append(ChartSpec(
+        chart_type='seasonal_decomposition',
+        title=f"{measure_col}: trend, {cycle} cycle and remainder",
+        rationale="Decomposition separates the repeating cycle from the trend and noise",
+        accessibility_checks=check_accessibility('line', stats),
+        implementation_params={
+            'x': time_col,
+            'y': measure_col,
+            'period': stats['dominant_length'],
+            'resample_every': stats['every'],
+            'color': COLORBLIND_CATEGORICAL[0],
+        },
+        priority=1,
+    ))
+
+    # Cycle plot: one line per cycle against the position within the cycle
+    specs.append(ChartSpec(
+        chart_type='cycle_plot',
+        title=f"{measure_col} by position in the {cycle} cycle",
+        rationale="Overlaying cycles shows the typical shape and how consistent it is",
+        accessibility_checks=check_accessibility('line', stats),
+        implementation_params={
+            'x': time_col,
+            'y': measure_col,
+            'period': stats['dominant_length'],
+            'resample_every': stats['every'],
+            'show_mean_profile': True,
+            'palette': COLORBLIND_SEQUENTIAL,
+        },
+        priority=2,
+    ))
+
+    # Plain line chart of the series
+    specs.append(ChartSpec(
+        chart_type='line',
+        title=f"{measure_col} over time",
+        rationale="Line chart shows the raw series the cycle was found in",
+        accessibility_checks=check_accessibility('line', stats),
+        implementation_params={
+            'x': time_col,
+            'y': measure_col,
+            'color': COLORBLIND_CATEGORICAL[1],
+        },
+        priority=3,
+    ))
+
+    return specs
+
+
+def recommend_for_anomaly(insight: Dict[str, Any], settings: Dict[str, Any]) -> List[ChartSpec]:
+    """
+    Recommend charts for anomaly (unusual period) insights.
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+
+    Returns:
+        List of up to 2 ChartSpec objects, ordered by priority
+    """
+    specs = []
+    stats = insight['statistics']
+    time_col = insight['primary_columns'][0]
+    measure_col = insight['primary_columns'][1]
+
+    # Line chart with the expected band and the event shaded
+    specs.append(ChartSpec(
+        chart_type='line_with_band',
+        title=f"{measure_col} against its expected range",
+        rationale="The shaded band shows the normal range, so the anomaly stands out where the line leaves it",
+        accessibility_checks=check_accessibility('line', stats),
+        implementation_params={
+            'x': time_col,
+            'y': measure_col,
+            'band': 'rolling_median_mad',
+            'window': stats['window_periods'],
+            'threshold': stats['threshold'],
+            'highlight': [stats['start'], stats['end']],
+            'color': COLORBLIND_CATEGORICAL[0],
+        },
+        priority=1,
+    ))
+
+    # Plain line chart zoomed to the event
+    specs.append(ChartSpec(
+        chart_type='line',
+        title=f"{measure_col} around {stats['peak_at']}",
+        rationale="Zooming in on the event shows its shape and duration",
+        accessibility_checks=check_accessibility('line', stats),
+        implementation_params={
+            'x': time_col,
+            'y': measure_col,
+            'around': stats['peak_at'],
+            'periods': stats['window_periods'],
+            'color': COLORBLIND_CATEGORICAL[1],
+        },
+        priority=2,
+    ))
+
+    return specs
+
+
+def recommend_for_changepoint(insight: Dict[str, Any], settings: Dict[str, Any]) -> List[ChartSpec]:
+    """
+    Recommend charts for changepoint (level shift) insights.
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+
+    Returns:
+        List of up to 3 ChartSpec objects, ordered by priority
+    """
+    specs = []
+    stats = insight['statistics']
+    time_col = insight['primary_columns'][0]
+    measure_col = insight['primary_columns'][1]
+    changepoints = [cp['time'] for cp in stats.get('changepoints', [])]
+
+    # Line chart with changepoint markers
+    specs.append(ChartSpec(
+        chart_type='line_with_changepoints',
+        title=f"{measure_col} over time with level shifts",
+        rationale="Vertical markers show where the level of the series changes",
+        accessibility_checks=check_accessibility('line', stats),
+        implementation_params={
+            'x': time_col,
+            'y': measure_col,
+            'vlines': changepoints,
+            'color': COLORBLIND_CATEGORICAL[0],
+        },
+        priority=1,
+    ))
+
+    # Segment means as a step line over the series
+    specs.append(ChartSpec(
+        chart_type='step_segment_means',
+        title=f"{measure_col} segment averages",
+        rationale="Step line of segment means makes the size of each shift readable",
+        accessibility_checks=check_accessibility('line', stats),
+        implementation_params={
+            'x': time_col,
+            'y': measure_col,
+            'breaks': changepoints,
+            'color': COLORBLIND_CATEGORICAL[1],
+        },
+        priority=2,
+    ))
+
+    # Box plot per segment
+    specs.append(ChartSpec(
+        chart_type='boxplot_by_segment',
+        title=f"{measure_col} distribution per segment",
+        rationale="Box plots show whether spread changed along with the level",
+        accessibility_checks=check_accessibility('boxplot', {'n_categories': len(changepoints) + 1}),
+        implementation_params={
+            'x': time_col,
+            'y': measure_col,
+            'breaks': changepoints,
+            'palette': COLORBLIND_CATEGORICAL,
+        },
+        priority=3,
+    ))
+
+    return specs
+
+
 def recommend_for_group(insight: Dict[str, Any], settings: Dict[str, Any]) -> List[ChartSpec]:
     """
     Recommend charts for group difference insights.
@@ -356,6 +598,174 @@ def recommend_for_relationship(insight: Dict[str, Any], settings: Dict[str, Any]
     return specs[:3]  # Limit to 3
 
 
+def recommend_for_subgroup(insight: Dict[str, Any], settings: Dict[str, Any]) -> List[ChartSpec]:
+    """
+    Recommend charts for subgroup (segment) insights.
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+
+    Returns:
+        List of up to 3 ChartSpec objects, ordered by priority
+    """
+    specs = []
+    stats = insight['statistics']
+    measure_col = insight['primary_columns'][0]
+    condition_cols = insight['primary_columns'][1:]
+    segment = insight.get('query') or ' and '.join(condition_cols)
+
+    # Segment vs rest bar chart
+    specs.append(ChartSpec(
+        chart_type='subgroup_bar',
+        title=f"{measure_col}: segment vs all other rows",
+        rationale="Bar chart contrasts the segment's mean with the rest of the data",
+        accessibility_checks=check_accessibility('bar', {'n_categories': 2}),
+        implementation_params={
+            'y': measure_col,
+            'segment': segment,
+            'error_bars': True,
+            'palette': COLORBLIND_CATEGORICAL,
+        },
+        priority=1,
+    ))
+
+    # Box plot of the segment vs the rest
+    specs.append(ChartSpec(
+        chart_type='boxplot_subgroup_vs_rest',
+        title=f"{measure_col} distribution in the segment and elsewhere",
+        rationale="Box plots show whether the whole distribution shifts, not only the mean",
+        accessibility_checks=check_accessibility('boxplot', {'n_categories': 2}),
+        implementation_params={
+            'y': measure_col,
+            'segment': segment,
+            'palette': COLORBLIND_CATEGORICAL,
+        },
+        priority=2,
+    ))
+
+    # Heatmap of the measure across the first two condition columns
+    if len(condition_cols) >= 2:
+        specs.append(ChartSpec(
+            chart_type='heatmap',
+            title=f"Mean {measure_col} by {condition_cols[0]} and {condition_cols[1]}",
+            rationale="Heatmap shows how the two conditions combine rather than add up",
+            accessibility_checks=check_accessibility('heatmap', stats),
+            implementation_params={
+                'x': condition_cols[0],
+                'y': condition_cols[1],
+                'value': measure_col,
+                'aggregate': 'mean',
+                'cmap': COLORBLIND_SEQUENTIAL,
+            },
+            priority=3,
+        ))
+
+    return specs
+
+
+def recommend_for_driver(insight: Dict[str, Any], settings: Dict[str, Any]) -> List[ChartSpec]:
+    """
+    Recommend charts for driver analysis insights.
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+
+    Returns:
+        List of up to 2 ChartSpec objects, ordered by priority
+    """
+    specs = []
+    stats = insight['statistics']
+    drivers = stats['drivers']
+
+    # Horizontal bars of each driver's share of explained variance
+    specs.append(ChartSpec(
+        chart_type='importance_bar',
+        title=f"What drives {stats['target']}",
+        rationale="Bars sorted by share of explained variance rank the drivers at a glance",
+        accessibility_checks=check_accessibility('bar', {'n_categories': len(drivers)}),
+        implementation_params={
+            'x': [d['share'] for d in drivers],
+            'y': [d['column'] for d in drivers],
+            'orientation': 'horizontal',
+            'x_label': f"Share of explained variance (R²={stats['r_squared']:.2f})",
+            'color': COLORBLIND_CATEGORICAL[0],
+        },
+        priority=1,
+    ))
+
+    # Standardized betas with 95% intervals
+    specs.append(ChartSpec(
+        chart_type='coefficient_plot',
+        title=f"Standardized effects on {stats['target']}",
+        rationale="Points with 95% intervals show each driver's direction and uncertainty",
+        accessibility_checks=check_accessibility('scatter', {'n_points': len(drivers)}),
+        implementation_params={
+            'x': [d['beta'] for d in drivers],
+            'y': [d['column'] for d in drivers],
+            'x_error': [1.96 * d['se'] for d in drivers],
+            'reference_line': 0,
+            'color': COLORBLIND_CATEGORICAL[1],
+        },
+        priority=2,
+    ))
+
+    return specs
+
+
+def recommend_for_cluster(insight: Dict[str, Any], settings: Dict[str, Any]) -> List[ChartSpec]:
+    """
+    Recommend charts for cluster (natural segment) insights.
+
+    Args:
+        insight: Insight dictionary
+        settings: Settings dict
+
+    Returns:
+        List of up to 2 ChartSpec objects, ordered by priority
+    """
+    specs = []
+    stats = insight['statistics']
+    columns = insight['primary_columns']
+
+    # Heatmap of cluster means in standard deviations from the overall mean
+    specs.append(ChartSpec(
+        chart_type='cluster_profile_heatmap',
+        title=f"Profile of the {stats['k']} segments",
+        rationale="Each cell shows how far a segment's average sits from the overall average, in standard deviations",
+        accessibility_checks=check_accessibility('heatmap', {'n_categories': len(columns)}),
+        implementation_params={
+            'rows': [f"Segment {c['cluster']} ({c['share']:.0%})" for c in stats['clusters']],
+            'columns': columns,
+            'value': 'z',
+            'colormap': 'RdBu_r',
+            'center': 0,
+        },
+        priority=1,
+    ))
+
+    # Scatter of the two columns that separate the largest segment most
+    top = [d['column'] for d in stats['clusters'][0]['distinguishing'][:2]]
+    if len(top) == 2:
+        specs.append(ChartSpec(
+            chart_type='scatter_by_cluster',
+            title=f"{top[1]} vs {top[0]} by segment",
+            rationale="Coloring points by segment shows how well the segments separate",
+            accessibility_checks=check_accessibility('scatter', {'n_points': stats['n_rows']}),
+            implementation_params={
+                'x': top[0],
+                'y': top[1],
+                'hue': 'cluster',
+                'palette': COLORBLIND_CATEGORICAL,
+                'sample': 5000,
+            },
+            priority=2,
+        ))
+
+    return specs
+
+
 def for_insight(insight: Dict[str, Any], df, settings: Dict[str, Any]) -> Tuple[List[ChartSpec], List[str]]:
     """
     Main recommendation function for a single insight.
@@ -372,12 +782,24 @@ def for_insight(insight: Dict[str, Any], df, settings: Dict[str, Any]) -> Tuple[
 
     if detector_type == 'distribution':
         specs = recommend_for_distribution(insight, settings)
-    elif detector_type == 'trend':
+    elif detector_type in ('trend', 'seasonality'):
         specs = recommend_for_trend(insight, settings)
+    elif detector_type == 'panel_trend':
+        specs = recommend_for_panel_trend(insight, settings)
+    elif detector_type == 'changepoint':
+        specs = recommend_for_changepoint(insight, settings)
+    elif detector_type == 'anomaly':
+        specs = recommend_for_anomaly(insight, settings)
     elif detector_type == 'group':
         specs = recommend_for_group(insight, settings)
     elif detector_type == 'relationship':
         specs = recommend_for_relationship(insight, settings)
+    elif detector_type == 'driver':
+        specs = recommend_for_driver(insight, settings)
+    elif detector_type == 'subgroup':
+        specs = recommend_for_subgroup(insight, settings)
+    elif detector_type == 'cluster':
+        specs = recommend_for_cluster(insight, settings)
     else:
         # Fallback: generic recommendations
         specs = []
@@ -0,0 +1,410 @@
+"""
+Wide-Table Screening Module
+Cheap first-stage screens over all column pairs so that exact statistics are only computed for top candidates.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+import polars as pl
+
+
+def _standardize(X: np.ndarray) -> np.ndarray:
+    """
+    Standardize columns to zero mean and unit variance, imputing NaN as the mean.
+
+    Args:
+        X: 2D float array (rows x columns), NaN = missing
+
+    Returns:
+        Standardized array with missing values set to 0
+    """
+    mean = np.nan_to_num(np.nanmean(X, axis=0)) if len(X) else np.zeros(X.shape[1])
+    Z = np.nan_to_num(X - mean)
+    std = np.sqrt((Z ** 2).mean(axis=0)) if len(Z) else np.ones(X.shape[1])
+    std[std == 0] = 1.0
+    return Z / std
+
+
+def _upper_pairs(scores: np.ndarray, max_pairs: int, min_score: float) -> List[Tuple[int, int]]:
+    """
+    Select the highest-scoring (i < j) pairs from a symmetric score matrix.
+
+    Args:
+        scores: Square matrix of screening scores
+        max_pairs: Maximum number of pairs to keep
+        min_score: Scores below this value are never kept
+
+    Returns:
+        List of (i, j) index pairs, best first
+    """
+    rows, cols = np.triu_indices(scores.shape[0], k=1)
+    values = scores[rows, cols]
+
+    keep = np.flatnonzero(values >= min_score)
+    if len(keep) > max_pairs:
+        keep = keep[np.argpartition(-values[keep], max_pairs - 1)[:max_pairs]]
+    keep = keep[np.argsort(-values[keep], kind='stable')]
+
+    return [(int(rows[k]), int(cols[k])) for k in keep]
+
+
+def sketch_correlations(X: np.ndarray, sketch_dim: int = 1024, seed: int = 42) -> np.ndarray:
+    """
+    Estimate the correlation matrix from a CountSketch of the rows.
+
+    Columns are standardized, then each row is added with a random sign
+    into one of sketch_dim buckets. Building the sketch is O(n · p) and the
+    p x p product costs O(p² · sketch_dim) instead of O(p² · n). The
+    estimate is unbiased with standard error of roughly sqrt((1 + r²) / sketch_dim).
+
+    Args:
+        X: 2D float array (rows x columns), NaN = missing
+        sketch_dim: Number of sketch buckets
+        seed: Random seed for bucket and sign assignment
+
+    Returns:
+        Approximate correlation matrix
+    """
+    Z = _standardize(X).astype(np.float32)
+    n = len(Z)
+
+    if n <= sketch_dim:
+        S = Z
+    else:
+        rng = np.random.default_rng(seed)
+        buckets = rng.integers(0, sketch_dim, n)
+        signs = rng.choice(np.array([-1.0, 1.0], dtype=np.float32), n)
+
+        # Sum signed rows per bucket with one sort and reduceat
+        order = np.argsort(buckets, kind='stable')
+        counts = np.bincount(buckets, minlength=sketch_dim)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])[counts > 0]
+        S = np.add.reduceat((Z * signs[:, None])[order], starts, axis=0)
+
+    return np.clip((S.T @ S) / max(n, 1), -1.0, 1.0).astype(np.float64)
+
+
+def categorical_codes(df: pl.DataFrame, columns: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode columns as dense integer codes, with nulls as code 0.
+
+    Args:
+        df: Input DataFrame
+        columns: Columns to encode
+
+    Returns:
+        Tuple of (codes array rows x columns, number of levels per column)
+    """
+    codes = df.select([
+        pl.col(c).rank('dense').fill_null(0).cast(pl.Int64) for c in columns
+    ]).to_numpy()
+    n_levels = codes.max(axis=0) + 1 if len(codes) else np.ones(len(columns), dtype=np.int64)
+    return codes, n_levels
+
+
+def mutual_information_screen(codes: np.ndarray, n_levels: np.ndarray, batch_size: int = 512) -> np.ndarray:
+    """
+    Cramér's V estimated from mutual information for every categorical pair.
+
+    Contingency tables for a whole batch of pairs come from one bincount
+    over offset joint codes. Since the G statistic 2·n·MI approximates
+    chi-square, V ≈ sqrt(2·MI / (min(k_a, k_b) - 1)) after removing the
+    small-sample bias (k_a - 1)(k_b - 1) / 2n from MI.
+
+    Args:
+        codes: Integer codes (rows x columns)
+        n_levels: Number of levels per column
+        batch_size: Pairs per bincount batch
+
+    Returns:
+        Symmetric matrix of estimated Cramér's V
+    """
+    n, p = codes.shape
+    scores = np.zeros((p, p))
+    if n == 0 or p < 2:
+        return scores
+
+    k = int(n_levels.max())
+    rows, cols = np.triu_indices(p, k=1)
+
+    # Marginals and observed level counts once per column
+    marginals = np.stack([np.bincount(codes[:, j], minlength=k) for j in range(p)]) / n
+    observed = (marginals > 0).sum(axis=1)
+
+    for start in range(0, len(rows), batch_size):
+        a = rows[start:start + batch_size]
+        b = cols[start:start + batch_size]
+        offsets = np.arange(len(a)) * k * k
+
+        joint = codes[:, a] * k + codes[:, b] + offsets
+        counts = np.bincount(joint.ravel(), minlength=len(a) * k * k).reshape(len(a), k, k) / n
+
+        expected = marginals[a][:, :, None] * marginals[b][:, None, :]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mi = np.nansum(np.where(counts > 0, counts * np.log(counts / expected), 0.0), axis=(1, 2))
+
+        bias = (observed[a] - 1) * (observed[b] - 1) / (2 * n)
+        min_dim = np.minimum(observed[a], observed[b])
+        scores[a, b] = np.where(
+            min_dim > 1,
+            np.sqrt(2 * np.maximum(mi - bias, 0.0) / np.maximum(min_dim - 1, 1)),
+            0.0,
+        )
+
+    return scores + scores.T
+
+
+def correlation_ratio_screen(codes: np.ndarray, n_levels: np.ndarray, X: np.ndarray) -> np.ndarray:
+    """
+    Correlation ratio (η²) of every numeric column on every categorical column.
+
+    Per-group counts, sums and sums of squares for all measures come from
+    one stacked one-hot matrix product over all categorical columns. Rows
+    with a null group (code 0) or a missing measure are excluded.
+
+    Args:
+        codes: Integer codes of categorical columns (rows x categoricals)
+        n_levels: Number of levels per categorical column
+        X: 2D float array of numeric columns (rows x measures), NaN = missing
+
+    Returns:
+        Matrix of η² with shape (categoricals, measures)
+    """
+    present = ~np.isnan(X)
+    X0 = np.where(present, X - np.nan_to_num(np.nanmean(X, axis=0)), 0.0) if len(X) else X
+    X0 = X0.astype(np.float32)
+
+    # One indicator column per (categorical, level); level 0 is the null group
+    offsets = np.concatenate([[0], np.cumsum(n_levels)[:-1]]).astype(np.int64)
+    one_hot = np.zeros((len(codes), int(n_levels.sum())), dtype=np.float32)
+    for g in range(codes.shape[1]):
+        one_hot[np.arange(len(codes)), offsets[g] + codes[:, g]] = 1.0
+    one_hot[:, offsets] = 0.0
+
+    if present.all():
+        n_g = np.repeat(one_hot.sum(axis=0)[:, None], X.shape[1], axis=1).astype(np.float64)
+    else:
+        n_g = (one_hot.T @ present.astype(np.float32)).astype(np.float64)
+    s_g = (one_hot.T @ X0).astype(np.float64)
+    q_g = (one_hot.T @ X0 ** 2).astype(np.float64)
+
+    eta = np.zeros((codes.shape[1], X.shape[1]))
+
+    for g in range(codes.shape[1]):
+        block = slice(offsets[g], offsets[g] + n_levels[g])
+        n_tot = n_g[block].sum(axis=0)
+        s_tot = s_g[block].sum(axis=0)
+        q_tot = q_g[block].sum(axis=0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            grand = np.where(n_tot > 0, s_tot ** 2 / n_tot, 0.0)
+            ss_total = q_tot - grand
+            ss_between = np.where(n_g[block] > 0, s_g[block] ** 2 / n_g[block], 0.0).sum(axis=0) - grand
+            eta[g] = np.where(ss_total > 0, ss_between / ss_total, 0.0)
+
+    return np.clip(eta, 0.0, 1.0)
+
+
+def top_levels(top_values: List[Dict[str, Any]], k: int, min_coverage: float) -> Optional[List[str]]:
+    """
+    Most frequent non-null levels of a high-cardinality column.
+
+    Args:
+        top_values: Profile top values ({'value', 'count', 'fraction'}; value None for nulls)
+        k: Number of levels to keep (the rest pool into one bucket)
+        min_coverage: Min fraction of rows the kept levels must cover
+
+    Returns:
+        Level values as strings, or None if the top levels cover too few
+        rows to make a useful comparison
+    """
+    kept = [v for v in top_values if v['value'] is not None]
+    kept = sorted(kept, key=lambda v: v['count'], reverse=True)[:k]
+
+    coverage = sum(v['fraction'] for v in kept)
+    if len(kept) < 2 or coverage < min_coverage:
+        return None
+
+    return [v['value'] for v in kept]
+
+
+def group_columns(
+    schema: Dict[str, Any],
+    cardinality: Dict[str, Any],
+    settings: Dict[str, Any],
+) -> Dict[str, Optional[List[str]]]:
+    """
+    Grouping columns for group comparisons, with collapsed levels where needed.
+
+    Columns with at most group_max_levels levels are used as they are;
+    higher-cardinality columns keep their top group_max_levels - 1 levels
+    (plus an 'Other' bucket) when group_collapse_high_cardinality is set.
+
+    Args:
+        schema: Schema dict from ingest
+        cardinality: Profile cardinality (top values per column)
+        settings: Settings dict
+
+    Returns:
+        Dict of column -> kept levels, or None when not collapsed
+    """
+    max_levels = settings.get('group_max_levels', 10)
+    collapse = settings.get('group_collapse_high_cardinality', True)
+    min_coverage = settings.get('group_min_top_coverage', 0.5)
+
+    columns = {}
+    for col in schema['columns']:
+        if col['type'] not in ['categorical', 'string', 'bool'] or col['unique_count'] < 2:
+            continue
+
+        name = col['normalized_name']
+        if col['unique_count'] <= max_levels:
+            columns[name] = None
+        elif collapse and col['type'] != 'bool':
+            levels = top_levels(cardinality.get(name, {}).get('top_values', []), max_levels - 1, min_coverage)
+            if levels:
+                columns[name] = levels
+
+    return columns
+
+
+def collapse_levels(column: str, levels: List[str], other: str) -> pl.Expr:
+    """
+    Column as text with levels outside `levels` pooled into `other`; nulls stay null.
+
+    Args:
+        column: Column name
+        levels: Levels kept as they are
+        other: Label of the pooled bucket
+
+    Returns:
+        Polars expression named after the column
+    """
+    text = pl.col(column).cast(pl.Utf8)
+    return (
+        pl.when(text.is_null()).then(None)
+        .when(text.is_in(levels)).then(text)
+        .otherwise(pl.lit(other))
+        .alias(column)
+    )
+
+
+def use_wide_mode(schema: Dict[str, Any], settings: Dict[str, Any]) -> bool:
+    """
+    Decide whether pairwise work should go through the wide-table screen.
+
+    Args:
+        schema: Schema dict from ingest
+        settings: Settings dict
+
+    Returns:
+        True if wide mode is enabled or triggered automatically
+    """
+    mode = settings.get('wide_mode', 'auto')
+
+    if mode == 'auto':
+        return len(schema['columns']) >= settings.get('wide_mode_min_columns', 200)
+
+    return bool(mode)
+
+
+def screen_pairs(
+    df: pl.DataFrame,
+    schema: Dict[str, Any],
+    settings: Dict[str, Any],
+    cardinality: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Run the first-stage screen over all pairs and keep the top candidates.
+
+    Numeric pairs are ranked by a random-projection correlation estimate,
+    categorical pairs by normalized mutual information on their codes, and
+    group × measure pairs by the correlation ratio. Group columns are the
+    ones GroupDetector compares, high-cardinality columns collapsed to the
+    same top levels plus 'Other'. Each family is capped at wide_max_pairs
+    candidates above a floor that allows for screening error.
+
+    Args:
+        df: Input DataFrame
+        schema: Schema dict from ingest
+        settings: Settings dict
+        cardinality: Profile cardinality (top values per column)
+
+    Returns:
+        Dict with candidate numeric, categorical and group pairs
+    """
+    max_pairs = settings.get('wide_max_pairs', 2000)
+    sample_size = settings.get('wide_screen_sample', 5000)
+    sketch_dim = settings.get('wide_sketch_dim', 1024)
+    min_abs = settings.get('correlation_min_abs', 0.3)
+
+    numeric_cols = [
+        col['normalized_name']
+        for col in schema['columns']
+        if col['type'] in ['int', 'float']
+    ]
+    categorical_cols = [
+        col['normalized_name']
+        for col in schema['columns']
+        if col['type'] in ['categorical', 'string', 'bool']
+        and col['unique_count'] < 50
+    ]
+    group_levels = group_columns(schema, cardinality, settings)
+    group_cols = list(group_levels)
+
+    sample_df = df if len(df) <= sample_size else df.sample(n=sample_size, seed=42)
+
+    # Allow for screening error so borderline pairs still reach the exact stage
+    margin = 3 / np.sqrt(min(sketch_dim, len(sample_df)) or 1)
+
+    numeric_pairs = []
+    X = None
+    if len(numeric_cols) >= 2:
+        X = sample_df.select([pl.col(c).cast(pl.Float64) for c in numeric_cols]).to_numpy()
+        approx = np.abs(sketch_correlations(X, sketch_dim))
+        numeric_pairs = [
+            [numeric_cols[i], numeric_cols[j]]
+            for i, j in _upper_pairs(approx, max_pairs, min_abs - margin)
+        ]
+
+    categorical_pairs = []
+    if len(categorical_cols) >= 2:
+        codes, n_levels = categorical_codes(sample_df, categorical_cols)
+        approx_v = mutual_information_screen(codes, n_levels)
+        categorical_pairs = [
+            [categorical_cols[i], categorical_cols[j]]
+            for i, j in _upper_pairs(approx_v, max_pairs, min_abs - margin)
+        ]
+
+    group_pairs = []
+    if group_cols and numeric_cols:
+        if X is None:
+            X = sample_df.select([pl.col(c).cast(pl.Float64) for c in numeric_cols]).to_numpy()
+        groups = sample_df.select([
+            pl.col(c) if levels is None else collapse_levels(c, levels, '\x00other')
+            for c, levels in group_levels.items()
+        ])
+        codes, n_levels = categorical_codes(groups, group_cols)
+        eta = correlation_ratio_screen(codes, n_levels, X)
+
+        # Keep at least small effects (η² ≥ 0.01), best first
+        flat = np.argsort(-eta, axis=None, kind='stable')[:max_pairs]
+        flat = flat[eta.ravel()[flat] >= settings.get('wide_min_eta_squared', 0.01)]
+        group_pairs = [
+            [group_cols[g], numeric_cols[m]]
+            for g, m in zip(*np.unravel_index(flat, eta.shape))
+        ]
+
+    return {
+        'numeric_pairs': numeric_pairs,
+        'categorical_pairs': categorical_pairs,
+        'group_pairs': group_pairs,
+        'pairs_screened': {
+            'numeric': len(numeric_cols) * (len(numeric_cols) - 1) // 2,
+            'categorical': len(categorical_cols) * (len(categorical_cols) - 1) // 2,
+            'group': len(group_cols) * len(numeric_cols),
+        },
+        'max_pairs': max_pairs,
+        'sample_size': len(sample_df),
+        'sketch_dim': sketch_dim,
+    }